@@ -22,6 +22,16 @@ from neuracore_types.batched_nc_data.batched_point_cloud_data import (
     BatchedPointCloudData,
 )
 from neuracore_types.batched_nc_data.batched_pose_data import BatchedPoseData
+from neuracore_types.batched_nc_data.embodiment_layout import (  # noqa: F401
+    CrossEmbodimentLayout,
+    PaddedBatch,
+    RobotSlots,
+)
+from neuracore_types.batched_nc_data.normalizer import (  # noqa: F401
+    DataTypeNormalizer,
+    NormalizationMode,
+    Normalizer,
+)
 from neuracore_types.nc_data import DataType
 
 BatchedNCDataUnion = Annotated[
@@ -7,6 +7,7 @@ import torch
 from pydantic import ConfigDict, Field, field_serializer, field_validator
 
 from neuracore_types.batched_nc_data.batched_nc_data import BatchedNCData
+from neuracore_types.nc_data.camera_data import CameraDataStats
 from neuracore_types.nc_data.nc_data import NCData
 from neuracore_types.utils.pydantic_to_ts import (
     REQUIRED_WITH_DEFAULT_FLAG,
@@ -75,7 +76,7 @@ class BatchedRGBData(BatchedNCData):
 
         rgb_data: RGBCameraData = cast(RGBCameraData, nc_data)
         # Need to change from (H, W, 3) to (3, H, W)
-        frame = np.array(rgb_data.frame)
+        frame = np.asarray(rgb_data.load_frame())
         frame = (
             torch.tensor(frame.transpose(2, 0, 1), dtype=torch.float32)
             .unsqueeze(0)
@@ -97,7 +98,9 @@ class BatchedRGBData(BatchedNCData):
             )
         else:
             intrinsics = torch.zeros((1, 1, 3, 3), dtype=torch.float32)
-        return cls(frame=frame, extrinsics=extrinsics, intrinsics=intrinsics)
+        return cls.from_trusted(
+            frame=frame, extrinsics=extrinsics, intrinsics=intrinsics
+        )
 
     def transform_nc_data(self) -> None:
         """Apply in-place transformations, e.g. reshaping, reordering dimensions, etc.
@@ -142,35 +145,33 @@ class BatchedRGBData(BatchedNCData):
         frames = []
         extrinsics_list = []
         intrinsics_list = []
+        no_extrinsics = np.zeros((4, 4), dtype=np.float32)
+        no_intrinsics = np.zeros((3, 3), dtype=np.float32)
 
         for nc in nc_data_list:
             rgb_data: RGBCameraData = cast(RGBCameraData, nc)
             # (H, W, 3) -> (3, H, W)
-            frame = np.array(rgb_data.frame).transpose(2, 0, 1)
+            frame = np.asarray(rgb_data.load_frame()).transpose(2, 0, 1)
             frames.append(frame)
 
             if rgb_data.extrinsics is not None:
                 extrinsics_list.append(rgb_data.extrinsics)
             else:
-                extrinsics_list.append(np.zeros((4, 4), dtype=np.float32))
+                extrinsics_list.append(no_extrinsics)
 
             if rgb_data.intrinsics is not None:
                 intrinsics_list.append(rgb_data.intrinsics)
             else:
-                intrinsics_list.append(np.zeros((3, 3), dtype=np.float32))
+                intrinsics_list.append(no_intrinsics)
 
         # Shape: (1, T, 3, H, W)
         frame_tensor = torch.tensor(np.stack(frames), dtype=torch.float32).unsqueeze(0)
         # Shape: (1, T, 4, 4)
-        extrinsics_tensor = torch.tensor(
-            np.stack(extrinsics_list), dtype=torch.float32
-        ).unsqueeze(0)
+        extrinsics_tensor = cls._stack_frames(extrinsics_list)
         # Shape: (1, T, 3, 3)
-        intrinsics_tensor = torch.tensor(
-            np.stack(intrinsics_list), dtype=torch.float32
-        ).unsqueeze(0)
+        intrinsics_tensor = cls._stack_frames(intrinsics_list)
 
-        return cls(
+        return cls.from_trusted(
             frame=frame_tensor,
             extrinsics=extrinsics_tensor,
             intrinsics=intrinsics_tensor,
@@ -195,6 +196,25 @@ class BatchedRGBData(BatchedNCData):
             intrinsics=torch.zeros((batch_size, time_steps, 3, 3), dtype=torch.float32),
         )
 
+    def _statistics_values(self) -> dict[str, torch.Tensor | None]:
+        """Values to compute statistics over, keyed by stats field name."""
+        # (B, T, 3, H, W) -> (B * T, H, W, 3) to match unbatched frames
+        height, width = self.frame.shape[-2:]
+        return {
+            "frame": self.frame.permute(0, 1, 3, 4, 2).reshape(-1, height, width, 3),
+            "extrinsics": self.extrinsics.reshape(-1, 4, 4),
+            "intrinsics": self.intrinsics.reshape(-1, 3, 3),
+        }
+
+    def calculate_statistics(self) -> CameraDataStats:
+        """Calculate statistics over the batch and time dimensions.
+
+        Returns:
+            CameraDataStats: Statistics matching those of the unbatched
+                data type.
+        """
+        return cast(CameraDataStats, self._calculate_statistics(CameraDataStats))
+
 
 class BatchedDepthData(BatchedNCData):
     """Batched depth camera data."""
@@ -255,7 +275,7 @@ class BatchedDepthData(BatchedNCData):
 
         depth_data: DepthCameraData = cast(DepthCameraData, nc_data)
         # Need to change from (H, W) to (1, H, W)
-        frame = np.array(depth_data.frame)
+        frame = np.asarray(depth_data.load_frame())
         frame = (
             torch.tensor(frame, dtype=torch.float32)
             .unsqueeze(0)
@@ -278,7 +298,9 @@ class BatchedDepthData(BatchedNCData):
             )
         else:
             intrinsics = torch.zeros((1, 1, 3, 3), dtype=torch.float32)
-        return cls(frame=frame, extrinsics=extrinsics, intrinsics=intrinsics)
+        return cls.from_trusted(
+            frame=frame, extrinsics=extrinsics, intrinsics=intrinsics
+        )
 
     @classmethod
     def from_nc_data_list(cls, nc_data_list: list[NCData]) -> "BatchedDepthData":
@@ -295,33 +317,31 @@ class BatchedDepthData(BatchedNCData):
         frames = []
         extrinsics_list = []
         intrinsics_list = []
+        no_extrinsics = np.zeros((4, 4), dtype=np.float32)
+        no_intrinsics = np.zeros((3, 3), dtype=np.float32)
 
         for nc in nc_data_list:
             depth_data: DepthCameraData = cast(DepthCameraData, nc)
             # (H, W) -> (1, H, W)
-            frame = np.array(depth_data.frame)
+            frame = np.asarray(depth_data.load_frame())
             frames.append(frame[np.newaxis, ...])
             if depth_data.extrinsics is not None:
                 extrinsics_list.append(depth_data.extrinsics)
             else:
-                extrinsics_list.append(np.zeros((4, 4), dtype=np.float32))
+                extrinsics_list.append(no_extrinsics)
             if depth_data.intrinsics is not None:
                 intrinsics_list.append(depth_data.intrinsics)
             else:
-                intrinsics_list.append(np.zeros((3, 3), dtype=np.float32))
+                intrinsics_list.append(no_intrinsics)
 
         # Shape: (1, T, 1, H, W)
         frame_tensor = torch.tensor(np.stack(frames), dtype=torch.float32).unsqueeze(0)
         # Shape: (1, T, 4, 4)
-        extrinsics_tensor = torch.tensor(
-            np.stack(extrinsics_list), dtype=torch.float32
-        ).unsqueeze(0)
+        extrinsics_tensor = cls._stack_frames(extrinsics_list)
         # Shape: (1, T, 3, 3)
-        intrinsics_tensor = torch.tensor(
-            np.stack(intrinsics_list), dtype=torch.float32
-        ).unsqueeze(0)
+        intrinsics_tensor = cls._stack_frames(intrinsics_list)
 
-        return cls(
+        return cls.from_trusted(
             frame=frame_tensor,
             extrinsics=extrinsics_tensor,
             intrinsics=intrinsics_tensor,
@@ -367,3 +387,21 @@ class BatchedDepthData(BatchedNCData):
                 reshaped, size=(224, 224), mode="bilinear", align_corners=False
             )
             self.frame = resized.reshape(batch_size, time_steps, channels, 224, 224)
+
+    def _statistics_values(self) -> dict[str, torch.Tensor | None]:
+        """Values to compute statistics over, keyed by stats field name."""
+        # (B, T, 1, H, W) -> (B * T, H, W) to match unbatched frames
+        return {
+            "frame": self.frame.reshape(-1, *self.frame.shape[-2:]),
+            "extrinsics": self.extrinsics.reshape(-1, 4, 4),
+            "intrinsics": self.intrinsics.reshape(-1, 3, 3),
+        }
+
+    def calculate_statistics(self) -> CameraDataStats:
+        """Calculate statistics over the batch and time dimensions.
+
+        Returns:
+            CameraDataStats: Statistics matching those of the unbatched
+                data type.
+        """
+        return cast(CameraDataStats, self._calculate_statistics(CameraDataStats))
@@ -6,6 +6,7 @@ import torch
 from pydantic import ConfigDict, Field, field_serializer, field_validator
 
 from neuracore_types.batched_nc_data.batched_nc_data import BatchedNCData
+from neuracore_types.nc_data.custom_1d_data import Custom1DDataStats
 from neuracore_types.nc_data.nc_data import NCData
 from neuracore_types.utils.pydantic_to_ts import (
     REQUIRED_WITH_DEFAULT_FLAG,
@@ -52,7 +53,7 @@ class BatchedCustom1DData(BatchedNCData):
             .unsqueeze(0)
             .unsqueeze(0)
         )
-        return cls(data=data)
+        return cls.from_trusted(data=data)
 
     @classmethod
     def from_nc_data_list(cls, nc_data_list: list[NCData]) -> "BatchedCustom1DData":
@@ -69,7 +70,7 @@ class BatchedCustom1DData(BatchedNCData):
         data_list = [cast(Custom1DData, nc).data for nc in nc_data_list]
         # Shape: (1, T, N)
         data_tensor = torch.tensor(data_list, dtype=torch.float32).unsqueeze(0)
-        return cls(data=data_tensor)
+        return cls.from_trusted(data=data_tensor)
 
     @classmethod
     def sample(cls, batch_size: int = 1, time_steps: int = 1) -> "BatchedCustom1DData":
@@ -83,3 +84,16 @@ class BatchedCustom1DData(BatchedNCData):
             BatchedCustom1DData: Sampled BatchedCustom1DData instance
         """
         return cls(data=torch.zeros((batch_size, time_steps, 10), dtype=torch.float32))
+
+    def _statistics_values(self) -> dict[str, torch.Tensor | None]:
+        """Values to compute statistics over, keyed by stats field name."""
+        return {"data": self.data.reshape(-1, self.data.shape[-1])}
+
+    def calculate_statistics(self) -> Custom1DDataStats:
+        """Calculate statistics over the batch and time dimensions.
+
+        Returns:
+            Custom1DDataStats: Statistics matching those of the unbatched
+                data type.
+        """
+        return cast(Custom1DDataStats, self._calculate_statistics(Custom1DDataStats))
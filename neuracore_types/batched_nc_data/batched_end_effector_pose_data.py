@@ -6,6 +6,7 @@ import torch
 from pydantic import ConfigDict, Field, field_serializer, field_validator
 
 from neuracore_types.batched_nc_data.batched_nc_data import BatchedNCData
+from neuracore_types.nc_data.end_effector_pose_data import EndEffectorPoseDataStats
 from neuracore_types.nc_data.nc_data import NCData
 from neuracore_types.utils.pydantic_to_ts import (
     REQUIRED_WITH_DEFAULT_FLAG,
@@ -53,7 +54,7 @@ class BatchedEndEffectorPoseData(BatchedNCData):
             .unsqueeze(0)
             .unsqueeze(0)
         )
-        return cls(pose=pose)
+        return cls.from_trusted(pose=pose)
 
     @classmethod
     def from_nc_data_list(
@@ -72,7 +73,7 @@ class BatchedEndEffectorPoseData(BatchedNCData):
         poses = [cast(EndEffectorPoseData, nc).pose for nc in nc_data_list]
         # Shape: (1, T, 7)
         pose_tensor = torch.tensor(poses, dtype=torch.float32).unsqueeze(0)
-        return cls(pose=pose_tensor)
+        return cls.from_trusted(pose=pose_tensor)
 
     @classmethod
     def sample(
@@ -88,3 +89,19 @@ class BatchedEndEffectorPoseData(BatchedNCData):
             BatchedEndEffectorPoseData: Sampled BatchedEndEffectorPoseData instance
         """
         return cls(pose=torch.zeros((batch_size, time_steps, 7), dtype=torch.float32))
+
+    def _statistics_values(self) -> dict[str, torch.Tensor | None]:
+        """Values to compute statistics over, keyed by stats field name."""
+        return {"pose": self.pose.reshape(-1, 7)}
+
+    def calculate_statistics(self) -> EndEffectorPoseDataStats:
+        """Calculate statistics over the batch and time dimensions.
+
+        Returns:
+            EndEffectorPoseDataStats: Statistics matching those of the unbatched
+                data type.
+        """
+        return cast(
+            EndEffectorPoseDataStats,
+            self._calculate_statistics(EndEffectorPoseDataStats),
+        )
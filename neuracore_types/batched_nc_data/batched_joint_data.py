@@ -6,6 +6,7 @@ import torch
 from pydantic import ConfigDict, Field, field_serializer, field_validator
 
 from neuracore_types.batched_nc_data.batched_nc_data import BatchedNCData
+from neuracore_types.nc_data.joint_data import JointDataStats
 from neuracore_types.nc_data.nc_data import NCData
 from neuracore_types.utils.pydantic_to_ts import (
     REQUIRED_WITH_DEFAULT_FLAG,
@@ -52,7 +53,7 @@ class BatchedJointData(BatchedNCData):
             .unsqueeze(0)
             .unsqueeze(0)
         )
-        return cls(value=value)
+        return cls.from_trusted(value=value)
 
     @classmethod
     def from_nc_data_list(cls, nc_data_list: list[NCData]) -> "BatchedJointData":
@@ -71,7 +72,7 @@ class BatchedJointData(BatchedNCData):
         value_tensor = (
             torch.tensor(values, dtype=torch.float32).unsqueeze(0).unsqueeze(-1)
         )
-        return cls(value=value_tensor)
+        return cls.from_trusted(value=value_tensor)
 
     @classmethod
     def sample(cls, batch_size: int = 1, time_steps: int = 1) -> "BatchedJointData":
@@ -85,3 +86,16 @@ class BatchedJointData(BatchedNCData):
             BatchedJointData: Sampled BatchedJointData instance
         """
         return cls(value=torch.zeros((batch_size, time_steps, 1), dtype=torch.float32))
+
+    def _statistics_values(self) -> dict[str, torch.Tensor | None]:
+        """Values to compute statistics over, keyed by stats field name."""
+        return {"value": self.value.reshape(-1, 1)}
+
+    def calculate_statistics(self) -> JointDataStats:
+        """Calculate statistics over the batch and time dimensions.
+
+        Returns:
+            JointDataStats: Statistics matching those of the unbatched
+                data type.
+        """
+        return cast(JointDataStats, self._calculate_statistics(JointDataStats))
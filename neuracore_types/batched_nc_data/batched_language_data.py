@@ -7,7 +7,7 @@ import torch
 from pydantic import ConfigDict, Field, field_serializer, field_validator
 
 from neuracore_types.batched_nc_data.batched_nc_data import BatchedNCData
-from neuracore_types.nc_data.language_data import LanguageData
+from neuracore_types.nc_data.language_data import LanguageData, LanguageDataStats
 from neuracore_types.nc_data.nc_data import NCData
 from neuracore_types.utils.pydantic_to_ts import (
     REQUIRED_WITH_DEFAULT_FLAG,
@@ -90,7 +90,7 @@ class BatchedLanguageData(BatchedNCData):
         input_ids = tokens["input_ids"]
         attention_mask = tokens["attention_mask"]
         # Add T dimension
-        return cls(
+        return cls.from_trusted(
             input_ids=input_ids.unsqueeze(1),  # (1, L) -> (1, 1, L)
             attention_mask=attention_mask.unsqueeze(1),  # (1, L) -> (1, 1, L)
         )
@@ -118,7 +118,7 @@ class BatchedLanguageData(BatchedNCData):
         input_ids_tensor = torch.cat(input_ids_list, dim=0).unsqueeze(0)
         attention_mask_tensor = torch.cat(attention_mask_list, dim=0).unsqueeze(0)
 
-        return cls(
+        return cls.from_trusted(
             input_ids=input_ids_tensor,
             attention_mask=attention_mask_tensor,
         )
@@ -145,3 +145,17 @@ class BatchedLanguageData(BatchedNCData):
                 batch_size, time_steps, 1
             ),  # (1, L) -> (B, T, L)
         )
+
+    def _statistics_values(self) -> dict[str, torch.Tensor | None]:
+        """Values to compute statistics over, keyed by stats field name."""
+        # Token ids have no meaningful numeric statistics
+        return {}
+
+    def calculate_statistics(self) -> LanguageDataStats:
+        """Calculate statistics over the batch and time dimensions.
+
+        Returns:
+            LanguageDataStats: Statistics matching those of the unbatched
+                data type.
+        """
+        return cast(LanguageDataStats, self._calculate_statistics(LanguageDataStats))
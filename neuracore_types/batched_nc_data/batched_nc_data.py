@@ -1,15 +1,25 @@
 """Base classes for Neuracore data types."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 
+import numpy as np
 import torch
 from pydantic import BaseModel, ConfigDict
 
-from neuracore_types.nc_data.nc_data import NCData
+from neuracore_types.nc_data.nc_data import (
+    DataItemStats,
+    DataItemStatsAccumulator,
+    NCData,
+    NCDataStats,
+    QuantileSketch,
+)
+from neuracore_types.utils.trusted_construction import TrustedConstructionMixin
 
+STATS_QUANTILES = (0.01, 0.99)
 
-class BatchedNCData(BaseModel):
+
+class BatchedNCData(TrustedConstructionMixin, BaseModel):
     """Base class for batched Neuracore data."""
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -47,6 +57,29 @@ class BatchedNCData(BaseModel):
             "from_nc_data_list method must be implemented in subclasses."
         )
 
+    @staticmethod
+    def _stack_frames(arrays: Sequence[np.ndarray]) -> torch.Tensor:
+        """Stack per-frame arrays into a float32 tensor of shape ``(1, T, ...)``.
+
+        Frames referring to the same array, like a ``StaticCalibration``, are
+        converted once and repeated along time. The result owns its memory,
+        so it can be written in place.
+        """
+        first = arrays[0]
+        if all(array is first for array in arrays):
+            return (
+                torch.tensor(first, dtype=torch.float32)
+                .expand(len(arrays), *np.shape(first))
+                .clone()
+                .unsqueeze(0)
+            )
+        return torch.tensor(np.stack(arrays), dtype=torch.float32).unsqueeze(0)
+
+    @staticmethod
+    def _is_repeated(values: torch.Tensor) -> bool:
+        """Whether every sample of ``values`` is a view of the same memory."""
+        return values.shape[0] > 1 and values.stride(0) == 0
+
     def transform_nc_data(self) -> None:
         """Apply in-place transformations, e.g. reshaping, reordering dimensions, etc.
 
@@ -68,6 +101,153 @@ class BatchedNCData(BaseModel):
         """Sample an example instance of BatchedNCData."""
         raise NotImplementedError("sample method must be implemented in subclasses.")
 
+    def _statistics_values(self) -> dict[str, torch.Tensor | None]:
+        """Values to compute statistics over, keyed by stats field name.
+
+        Each tensor has shape ``(N, ...)``, with all samples (batch, time and,
+        where relevant, points) flattened into the first axis, and the
+        remaining axes laid out as in the corresponding NCData statistics.
+        """
+        raise NotImplementedError(
+            "_statistics_values method must be implemented in subclasses."
+        )
+
+    def calculate_statistics(self) -> NCDataStats:
+        """Calculate statistics over the batch and time dimensions.
+
+        Returns the same statistics type as ``NCData.calculate_statistics``,
+        reduced with tensor operations instead of per-item Python loops.
+        """
+        raise NotImplementedError(
+            "calculate_statistics method must be implemented in subclasses."
+        )
+
+    def _calculate_statistics(self, stats_class: type[NCDataStats]) -> NCDataStats:
+        """Build ``stats_class`` from the values of ``_statistics_values``."""
+        stats = {
+            name: self._tensor_statistics(values)
+            for name, values in self._statistics_values().items()
+            if values is not None
+        }
+        return stats_class(**{
+            name: stats.get(name, DataItemStats())
+            for name in stats_class.data_item_stats_fields()
+        })
+
+    def accumulate_statistics(
+        self, accumulators: dict[str, DataItemStatsAccumulator] | None = None
+    ) -> dict[str, DataItemStatsAccumulator]:
+        """Merge the values of this batch into statistics accumulators.
+
+        Moments are reduced on the tensors' device; quantile sketches are only
+        built for one-dimensional features.
+
+        Args:
+            accumulators: Accumulators to merge into, keyed by stats field
+                name. A new mapping is created if omitted.
+
+        Returns:
+            Mapping of stats field name to the updated accumulator.
+        """
+        accumulators = {} if accumulators is None else accumulators
+        for name, values in self._statistics_values().items():
+            if values is None or values.shape[0] == 0:
+                continue
+            count = values.shape[0]
+            if self._is_repeated(values) and values.ndim > 2:
+                # Expanded from a single sample, e.g. a static calibration
+                value = values[0].to(self._reduction_dtype(values))
+                total, m2 = value * count, torch.zeros_like(value)
+                low = high = value
+            else:
+                values = values.to(self._reduction_dtype(values))
+                total = values.sum(dim=0)
+                m2 = (values - total / count).square().sum(dim=0)
+                low, high = values.amin(dim=0), values.amax(dim=0)
+            sketch = None
+            if values.ndim <= 2:
+                sketch = QuantileSketch.from_values(
+                    values.reshape(count, -1).cpu().numpy()
+                )
+            batch_accumulator = DataItemStatsAccumulator.model_construct(
+                count=count,
+                sum=self._to_numpy(total, np.float64),
+                m2=self._to_numpy(m2, np.float64),
+                min=self._to_numpy(low, np.float64),
+                max=self._to_numpy(high, np.float64),
+                sketch=sketch,
+            )
+            accumulators[name] = accumulators.get(
+                name, DataItemStatsAccumulator()
+            ).merge(batch_accumulator)
+        return accumulators
+
+    @staticmethod
+    def _reduction_dtype(values: torch.Tensor) -> torch.dtype:
+        """Floating point dtype to reduce ``values`` in."""
+        # MPS has no float64 support
+        return torch.float32 if values.device.type == "mps" else torch.float64
+
+    @staticmethod
+    def _to_numpy(values: torch.Tensor, dtype: Any) -> np.ndarray:
+        """Move a tensor to host memory as a NumPy array of ``dtype``."""
+        return values.detach().cpu().numpy().astype(dtype)
+
+    @classmethod
+    def _tensor_statistics(cls, values: torch.Tensor) -> DataItemStats:
+        """Compute ``DataItemStats`` over the first axis of ``values``.
+
+        Quantiles are only computed for one-dimensional features, matching the
+        per-item statistics of image and matrix data which leave them empty.
+        """
+        count = values.shape[0]
+        if count == 0:
+            return DataItemStats()
+        if cls._is_repeated(values):
+            # Expanded from a single sample, e.g. a static calibration
+            stats = cls._tensor_statistics(values[:1])
+            stats.count = np.full_like(stats.count, count)
+            return stats
+        values = values.to(cls._reduction_dtype(values))
+        q01 = q99 = np.array([])
+        if values.ndim <= 2:
+            q01, q99 = (
+                cls._to_numpy(quantile, np.float32)
+                for quantile in cls._quantiles(values, STATS_QUANTILES)
+            )
+        num_counts = values.shape[1] if values.ndim == 2 else 1
+        return DataItemStats(
+            mean=cls._to_numpy(values.mean(dim=0), np.float32),
+            std=cls._to_numpy(values.std(dim=0, correction=0), np.float32),
+            count=np.full((num_counts,), count, dtype=np.int64),
+            min=cls._to_numpy(values.amin(dim=0), np.float32),
+            max=cls._to_numpy(values.amax(dim=0), np.float32),
+            q01=q01,
+            q99=q99,
+        )
+
+    @staticmethod
+    def _quantiles(
+        values: torch.Tensor, quantiles: tuple[float, ...]
+    ) -> list[torch.Tensor]:
+        """Quantiles along the first axis with linear interpolation.
+
+        Equivalent to ``np.quantile(values, q, axis=0)`` but sorts once for all
+        quantiles and has no input size limit, unlike ``torch.quantile``.
+        """
+        sorted_values = values.sort(dim=0).values
+        last = values.shape[0] - 1
+        result = []
+        for q in quantiles:
+            position = q * last
+            lower = int(np.floor(position))
+            upper = min(lower + 1, last)
+            weight = position - lower
+            result.append(
+                torch.lerp(sorted_values[lower], sorted_values[upper], weight)
+            )
+        return result
+
     @staticmethod
     def _create_tensor_handlers(
         field_name: str,
@@ -7,6 +7,9 @@ from pydantic import ConfigDict, Field, field_serializer, field_validator
 
 from neuracore_types.batched_nc_data.batched_nc_data import BatchedNCData
 from neuracore_types.nc_data.nc_data import NCData
+from neuracore_types.nc_data.parallel_gripper_open_amount_data import (
+    ParallelGripperOpenAmountDataStats,
+)
 from neuracore_types.utils.pydantic_to_ts import (
     REQUIRED_WITH_DEFAULT_FLAG,
     fix_required_with_defaults,
@@ -57,7 +60,7 @@ class BatchedParallelGripperOpenAmountData(BatchedNCData):
             .unsqueeze(0)
             .unsqueeze(0)
         )
-        return cls(open_amount=open_amount)
+        return cls.from_trusted(open_amount=open_amount)
 
     @classmethod
     def from_nc_data_list(
@@ -82,7 +85,7 @@ class BatchedParallelGripperOpenAmountData(BatchedNCData):
         open_amount_tensor = (
             torch.tensor(open_amounts, dtype=torch.float32).unsqueeze(0).unsqueeze(-1)
         )
-        return cls(open_amount=open_amount_tensor)
+        return cls.from_trusted(open_amount=open_amount_tensor)
 
     @classmethod
     def sample(
@@ -100,3 +103,19 @@ class BatchedParallelGripperOpenAmountData(BatchedNCData):
         return cls(
             open_amount=torch.zeros((batch_size, time_steps, 1), dtype=torch.float32)
         )
+
+    def _statistics_values(self) -> dict[str, torch.Tensor | None]:
+        """Values to compute statistics over, keyed by stats field name."""
+        return {"open_amount": self.open_amount.reshape(-1, 1)}
+
+    def calculate_statistics(self) -> ParallelGripperOpenAmountDataStats:
+        """Calculate statistics over the batch and time dimensions.
+
+        Returns:
+            ParallelGripperOpenAmountDataStats: Statistics matching those of
+                the unbatched data type.
+        """
+        return cast(
+            ParallelGripperOpenAmountDataStats,
+            self._calculate_statistics(ParallelGripperOpenAmountDataStats),
+        )
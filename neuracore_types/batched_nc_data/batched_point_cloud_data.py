@@ -7,6 +7,7 @@ from pydantic import ConfigDict, Field, field_serializer, field_validator
 
 from neuracore_types.batched_nc_data.batched_nc_data import BatchedNCData
 from neuracore_types.nc_data.nc_data import NCData
+from neuracore_types.nc_data.point_cloud_data import PointCloudDataStats
 from neuracore_types.utils.pydantic_to_ts import (
     REQUIRED_WITH_DEFAULT_FLAG,
     fix_required_with_defaults,
@@ -116,7 +117,7 @@ class BatchedPointCloudData(BatchedNCData):
                 .unsqueeze(0)
             )
 
-        return cls(
+        return cls.from_trusted(
             points=points,
             rgb_points=rgb_points,
             extrinsics=extrinsics,
@@ -173,17 +174,13 @@ class BatchedPointCloudData(BatchedNCData):
 
         extrinsics_tensor = None
         if has_extrinsics and len(extrinsics_list) == len(nc_data_list):
-            extrinsics_tensor = torch.tensor(
-                np.stack(extrinsics_list), dtype=torch.float32
-            ).unsqueeze(0)
+            extrinsics_tensor = cls._stack_frames(extrinsics_list)
 
         intrinsics_tensor = None
         if has_intrinsics and len(intrinsics_list) == len(nc_data_list):
-            intrinsics_tensor = torch.tensor(
-                np.stack(intrinsics_list), dtype=torch.float32
-            ).unsqueeze(0)
+            intrinsics_tensor = cls._stack_frames(intrinsics_list)
 
-        return cls(
+        return cls.from_trusted(
             points=points_tensor,
             rgb_points=rgb_points_tensor,
             extrinsics=extrinsics_tensor,
@@ -203,3 +200,36 @@ class BatchedPointCloudData(BatchedNCData):
             extrinsics=torch.zeros((batch_size, time_steps, 4, 4), dtype=torch.float32),
             intrinsics=torch.zeros((batch_size, time_steps, 3, 3), dtype=torch.float32),
         )
+
+    def _statistics_values(self) -> dict[str, torch.Tensor | None]:
+        """Values to compute statistics over, keyed by stats field name."""
+        # (B, T, 3, N) -> (B * T * N, 3), as unbatched stats reduce over points
+        return {
+            "points": self.points.transpose(-1, -2).reshape(-1, 3),
+            "rgb_points": (
+                self.rgb_points.transpose(-1, -2).reshape(-1, 3)
+                if self.rgb_points is not None
+                else None
+            ),
+            "extrinsics": (
+                self.extrinsics.reshape(-1, 4, 4)
+                if self.extrinsics is not None
+                else None
+            ),
+            "intrinsics": (
+                self.intrinsics.reshape(-1, 3, 3)
+                if self.intrinsics is not None
+                else None
+            ),
+        }
+
+    def calculate_statistics(self) -> PointCloudDataStats:
+        """Calculate statistics over the batch and time dimensions.
+
+        Returns:
+            PointCloudDataStats: Statistics matching those of the unbatched
+                data type.
+        """
+        return cast(
+            PointCloudDataStats, self._calculate_statistics(PointCloudDataStats)
+        )
@@ -7,6 +7,7 @@ from pydantic import ConfigDict, Field, field_serializer, field_validator
 
 from neuracore_types.batched_nc_data.batched_nc_data import BatchedNCData
 from neuracore_types.nc_data.nc_data import NCData
+from neuracore_types.nc_data.pose_data import PoseDataStats
 from neuracore_types.utils.pydantic_to_ts import (
     REQUIRED_WITH_DEFAULT_FLAG,
     fix_required_with_defaults,
@@ -50,7 +51,7 @@ class BatchedPoseData(BatchedNCData):
         pose = (
             torch.tensor(pose_data.pose, dtype=torch.float32).unsqueeze(0).unsqueeze(0)
         )
-        return cls(pose=pose)
+        return cls.from_trusted(pose=pose)
 
     @classmethod
     def from_nc_data_list(cls, nc_data_list: list[NCData]) -> "BatchedPoseData":
@@ -67,7 +68,7 @@ class BatchedPoseData(BatchedNCData):
         poses = [cast(PoseData, nc).pose for nc in nc_data_list]
         # Shape: (1, T, 7)
         pose_tensor = torch.tensor(poses, dtype=torch.float32).unsqueeze(0)
-        return cls(pose=pose_tensor)
+        return cls.from_trusted(pose=pose_tensor)
 
     @classmethod
     def sample(cls, batch_size: int = 1, time_steps: int = 1) -> "BatchedPoseData":
@@ -81,3 +82,16 @@ class BatchedPoseData(BatchedNCData):
             BatchedPoseData: Sampled BatchedPoseData instance
         """
         return cls(pose=torch.zeros((batch_size, time_steps, 7), dtype=torch.float32))
+
+    def _statistics_values(self) -> dict[str, torch.Tensor | None]:
+        """Values to compute statistics over, keyed by stats field name."""
+        return {"pose": self.pose.reshape(-1, 7)}
+
+    def calculate_statistics(self) -> PoseDataStats:
+        """Calculate statistics over the batch and time dimensions.
+
+        Returns:
+            PoseDataStats: Statistics matching those of the unbatched
+                data type.
+        """
+        return cast(PoseDataStats, self._calculate_statistics(PoseDataStats))
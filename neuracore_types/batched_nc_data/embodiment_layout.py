@@ -0,0 +1,215 @@
+"""Padded batch layout shared by the robots of a cross-embodiment description.
+
+Robots of a ``CrossEmbodimentDescription`` have different sensors, e.g. 6 or
+7 arm joints, so their batches do not have the same shape. The layout gives
+every data type a fixed number of slots, the slot of a sensor being its
+index in the robot's embodiment description, and records which slots each
+robot fills:
+
+- ``slots``: the slot of every sensor of the robot, in index order, used as
+  scatter indices into padded tensors;
+- ``mask``: which slots the robot fills.
+
+Both are computed once per robot, so batching episodes of any mix of
+robots stacks the sensors of each episode and scatters them into
+zero-padded ``(B, S, T, ...)`` tensors with one indexing operation per
+field, as cheaply as batching a single robot.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import NamedTuple
+
+import torch
+
+from neuracore_types.batched_nc_data.batched_nc_data import BatchedNCData
+from neuracore_types.episode.episode import (
+    CrossEmbodimentDescription,
+    SynchronizedEpisode,
+)
+from neuracore_types.nc_data import DataType
+from neuracore_types.nc_data.nc_data import NCData
+
+
+class RobotSlots(NamedTuple):
+    """Slots filled by the sensors of one robot for one data type."""
+
+    names: tuple[str, ...]  # Sensor names, in index order
+    slots: torch.Tensor  # (len(names),) int64 slot of each sensor
+    mask: torch.Tensor  # (S,) bool, True for the slots of the robot
+
+
+@dataclass(frozen=True)
+class PaddedBatch:
+    """Batch of episodes of several robots in a cross-embodiment layout.
+
+    Attributes:
+        data: Per data type, one ``BatchedNCData`` of shape ``(B, T, ...)``
+            per slot. Slots a robot does not fill hold zeros.
+        masks: Per data type, ``(B, S)`` bool tensors of the slots filled by
+            the robot of each episode.
+        robot_ids: Robot ID of each episode.
+    """
+
+    data: dict[DataType, list[BatchedNCData]]
+    masks: dict[DataType, torch.Tensor]
+    robot_ids: list[str]
+
+
+class CrossEmbodimentLayout:
+    """Fixed slot positions of the sensors of every robot, per data type."""
+
+    def __init__(self, cross_embodiment_description: CrossEmbodimentDescription):
+        """Compile a cross-embodiment description.
+
+        Args:
+            cross_embodiment_description: Mapping of
+                `robot_id -> DataType -> {index: sensor_name}`. The index of a
+                sensor is its slot.
+
+        Raises:
+            ValueError: If an index is negative.
+        """
+        self.cross_embodiment_description = cross_embodiment_description
+        self.num_slots: dict[DataType, int] = {}
+        for embodiment_description in cross_embodiment_description.values():
+            for data_type, indexed_names in embodiment_description.items():
+                if not indexed_names:
+                    continue
+                if min(indexed_names) < 0:
+                    raise ValueError(
+                        f"Slot indices must not be negative, got {min(indexed_names)}"
+                    )
+                self.num_slots[data_type] = max(
+                    self.num_slots.get(data_type, 0), max(indexed_names) + 1
+                )
+        self.robots: dict[str, dict[DataType, RobotSlots]] = {}
+        for robot_id, embodiment_description in cross_embodiment_description.items():
+            robot_slots = {}
+            for data_type, num_slots in self.num_slots.items():
+                indexed_names = embodiment_description.get(data_type, {})
+                indices = sorted(indexed_names)
+                mask = torch.zeros(num_slots, dtype=torch.bool)
+                mask[indices] = True
+                robot_slots[data_type] = RobotSlots(
+                    names=tuple(indexed_names[index] for index in indices),
+                    slots=torch.tensor(indices, dtype=torch.int64),
+                    mask=mask,
+                )
+            self.robots[robot_id] = robot_slots
+
+    def robot_slots(self, robot_id: str) -> dict[DataType, RobotSlots]:
+        """Return the slots of a robot for every data type of the layout.
+
+        Args:
+            robot_id: ID of the robot.
+
+        Returns:
+            Slots of the robot's sensors, by data type.
+
+        Raises:
+            ValueError: If the robot is not in the layout.
+        """
+        robot_slots = self.robots.get(robot_id)
+        if robot_slots is None:
+            raise ValueError(f"Robot {robot_id} is not in the cross embodiment layout")
+        return robot_slots
+
+    def batch(self, episodes: Sequence[SynchronizedEpisode]) -> PaddedBatch:
+        """Batch episodes of any robots of the layout into padded tensors.
+
+        Args:
+            episodes: Episodes of the same length. Every observation must hold
+                every sensor of its robot's embodiment description.
+
+        Returns:
+            PaddedBatch: One ``(B, T, ...)`` ``BatchedNCData`` per slot.
+
+        Raises:
+            ValueError: If there are no episodes, they have different lengths,
+                or an episode is missing a sensor of its robot.
+        """
+        from neuracore_types.batched_nc_data import DATA_TYPE_TO_BATCHED_NC_DATA_CLASS
+
+        if not episodes:
+            raise ValueError("Cannot batch an empty list of episodes")
+        num_steps = len(episodes[0].observations)
+        if any(len(episode.observations) != num_steps for episode in episodes):
+            raise ValueError("Episodes of a batch must have the same length")
+        robot_slots = [self.robot_slots(episode.robot_id) for episode in episodes]
+        data: dict[DataType, list[BatchedNCData]] = {}
+        masks: dict[DataType, torch.Tensor] = {}
+        for data_type, num_slots in self.num_slots.items():
+            batched_class = DATA_TYPE_TO_BATCHED_NC_DATA_CLASS[data_type]
+            # Fields of every episode's sensors, stacked to (num_sensors, T, ...)
+            stacked: list[dict[str, torch.Tensor] | None] = []
+            for episode, slots in zip(episodes, robot_slots):
+                names = slots[data_type].names
+                stacked.append(
+                    _stack_sensors(episode, data_type, names, batched_class)
+                    if names
+                    else None
+                )
+            # Values of one sensor, of shape (T, ...), to shape the padding
+            first = next((fields for fields in stacked if fields), None)
+            if first is None:
+                # No robot of the batch has this data type
+                template = _tensor_fields(batched_class.sample(1, num_steps))
+            else:
+                template = {field: values[0] for field, values in first.items()}
+            padded = {
+                field: values.new_zeros((len(episodes), num_slots, *values.shape))
+                for field, values in template.items()
+            }
+            for batch_index, (fields, slots) in enumerate(zip(stacked, robot_slots)):
+                if fields is None:
+                    continue
+                for field, values in fields.items():
+                    padded[field][batch_index, slots[data_type].slots] = values
+            data[data_type] = [
+                batched_class.from_trusted(
+                    **{field: values[:, slot] for field, values in padded.items()}
+                )
+                for slot in range(num_slots)
+            ]
+            masks[data_type] = torch.stack(
+                [slots[data_type].mask for slots in robot_slots]
+            )
+        return PaddedBatch(
+            data=data,
+            masks=masks,
+            robot_ids=[episode.robot_id for episode in episodes],
+        )
+
+
+def _tensor_fields(batched: BatchedNCData) -> dict[str, torch.Tensor]:
+    """Return the tensor fields of batched data, without their batch dimension."""
+    return {
+        field: value[0] for field, value in batched if isinstance(value, torch.Tensor)
+    }
+
+
+def _stack_sensors(
+    episode: SynchronizedEpisode,
+    data_type: DataType,
+    names: tuple[str, ...],
+    batched_class: type[BatchedNCData],
+) -> dict[str, torch.Tensor]:
+    """Convert sensors of an episode and stack them to ``(num_sensors, T, ...)``."""
+    per_sensor = []
+    for name in names:
+        try:
+            nc_data_list: list[NCData] = [
+                observation.data[data_type][name]
+                for observation in episode.observations
+            ]
+        except KeyError:
+            raise ValueError(
+                f"Episode of robot {episode.robot_id} is missing sensor "
+                f"{data_type.value}/{name}"
+            ) from None
+        per_sensor.append(_tensor_fields(batched_class.from_nc_data_list(nc_data_list)))
+    return {
+        field: torch.stack([fields[field] for fields in per_sensor])
+        for field in per_sensor[0]
+    }
@@ -0,0 +1,271 @@
+"""Precompiled normalizers for batched Neuracore data."""
+
+from collections.abc import Mapping, Sequence
+from enum import Enum
+
+import numpy as np
+import torch
+
+from neuracore_types.batched_nc_data.batched_nc_data import BatchedNCData
+from neuracore_types.nc_data import DataType
+from neuracore_types.nc_data.nc_data import DataItemStats, NCDataStats
+
+DEFAULT_NORMALIZATION_EPSILON = 1e-6
+
+
+class NormalizationMode(str, Enum):
+    """How statistics are used to normalize data.
+
+    MEAN_STD: ``(x - mean) / std``.
+    MIN_MAX: Linearly map ``[min, max]`` to ``[-1, 1]``.
+    QUANTILE: Linearly map ``[q01, q99]`` to ``[-1, 1]``.
+    """
+
+    MEAN_STD = "MEAN_STD"
+    MIN_MAX = "MIN_MAX"
+    QUANTILE = "QUANTILE"
+
+
+class DataTypeNormalizer:
+    """Normalizer for all sensors of a single data type.
+
+    The statistics are converted once into device-resident ``scale`` and
+    ``shift`` tensors, so that normalizing is a single fused multiply-add
+    ``x * scale + shift`` and unnormalizing is its inverse. The spread used
+    for scaling is clamped to ``epsilon`` to avoid dividing by zero for
+    constant dimensions.
+
+    Per-sensor parameters are concatenated in the order of the statistics
+    list, so the same normalizer can be applied either to a list of
+    ``BatchedNCData`` (one per sensor) or to a tensor whose last dimension
+    holds all sensors concatenated.
+    """
+
+    def __init__(
+        self,
+        stats: Sequence[NCDataStats],
+        mode: NormalizationMode = NormalizationMode.MEAN_STD,
+        field: str | None = None,
+        epsilon: float = DEFAULT_NORMALIZATION_EPSILON,
+        device: torch.device | str | None = None,
+    ):
+        """Initialize the normalizer.
+
+        Args:
+            stats: Statistics for each sensor of the data type, in order.
+            mode: How the statistics are used to normalize data.
+            field: Name of the statistics and batched data field to normalize.
+                Defaults to the only ``DataItemStats`` field of the statistics.
+            epsilon: Minimum spread used when scaling.
+            device: Device to hold the normalization tensors on.
+
+        Raises:
+            ValueError: If no statistics are given, the field is ambiguous or
+                the statistics required by ``mode`` are missing.
+        """
+        if not stats:
+            raise ValueError("At least one set of statistics is required.")
+        self.mode = mode
+        self.field = field or self._default_field(stats[0])
+        self.epsilon = epsilon
+
+        scales, shifts = [], []
+        for sensor_stats in stats:
+            scale, shift = self._scale_and_shift(getattr(sensor_stats, self.field))
+            scales.append(scale)
+            shifts.append(shift)
+        self.sizes = [len(scale) for scale in scales]
+        self.offsets = np.cumsum([0] + self.sizes).tolist()
+
+        self.scale = torch.tensor(np.concatenate(scales), dtype=torch.float32)
+        self.shift = torch.tensor(np.concatenate(shifts), dtype=torch.float32)
+        self.inverse_scale = 1.0 / self.scale
+        self.inverse_shift = -self.shift * self.inverse_scale
+        if device is not None:
+            self.to(device)
+
+    @staticmethod
+    def _default_field(stats: NCDataStats) -> str:
+        """Return the only DataItemStats field of ``stats``."""
+        fields = stats.data_item_stats_fields()
+        if len(fields) != 1:
+            raise ValueError(
+                f"{type(stats).__name__} has statistics fields {fields}; "
+                "specify which one to normalize."
+            )
+        return fields[0]
+
+    def _scale_and_shift(self, stats: DataItemStats) -> tuple[np.ndarray, np.ndarray]:
+        """Compute ``scale`` and ``shift`` such that ``x * scale + shift``."""
+        if self.mode == NormalizationMode.MEAN_STD:
+            center = np.asarray(stats.mean, dtype=np.float64)
+            half_range = np.asarray(stats.std, dtype=np.float64)
+        else:
+            low, high = (
+                (stats.min, stats.max)
+                if self.mode == NormalizationMode.MIN_MAX
+                else (stats.q01, stats.q99)
+            )
+            low = np.asarray(low, dtype=np.float64)
+            high = np.asarray(high, dtype=np.float64)
+            center = (high + low) / 2
+            half_range = (high - low) / 2
+        if center.ndim != 1 or center.size == 0 or center.shape != half_range.shape:
+            raise ValueError(
+                f"Statistics for {self.mode.value} normalization of "
+                f"'{self.field}' must be non-empty 1D arrays."
+            )
+        scale = 1.0 / np.maximum(half_range, self.epsilon)
+        return scale, -center * scale
+
+    def to(self, device: torch.device | str) -> "DataTypeNormalizer":
+        """Move the normalization tensors to ``device``."""
+        self.scale = self.scale.to(device)
+        self.shift = self.shift.to(device)
+        self.inverse_scale = self.inverse_scale.to(device)
+        self.inverse_shift = self.inverse_shift.to(device)
+        return self
+
+    def normalize_tensor(self, x: torch.Tensor, inplace: bool = False) -> torch.Tensor:
+        """Normalize a tensor whose last dimension holds all sensors."""
+        out = x if inplace else None
+        return torch.addcmul(self.shift, x, self.scale, out=out)
+
+    def unnormalize_tensor(
+        self, x: torch.Tensor, inplace: bool = False
+    ) -> torch.Tensor:
+        """Unnormalize a tensor whose last dimension holds all sensors."""
+        out = x if inplace else None
+        return torch.addcmul(self.inverse_shift, x, self.inverse_scale, out=out)
+
+    def normalize(self, batched_data: Sequence[BatchedNCData]) -> None:
+        """Normalize batched data of every sensor in place."""
+        self._apply(batched_data, self.scale, self.shift)
+
+    def unnormalize(self, batched_data: Sequence[BatchedNCData]) -> None:
+        """Unnormalize batched data of every sensor in place."""
+        self._apply(batched_data, self.inverse_scale, self.inverse_shift)
+
+    def _apply(
+        self,
+        batched_data: Sequence[BatchedNCData],
+        scale: torch.Tensor,
+        shift: torch.Tensor,
+    ) -> None:
+        """Apply ``x * scale + shift`` to each sensor's field in place."""
+        if len(batched_data) != len(self.sizes):
+            raise ValueError(
+                f"Expected data for {len(self.sizes)} sensors, "
+                f"got {len(batched_data)}."
+            )
+        for i, data in enumerate(batched_data):
+            start, end = self.offsets[i], self.offsets[i + 1]
+            tensor = getattr(data, self.field)
+            torch.addcmul(shift[start:end], tensor, scale[start:end], out=tensor)
+
+
+class Normalizer:
+    """Normalizers for every data type of a model, built once from statistics.
+
+    Example:
+        normalizer = Normalizer.from_dataset_statistics(
+            model_init_description.input_dataset_statistics, device=device
+        )
+        normalizer.normalize({DataType.JOINT_POSITIONS: batched_joints})
+    """
+
+    def __init__(self, normalizers: Mapping[DataType, DataTypeNormalizer]):
+        """Initialize the normalizer.
+
+        Args:
+            normalizers: Normalizer for each data type.
+        """
+        self.normalizers = dict(normalizers)
+
+    @classmethod
+    def from_dataset_statistics(
+        cls,
+        dataset_statistics: Mapping[DataType, Sequence[NCDataStats]],
+        mode: NormalizationMode = NormalizationMode.MEAN_STD,
+        data_types: Sequence[DataType] | None = None,
+        fields: Mapping[DataType, str] | None = None,
+        epsilon: float = DEFAULT_NORMALIZATION_EPSILON,
+        device: torch.device | str | None = None,
+    ) -> "Normalizer":
+        """Build normalizers from per data type statistics.
+
+        Args:
+            dataset_statistics: Statistics for each data type and sensor, as in
+                ``ModelInitDescription.input_dataset_statistics``.
+            mode: How the statistics are used to normalize data.
+            data_types: Data types to normalize. Defaults to every data type
+                in ``dataset_statistics`` whose statistics field to normalize
+                is unambiguous and holds non-empty 1D arrays, e.g. joints and
+                poses but not cameras, point clouds or language.
+            fields: Name of the field to normalize for data types whose
+                statistics have several ``DataItemStats`` fields.
+            epsilon: Minimum spread used when scaling.
+            device: Device to hold the normalization tensors on.
+
+        Returns:
+            Normalizer: Normalizer for the requested data types.
+
+        Raises:
+            ValueError: If a requested data type cannot be normalized.
+        """
+        fields = fields or {}
+        if data_types is None:
+            data_types = [
+                data_type
+                for data_type, stats in dataset_statistics.items()
+                if cls._has_vector_statistics(stats, fields.get(data_type))
+            ]
+        return cls({
+            data_type: DataTypeNormalizer(
+                dataset_statistics[data_type],
+                mode=mode,
+                field=fields.get(data_type),
+                epsilon=epsilon,
+                device=device,
+            )
+            for data_type in data_types
+        })
+
+    @staticmethod
+    def _has_vector_statistics(stats: Sequence[NCDataStats], field: str | None) -> bool:
+        """Whether every sensor has non-empty 1D statistics to normalize."""
+        if not stats:
+            return False
+        names = [field] if field else stats[0].data_item_stats_fields()
+        if len(names) != 1:
+            return False
+        means = [
+            np.asarray(getattr(sensor_stats, names[0]).mean) for sensor_stats in stats
+        ]
+        return all(mean.ndim == 1 and mean.size > 0 for mean in means)
+
+    def __getitem__(self, data_type: DataType) -> DataTypeNormalizer:
+        """Get the normalizer of a data type."""
+        return self.normalizers[data_type]
+
+    def __contains__(self, data_type: object) -> bool:
+        """Whether a normalizer exists for a data type."""
+        return data_type in self.normalizers
+
+    def to(self, device: torch.device | str) -> "Normalizer":
+        """Move all normalization tensors to ``device``."""
+        for normalizer in self.normalizers.values():
+            normalizer.to(device)
+        return self
+
+    def normalize(self, batch: Mapping[DataType, Sequence[BatchedNCData]]) -> None:
+        """Normalize every data type with a normalizer in place."""
+        for data_type, batched_data in batch.items():
+            if data_type in self.normalizers:
+                self.normalizers[data_type].normalize(batched_data)
+
+    def unnormalize(self, batch: Mapping[DataType, Sequence[BatchedNCData]]) -> None:
+        """Unnormalize every data type with a normalizer in place."""
+        for data_type, batched_data in batch.items():
+            if data_type in self.normalizers:
+                self.normalizers[data_type].unnormalize(batched_data)
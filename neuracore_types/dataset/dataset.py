@@ -4,8 +4,16 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from neuracore_types.episode.episode import CrossEmbodimentDescription
-from neuracore_types.nc_data import DataType, NCDataStatsUnion
+from neuracore_types.episode.episode import (
+    CrossEmbodimentDescription,
+    EpisodeStatistics,
+)
+from neuracore_types.nc_data import (
+    DATA_TYPE_TO_NC_DATA_STATS_CLASS,
+    DataItemStatsAccumulator,
+    DataType,
+    NCDataStatsUnion,
+)
 from neuracore_types.utils.pydantic_to_ts import (
     REQUIRED_WITH_DEFAULT_FLAG,
     fix_required_with_defaults,
@@ -81,6 +89,9 @@ class SynchronizedDatasetStatistics(BaseModel):
         synchronized_dataset_id: Unique identifier for the synced dataset.
         cross_embodiment_description: Mapping of robot IDs to data type names.
         dataset_statistics: Statistics for each robot and data type.
+        data_accumulators: Mergeable statistics for each robot, data type,
+            sensor name and stats field, used to update `dataset_statistics`
+            incrementally as episodes are added or removed.
     """
 
     synchronized_dataset_id: str
@@ -89,8 +100,108 @@ class SynchronizedDatasetStatistics(BaseModel):
     dataset_statistics: dict[str, dict[DataType, list[NCDataStatsUnion]]] = Field(
         default_factory=dict, json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG
     )
+    data_accumulators: dict[
+        str, dict[DataType, dict[str, dict[str, DataItemStatsAccumulator]]]
+    ] = Field(default_factory=dict, json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG)
     model_config = ConfigDict(json_schema_extra=fix_required_with_defaults)
 
+    def add_episode_statistics(
+        self, robot_id: str, episode_statistics: EpisodeStatistics
+    ) -> None:
+        """Merge the contribution of an episode into the dataset statistics.
+
+        Only the statistics of the data types present in the episode are
+        recomputed, so the cost is proportional to the added data rather than
+        to the size of the dataset.
+
+        Args:
+            robot_id: Robot that recorded the episode.
+            episode_statistics: Statistics of the episode, with
+                `data_accumulators` populated.
+        """
+        self._update_episode_statistics(robot_id, episode_statistics, remove=False)
+
+    def remove_episode_statistics(
+        self, robot_id: str, episode_statistics: EpisodeStatistics
+    ) -> None:
+        """Remove the contribution of a previously added episode.
+
+        Args:
+            robot_id: Robot that recorded the episode.
+            episode_statistics: Statistics that were previously passed to
+                `add_episode_statistics`.
+
+        Raises:
+            ValueError: If the episode holds data that was never added.
+        """
+        self._update_episode_statistics(robot_id, episode_statistics, remove=True)
+
+    def _update_episode_statistics(
+        self, robot_id: str, episode_statistics: EpisodeStatistics, remove: bool
+    ) -> None:
+        """Add or remove episode accumulators and refresh affected statistics."""
+        robot_accumulators = self.data_accumulators.get(robot_id, {})
+        # Compute every update before applying any, so a failed removal leaves
+        # the statistics untouched.
+        updates: dict[DataType, dict[str, dict[str, DataItemStatsAccumulator]]] = {}
+        for data_type, sensors in episode_statistics.data_accumulators.items():
+            type_accumulators = robot_accumulators.get(data_type, {})
+            for name, fields in sensors.items():
+                if remove and name not in type_accumulators:
+                    raise ValueError(
+                        f"No statistics for {data_type.value} sensor '{name}' "
+                        f"of robot '{robot_id}' to remove."
+                    )
+                sensor_accumulators = dict(type_accumulators.get(name, {}))
+                for field, accumulator in fields.items():
+                    current = sensor_accumulators.get(field, DataItemStatsAccumulator())
+                    sensor_accumulators[field] = (
+                        current.subtract(accumulator)
+                        if remove
+                        else current.merge(accumulator)
+                    )
+                updates.setdefault(data_type, {})[name] = sensor_accumulators
+
+        robot_accumulators = self.data_accumulators.setdefault(robot_id, {})
+        for data_type, sensors in updates.items():
+            type_accumulators = robot_accumulators.setdefault(data_type, {})
+            for name, sensor_accumulators in sensors.items():
+                if all(acc.count == 0 for acc in sensor_accumulators.values()):
+                    type_accumulators.pop(name, None)
+                else:
+                    type_accumulators[name] = sensor_accumulators
+            self._refresh_statistics(robot_id, data_type)
+
+    def _sensor_order(self, robot_id: str, data_type: DataType) -> list[str]:
+        """Sensor names ordered as in the input then output descriptions."""
+        names: dict[str, None] = {}
+        for description in (
+            self.input_cross_embodiment_description,
+            self.output_cross_embodiment_description,
+        ):
+            indexed_names = description.get(robot_id, {}).get(data_type, {})
+            for index in sorted(indexed_names):
+                names.setdefault(indexed_names[index], None)
+        accumulators = self.data_accumulators.get(robot_id, {}).get(data_type, {})
+        for name in accumulators:
+            names.setdefault(name, None)
+        return [name for name in names if name in accumulators]
+
+    def _refresh_statistics(self, robot_id: str, data_type: DataType) -> None:
+        """Recompute the finalized statistics of one robot and data type."""
+        robot_statistics = self.dataset_statistics.setdefault(robot_id, {})
+        accumulators = self.data_accumulators[robot_id].get(data_type, {})
+        stats_class = DATA_TYPE_TO_NC_DATA_STATS_CLASS[data_type]
+        statistics = [
+            stats_class.from_accumulators(accumulators[name])
+            for name in self._sensor_order(robot_id, data_type)
+        ]
+        if statistics:
+            robot_statistics[data_type] = statistics  # type: ignore[assignment]
+        else:
+            robot_statistics.pop(data_type, None)
+            self.data_accumulators[robot_id].pop(data_type, None)
+
 
 class Dataset(BaseModel):
     """Represents a dataset of unsynchronized episodes.
@@ -1,3 +1,5 @@
 """Init."""
 
+from neuracore_types.episode.columnar_episode import *  # noqa: F403
 from neuracore_types.episode.episode import *  # noqa: F403
+from neuracore_types.episode.timestamp_index import *  # noqa: F403
@@ -0,0 +1,346 @@
+"""Columnar in-memory representation of synchronized episodes.
+
+``SynchronizedEpisode`` holds one ``SynchronizedPoint`` per step, each with
+its own nested dicts, so iterating, slicing or reordering an episode costs a
+Python object per step, data type and sensor. ``ColumnarSynchronizedEpisode``
+holds the same data as one array of timestamps and, per data type and
+sensor, one column of NCData:
+
+- slicing takes views of the arrays, whatever the episode length;
+- ``order`` validates the sensors once and permutes the column keys;
+- ``field_array`` stacks a field of a sensor, e.g. joint values, as one
+  array;
+- ``nearest``, ``floor``, ``ceil`` and ``between`` look up steps by time in
+  O(log N), ``between`` returning a view of the time window;
+- points are only created when accessed, as ``SynchronizedPoint`` views of
+  one step.
+
+Columns are object arrays of NCData, with None at the steps a sensor is
+missing from. NCData are shared, not copied, with the episode they come
+from.
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+
+import numpy as np
+
+from neuracore_types.episode.episode import (
+    EmbodimentDescription,
+    EmbodimentOrderingPlan,
+    SynchronizedEpisode,
+    SynchronizedPoint,
+)
+from neuracore_types.episode.timestamp_index import TimestampIndex
+from neuracore_types.nc_data import DataType
+from neuracore_types.nc_data.nc_data import NCData
+
+
+def object_array(values: Sequence[object]) -> np.ndarray:
+    """Build a 1D object array holding the given objects as they are.
+
+    ``np.array`` would unpack objects that look like sequences, such as
+    pydantic models, so they are inserted one by one.
+
+    Args:
+        values: Objects to hold.
+
+    Returns:
+        np.ndarray: Object array of shape ``(len(values),)``.
+    """
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _has_missing_steps(column: np.ndarray) -> bool:
+    """Return whether a column has None at some step."""
+    # NCData are always truthy, so only None converts to False
+    return not column.astype(bool).all()
+
+
+class ColumnarSynchronizedEpisode:
+    """Synchronized episode stored as one column of NCData per sensor.
+
+    Indexing and iterating give ``SynchronizedPoint``, created on access, so
+    the episode can replace ``SynchronizedEpisode.observations`` when
+    reading.
+    Episodes are immutable: slicing and ordering return new episodes sharing
+    the same arrays.
+    """
+
+    def __init__(
+        self,
+        timestamps: np.ndarray,
+        columns: Mapping[DataType, Mapping[str, np.ndarray]],
+        robot_id: str,
+        start_time: float | None = None,
+        end_time: float | None = None,
+    ):
+        """Initialize the episode.
+
+        Args:
+            timestamps: Times of the steps, of shape ``(T,)``.
+            columns: Per data type and sensor name, object arrays of shape
+                ``(T,)`` of the sensor's NCData, None where it is missing.
+            robot_id: ID of the robot, also used for the points.
+            start_time: Start of the episode, by default the first timestamp.
+            end_time: End of the episode, by default the last timestamp.
+
+        Raises:
+            ValueError: If a column does not have one entry per step.
+        """
+        self.timestamps = np.asarray(timestamps, dtype=np.float64)
+        self.columns = {
+            data_type: dict(sensors) for data_type, sensors in columns.items()
+        }
+        for data_type, sensors in self.columns.items():
+            for name, column in sensors.items():
+                if column.shape != self.timestamps.shape:
+                    raise ValueError(
+                        f"Column {data_type.value}/{name} has shape "
+                        f"{column.shape}, expected {self.timestamps.shape}"
+                    )
+        self.robot_id = robot_id
+        has_steps = len(self.timestamps) > 0
+        if start_time is None:
+            start_time = float(self.timestamps[0]) if has_steps else 0.0
+        if end_time is None:
+            end_time = float(self.timestamps[-1]) if has_steps else 0.0
+        self.start_time = start_time
+        self.end_time = end_time
+        self._timestamp_index: TimestampIndex | None = None
+
+    @classmethod
+    def from_synchronized_episode(
+        cls, episode: SynchronizedEpisode
+    ) -> "ColumnarSynchronizedEpisode":
+        """Convert an episode of synchronized points to columns.
+
+        Args:
+            episode: Episode to convert. Its NCData are shared, not copied.
+
+        Returns:
+            ColumnarSynchronizedEpisode: The columnar episode, with columns in
+                order of first appearance.
+        """
+        observations = episode.observations
+        num_steps = len(observations)
+        columns: dict[DataType, dict[str, np.ndarray]] = {}
+        for step, observation in enumerate(observations):
+            for data_type, sensors in observation.data.items():
+                type_columns = columns.setdefault(data_type, {})
+                for name, nc_data in sensors.items():
+                    column = type_columns.get(name)
+                    if column is None:
+                        column = type_columns[name] = np.full(
+                            num_steps, None, dtype=object
+                        )
+                    column[step] = nc_data
+        return cls(
+            timestamps=np.fromiter(
+                (observation.timestamp for observation in observations),
+                dtype=np.float64,
+                count=num_steps,
+            ),
+            columns=columns,
+            robot_id=episode.robot_id,
+            start_time=episode.start_time,
+            end_time=episode.end_time,
+        )
+
+    def to_synchronized_episode(self) -> SynchronizedEpisode:
+        """Convert to an episode of synchronized points.
+
+        Returns:
+            SynchronizedEpisode: Episode sharing the NCData of the columns.
+        """
+        return SynchronizedEpisode.from_trusted(
+            observations=list(self),
+            start_time=self.start_time,
+            end_time=self.end_time,
+            robot_id=self.robot_id,
+        )
+
+    def __len__(self) -> int:
+        """Number of steps."""
+        return len(self.timestamps)
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> "SynchronizedPoint | ColumnarSynchronizedEpisode":
+        """Get the point of a step, or a slice of the episode as views."""
+        if isinstance(index, slice):
+            return self._slice(index)
+        return self._point(range(len(self))[index])
+
+    def __iter__(self) -> Iterator[SynchronizedPoint]:
+        """Iterate over the points of the episode, created one at a time."""
+        for step in range(len(self)):
+            yield self._point(step)
+
+    def _point(self, step: int) -> SynchronizedPoint:
+        """Create the point of a step."""
+        data: dict[DataType, dict[str, NCData]] = {}
+        for data_type, sensors in self.columns.items():
+            type_data = {
+                name: column[step]
+                for name, column in sensors.items()
+                if column[step] is not None
+            }
+            if type_data:
+                data[data_type] = type_data
+        return SynchronizedPoint.from_trusted(
+            timestamp=float(self.timestamps[step]), robot_id=self.robot_id, data=data
+        )
+
+    def timestamp_index(self) -> TimestampIndex:
+        """Return the index of the step timestamps, built on first use.
+
+        Raises:
+            ValueError: If the timestamps are not sorted.
+        """
+        if self._timestamp_index is None:
+            self._timestamp_index = TimestampIndex(self.timestamps.tolist())
+        return self._timestamp_index
+
+    def nearest(self, timestamp: float) -> SynchronizedPoint:
+        """Return the point of the step nearest to a time.
+
+        Args:
+            timestamp: Time to look up.
+
+        Returns:
+            SynchronizedPoint: The point, of the earlier step on ties.
+
+        Raises:
+            ValueError: If the episode has no steps.
+        """
+        return self._point(self.timestamp_index().nearest(timestamp))
+
+    def floor(self, timestamp: float) -> SynchronizedPoint | None:
+        """Return the point of the last step at or before a time.
+
+        Args:
+            timestamp: Time to look up.
+
+        Returns:
+            SynchronizedPoint | None: The point, or None if every step is
+                later.
+        """
+        step = self.timestamp_index().floor(timestamp)
+        return None if step is None else self._point(step)
+
+    def ceil(self, timestamp: float) -> SynchronizedPoint | None:
+        """Return the point of the first step at or after a time.
+
+        Args:
+            timestamp: Time to look up.
+
+        Returns:
+            SynchronizedPoint | None: The point, or None if every step is
+                earlier.
+        """
+        step = self.timestamp_index().ceil(timestamp)
+        return None if step is None else self._point(step)
+
+    def between(self, start: float, end: float) -> "ColumnarSynchronizedEpisode":
+        """Return the steps in the half-open time window ``[start, end)``.
+
+        Args:
+            start: Start of the window, included.
+            end: End of the window, excluded.
+
+        Returns:
+            ColumnarSynchronizedEpisode: View of the steps, clipped to the
+                time window.
+        """
+        window = self.timestamp_index().between(start, end)
+        return self._slice(window, max(start, self.start_time), min(end, self.end_time))
+
+    def _slice(
+        self,
+        steps: slice,
+        start_time: float | None = None,
+        end_time: float | None = None,
+    ) -> "ColumnarSynchronizedEpisode":
+        """Create the episode of a slice of the steps, as views."""
+        return ColumnarSynchronizedEpisode(
+            timestamps=self.timestamps[steps],
+            columns={
+                data_type: {name: column[steps] for name, column in sensors.items()}
+                for data_type, sensors in self.columns.items()
+            },
+            robot_id=self.robot_id,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    def column(self, data_type: DataType, name: str) -> np.ndarray:
+        """Return the NCData of a sensor at every step.
+
+        Args:
+            data_type: Data type of the sensor.
+            name: Name of the sensor.
+
+        Returns:
+            np.ndarray: Object array of shape ``(T,)``, None where the sensor
+                is missing.
+        """
+        return self.columns[data_type][name]
+
+    def field_array(self, data_type: DataType, name: str, field: str) -> np.ndarray:
+        """Stack a field of a sensor's NCData over every step.
+
+        Args:
+            data_type: Data type of the sensor.
+            name: Name of the sensor.
+            field: Field of the NCData, e.g. ``"value"`` for joints.
+
+        Returns:
+            np.ndarray: Values of shape ``(T, ...)``.
+
+        Raises:
+            ValueError: If the sensor is missing from a step.
+        """
+        column = self.column(data_type, name)
+        if _has_missing_steps(column):
+            raise ValueError(f"Sensor {data_type.value}/{name} is missing from steps")
+        return np.array([getattr(nc_data, field) for nc_data in column])
+
+    def order(
+        self, embodiment_description: EmbodimentDescription | EmbodimentOrderingPlan
+    ) -> "ColumnarSynchronizedEpisode":
+        """Return the episode with sensors ordered by an embodiment description.
+
+        Like ``SynchronizedEpisode.order``, the episode must hold exactly the
+        data types and sensor names of the description, at every step. The
+        sensors are validated once for the whole episode and only the column
+        keys are reordered.
+
+        Args:
+            embodiment_description: Mapping of `DataType -> {index: sensor_name}`
+                describing the exact names to include and their order, or its
+                compiled `EmbodimentOrderingPlan`.
+
+        Returns:
+            ColumnarSynchronizedEpisode: Episode sharing the same columns.
+
+        Raises:
+            ValueError: If the episode and embodiment description do not have
+                exactly matching data types or sensor names, or a sensor is
+                missing from a step.
+        """
+        plan = EmbodimentOrderingPlan.compile(embodiment_description)
+        plan.validate(self.columns, "ColumnarSynchronizedEpisode", "episode")
+        for data_type, sensors in self.columns.items():
+            for name, column in sensors.items():
+                if _has_missing_steps(column):
+                    raise ValueError(
+                        f"Sensor {data_type.value}/{name} is missing from steps"
+                    )
+        columns = plan.order_data(self.columns)
+        return ColumnarSynchronizedEpisode(
+            timestamps=self.timestamps,
+            columns=columns,
+            robot_id=self.robot_id,
+            start_time=self.start_time,
+            end_time=self.end_time,
+        )
@@ -1,17 +1,31 @@
 """Models for episodes and synchronized data points."""
 
 import time
+from collections.abc import Mapping
 from datetime import datetime
 from enum import Enum
+from typing import TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, NonNegativeInt
 
-from neuracore_types.nc_data import DataType, NCDataUnion
-from neuracore_types.nc_data.nc_data import DataItemStats, NCData
+from neuracore_types.episode.timestamp_index import TimestampIndex
+from neuracore_types.nc_data import (
+    DATA_TYPE_TO_NC_DATA_STATS_CLASS,
+    CameraData,
+    DataType,
+    FrameProvider,
+    NCDataUnion,
+)
+from neuracore_types.nc_data.nc_data import (
+    DataItemStats,
+    DataItemStatsAccumulator,
+    NCData,
+)
 from neuracore_types.utils.pydantic_to_ts import (
     REQUIRED_WITH_DEFAULT_FLAG,
     fix_required_with_defaults,
 )
+from neuracore_types.utils.trusted_construction import TrustedConstructionMixin
 
 EmbodimentDescription = dict[DataType, dict[int, str]]
 CrossEmbodimentDescription = dict[str, EmbodimentDescription]
@@ -19,10 +33,124 @@ CrossEmbodimentDescription = dict[str, EmbodimentDescription]
 EmbodimentUnion = dict[DataType, list[str]]
 CrossEmbodimentUnion = dict[str, EmbodimentUnion]
 
+# Frame provider of every camera, by data type and sensor name
+FrameProviders = Mapping[DataType, Mapping[str, FrameProvider]]
+
 NOTES_MAX_LENGTH = 1000
 
+_T = TypeVar("_T")
+
+
+class EmbodimentOrderingPlan:
+    """Embodiment description compiled to order synchronized data.
+
+    Ordering a synchronized point by an ``EmbodimentDescription`` sorts its
+    indices and builds sets of data types and names to compare. The plan
+    does this once: it holds the sensor names of every data type in index
+    order and the key sets to validate against, so ordering many points only
+    compares dict key views and rebuilds the dicts.
+    """
+
+    def __init__(self, embodiment_description: EmbodimentDescription):
+        """Compile an embodiment description.
+
+        Args:
+            embodiment_description: Mapping of `DataType -> {index: sensor_name}`
+                describing the exact names to include and their order.
+        """
+        self.embodiment_description = embodiment_description
+        # Sensor names of every data type, in index order
+        self.keys: tuple[tuple[DataType, tuple[str, ...]], ...] = tuple(
+            (
+                data_type,
+                tuple(indexed_names[index] for index in sorted(indexed_names)),
+            )
+            for data_type, indexed_names in embodiment_description.items()
+        )
+        self._data_types = frozenset(embodiment_description)
+        self._names = {data_type: frozenset(names) for data_type, names in self.keys}
+
+    @classmethod
+    def compile(
+        cls, order_spec: "EmbodimentDescription | EmbodimentOrderingPlan"
+    ) -> "EmbodimentOrderingPlan":
+        """Return the plan of an embodiment description, or a plan as is."""
+        if isinstance(order_spec, EmbodimentOrderingPlan):
+            return order_spec
+        return cls(order_spec)
+
+    def validate(
+        self,
+        data: Mapping[DataType, Mapping[str, object]],
+        owner: str = "SynchronizedPoint",
+        noun: str = "synchronized point",
+    ) -> None:
+        """Check that data has exactly the data types and names of the plan.
+
+        Args:
+            data: Data keyed by data type and sensor name.
+            owner: Class holding the data, for error messages.
+            noun: Description of the data, for error messages.
+
+        Raises:
+            ValueError: If the data and embodiment description do not have
+                exactly matching data types or sensor names.
+        """
+        if data.keys() != self._data_types:
+            data_types = set(data)
+            raise ValueError(
+                f"{owner} data types must exactly match embodiment_description.\n"
+                f"Extra data types in {noun}: {data_types - self._data_types}\n"
+                f"Missing data types from {noun}: {self._data_types - data_types}\n"
+            )
+        for data_type, expected_names in self._names.items():
+            names = data[data_type].keys()
+            if names != expected_names:
+                raise ValueError(
+                    f"{owner} names for DataType {data_type} must exactly "
+                    "match embodiment_description.\n"
+                    f"Extra names in {noun}: {set(names) - expected_names}\n"
+                    f"Missing names from {noun}: {expected_names - set(names)}\n"
+                )
+
+    def order_data(
+        self, data: Mapping[DataType, Mapping[str, _T]]
+    ) -> dict[DataType, dict[str, _T]]:
+        """Rebuild validated data with sensors in index order.
+
+        Args:
+            data: Data with exactly the data types and names of the plan.
+
+        Returns:
+            New dicts in the order of the embodiment description.
+        """
+        ordered = {}
+        for data_type, names in self.keys:
+            sensors = data[data_type]
+            ordered[data_type] = {name: sensors[name] for name in names}
+        return ordered
+
+    def order_point(self, point: "SynchronizedPoint") -> "SynchronizedPoint":
+        """Validate and order one synchronized point.
+
+        Args:
+            point: Point to order.
+
+        Returns:
+            SynchronizedPoint: New point sharing the NCData of ``point``.
 
-class SynchronizedPoint(BaseModel):
+        Raises:
+            ValueError: If the point does not match the embodiment description.
+        """
+        self.validate(point.data)
+        return SynchronizedPoint.from_trusted(
+            timestamp=point.timestamp,
+            robot_id=point.robot_id,
+            data=self.order_data(point.data),
+        )
+
+
+class SynchronizedPoint(TrustedConstructionMixin, BaseModel):
     """Synchronized collection of all sensor data at a single time point.
 
     Represents a complete snapshot of robot state and sensor information
@@ -42,7 +170,8 @@ class SynchronizedPoint(BaseModel):
     model_config = ConfigDict(json_schema_extra=fix_required_with_defaults)
 
     def order(
-        self, embodiment_description: EmbodimentDescription
+        self,
+        embodiment_description: "EmbodimentDescription | EmbodimentOrderingPlan",
     ) -> "SynchronizedPoint":
         """Return a new sync point ordered by indexed embodiment specification.
 
@@ -56,12 +185,14 @@ class SynchronizedPoint(BaseModel):
         information. Extra or missing data types raise an error. Extra or missing
         sensor names within a data type also raise an error.
 
-        Uses `model_construct()` to skip validation for better performance,
-        since this only reorders already validated data.
+        Uses `from_trusted()` to skip validation for better performance,
+        since this only reorders already validated data. To order many points,
+        compile the description once into an `EmbodimentOrderingPlan`.
 
         Args:
             embodiment_description: Mapping of `DataType -> {index: sensor_name}`
-                describing the exact names to include and their order.
+                describing the exact names to include and their order, or its
+                compiled `EmbodimentOrderingPlan`.
 
         Returns:
             A new `SynchronizedPoint` with each data type's dictionary rebuilt in
@@ -71,41 +202,40 @@ class SynchronizedPoint(BaseModel):
             ValueError: If the sync point and embodiment description do not have
                 exactly matching data types or sensor names.
         """
-        sync_point_data_types = set(self.data.keys())
-        expected_data_types = set(embodiment_description.keys())
-        if sync_point_data_types != expected_data_types:
-            extra_data_types = sync_point_data_types - expected_data_types
-            missing_data_types = expected_data_types - sync_point_data_types
-            raise ValueError(
-                "SynchronizedPoint data types must exactly match "
-                "embodiment_description.\n"
-                f"Extra data types in synchronized point: {extra_data_types}\n"
-                f"Missing data types from synchronized point: {missing_data_types}\n"
-            )
+        return EmbodimentOrderingPlan.compile(embodiment_description).order_point(self)
 
-        for data_type, indexed_names in embodiment_description.items():
-            sync_point_names = set(self.data[data_type].keys())
-            expected_names = set(indexed_names.values())
-            if sync_point_names != expected_names:
-                extra_names = sync_point_names - expected_names
-                missing_names = expected_names - sync_point_names
-                raise ValueError(
-                    f"SynchronizedPoint names for DataType {data_type} must exactly "
-                    "match embodiment_description.\n"
-                    f"Extra names in synchronized point: {extra_names}\n"
-                    f"Missing names from synchronized point: {missing_names}\n"
-                )
+    def with_frame_providers(
+        self, frame_providers: FrameProviders
+    ) -> "SynchronizedPoint":
+        """Return a point whose cameras fetch their frames lazily.
 
-        return SynchronizedPoint.model_construct(
-            timestamp=self.timestamp,
-            robot_id=self.robot_id,
-            data={
-                data_type: {
-                    indexed_names[index]: self.data[data_type][indexed_names[index]]
-                    for index in sorted(indexed_names)
-                }
-                for data_type, indexed_names in embodiment_description.items()
-            },
+        Cameras with a frame provider are replaced by copies attached to it,
+        see `CameraData.with_frame_provider`, so `CameraData.load_frame` and
+        the batched converters resolve their `frame_idx` on demand. Other
+        data is shared with this point.
+
+        Args:
+            frame_providers: Mapping of `DataType -> {sensor_name: provider}`.
+
+        Returns:
+            A new `SynchronizedPoint` with the providers attached.
+        """
+        data: dict[DataType, Mapping[str, NCData]] = {}
+        for data_type, sensors in self.data.items():
+            providers = frame_providers.get(data_type)
+            if not providers:
+                data[data_type] = sensors
+                continue
+            data[data_type] = {
+                name: (
+                    nc_data.with_frame_provider(providers[name])
+                    if name in providers and isinstance(nc_data, CameraData)
+                    else nc_data
+                )
+                for name, nc_data in sensors.items()
+            }
+        return SynchronizedPoint.from_trusted(
+            timestamp=self.timestamp, robot_id=self.robot_id, data=data
         )
 
     def __getitem__(self, key: DataType | str) -> dict[str, NCData]:
@@ -125,7 +255,7 @@ class SynchronizedPoint(BaseModel):
             super().__setitem__(key, value)
 
 
-class SynchronizedEpisode(BaseModel):
+class SynchronizedEpisode(TrustedConstructionMixin, BaseModel):
     """Synchronized episode of time-ordered synchronized observations."""
 
     observations: list[SynchronizedPoint]
@@ -133,26 +263,150 @@ class SynchronizedEpisode(BaseModel):
     end_time: float
     robot_id: str
 
-    def order(self, order_spec: EmbodimentDescription) -> "SynchronizedEpisode":
+    def order(
+        self, order_spec: "EmbodimentDescription | EmbodimentOrderingPlan"
+    ) -> "SynchronizedEpisode":
         """Return a new episode with observations ordered by index specification.
 
+        The specification is compiled once into an `EmbodimentOrderingPlan`
+        for the whole episode. Observations are already validated, so the new
+        episode is built with `from_trusted()`.
+
         Args:
             order_spec: Mapping of `DataType -> {index: sensor_name}` used to
-                reorder every observation.
+                reorder every observation, or its compiled
+                `EmbodimentOrderingPlan`.
 
         Returns:
             New `SynchronizedEpisode` with each observation ordered according to
             the provided indexed embodiment description.
+
+        Raises:
+            ValueError: If an observation does not match the specification.
         """
-        return SynchronizedEpisode(
+        plan = EmbodimentOrderingPlan.compile(order_spec)
+        order_point = plan.order_point
+        return SynchronizedEpisode.from_trusted(
             observations=[
-                observation.order(order_spec) for observation in self.observations
+                order_point(observation) for observation in self.observations
             ],
             start_time=self.start_time,
             end_time=self.end_time,
             robot_id=self.robot_id,
         )
 
+    def with_frame_providers(
+        self, frame_providers: FrameProviders
+    ) -> "SynchronizedEpisode":
+        """Return an episode whose cameras fetch their frames lazily.
+
+        Args:
+            frame_providers: Mapping of `DataType -> {sensor_name: provider}`,
+                see `SynchronizedPoint.with_frame_providers`.
+
+        Returns:
+            A new `SynchronizedEpisode` with the providers attached.
+        """
+        return SynchronizedEpisode.from_trusted(
+            observations=[
+                observation.with_frame_providers(frame_providers)
+                for observation in self.observations
+            ],
+            start_time=self.start_time,
+            end_time=self.end_time,
+            robot_id=self.robot_id,
+        )
+
+    def timestamp_index(self) -> TimestampIndex:
+        """Build the index of the observation timestamps.
+
+        Building the index reads every observation once. Keep it and pass it
+        to `nearest`, `floor`, `ceil` and `between` for repeated lookups,
+        which then take O(log N), as long as the observations do not change.
+
+        Returns:
+            TimestampIndex: Index of the observation timestamps.
+
+        Raises:
+            ValueError: If the observations are not sorted by timestamp.
+        """
+        return TimestampIndex(
+            observation.timestamp for observation in self.observations
+        )
+
+    def _index(self, index: TimestampIndex | None) -> TimestampIndex:
+        """Return the given index, or build one."""
+        return self.timestamp_index() if index is None else index
+
+    def nearest(
+        self, timestamp: float, index: TimestampIndex | None = None
+    ) -> SynchronizedPoint:
+        """Return the observation nearest to a time.
+
+        Args:
+            timestamp: Time to look up.
+            index: Index of the episode, built for this lookup if not given.
+
+        Returns:
+            The nearest observation, the earlier one on ties.
+
+        Raises:
+            ValueError: If the episode has no observations.
+        """
+        return self.observations[self._index(index).nearest(timestamp)]
+
+    def floor(
+        self, timestamp: float, index: TimestampIndex | None = None
+    ) -> SynchronizedPoint | None:
+        """Return the last observation at or before a time.
+
+        Args:
+            timestamp: Time to look up.
+            index: Index of the episode, built for this lookup if not given.
+
+        Returns:
+            The observation, or None if every observation is later.
+        """
+        position = self._index(index).floor(timestamp)
+        return None if position is None else self.observations[position]
+
+    def ceil(
+        self, timestamp: float, index: TimestampIndex | None = None
+    ) -> SynchronizedPoint | None:
+        """Return the first observation at or after a time.
+
+        Args:
+            timestamp: Time to look up.
+            index: Index of the episode, built for this lookup if not given.
+
+        Returns:
+            The observation, or None if every observation is earlier.
+        """
+        position = self._index(index).ceil(timestamp)
+        return None if position is None else self.observations[position]
+
+    def between(
+        self, start: float, end: float, index: TimestampIndex | None = None
+    ) -> "SynchronizedEpisode":
+        """Return the observations in the half-open time window ``[start, end)``.
+
+        Args:
+            start: Start of the window, included.
+            end: End of the window, excluded.
+            index: Index of the episode, built for this lookup if not given.
+
+        Returns:
+            A new `SynchronizedEpisode` sharing the observations of this one,
+            clipped to the time window.
+        """
+        window = self._index(index).between(start, end)
+        return SynchronizedEpisode.from_trusted(
+            observations=self.observations[window],
+            start_time=max(start, self.start_time),
+            end_time=min(end, self.end_time),
+            robot_id=self.robot_id,
+        )
+
 
 class EpisodeStatistics(BaseModel):
     """Description of a single episode with statistics and counts.
@@ -168,8 +422,117 @@ class EpisodeStatistics(BaseModel):
         default_factory=dict, json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG
     )
 
+    # Optional mergeable statistics, keyed by data type, sensor name and
+    # stats field name (e.g. "frame", "extrinsics" for cameras)
+    data_accumulators: dict[
+        DataType, dict[str, dict[str, DataItemStatsAccumulator]]
+    ] = Field(default_factory=dict, json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG)
+
     model_config = ConfigDict(json_schema_extra=fix_required_with_defaults)
 
+    @classmethod
+    def from_synchronized_episode(
+        cls, episode: "SynchronizedEpisode"
+    ) -> "EpisodeStatistics":
+        """Create episode statistics with accumulators from an episode.
+
+        Args:
+            episode: Synchronized episode to compute statistics for.
+
+        Returns:
+            EpisodeStatistics: Statistics holding the episode length, the
+                finalized statistics and mergeable accumulators of every
+                sensor in the episode.
+        """
+        item_stats: dict[DataType, dict[str, list]] = {}
+        for observation in episode.observations:
+            for data_type, sensors in observation.data.items():
+                type_stats = item_stats.setdefault(data_type, {})
+                for name, nc_data in sensors.items():
+                    type_stats.setdefault(name, []).append(
+                        nc_data.calculate_statistics()
+                    )
+        return cls.from_accumulators(
+            len(episode.observations),
+            {
+                data_type: {
+                    name: DATA_TYPE_TO_NC_DATA_STATS_CLASS[data_type].accumulate(stats)
+                    for name, stats in sensors.items()
+                }
+                for data_type, sensors in item_stats.items()
+            },
+        )
+
+    @classmethod
+    def from_accumulators(
+        cls,
+        episode_length: int,
+        data_accumulators: dict[
+            DataType, dict[str, dict[str, DataItemStatsAccumulator]]
+        ],
+    ) -> "EpisodeStatistics":
+        """Create episode statistics from mergeable accumulators.
+
+        `data` holds, for every sensor, the finalized statistics of the first
+        stats field of its data type, e.g. `value` for joints and `frame` for
+        cameras.
+
+        Args:
+            episode_length: Number of steps of the episode.
+            data_accumulators: Accumulators keyed by data type, sensor name and
+                stats field name.
+
+        Returns:
+            EpisodeStatistics: Statistics with `data` finalized from the
+                accumulators.
+        """
+        data: dict[DataType, dict[str, DataItemStats]] = {}
+        for data_type, sensors in data_accumulators.items():
+            field = DATA_TYPE_TO_NC_DATA_STATS_CLASS[
+                data_type
+            ].data_item_stats_fields()[0]
+            data[data_type] = {
+                name: fields[field].to_data_item_stats()
+                for name, fields in sensors.items()
+                if field in fields
+            }
+        return cls(
+            episode_length=episode_length,
+            data=data,
+            data_accumulators=data_accumulators,
+        )
+
+    def merge(self, other: "EpisodeStatistics") -> "EpisodeStatistics":
+        """Return the statistics of the steps of both statistics.
+
+        Used to compute the statistics of an episode from its parts, e.g. the
+        chunks of a long episode, without holding the episode in memory.
+
+        Args:
+            other: Statistics of other steps, with `data_accumulators`
+                populated.
+
+        Returns:
+            EpisodeStatistics: Statistics with the summed episode length,
+                merged accumulators and `data` finalized from them.
+        """
+        data_accumulators = {
+            data_type: {name: dict(fields) for name, fields in sensors.items()}
+            for data_type, sensors in self.data_accumulators.items()
+        }
+        for data_type, sensors in other.data_accumulators.items():
+            type_accumulators = data_accumulators.setdefault(data_type, {})
+            for name, fields in sensors.items():
+                sensor_accumulators = type_accumulators.setdefault(name, {})
+                for field, accumulator in fields.items():
+                    current = sensor_accumulators.get(field)
+                    sensor_accumulators[field] = (
+                        accumulator if current is None else current.merge(accumulator)
+                    )
+        return EpisodeStatistics.from_accumulators(
+            self.episode_length + other.episode_length, data_accumulators
+        )
+
     def get_data_types(self) -> list[DataType]:
         """Determine which data types are present in the recording.
 
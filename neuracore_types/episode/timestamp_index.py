@@ -0,0 +1,94 @@
+"""Sorted index of the timestamps of an episode.
+
+Looking up the observation at a time, or the observations within a time
+window, otherwise scans every observation. ``TimestampIndex`` holds the
+timestamps once and answers nearest, floor, ceil and half-open range
+lookups by binary search, in O(log N). Lookups return positions, so
+episodes can return their points, or slices sharing their NCData.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+
+
+class TimestampIndex:
+    """Binary search over non-decreasing timestamps."""
+
+    def __init__(self, timestamps: Iterable[float]):
+        """Initialize the index.
+
+        Args:
+            timestamps: Timestamps of the steps, in non-decreasing order.
+
+        Raises:
+            ValueError: If the timestamps are not sorted.
+        """
+        self.timestamps = [float(timestamp) for timestamp in timestamps]
+        if any(b < a for a, b in zip(self.timestamps, self.timestamps[1:])):
+            raise ValueError("Timestamps must be sorted in non-decreasing order")
+
+    def __len__(self) -> int:
+        """Number of indexed timestamps."""
+        return len(self.timestamps)
+
+    def nearest(self, timestamp: float) -> int:
+        """Return the position of the timestamp nearest to a time.
+
+        Args:
+            timestamp: Time to look up.
+
+        Returns:
+            int: Position of the nearest timestamp, the earlier one on ties.
+
+        Raises:
+            ValueError: If the index is empty.
+        """
+        if not self.timestamps:
+            raise ValueError("Cannot look up a timestamp in an empty index")
+        position = bisect_left(self.timestamps, timestamp)
+        if position == len(self.timestamps):
+            return position - 1
+        if position > 0 and (
+            timestamp - self.timestamps[position - 1]
+            <= self.timestamps[position] - timestamp
+        ):
+            return position - 1
+        return position
+
+    def floor(self, timestamp: float) -> int | None:
+        """Return the position of the last timestamp at or before a time.
+
+        Args:
+            timestamp: Time to look up.
+
+        Returns:
+            int | None: The position, or None if every timestamp is later.
+        """
+        position = bisect_right(self.timestamps, timestamp) - 1
+        return position if position >= 0 else None
+
+    def ceil(self, timestamp: float) -> int | None:
+        """Return the position of the first timestamp at or after a time.
+
+        Args:
+            timestamp: Time to look up.
+
+        Returns:
+            int | None: The position, or None if every timestamp is earlier.
+        """
+        position = bisect_left(self.timestamps, timestamp)
+        return position if position < len(self.timestamps) else None
+
+    def between(self, start: float, end: float) -> slice:
+        """Return the positions of the timestamps in ``[start, end)``.
+
+        Args:
+            start: Start of the window, included.
+            end: End of the window, excluded.
+
+        Returns:
+            slice: Slice of the positions, empty if no timestamp is in the
+                window.
+        """
+        first = bisect_left(self.timestamps, start)
+        return slice(first, max(first, bisect_left(self.timestamps, end)))
@@ -0,0 +1,13 @@
+"""Neuracore Import Runner Package.
+
+This package drives import configurations over raw datasets, turning raw
+episodes into Neuracore data in parallel.
+
+Main components:
+
+- episode_source: Interface for reading raw episodes and a local file source.
+- import_runner: Parallel import of episodes with a DatasetImportConfig.
+"""
+
+from neuracore_types.import_runner.episode_source import *  # noqa: F403
+from neuracore_types.import_runner.import_runner import *  # noqa: F403
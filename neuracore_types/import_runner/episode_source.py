@@ -0,0 +1,218 @@
+"""Episode sources that feed raw arrays into the import runner.
+
+An episode source lists the episodes of a raw dataset and loads each one as a
+mapping from source name to an array whose first axis is time. The source
+names are the ones referenced by ``NCDataImportConfig.source`` and
+``MappingItem.source_name``.
+
+``LocalFileEpisodeSource`` memory-maps ``.npy`` files and the uncompressed
+members of ``.npz`` archives, so loading an episode only reads array headers.
+Selecting a mapping item's columns with ``select_columns`` and slicing time
+chunks with ``iter_time_chunks`` keep views of the mapped files: only the
+chunk being transformed is ever read from disk, so memory stays bounded by
+the chunk size however long the episode is.
+"""
+
+import struct
+import zipfile
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+
+from neuracore_types.importer.config import IndexRangeConfig
+
+# Fixed-size part of a zip local file header, followed by name and extra field
+_ZIP_LOCAL_HEADER = struct.Struct("<4s5H3I2H")
+_NPY_HEADER_READERS = {
+    (1, 0): np.lib.format.read_array_header_1_0,
+    (2, 0): np.lib.format.read_array_header_2_0,
+}
+
+MmapMode = Literal["r", "c"]
+
+
+def select_columns(
+    array: np.ndarray,
+    index: int | None = None,
+    index_range: IndexRangeConfig | None = None,
+) -> np.ndarray:
+    """Select the columns referenced by a mapping item, as a view.
+
+    Args:
+        array: Source array of shape ``(T, ...)``.
+        index: Single column to select.
+        index_range: Range of columns to select.
+
+    Returns:
+        The selected columns, sharing memory with ``array``.
+    """
+    if index is not None:
+        return array[:, index]
+    if index_range is not None:
+        return array[:, index_range.start : index_range.end]
+    return array
+
+
+def iter_time_chunks(
+    array: np.ndarray,
+    chunk_size: int,
+    index: int | None = None,
+    index_range: IndexRangeConfig | None = None,
+) -> Iterator[tuple[int, np.ndarray]]:
+    """Split the columns selected by a mapping item into chunks of time steps.
+
+    Columns are selected before slicing and nothing is copied, so chunks of a
+    memory-mapped array are only read when they are used.
+
+    Args:
+        array: Source array of shape ``(T, ...)``.
+        chunk_size: Number of time steps per chunk. The last chunk may be
+            shorter.
+        index: Single column to select.
+        index_range: Range of columns to select.
+
+    Yields:
+        The first time step of each chunk and a view of its selected columns.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    selected = select_columns(array, index, index_range)
+    for start in range(0, len(selected), chunk_size):
+        yield start, selected[start : start + chunk_size]
+
+
+def _mmap_npz_member(
+    path: Path, info: zipfile.ZipInfo, mmap_mode: MmapMode
+) -> np.ndarray | None:
+    """Memory-map an array stored uncompressed in an ``.npz`` archive.
+
+    Returns:
+        The mapped array, or None if the member cannot be mapped.
+    """
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    with path.open("rb") as f:
+        f.seek(info.header_offset)
+        header = _ZIP_LOCAL_HEADER.unpack(f.read(_ZIP_LOCAL_HEADER.size))
+        data_offset = info.header_offset + _ZIP_LOCAL_HEADER.size + sum(header[-2:])
+        f.seek(data_offset)
+        version = np.lib.format.read_magic(f)
+        if version not in _NPY_HEADER_READERS:
+            return None
+        shape, fortran_order, dtype = _NPY_HEADER_READERS[version](f)
+        offset = f.tell()
+    if dtype.hasobject or 0 in shape:
+        return None
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode=mmap_mode,
+        offset=offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
+class EpisodeSource(ABC):
+    """Interface for reading raw episodes to import.
+
+    Sources are shipped to worker processes, so implementations must be
+    picklable and should only open files inside ``load``.
+    """
+
+    @abstractmethod
+    def episode_ids(self) -> list[str]:
+        """List the episodes available in this source.
+
+        Returns:
+            Episode identifiers, in import order.
+        """
+
+    @abstractmethod
+    def load(self, episode_id: str) -> dict[str, np.ndarray]:
+        """Load the raw arrays of an episode.
+
+        Args:
+            episode_id: Identifier returned by ``episode_ids``.
+
+        Returns:
+            Mapping from source name to an array of shape ``(T, ...)``.
+        """
+
+
+class LocalFileEpisodeSource(EpisodeSource):
+    """Episodes stored as NumPy files in a local directory.
+
+    Each episode is either an ``<episode_id>.npz`` archive, or an
+    ``<episode_id>/`` directory of ``.npy`` files. In a directory, the source
+    name of a file is its path relative to the episode directory without the
+    suffix, e.g. ``observation/images/front.npy`` is read as
+    ``observation/images/front``.
+
+    Arrays are memory-mapped by default. Members of compressed archives
+    (``np.savez_compressed``) cannot be mapped and are read into memory.
+    """
+
+    def __init__(self, root: str | Path, mmap_mode: MmapMode | None = "r"):
+        """Initialize the source.
+
+        Args:
+            root: Directory containing one entry per episode.
+            mmap_mode: Mode to memory-map arrays with, ``"r"`` for read-only
+                or ``"c"`` for copy-on-write. None reads arrays into memory.
+        """
+        self.root = Path(root)
+        self.mmap_mode = mmap_mode
+        if not self.root.is_dir():
+            raise ValueError(f"Episode directory not found: {self.root}")
+
+    def episode_ids(self) -> list[str]:
+        """List the episodes in the root directory, sorted by name.
+
+        Returns:
+            Episode identifiers.
+        """
+        return sorted(
+            path.stem if path.suffix == ".npz" else path.name
+            for path in self.root.iterdir()
+            if path.suffix == ".npz" or path.is_dir()
+        )
+
+    def load(self, episode_id: str) -> dict[str, np.ndarray]:
+        """Load the arrays of an episode.
+
+        Args:
+            episode_id: Identifier returned by ``episode_ids``.
+
+        Returns:
+            Mapping from source name to array, memory-mapped unless
+            ``mmap_mode`` is None.
+        """
+        archive = self.root / f"{episode_id}.npz"
+        if archive.is_file():
+            return self._load_npz(archive)
+        directory = self.root / episode_id
+        if not directory.is_dir():
+            raise ValueError(f"Episode not found: {episode_id}")
+        return {
+            path.relative_to(directory)
+            .with_suffix("")
+            .as_posix(): np.load(path, mmap_mode=self.mmap_mode)
+            for path in sorted(directory.rglob("*.npy"))
+        }
+
+    def _load_npz(self, archive: Path) -> dict[str, np.ndarray]:
+        """Load the arrays of an ``.npz`` archive, mapping what can be mapped."""
+        arrays: dict[str, np.ndarray] = {}
+        with np.load(archive) as data:
+            infos = {info.filename: info for info in data.zip.infolist()}
+            for name in data.files:
+                array = None
+                info = infos.get(f"{name}.npy")
+                if self.mmap_mode is not None and info is not None:
+                    array = _mmap_npz_member(archive, info, self.mmap_mode)
+                arrays[name] = data[name] if array is None else array
+        return arrays
@@ -0,0 +1,639 @@
+"""Parallel import of raw episodes into Neuracore data.
+
+``ImportRunner`` drives a ``DatasetImportConfig`` over an ``EpisodeSource``.
+For every episode, each mapping item is extracted from its source array,
+transformed with its compiled transform sequence over the whole trace, turned
+into NCData and optionally encoded to its JSON form, which PNG-encodes camera
+frames. Scalar mapping items reading columns of the same source, like the
+joints of an arm, are extracted and transformed together by a single
+``MappingItemGather``.
+
+Episodes are imported in a process pool. Within an episode, camera streams
+dominate the import time with image transforms and PNG encoding, so they are
+split into chunks of frames and run in a thread pool. Both pools are fed
+through a bounded window of pending tasks: new work is only submitted as
+results are consumed, so a slow consumer applies backpressure instead of
+letting decoded episodes and frames pile up in memory.
+
+Mapping items are selected from their source arrays as views and camera
+streams are transformed one chunk of frames at a time, so with a
+memory-mapped source like ``LocalFileEpisodeSource`` only the frames being
+imported are held in memory.
+
+With ``profile=True`` every episode is imported under a
+``TransformProfiler``, which also times the encoding of every NCData, and
+carries its counters in ``ImportedEpisode.profile``.
+
+Calibration sources that are constant over an episode are transformed once.
+Every frame of the sensor refers to the same arrays, and the episode holds
+them once as a ``StaticCalibration``: encoded frames then leave their
+calibration out, like ``dump_sensor_trace``.
+"""
+
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextvars import Context, copy_context
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+
+from neuracore_types.import_runner.episode_source import (
+    EpisodeSource,
+    iter_time_chunks,
+    select_columns,
+)
+from neuracore_types.importer.config import (
+    ActionSpaceConfig,
+    EndEffectorPoseInputTypeConfig,
+    JointPositionInputTypeConfig,
+)
+from neuracore_types.importer.data_config import MappingItem, PoseDataMappingItem
+from neuracore_types.importer.mapping_gather import (
+    MappingItemGather,
+    group_mapping_items,
+)
+from neuracore_types.importer.profiling import (
+    TransformProfiler,
+    active_profiler,
+    profile_mapping_item,
+)
+from neuracore_types.importer.transform import DataTransformSequence
+from neuracore_types.importer.transform_compiler import CompiledDataTransformSequence
+from neuracore_types.nc_data import (
+    DATA_TYPE_TO_NC_DATA_CLASS,
+    DatasetImportConfig,
+    DataType,
+)
+from neuracore_types.nc_data.camera_data import CameraData
+from neuracore_types.nc_data.custom_1d_data import Custom1DData
+from neuracore_types.nc_data.end_effector_pose_data import EndEffectorPoseData
+from neuracore_types.nc_data.joint_data import JointData
+from neuracore_types.nc_data.language_data import LanguageData
+from neuracore_types.nc_data.nc_data import NCData, NCDataImportConfig
+from neuracore_types.nc_data.parallel_gripper_open_amount_data import (
+    ParallelGripperOpenAmountData,
+)
+from neuracore_types.nc_data.point_cloud_data import PointCloudData
+from neuracore_types.nc_data.pose_data import PoseData
+from neuracore_types.nc_data.static_calibration import (
+    CALIBRATION_FIELDS,
+    StaticCalibration,
+    static_trace_value,
+)
+
+_T = TypeVar("_T")
+
+_CAMERA_DATA_TYPES = frozenset({DataType.RGB_IMAGES, DataType.DEPTH_IMAGES})
+_JOINT_POSITION_DATA_TYPES = frozenset({
+    DataType.JOINT_POSITIONS,
+    DataType.JOINT_TARGET_POSITIONS,
+})
+
+# Field of each NCData class holding the transformed mapping item value
+_VALUE_FIELDS: dict[type[NCData], str] = {
+    JointData: "value",
+    ParallelGripperOpenAmountData: "open_amount",
+    LanguageData: "text",
+    PoseData: "pose",
+    EndEffectorPoseData: "pose",
+    Custom1DData: "data",
+    PointCloudData: "points",
+    CameraData: "frame",
+}
+_SCALAR_FIELDS = frozenset({"value", "open_amount", "text"})
+
+
+class ImportedEpisode(BaseModel):
+    """Data imported from a single episode.
+
+    ``data`` maps each data type to its streams, keyed by mapping item name.
+    Each stream is a list of NCData in time order or, when the runner encodes,
+    of their JSON-serializable ``model_dump(mode="json")`` form.
+
+    ``calibration`` holds the calibration of the streams whose extrinsics and
+    intrinsics are constant over the episode. The NCData of these streams
+    refer to its arrays, and their encoded form leaves the calibration out.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    episode_id: str
+    data: dict[DataType, dict[str, list[Any]]] = Field(default_factory=dict)
+    calibration: dict[DataType, dict[str, StaticCalibration]] = Field(
+        default_factory=dict
+    )
+    profile: TransformProfiler | None = None
+
+
+@dataclass(frozen=True)
+class _Stream:
+    """A mapping item resolved for import."""
+
+    data_type: DataType
+    item: MappingItem
+    source: str
+    nc_data_class: type[NCData]
+    value_field: str
+    transforms: CompiledDataTransformSequence
+    calibration: tuple[tuple[str, str, CompiledDataTransformSequence], ...] = ()
+
+    @property
+    def is_camera(self) -> bool:
+        """Whether this is a camera stream, imported in chunks of frames."""
+        return self.data_type in _CAMERA_DATA_TYPES
+
+
+def _value_field(nc_data_class: type[NCData]) -> str:
+    """Return the field of ``nc_data_class`` holding the imported value."""
+    for cls in nc_data_class.__mro__:
+        if cls in _VALUE_FIELDS:
+            return _VALUE_FIELDS[cls]
+    raise NotImplementedError(f"Importing {nc_data_class.__name__} is not supported")
+
+
+def _validate_supported(config: DatasetImportConfig) -> None:
+    """Reject configurations that need robot kinematics to import."""
+    for data_type, import_config in config.data_import_config.items():
+        data_format = import_config.format
+        if data_type in _JOINT_POSITION_DATA_TYPES and (
+            data_format.joint_position_input_type
+            == JointPositionInputTypeConfig.END_EFFECTOR
+            or data_format.action_space == ActionSpaceConfig.END_EFFECTOR
+        ):
+            raise NotImplementedError(
+                f"{data_type.value} from end effector poses requires "
+                "inverse kinematics, which the import runner does not support"
+            )
+        if (
+            data_type == DataType.END_EFFECTOR_POSES
+            and data_format.ee_pose_input_type
+            == EndEffectorPoseInputTypeConfig.JOINT_POSITIONS
+        ):
+            raise NotImplementedError(
+                f"{data_type.value} from joint positions requires forward "
+                "kinematics, which the import runner does not support"
+            )
+
+
+def _owned(values: np.ndarray, raw: np.ndarray) -> np.ndarray:
+    """Copy transformed values that are still views of a raw source array.
+
+    Sources may be memory-mapped, and imported data must not keep the mapped
+    file open or change with it.
+    """
+    return values.copy() if np.may_share_memory(values, raw) else values
+
+
+def _bounded_map(
+    executor: Executor,
+    fn: Callable[..., _T],
+    args: Iterable[tuple],
+    max_pending: int,
+) -> Iterator[_T]:
+    """Run ``fn(*arg)`` for each ``arg`` with at most ``max_pending`` in flight.
+
+    Tasks are submitted lazily as results are consumed. Results are yielded
+    in completion order.
+
+    Args:
+        executor: Executor to run the tasks in.
+        fn: Task function.
+        args: Positional arguments of each task.
+        max_pending: Maximum number of submitted but unconsumed tasks.
+
+    Yields:
+        Task results.
+    """
+    pending: set[Future[_T]] = set()
+    for arg in args:
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+        pending.add(executor.submit(fn, *arg))
+    for future in as_completed(pending):
+        yield future.result()
+
+
+_WORKER_RUNNER: "ImportRunner | None" = None
+
+
+def _init_worker(runner: "ImportRunner") -> None:
+    """Store the runner in a worker process, so it is only pickled once."""
+    global _WORKER_RUNNER
+    _WORKER_RUNNER = runner
+
+
+def _import_in_worker(episode_id: str) -> ImportedEpisode:
+    """Import an episode with the runner of this worker process."""
+    assert _WORKER_RUNNER is not None
+    return _WORKER_RUNNER.import_episode(episode_id)
+
+
+class ImportRunner:
+    """Import the episodes of an EpisodeSource with a DatasetImportConfig.
+
+    Every mapping item of every configured data type becomes one stream of
+    NCData per episode. Mapping items read the source array named by their
+    ``source_name``, falling back to the ``source`` of their import config and
+    then to their own ``name``.
+
+    Configurations that need robot kinematics (joint positions from end
+    effector poses or the reverse) are not supported.
+    """
+
+    def __init__(
+        self,
+        config: DatasetImportConfig,
+        source: EpisodeSource,
+        max_workers: int | None = None,
+        camera_workers: int = 4,
+        max_pending: int | None = None,
+        chunk_size: int = 16,
+        encode: bool = True,
+        timestamps_source: str = "timestamps",
+        profile: bool = False,
+    ):
+        """Initialize the runner.
+
+        Args:
+            config: Dataset import configuration.
+            source: Source of the raw episodes.
+            max_workers: Number of worker processes importing episodes. 0
+                imports episodes in the calling process. Defaults to the
+                number of CPUs.
+            camera_workers: Number of threads importing camera frames within
+                an episode. 0 imports them in the episode's process thread.
+            max_pending: Maximum number of episodes submitted to the process
+                pool but not yet consumed. Defaults to twice ``max_workers``.
+            chunk_size: Number of camera frames transformed and encoded per
+                thread pool task.
+            encode: Return the JSON form of every NCData, with camera frames
+                PNG-encoded, instead of the NCData itself.
+            timestamps_source: Source array holding the timestamp of every
+                step. Episodes without it are timestamped from
+                ``config.frequency``.
+            profile: Profile the transforms and encoding of every episode,
+                returning the counters in ``ImportedEpisode.profile``.
+        """
+        _validate_supported(config)
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.config = config
+        self.source = source
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self.camera_workers = camera_workers
+        self.max_pending = max_pending or 2 * max(self.max_workers, 1)
+        self.chunk_size = chunk_size
+        self.encode = encode
+        self.timestamps_source = timestamps_source
+        self.profile = profile
+        self._gathers: list[tuple[MappingItemGather, list[_Stream]]] = []
+        self._streams = self._gather([
+            self._resolve(data_type, import_config, item)
+            for data_type, import_config in config.data_import_config.items()
+            for item in import_config.mapping
+        ])
+
+    @staticmethod
+    def _resolve(
+        data_type: DataType, import_config: NCDataImportConfig, item: MappingItem
+    ) -> _Stream:
+        """Resolve a mapping item into a stream with compiled transforms."""
+        calibration = []
+        for field in ("extrinsics", "intrinsics"):
+            calibration_source = getattr(item, f"{field}_source", None)
+            if calibration_source is not None:
+                transforms: DataTransformSequence = getattr(item, f"{field}_transforms")
+                calibration.append((field, calibration_source, transforms.compile()))
+        nc_data_class = DATA_TYPE_TO_NC_DATA_CLASS[data_type]
+        return _Stream(
+            data_type=data_type,
+            item=item,
+            source=item.source_name or import_config.source or item.name,
+            nc_data_class=nc_data_class,
+            value_field=_value_field(nc_data_class),
+            transforms=item.transforms.compile(),
+            calibration=tuple(calibration),
+        )
+
+    def _gather(self, streams: list[_Stream]) -> list[_Stream]:
+        """Group scalar streams reading the same source into single gathers.
+
+        Returns:
+            The streams that are not part of a gather.
+        """
+        by_source: dict[tuple[DataType, str], list[_Stream]] = {}
+        for stream in streams:
+            if not stream.is_camera and not isinstance(
+                stream.item, PoseDataMappingItem
+            ):
+                by_source.setdefault((stream.data_type, stream.source), []).append(
+                    stream
+                )
+        gathered: set[int] = set()
+        for source_streams in by_source.values():
+            gathers, _ = group_mapping_items([stream.item for stream in source_streams])
+            for gather in gathers:
+                gather_streams = [
+                    next(s for s in source_streams if s.item is item)
+                    for item in gather.items
+                ]
+                self._gathers.append((gather, gather_streams))
+                gathered.update(id(stream) for stream in gather_streams)
+        return [stream for stream in streams if id(stream) not in gathered]
+
+    @staticmethod
+    def _source_array(data: dict[str, np.ndarray], name: str) -> np.ndarray:
+        """Return the source array called ``name``."""
+        if name not in data:
+            raise ValueError(f"Source '{name}' not found in episode")
+        return data[name]
+
+    def _extract(self, stream: _Stream, data: dict[str, np.ndarray]) -> np.ndarray:
+        """Extract the raw values of a stream from the episode arrays."""
+        item = stream.item
+        if isinstance(item, PoseDataMappingItem) and (
+            item.pose_position_source_name is not None
+            or item.pose_position_index_range is not None
+        ):
+            position = select_columns(
+                self._source_array(
+                    data, item.pose_position_source_name or stream.source
+                ),
+                None,
+                item.pose_position_index_range,
+            )
+            orientation = select_columns(
+                self._source_array(
+                    data, item.pose_orientation_source_name or stream.source
+                ),
+                None,
+                item.pose_orientation_index_range,
+            )
+            return np.concatenate([position, orientation], axis=-1)
+        return select_columns(
+            self._source_array(data, stream.source), item.index, item.index_range
+        )
+
+    def _timestamps(self, data: dict[str, np.ndarray], length: int) -> np.ndarray:
+        """Return the timestamps of a stream of ``length`` steps."""
+        if self.timestamps_source in data:
+            timestamps = np.asarray(data[self.timestamps_source], dtype=np.float64)
+            if len(timestamps) != length:
+                raise ValueError(
+                    f"Expected {length} timestamps, got {len(timestamps)} in "
+                    f"'{self.timestamps_source}'"
+                )
+            return timestamps
+        if self.config.frequency is None:
+            raise ValueError(
+                f"Episode has no '{self.timestamps_source}' source and the "
+                "config does not set a frequency"
+            )
+        return np.arange(length) / self.config.frequency
+
+    def _import_chunk(
+        self,
+        stream: _Stream,
+        chunk: np.ndarray,
+        timestamps: np.ndarray,
+        data: dict[str, np.ndarray],
+        start: int = 0,
+        static: dict[str, np.ndarray] | None = None,
+    ) -> list[Any]:
+        """Import the raw values and timestamps of steps from ``start``."""
+        with profile_mapping_item(stream.item.name):
+            values = _owned(stream.transforms.apply_batch(chunk), chunk)
+            return self._to_nc_data(stream, values, timestamps, data, start, static)
+
+    def _static_calibration(
+        self, stream: _Stream, data: dict[str, np.ndarray]
+    ) -> dict[str, np.ndarray]:
+        """Transform the calibration sources of a stream that are constant.
+
+        Returns:
+            The transformed, read-only calibration of each constant source,
+            keyed by NCData field.
+        """
+        static = {}
+        for field, name, transforms in stream.calibration:
+            raw = self._source_array(data, name)
+            if static_trace_value(raw) is not None:
+                value = _owned(transforms.apply_batch(raw[:1]), raw)[0]
+                value.flags.writeable = False
+                static[field] = value
+        return static
+
+    def _to_nc_data(
+        self,
+        stream: _Stream,
+        values: np.ndarray,
+        timestamps: np.ndarray,
+        data: dict[str, np.ndarray],
+        start: int = 0,
+        static: dict[str, np.ndarray] | None = None,
+    ) -> list[Any]:
+        """Build the NCData of transformed values of steps from ``start``.
+
+        Calibration fields in ``static`` are shared by every NCData instead of
+        being transformed per step.
+        """
+        static = static or {}
+        stop = start + len(values)
+        rows = (
+            values.tolist()
+            if stream.value_field in _SCALAR_FIELDS
+            else [np.atleast_1d(row) for row in values]
+        )
+        calibration = []
+        for field, name, transforms in stream.calibration:
+            if field not in static:
+                raw = self._source_array(data, name)[start:stop]
+                calibration.append((field, _owned(transforms.apply_batch(raw), raw)))
+        profiler = active_profiler()
+        # Frames of a static calibration refer to the episode's calibration
+        exclude = set(CALIBRATION_FIELDS) if static and not calibration else None
+        imported: list[Any] = []
+        for offset, timestamp in enumerate(timestamps.tolist()):
+            fields: dict[str, Any] = {
+                "timestamp": timestamp,
+                stream.value_field: rows[offset],
+                **static,
+            }
+            for field, calibration_values in calibration:
+                fields[field] = calibration_values[offset]
+            if stream.is_camera:
+                fields["frame_idx"] = start + offset
+            nc_data = stream.nc_data_class(**fields)
+            if not self.encode:
+                imported.append(nc_data)
+            elif profiler is None:
+                imported.append(nc_data.model_dump(mode="json", exclude=exclude))
+            else:
+                encode_start = time.perf_counter()
+                dumped = nc_data.model_dump(mode="json", exclude=exclude)
+                profiler.record(
+                    f"encode {stream.nc_data_class.__name__}",
+                    time.perf_counter() - encode_start,
+                    rows[offset],
+                    dumped[stream.value_field],
+                )
+                imported.append(dumped)
+        return imported
+
+    def _import_cameras(
+        self,
+        streams: list[_Stream],
+        data: dict[str, np.ndarray],
+        statics: list[dict[str, np.ndarray]],
+    ) -> list[list[Any]]:
+        """Import camera streams in chunks of frames in a thread pool."""
+        # Extracted once per stream, chunks are views of them
+        raws = [self._extract(stream, data) for stream in streams]
+        timestamps = [self._timestamps(data, len(raw)) for raw in raws]
+
+        def import_chunk(index: int, start: int, chunk: np.ndarray) -> list[Any]:
+            return self._import_chunk(
+                streams[index],
+                chunk,
+                timestamps[index][start : start + len(chunk)],
+                data,
+                start,
+                statics[index],
+            )
+
+        def run_chunk(
+            context: Context, index: int, start: int, chunk: np.ndarray
+        ) -> tuple[int, int, list[Any]]:
+            return index, start, context.run(import_chunk, index, start, chunk)
+
+        chunks = (
+            (index, start, chunk)
+            for index, raw in enumerate(raws)
+            for start, chunk in iter_time_chunks(raw, self.chunk_size)
+        )
+        results: dict[tuple[int, int], list[Any]] = {}
+        if self.camera_workers == 0:
+            # Still chunked, so only one chunk of frames is read at a time
+            for index, start, chunk in chunks:
+                results[index, start] = import_chunk(index, start, chunk)
+        else:
+            with ThreadPoolExecutor(self.camera_workers) as executor:
+                # Every chunk runs in a copy of this thread's context, to
+                # record into its active profiler
+                for index, start, imported in _bounded_map(
+                    executor,
+                    run_chunk,
+                    ((copy_context(), *chunk) for chunk in chunks),
+                    2 * self.camera_workers,
+                ):
+                    results[index, start] = imported
+        return [
+            [
+                item
+                for key in sorted(results)
+                if key[0] == index
+                for item in results[key]
+            ]
+            for index in range(len(streams))
+        ]
+
+    def import_episode(self, episode_id: str) -> ImportedEpisode:
+        """Import a single episode in the calling process.
+
+        Args:
+            episode_id: Identifier of the episode in the source.
+
+        Returns:
+            The imported episode.
+        """
+        if not self.profile:
+            return self._import_episode(episode_id)
+        with TransformProfiler() as profiler:
+            episode = self._import_episode(episode_id)
+        episode.profile = profiler
+        return episode
+
+    def _import_episode(self, episode_id: str) -> ImportedEpisode:
+        """Import a single episode."""
+        data = self.source.load(episode_id)
+        imported: dict[DataType, dict[str, list[Any]]] = {}
+        calibration: dict[DataType, dict[str, StaticCalibration]] = {}
+        statics = [self._static_calibration(stream, data) for stream in self._streams]
+        for stream, static in zip(self._streams, statics):
+            if static and len(static) == len(stream.calibration):
+                calibration.setdefault(stream.data_type, {})[stream.item.name] = (
+                    StaticCalibration.model_construct(
+                        None, **{**dict.fromkeys(CALIBRATION_FIELDS), **static}
+                    )
+                )
+        for gather, streams in self._gathers:
+            with profile_mapping_item(", ".join(gather.names)):
+                values = gather.apply_batch(self._source_array(data, streams[0].source))
+            timestamps = self._timestamps(data, len(values))
+            for column, stream in enumerate(streams):
+                with profile_mapping_item(stream.item.name):
+                    imported.setdefault(stream.data_type, {})[stream.item.name] = (
+                        self._to_nc_data(stream, values[:, column], timestamps, data)
+                    )
+        cameras = []
+        for stream, static in zip(self._streams, statics):
+            if stream.is_camera:
+                cameras.append((stream, static))
+            else:
+                raw = self._extract(stream, data)
+                timestamps = self._timestamps(data, len(raw))
+                imported.setdefault(stream.data_type, {})[stream.item.name] = (
+                    self._import_chunk(stream, raw, timestamps, data, static=static)
+                )
+        camera_data = self._import_cameras(
+            [stream for stream, _ in cameras],
+            data,
+            [static for _, static in cameras],
+        )
+        for (stream, _), stream_data in zip(cameras, camera_data):
+            imported.setdefault(stream.data_type, {})[stream.item.name] = stream_data
+        return ImportedEpisode.model_construct(
+            None, episode_id=episode_id, data=imported, calibration=calibration
+        )
+
+    def run(
+        self, episode_ids: Iterable[str] | None = None
+    ) -> Iterator[ImportedEpisode]:
+        """Import episodes in parallel.
+
+        Args:
+            episode_ids: Episodes to import. Defaults to every episode of the
+                source.
+
+        Yields:
+            Imported episodes, in completion order.
+        """
+        if episode_ids is None:
+            episode_ids = self.source.episode_ids()
+        if self.max_workers == 0:
+            for episode_id in episode_ids:
+                yield self.import_episode(episode_id)
+            return
+        with ProcessPoolExecutor(
+            self.max_workers, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            yield from _bounded_map(
+                executor,
+                _import_in_worker,
+                ((episode_id,) for episode_id in episode_ids),
+                self.max_pending,
+            )
@@ -7,7 +7,10 @@ Main components:
 
 - config: Core enums and models for dataset and import configuration.
 - data_config: Classes for mapping, formatting, and normalizing input data.
+- mapping_gather: Single-pass extraction of scalar mapping items of a source.
+- profiling: Opt-in per-transform and per-mapping item profiling counters.
 - transform: Tools for applying transformations to imported data.
+- transform_compiler: Fused execution of transform sequences.
 
 Use these modules to define how your raw data is interpreted, formatted, and converted
 for use in Neuracore.
@@ -15,4 +18,7 @@ for use in Neuracore.
 
 from neuracore_types.importer.config import *  # noqa: F403
 from neuracore_types.importer.data_config import *  # noqa: F403
+from neuracore_types.importer.mapping_gather import *  # noqa: F403
+from neuracore_types.importer.profiling import *  # noqa: F403
 from neuracore_types.importer.transform import *  # noqa: F403
+from neuracore_types.importer.transform_compiler import *  # noqa: F403
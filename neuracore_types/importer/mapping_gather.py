@@ -0,0 +1,160 @@
+"""Gather many scalar mapping items from one source in a single pass.
+
+Scalar data types (joints, gripper open amounts) map every column of a wide
+source, e.g. a ``(T, 30)`` arm state, to its own mapping item with its own
+transform sequence. The sequences only differ in their tail: the shared
+format transforms are followed by an optional ``FlipSign`` and ``Offset``
+for the item and a final ``NumpyToScalar``.
+
+``MappingItemGather`` takes the columns of all such items with one fancy
+index, applies the shared transforms once to the ``(T, N)`` block and the
+per-item sign flips and offsets as column vectors. Results are bit-identical
+to transforming every item on its own: multiplying by 1.0 and adding -0.0
+leave every value unchanged, so items without a flip or offset can share the
+vectorized step.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from neuracore_types.importer.data_config import MappingItem
+from neuracore_types.importer.transform import (
+    DataTransform,
+    DataTransformSequence,
+    ElementwiseDataTransform,
+    FlipSign,
+    ImageChannelOrder,
+    NumpyToScalar,
+    Offset,
+)
+
+
+def _split_transforms(
+    item: MappingItem,
+) -> tuple[list[DataTransform], bool, float | None] | None:
+    """Split an item's transforms into shared transforms, flip and offset.
+
+    Returns:
+        The element-wise transforms before the item's own tail, whether the
+        item flips its sign and its offset, or None if the item does not
+        select a single column with the expected tail.
+    """
+    transforms = list(item.transforms.transforms)
+    if item.index is None or not transforms:
+        return None
+    if not isinstance(transforms.pop(), NumpyToScalar):
+        return None
+    offset = None
+    if transforms and isinstance(transforms[-1], Offset):
+        offset = transforms[-1].value
+        transforms.pop()
+    flip = bool(transforms) and isinstance(transforms[-1], FlipSign)
+    if flip:
+        transforms.pop()
+    # ImageChannelOrder reorders the last axis, which would mix the columns
+    if not all(
+        isinstance(t, ElementwiseDataTransform) and not isinstance(t, ImageChannelOrder)
+        for t in transforms
+    ):
+        return None
+    return transforms, flip, offset
+
+
+class MappingItemGather:
+    """Extract and transform scalar mapping items of one source together.
+
+    Use ``group_mapping_items`` to split a list of mapping items into gathers.
+    """
+
+    def __init__(self, items: Sequence[MappingItem]):
+        """Initialize the gather.
+
+        Args:
+            items: Mapping items reading single columns of the same source,
+                whose transforms differ only in their sign flip and offset.
+        """
+        if not items:
+            raise ValueError("A gather needs at least one mapping item")
+        splits: list[tuple[list[DataTransform], bool, float | None]] = []
+        for item in items:
+            split = _split_transforms(item)
+            if split is None or (splits and split[0] != splits[0][0]):
+                raise ValueError(
+                    "Mapping items can only be gathered if they select a single "
+                    "column and share their transforms up to a sign flip and "
+                    "offset"
+                )
+            splits.append(split)
+        offsets = [offset for _, _, offset in splits]
+        self.items = list(items)
+        self.names = [item.name for item in items]
+        self.index = np.array([item.index for item in items], dtype=np.intp)
+        self.transforms = DataTransformSequence(transforms=splits[0][0]).compile()
+        self.flip = np.array([flip for _, flip, _ in splits], dtype=bool)
+        # -0.0 is the additive identity for every value, including -0.0
+        self.offset = np.array(
+            [-0.0 if offset is None else offset for offset in offsets],
+            dtype=np.float64,
+        )
+        self._flips = bool(self.flip.any())
+        self._offsets = any(offset is not None for offset in offsets)
+
+    def apply_batch(self, data: np.ndarray) -> np.ndarray:
+        """Extract and transform every item from a source.
+
+        Args:
+            data: Source array of shape ``(T, M)``.
+
+        Returns:
+            Transformed values of shape ``(T, N)``, column ``j`` belonging to
+            ``items[j]``. Columns are contiguous in memory.
+        """
+        # Gather item-major, so that every item's trace is contiguous. The
+        # fancy index copies, so every step can then work in place.
+        values = np.asarray(data).T[self.index]
+        in_place = self.transforms.result_dtype(values.dtype) == values.dtype
+        values = self.transforms.apply_batch(values, out=values if in_place else None)
+        if self._flips:
+            # Python floats are weakly typed, so match their promotion
+            dtype = np.result_type(values.dtype, -1.0)
+            sign = np.where(self.flip, -1.0, 1.0).astype(dtype)[:, np.newaxis]
+            values = np.multiply(
+                values, sign, out=values if values.dtype == dtype else None
+            )
+        if self._offsets:
+            dtype = np.result_type(values.dtype, 0.0)
+            values = np.add(
+                values,
+                self.offset.astype(dtype)[:, np.newaxis],
+                out=values if values.dtype == dtype else None,
+            )
+        return values.T
+
+
+def group_mapping_items(
+    items: Sequence[MappingItem],
+) -> tuple[list[MappingItemGather], list[MappingItem]]:
+    """Group mapping items of one source into gathers.
+
+    Args:
+        items: Mapping items reading the same source.
+
+    Returns:
+        The gathers, in order of their first item, and the items that cannot
+        be gathered.
+    """
+    groups: list[tuple[list[DataTransform], list[MappingItem]]] = []
+    remaining = []
+    for item in items:
+        split = _split_transforms(item)
+        if split is None:
+            remaining.append(item)
+            continue
+        for shared, group in groups:
+            if shared == split[0]:
+                group.append(item)
+                break
+        else:
+            groups.append((split[0], [item]))
+    return [MappingItemGather(group) for _, group in groups], remaining
@@ -0,0 +1,249 @@
+"""Opt-in profiling of data transforms during import.
+
+Activate a ``TransformProfiler`` as a context manager to record, for every
+transform class and mapping item, the number of calls, the cumulative wall
+time and the bytes going in and out::
+
+    with TransformProfiler() as profiler:
+        runner.import_episode(episode_id)
+    print(profiler.report())
+
+``DataTransformSequence``, compiled sequences and ``ImportRunner`` (including
+the PNG encoding of camera frames) record into the active profiler. When no
+profiler is active they only check ``active_profiler()`` once per sequence
+call. Compiled sequences fuse element-wise transforms, so their steps are
+recorded by operation, e.g. ``compiled clip``, while opaque transforms like
+``Pose`` keep their class name.
+
+The active profiler and the mapping item of a record, set with
+``profile_mapping_item``, are ``contextvars.ContextVar``s: they are tracked
+per thread and per asyncio task, so concurrent imports each record into
+their own profiler. Work handed to a thread pool runs in a
+``contextvars.copy_context()`` of the submitting thread to record into its
+profiler.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Literal, TypeVar
+
+from pydantic import BaseModel
+
+_T = TypeVar("_T")
+
+_ACTIVE_PROFILER: ContextVar["TransformProfiler | None"] = ContextVar(
+    "active_profiler", default=None
+)
+_MAPPING_ITEM: ContextVar[str | None] = ContextVar("mapping_item", default=None)
+# Profilers entered in the current context, with the tokens restoring the
+# profiler active before them. Tokens can only be reset in the context that
+# created them, so a profiler entered in several threads keeps one per thread.
+_ENTERED: ContextVar[
+    tuple[tuple["TransformProfiler", Token["TransformProfiler | None"]], ...]
+] = ContextVar("entered_profilers", default=())
+
+
+def active_profiler() -> "TransformProfiler | None":
+    """Return the active profiler, or None if profiling is disabled."""
+    return _ACTIVE_PROFILER.get()
+
+
+@contextmanager
+def profile_mapping_item(name: str) -> Iterator[None]:
+    """Attribute the transforms run inside the context to a mapping item.
+
+    Args:
+        name: Name of the mapping item.
+    """
+    token = _MAPPING_ITEM.set(name)
+    try:
+        yield
+    finally:
+        _MAPPING_ITEM.reset(token)
+
+
+def _nbytes(data: Any) -> int:
+    """Size of ``data`` in bytes, or 0 if unknown."""
+    if isinstance(data, (str, bytes)):
+        return len(data)
+    return getattr(data, "nbytes", 0)
+
+
+class TransformStats(BaseModel):
+    """Counters of one transform, mapping item or pair of both."""
+
+    calls: int = 0
+    seconds: float = 0.0
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+    def merge(self, other: "TransformStats") -> "TransformStats":
+        """Combine with the counters of another run.
+
+        Args:
+            other: Counters to add.
+
+        Returns:
+            TransformStats: New counters holding the sums of both.
+        """
+        return TransformStats(
+            calls=self.calls + other.calls,
+            seconds=self.seconds + other.seconds,
+            bytes_in=self.bytes_in + other.bytes_in,
+            bytes_out=self.bytes_out + other.bytes_out,
+        )
+
+
+class TransformProfiler:
+    """Collect per-transform and per-mapping item counters.
+
+    Profilers are thread-safe and picklable, so worker processes can profile
+    their own imports and send the results back to be merged. A profiler is
+    active in the thread or task that entered it, and the same profiler can
+    be entered by several threads at once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty profiler."""
+        # Keyed by (transform name, mapping item name)
+        self.stats: dict[tuple[str, str | None], TransformStats] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "TransformProfiler":
+        """Activate this profiler until the context exits."""
+        token = _ACTIVE_PROFILER.set(self)
+        _ENTERED.set((*_ENTERED.get(), (self, token)))
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Restore the previously active profiler.
+
+        Raises:
+            ValueError: If the profiler was not entered in this context.
+        """
+        entered = _ENTERED.get()
+        for index in reversed(range(len(entered))):
+            profiler, token = entered[index]
+            if profiler is self:
+                _ACTIVE_PROFILER.reset(token)
+                _ENTERED.set(entered[:index] + entered[index + 1 :])
+                return
+        raise ValueError("The profiler was not entered in this context")
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the counters only."""
+        return {"stats": self.stats}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled profiler."""
+        self.__init__()  # type: ignore[misc]
+        self.stats = state["stats"]
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        data_in: Any = None,
+        data_out: Any = None,
+    ) -> None:
+        """Record one call, attributed to the current mapping item.
+
+        Args:
+            name: Name of the transform or operation.
+            seconds: Wall time of the call.
+            data_in: Input of the call, to count its bytes.
+            data_out: Output of the call, to count its bytes.
+        """
+        key = (name, _MAPPING_ITEM.get())
+        bytes_in, bytes_out = _nbytes(data_in), _nbytes(data_out)
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = TransformStats()
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.bytes_in += bytes_in
+            stats.bytes_out += bytes_out
+
+    def call(self, name: str, fn: Callable[[Any], _T], data: Any) -> _T:
+        """Call ``fn(data)`` and record it.
+
+        Args:
+            name: Name of the transform or operation.
+            fn: Function to call.
+            data: Argument of ``fn``.
+
+        Returns:
+            The result of ``fn(data)``.
+        """
+        start = time.perf_counter()
+        result = fn(data)
+        self.record(name, time.perf_counter() - start, data, result)
+        return result
+
+    def merge(self, other: "TransformProfiler") -> None:
+        """Add the counters of another profiler, e.g. of a worker process.
+
+        Args:
+            other: Profiler to merge into this one.
+        """
+        with self._lock:
+            for key, stats in other.stats.items():
+                self.stats[key] = self.stats.get(key, TransformStats()).merge(stats)
+
+    def summary(
+        self, by: Literal["transform", "item"] | None = "transform"
+    ) -> list[tuple[str, TransformStats]]:
+        """Aggregate the counters, slowest first.
+
+        Args:
+            by: Aggregate per transform or per mapping item. None keeps one
+                entry per transform and mapping item, labelled
+                ``"<transform> [<item>]"``.
+
+        Returns:
+            Labels and their counters, sorted by decreasing wall time.
+        """
+        totals: dict[str, TransformStats] = {}
+        with self._lock:
+            for (name, item), stats in self.stats.items():
+                if by == "transform":
+                    label = name
+                elif by == "item":
+                    label = str(item)
+                else:
+                    label = name if item is None else f"{name} [{item}]"
+                totals[label] = totals.get(label, TransformStats()).merge(stats)
+        return sorted(totals.items(), key=lambda entry: -entry[1].seconds)
+
+    def report(
+        self,
+        by: Literal["transform", "item"] | None = "transform",
+        limit: int | None = None,
+    ) -> str:
+        """Format the summary as a table.
+
+        Args:
+            by: Aggregation of the rows, as in ``summary``.
+            limit: Maximum number of rows, slowest first.
+
+        Returns:
+            The table, one row per label.
+        """
+        entries = self.summary(by)
+        total = sum(stats.seconds for _, stats in entries) or 1.0
+        width = max([len("name"), *(len(label) for label, _ in entries)])
+        lines = [
+            f"{'name':<{width}} {'calls':>8} {'total ms':>10} {'%':>6} "
+            f"{'MB in':>9} {'MB out':>9}"
+        ]
+        for label, stats in entries[:limit]:
+            lines.append(
+                f"{label:<{width}} {stats.calls:>8} {stats.seconds * 1e3:>10.2f} "
+                f"{100 * stats.seconds / total:>6.1f} {stats.bytes_in / 1e6:>9.2f} "
+                f"{stats.bytes_out / 1e6:>9.2f}"
+            )
+        return "\n".join(lines)
@@ -3,11 +3,25 @@
 This module provides tools to convert and standardize raw input data for use
 in Neuracore datasets. The transformations are applied to the data in the
 order they are specified.
+
+Every transform can be applied to a single sample with ``__call__`` or to a
+whole trace of samples stacked along a leading time axis with
+``apply_batch``. The batched path is vectorized, so prefer it when converting
+full episodes. Sequences of element-wise transforms can additionally be
+fused with ``DataTransformSequence.compile``.
+
+Transforms without fields, like ``FlipSign``, cannot be modified, so copying
+or unpickling one returns a shared instance. Import configurations copy
+their transform lists for every mapping item, so identical stateless
+transforms are shared across items and across configs.
 """
 
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
 import numpy as np
-from pydantic import BaseModel, ConfigDict, Field, field_validator
-from scipy.spatial.transform import Rotation as R
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 from neuracore_types.importer.config import (
     AngleConfig,
@@ -22,6 +36,29 @@ from neuracore_types.importer.config import (
     QuaternionOrderConfig,
     RotationConfig,
 )
+from neuracore_types.importer.profiling import active_profiler
+from neuracore_types.utils.quaternion_utils import (
+    quat_from_euler,
+    quat_from_matrix,
+    quat_from_rotvec,
+    quat_left_matrix,
+    quat_normalize,
+    quat_power,
+    quat_right_matrix,
+    quat_rotate,
+    quat_to_matrix,
+)
+
+if TYPE_CHECKING:
+    from neuracore_types.importer.transform_compiler import (
+        CompiledDataTransformSequence,
+    )
+
+
+@cache
+def _stateless_transform(cls: type["DataTransform"]) -> "DataTransform":
+    """Return the shared instance of a transform class without fields."""
+    return cls()
 
 
 class DataTransform(BaseModel):
@@ -29,22 +66,123 @@ class DataTransform(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    def __copy__(self) -> "DataTransform":
+        """Copy the transform, sharing it if it has no fields."""
+        if not type(self).model_fields:
+            return self
+        return super().__copy__()
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "DataTransform":
+        """Deep copy the transform, sharing it if it has no fields."""
+        if not type(self).model_fields:
+            return self
+        return super().__deepcopy__(memo)
+
+    def __reduce__(self) -> Any:
+        """Pickle transforms without fields as a reference to their class."""
+        if not type(self).model_fields:
+            return _stateless_transform, (type(self),)
+        return super().__reduce__()
+
     def __call__(self, data: np.ndarray) -> np.ndarray:
         """Transform the data."""
         raise NotImplementedError("Subclasses must implement __call__")
 
+    def apply_batch(self, data: np.ndarray) -> np.ndarray:
+        """Transform a batch of samples stacked along the first axis.
+
+        Subclasses should override this with a vectorized implementation; the
+        default applies ``__call__`` to each sample in turn.
+
+        Args:
+            data: Samples of shape ``(T, ...)``.
+
+        Returns:
+            np.ndarray: Transformed samples of shape ``(T, ...)``.
+        """
+        return np.stack([self(sample) for sample in data])
+
+
+class ElementwiseDataTransform(DataTransform):
+    """Base class for transforms applied independently to every element.
+
+    These transforms work on arrays of any shape, so a batch is transformed
+    with the same call as a single sample.
+    """
+
+    def apply_batch(self, data: np.ndarray) -> np.ndarray:
+        """Transform a batch of samples stacked along the first axis."""
+        return self(data)
+
 
 class DataTransformSequence(DataTransform):
     """Sequence of data transformations."""
 
     transforms: list[DataTransform] = Field(default_factory=list)
 
+    @field_validator("transforms")
+    @classmethod
+    def share_stateless_transforms(
+        cls, transforms: list[DataTransform]
+    ) -> list[DataTransform]:
+        """Replace transforms without fields by their shared instance."""
+        return [
+            _stateless_transform(type(t)) if not type(t).model_fields else t
+            for t in transforms
+        ]
+
     def __call__(self, data: np.ndarray) -> np.ndarray:
         """Apply all transforms in sequence to the data."""
+        profiler = active_profiler()
         for transform in self.transforms:
-            data = transform(data)
+            if profiler is None or isinstance(transform, DataTransformSequence):
+                data = transform(data)
+            else:
+                data = profiler.call(type(transform).__name__, transform, data)
         return data
 
+    def apply_batch(self, data: np.ndarray) -> np.ndarray:
+        """Apply all transforms in sequence to a batch of samples."""
+        profiler = active_profiler()
+        for transform in self.transforms:
+            if profiler is None or isinstance(transform, DataTransformSequence):
+                data = transform.apply_batch(data)
+            else:
+                data = profiler.call(
+                    type(transform).__name__, transform.apply_batch, data
+                )
+        return data
+
+    def compile(
+        self, exact: bool = True, reuse_buffers: bool = False
+    ) -> "CompiledDataTransformSequence":
+        """Compile the sequence into a fused pipeline.
+
+        Args:
+            exact: Only apply optimizations that keep results bit-identical
+                to this sequence.
+            reuse_buffers: Reuse output buffers across calls with the same
+                shapes.
+
+        Returns:
+            CompiledDataTransformSequence: Callable equivalent of this sequence.
+        """
+        from neuracore_types.importer.transform_compiler import (
+            CompiledDataTransformSequence,
+        )
+
+        return CompiledDataTransformSequence(
+            self, exact=exact, reuse_buffers=reuse_buffers
+        )
+
+
+def _check_pose_batch(pose: np.ndarray) -> None:
+    """Raise if ``pose`` is not a batch of [x, y, z, qx, qy, qz, qw] poses."""
+    if pose.ndim != 2 or pose.shape[1] != 7:
+        raise ValueError(
+            "Expected poses of shape (T, 7) in [x, y, z, qx, qy, qz, qw] format"
+        )
+
 
 class Rotation(DataTransform):
     """Convert rotations to quaternion xyzw."""
@@ -64,24 +202,28 @@ class Rotation(DataTransform):
 
     def __call__(self, values: np.ndarray) -> np.ndarray:
         """Convert rotation to quaternion xyzw format."""
+        return self.apply_batch(np.asarray(values)[np.newaxis])[0]
+
+    def apply_batch(self, values: np.ndarray) -> np.ndarray:
+        """Convert a batch of rotations to quaternions of shape ``(T, 4)``."""
         if self.rotation_type == RotationConfig.QUATERNION:
             if self.seq == QuaternionOrderConfig.XYZW:
                 return values
             elif self.seq == QuaternionOrderConfig.WXYZ:
-                return values[[1, 2, 3, 0]]
+                return values[..., [1, 2, 3, 0]]
             else:
                 raise ValueError(f"Unsupported quaternion order: {self.seq}")
         elif self.rotation_type == RotationConfig.MATRIX:
-            return R.from_matrix(values).as_quat()
+            return quat_from_matrix(values)
         elif self.rotation_type == RotationConfig.EULER:
             seq_str = (
                 self.seq.value.upper()
                 if self.extrinsic_euler
                 else self.seq.value.lower()
             )
-            return R.from_euler(seq_str, values, degrees=self.degrees).as_quat()
+            return quat_from_euler(seq_str, values, degrees=self.degrees)
         elif self.rotation_type == RotationConfig.AXIS_ANGLE:
-            return R.from_rotvec(values, degrees=self.degrees).as_quat()
+            return quat_from_rotvec(values, degrees=self.degrees)
         else:
             raise ValueError(f"Unsupported rotation type: {self.rotation_type}")
 
@@ -96,37 +238,41 @@ class Pose(DataTransform):
     # Forwarded to the internal Rotation transform; see Rotation.extrinsic_euler.
     extrinsic_euler: bool = False
 
+    _rotation_transform: Rotation = PrivateAttr()
+
     def model_post_init(self, __context: object) -> None:
         """Initialize rotation_transform after model initialization."""
         if self.pose_type == PoseConfig.POSITION_ORIENTATION:
-            object.__setattr__(
-                self,
-                "rotation_transform",
-                Rotation(
-                    rotation_type=self.rotation_type,
-                    angle_type=self.angle_type,
-                    seq=self.seq,
-                    extrinsic_euler=self.extrinsic_euler,
-                ),
+            self._rotation_transform = Rotation(
+                rotation_type=self.rotation_type,
+                angle_type=self.angle_type,
+                seq=self.seq,
+                extrinsic_euler=self.extrinsic_euler,
             )
         elif self.pose_type == PoseConfig.MATRIX:
-            object.__setattr__(
-                self,
-                "rotation_transform",
-                Rotation(rotation_type=RotationConfig.MATRIX),
-            )
+            self._rotation_transform = Rotation(rotation_type=RotationConfig.MATRIX)
         else:
             raise ValueError(f"Unsupported pose type: {self.pose_type}")
 
     def __call__(self, pose: np.ndarray) -> np.ndarray:
         """Convert pose to position and quaternion rotation."""
+        return self.apply_batch(np.asarray(pose)[np.newaxis])[0]
+
+    def apply_batch(self, pose: np.ndarray) -> np.ndarray:
+        """Convert a batch of poses to shape ``(T, 7)``."""
+        rotation_transform = self._rotation_transform
         if self.pose_type == PoseConfig.POSITION_ORIENTATION:
-            return np.concatenate([pose[:3], self.rotation_transform(pose[3:])])
+            return np.concatenate(
+                [pose[:, :3], rotation_transform.apply_batch(pose[:, 3:])], axis=-1
+            )
         elif self.pose_type == PoseConfig.MATRIX:
-            if pose.ndim == 1:
-                pose = pose.reshape(4, 4)
-            rot_mat = pose[:3, :3]
-            return np.concatenate([pose[:3, 3], self.rotation_transform(rot_mat)])
+            if pose.ndim == 2:
+                pose = pose.reshape(-1, 4, 4)
+            rot_mat = pose[:, :3, :3]
+            return np.concatenate(
+                [pose[:, :3, 3], rotation_transform.apply_batch(rot_mat)], axis=-1
+            )
+        raise ValueError(f"Unsupported pose type: {self.pose_type}")
 
 
 class ScalePosition(DataTransform):
@@ -141,8 +287,13 @@ class ScalePosition(DataTransform):
         """
         if pose.shape != (7,):
             raise ValueError("Expected pose to be in [x, y, z, qx, qy, qz, qw] format")
+        return self.apply_batch(pose[np.newaxis])[0]
+
+    def apply_batch(self, pose: np.ndarray) -> np.ndarray:
+        """Scale the positions of a batch of poses of shape ``(T, 7)``."""
+        _check_pose_batch(pose)
         pose = pose.copy()
-        pose[:3] = pose[:3] * self.factor
+        pose[:, :3] = pose[:, :3] * self.factor
         return pose
 
 
@@ -158,12 +309,42 @@ class ScaleOrientation(DataTransform):
         """
         if pose.shape != (7,):
             raise ValueError("Expected pose to be in [x, y, z, qx, qy, qz, qw] format")
+        return self.apply_batch(pose[np.newaxis])[0]
+
+    def apply_batch(self, pose: np.ndarray) -> np.ndarray:
+        """Scale the orientations of a batch of poses of shape ``(T, 7)``."""
+        _check_pose_batch(pose)
         pose = pose.copy()
-        rotvec = R.from_quat(pose[3:]).as_rotvec()
-        pose[3:] = R.from_rotvec(rotvec * self.factor).as_quat()
+        pose[:, 3:] = quat_power(quat_normalize(pose[:, 3:]), self.factor)
         return pose
 
 
+@dataclass(frozen=True, eq=False)
+class _FrameMatrices:
+    """Constant transforms of an ``ApplyFrameTransform``, precomposed.
+
+    Attributes:
+        world: Product ``W`` of the WORLD entries.
+        tool: Product ``B`` of the TOOL entries.
+        quaternion: ``q -> w * q * b`` as a single 4x4 linear map on xyzw
+            quaternions.
+    """
+
+    world: np.ndarray
+    tool: np.ndarray
+    quaternion: np.ndarray
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the matrices by value, as pydantic compares private attributes."""
+        if not isinstance(other, _FrameMatrices):
+            return NotImplemented
+        return (
+            np.array_equal(self.world, other.world)
+            and np.array_equal(self.tool, other.tool)
+            and np.array_equal(self.quaternion, other.quaternion)
+        )
+
+
 class ApplyFrameTransform(DataTransform):
     """Apply a sequence of constant SE(3) transforms to a pose.
 
@@ -184,27 +365,67 @@ class ApplyFrameTransform(DataTransform):
 
     transforms: list[FrameTransformConfig] = Field(default_factory=list)
 
+    _matrices: "_FrameMatrices" = PrivateAttr()
+
+    def model_post_init(self, __context: object) -> None:
+        """Precompose the constant WORLD and TOOL transforms.
+
+        Matrix products are associative, so however the entries interleave the
+        result is ``T' = W @ T @ B`` with ``W`` the product of all WORLD entries
+        (last first) and ``B`` the product of all TOOL entries (in order).
+        """
+        world, tool = np.eye(4), np.eye(4)
+        for transform in self.transforms:
+            X = self._to_matrix(transform)
+            if transform.frame == Frame.WORLD:
+                world = X @ world
+            else:  # TOOL
+                tool = tool @ X
+        self._matrices = _FrameMatrices(
+            world=world,
+            tool=tool,
+            quaternion=quat_left_matrix(quat_from_matrix(world[:3, :3]))
+            @ quat_right_matrix(quat_from_matrix(tool[:3, :3])),
+        )
+
     @staticmethod
     def _to_matrix(transform: FrameTransformConfig) -> np.ndarray:
         """Build a 4x4 homogeneous matrix from a FrameTransformConfig."""
         r, t = transform.rotation, transform.translation
         X = np.eye(4)
-        X[:3, :3] = R.from_euler("xyz", [r.roll, r.pitch, r.yaw]).as_matrix()
+        X[:3, :3] = quat_to_matrix(
+            quat_from_euler("xyz", np.array([r.roll, r.pitch, r.yaw]))
+        )
         X[:3, 3] = [t.x, t.y, t.z]
         return X
 
     def __call__(self, pose: np.ndarray) -> np.ndarray:
         """Apply the transforms. Pose format: [x, y, z, qx, qy, qz, qw]."""
-        T = np.eye(4)
-        T[:3, 3] = pose[:3]
-        T[:3, :3] = R.from_quat(pose[3:7]).as_matrix()
-        for transform in self.transforms:
-            X = self._to_matrix(transform)
-            if transform.frame == Frame.WORLD:
-                T = X @ T
-            else:  # TOOL
-                T = T @ X
-        return np.concatenate([T[:3, 3], R.from_matrix(T[:3, :3]).as_quat()])
+        return self.apply_batch(np.asarray(pose)[np.newaxis])[0]
+
+    def apply_batch(self, pose: np.ndarray) -> np.ndarray:
+        """Apply the transforms to a batch of poses of shape ``(T, 7)``.
+
+        Works on quaternions directly: with ``W = [Rw | tw]`` and
+        ``B = [Rb | tb]``, ``W @ [Rq | p] @ B`` has rotation ``w * q * b``
+        and position ``Rw (Rq tb + p) + tw``.
+        """
+        world = self._matrices.world
+        tool = self._matrices.tool
+        quaternion_matrix = self._matrices.quaternion
+
+        quat = quat_normalize(pose[:, 3:7])
+        position = quat_rotate(quat, tool[:3, 3]) + pose[:, :3]
+        position = position @ world[:3, :3].T + world[:3, 3]
+
+        quat = quat @ quaternion_matrix.T
+        # Keep the sign convention of a matrix -> quaternion conversion, which
+        # makes the largest-magnitude component positive.
+        largest = np.take_along_axis(
+            quat, np.abs(quat).argmax(axis=-1, keepdims=True), axis=-1
+        )
+        quat *= np.where(largest < 0, -1.0, 1.0)
+        return np.concatenate([position, quat], axis=-1)
 
 
 class ImageFormat(DataTransform):
@@ -214,13 +435,17 @@ class ImageFormat(DataTransform):
 
     def __call__(self, image: np.ndarray) -> np.ndarray:
         """Convert image format to HWC."""
+        return self.apply_batch(image[np.newaxis])[0]
+
+    def apply_batch(self, image: np.ndarray) -> np.ndarray:
+        """Convert a batch of images to ``(T, H, W, C)``."""
         if self.format == ImageConventionConfig.CHANNELS_LAST:
             return image
         else:
-            return image.transpose(1, 2, 0)
+            return image.transpose(0, 2, 3, 1)
 
 
-class ImageChannelOrder(DataTransform):
+class ImageChannelOrder(ElementwiseDataTransform):
     """Convert image channel order to RGB.
 
     Expects image to be in HWC format.
@@ -232,11 +457,15 @@ class ImageChannelOrder(DataTransform):
         """Convert image channel order to RGB."""
         if self.order == ImageChannelOrderConfig.RGB:
             return image
+        elif image.shape[-1] == 3:
+            # Copying the reversed view is faster than fancy indexing, and
+            # keeps positive strides, which torch.from_numpy requires
+            return np.ascontiguousarray(image[..., ::-1])
         else:
             return image[..., [2, 1, 0]]
 
 
-class CastToNumpyDtype(DataTransform):
+class CastToNumpyDtype(ElementwiseDataTransform):
     """Cast the data to a given numpy dtype."""
 
     dtype: np.dtype
@@ -264,6 +493,10 @@ class NumpyToScalar(DataTransform):
         """Convert numpy array to scalar."""
         return data.item()
 
+    def apply_batch(self, data: np.ndarray) -> np.ndarray:
+        """Convert a batch of single-element arrays to an array of shape (T,)."""
+        return np.asarray(data).reshape(len(data))
+
 
 class Squeeze(DataTransform):
     """Squeeze any singleton dimensions."""
@@ -272,8 +505,13 @@ class Squeeze(DataTransform):
         """Squeeze any singleton dimensions."""
         return data.squeeze()
 
+    def apply_batch(self, data: np.ndarray) -> np.ndarray:
+        """Squeeze singleton dimensions of every sample, keeping the time axis."""
+        axes = tuple(axis for axis in range(1, data.ndim) if data.shape[axis] == 1)
+        return data.squeeze(axis=axes)
+
 
-class Scale(DataTransform):
+class Scale(ElementwiseDataTransform):
     """Scale the data by a factor."""
 
     factor: float
@@ -283,7 +521,7 @@ class Scale(DataTransform):
         return data * self.factor
 
 
-class Clip(DataTransform):
+class Clip(ElementwiseDataTransform):
     """Clip the data to a range."""
 
     min: float
@@ -294,7 +532,7 @@ class Clip(DataTransform):
         return np.clip(data, self.min, self.max)
 
 
-class Normalize(DataTransform):
+class Normalize(ElementwiseDataTransform):
     """Normalize the data from [min, max] to [0, 1]."""
 
     min: float
@@ -305,7 +543,7 @@ class Normalize(DataTransform):
         return (data - self.min) / (self.max - self.min)
 
 
-class Unnormalize(DataTransform):
+class Unnormalize(ElementwiseDataTransform):
     """Unnormalize the data from [0, 1] to [min, max]."""
 
     min: float
@@ -316,7 +554,7 @@ class Unnormalize(DataTransform):
         return data * (self.max - self.min) + self.min
 
 
-class FlipSign(DataTransform):
+class FlipSign(ElementwiseDataTransform):
     """Flip the sign of the data."""
 
     def __call__(self, data: float) -> float:
@@ -324,7 +562,7 @@ class FlipSign(DataTransform):
         return data * -1.0
 
 
-class Offset(DataTransform):
+class Offset(ElementwiseDataTransform):
     """Offset the data by a value."""
 
     value: float
@@ -334,7 +572,7 @@ class Offset(DataTransform):
         return data + self.value
 
 
-class NanToNum(DataTransform):
+class NanToNum(ElementwiseDataTransform):
     """Convert NaN to 0."""
 
     def __call__(self, data: np.ndarray) -> np.ndarray:
@@ -342,7 +580,7 @@ class NanToNum(DataTransform):
         return np.nan_to_num(data, nan=0.0, posinf=0.0, neginf=0.0)
 
 
-class DegreesToRadians(DataTransform):
+class DegreesToRadians(ElementwiseDataTransform):
     """Convert degrees to radians."""
 
     def __call__(self, data: np.ndarray) -> np.ndarray:
@@ -357,6 +595,12 @@ class LanguageFromBytes(DataTransform):
         """Convert bytes to UTF-8 string."""
         return data.decode("utf-8")
 
+    def apply_batch(self, data: np.ndarray) -> np.ndarray:
+        """Convert a batch of bytes to an object array of UTF-8 strings."""
+        strings = np.empty(len(data), dtype=object)
+        strings[:] = [self(item) for item in data]
+        return strings
+
 
 class ExtrinsicsToMatrix(DataTransform):
     """Convert raw extrinsics data to a 4x4 homogeneous transformation matrix.
@@ -370,32 +614,36 @@ class ExtrinsicsToMatrix(DataTransform):
 
     def __call__(self, data: np.ndarray) -> np.ndarray:
         """Convert raw extrinsics data to a 4x4 transformation matrix."""
-        raw = np.asarray(data, dtype=np.float64).flatten()
+        return self.apply_batch(np.asarray(data)[np.newaxis])[0]
+
+    def apply_batch(self, data: np.ndarray) -> np.ndarray:
+        """Convert a batch of raw extrinsics to matrices of shape (T, 4, 4)."""
+        raw = np.asarray(data, dtype=np.float64).reshape(len(data), -1)
 
         if self.extrinsics_format == PoseConfig.MATRIX:
-            return raw.reshape(4, 4)
+            return raw.reshape(-1, 4, 4)
 
         orient = self.extrinsics_orientation
         rotation_type = orient.type if orient else RotationConfig.QUATERNION
-        position = raw[:3]
+        position = raw[:, :3]
 
         if rotation_type == RotationConfig.QUATERNION:
-            quat = raw[3:7]
+            quat = raw[:, 3:7]
             if orient and orient.quaternion_order == QuaternionOrderConfig.WXYZ:
-                quat = np.array([quat[1], quat[2], quat[3], quat[0]])
-            rot_matrix = R.from_quat(quat).as_matrix()
+                quat = quat[:, [1, 2, 3, 0]]
+            rot_matrix = quat_to_matrix(quat_normalize(quat))
         elif rotation_type == RotationConfig.EULER:
-            euler = raw[3:6]
+            euler = raw[:, 3:6]
             order = orient.euler_order.value if orient else EulerOrderConfig.XYZ.value
             if orient and orient.angle_units == AngleConfig.DEGREES:
                 euler = np.radians(euler)
-            rot_matrix = R.from_euler(order, euler).as_matrix()
+            rot_matrix = quat_to_matrix(quat_from_euler(order, euler))
         else:
             raise ValueError(f"Unsupported extrinsics rotation type: {rotation_type}")
 
-        matrix = np.eye(4, dtype=np.float64)
-        matrix[:3, :3] = rot_matrix
-        matrix[:3, 3] = position
+        matrix = np.broadcast_to(np.eye(4), (len(raw), 4, 4)).copy()
+        matrix[:, :3, :3] = rot_matrix
+        matrix[:, :3, 3] = position
         return matrix
 
 
@@ -410,20 +658,23 @@ class IntrinsicsToMatrix(DataTransform):
 
     def __call__(self, data: np.ndarray) -> np.ndarray:
         """Convert raw intrinsics data to a 3x3 intrinsics matrix."""
-        raw = np.asarray(data, dtype=np.float64).flatten()
+        return self.apply_batch(np.asarray(data)[np.newaxis])[0]
+
+    def apply_batch(self, data: np.ndarray) -> np.ndarray:
+        """Convert a batch of raw intrinsics to matrices of shape (T, 3, 3)."""
+        raw = np.asarray(data, dtype=np.float64).reshape(len(data), -1)
 
         if self.intrinsics_format == IntrinsicsConfig.MATRIX:
-            return raw.reshape(3, 3)
+            return raw.reshape(-1, 3, 3)
 
         if self.intrinsics_format == IntrinsicsConfig.FLAT:
-            fx, fy, cx, cy = raw[:4]
-            return np.array(
-                [
-                    [fx, 0.0, cx],
-                    [0.0, fy, cy],
-                    [0.0, 0.0, 1.0],
-                ],
-                dtype=np.float64,
-            )
+            matrix = np.zeros((len(raw), 3, 3), dtype=np.float64)
+            # [fx, fy, cx, cy] -> [[fx, 0, cx], [0, fy, cy], [0, 0, 1]]
+            matrix[:, 0, 0] = raw[:, 0]
+            matrix[:, 1, 1] = raw[:, 1]
+            matrix[:, 0, 2] = raw[:, 2]
+            matrix[:, 1, 2] = raw[:, 3]
+            matrix[:, 2, 2] = 1.0
+            return matrix
 
         raise ValueError(f"Unsupported intrinsics format: {self.intrinsics_format}")
@@ -0,0 +1,531 @@
+"""Compile DataTransformSequences into fused, allocation-light pipelines.
+
+Import configurations produce chains of small element-wise transforms, e.g.
+``DegreesToRadians -> FlipSign -> Offset -> Clip -> CastToNumpyDtype``. Run
+naively, every step allocates a fresh array. The compiled pipeline instead
+allocates at most one buffer per dtype change and applies the remaining
+steps in place, drops identity steps, folds sign flips into neighbouring
+multiplications and fuses a cast into the preceding step, e.g. a single
+``np.clip`` writing straight into the cast buffer.
+
+Layout-only transforms (``ImageFormat``, ``ImageChannelOrder``, ``Squeeze``)
+return views and commute with element-wise steps, so they are hoisted to the
+front: the element-wise steps then read through the strided view and write
+the first, C-contiguous buffer in its final layout. ``ImageChannelOrder``
+copies BGR frames to keep positive strides, so the compiled pipeline
+reverses the channels with a raw view instead. For example the import
+chain ``Clip -> Cast(uint8) -> ImageFormat -> ImageChannelOrder`` makes
+exactly one contiguous copy of a uint8 frame, in either channel order.
+
+By default compilation is exact: every optimization is chosen so that the
+compiled pipeline returns bit-identical results to the original sequence,
+including NumPy's dtype promotion rules. With ``exact=False`` consecutive
+affine steps are additionally folded into a single multiply-add, which can
+differ from the original in the last bits.
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import numpy as np
+
+from neuracore_types.importer.config import (
+    ImageChannelOrderConfig,
+    ImageConventionConfig,
+)
+from neuracore_types.importer.profiling import active_profiler
+from neuracore_types.importer.transform import (
+    CastToNumpyDtype,
+    Clip,
+    DataTransform,
+    DataTransformSequence,
+    DegreesToRadians,
+    FlipSign,
+    ImageChannelOrder,
+    ImageFormat,
+    NanToNum,
+    Normalize,
+    Offset,
+    Scale,
+    ScaleOrientation,
+    ScalePosition,
+    Squeeze,
+    Unnormalize,
+)
+
+_ARITHMETIC_UFUNCS = {
+    "mul": np.multiply,
+    "add": np.add,
+    "sub": np.subtract,
+    "div": np.true_divide,
+}
+
+
+@dataclass(frozen=True)
+class _Op:
+    """A single step of a compiled pipeline.
+
+    ``kind`` is one of ``mul``, ``add``, ``sub``, ``div``, ``clip``,
+    ``cast``, ``nan_to_num``, ``view`` (a transform returning a view with
+    the same values) or ``transform`` (an opaque transform applied as is).
+    """
+
+    kind: str
+    args: tuple = ()
+    transform: DataTransform | None = None
+    # Function computing a ``view`` step, instead of calling ``transform``
+    view: Callable[[np.ndarray], np.ndarray] | None = None
+    # dtype the result of an arithmetic or clip step is written as
+    cast: np.dtype | None = None
+
+
+@dataclass(frozen=True)
+class _ResolvedOp:
+    """A compiled step resolved for a specific input dtype."""
+
+    op: _Op
+    # Whether the step writes into a new buffer rather than in place
+    allocates: bool
+    # dtype of the step's output
+    dtype: np.dtype | None
+
+
+def _reverse_channels(image: np.ndarray) -> np.ndarray:
+    """Swap RGB and BGR channels as a view, like ``ImageChannelOrder``."""
+    if image.shape[-1] < 3:
+        # Raises the same IndexError as ImageChannelOrder
+        return image[..., [2, 1, 0]]
+    return image[..., 2::-1]
+
+
+def _lower(transforms: list[DataTransform], exact: bool) -> Iterator[_Op]:
+    """Lower transforms to primitive element-wise operations."""
+    for transform in transforms:
+        if isinstance(transform, DataTransformSequence):
+            yield from _lower(transform.transforms, exact)
+        elif isinstance(transform, Scale):
+            yield _Op("mul", (transform.factor,))
+        elif isinstance(transform, FlipSign):
+            yield _Op("mul", (-1.0,))
+        elif isinstance(transform, Offset):
+            yield _Op("add", (transform.value,))
+        elif isinstance(transform, DegreesToRadians):
+            # Mirrors ``data * np.pi / 180.0``
+            yield _Op("mul", (np.pi,))
+            yield _Op("div", (180.0,))
+        elif isinstance(transform, Normalize):
+            yield _Op("sub", (transform.min,))
+            yield _Op("div", (transform.max - transform.min,))
+        elif isinstance(transform, Unnormalize):
+            yield _Op("mul", (transform.max - transform.min,))
+            yield _Op("add", (transform.min,))
+        elif isinstance(transform, Clip):
+            yield _Op("clip", (transform.min, transform.max))
+        elif isinstance(transform, CastToNumpyDtype):
+            yield _Op("cast", (transform.dtype,))
+        elif isinstance(transform, NanToNum):
+            yield _Op("nan_to_num")
+        elif (
+            isinstance(transform, ImageFormat)
+            and transform.format == ImageConventionConfig.CHANNELS_LAST
+        ) or (
+            isinstance(transform, ImageChannelOrder)
+            and transform.order == ImageChannelOrderConfig.RGB
+        ):
+            continue
+        elif isinstance(transform, ImageChannelOrder):
+            yield _Op("view", transform=transform, view=_reverse_channels)
+        elif isinstance(transform, (ImageFormat, Squeeze)):
+            yield _Op("view", transform=transform)
+        elif isinstance(transform, ScalePosition) and transform.factor == 1.0:
+            # Multiplying positions by 1.0 is exact
+            continue
+        elif (
+            isinstance(transform, ScaleOrientation)
+            and transform.factor == 1.0
+            and not exact
+        ):
+            # The quaternion -> rotvec -> quaternion round trip is only an
+            # identity up to rounding and quaternion sign
+            continue
+        else:
+            yield _Op("transform", transform=transform)
+
+
+def _hoist_views(ops: list[_Op]) -> list[_Op]:
+    """Move view steps in front of the element-wise steps preceding them.
+
+    Views only change the layout, so they commute with element-wise steps.
+    Opaque transforms are barriers.
+    """
+    hoisted: list[_Op] = []
+    segment: list[_Op] = []
+    for op in ops + [_Op("transform")]:
+        if op.kind == "transform":
+            hoisted.extend(step for step in segment if step.kind == "view")
+            hoisted.extend(step for step in segment if step.kind != "view")
+            hoisted.append(op)
+            segment = []
+        else:
+            segment.append(op)
+    return hoisted[:-1]
+
+
+def _result_dtype(dtype: np.dtype, op: _Op) -> np.dtype:
+    """Return the dtype NumPy produces for ``op`` applied to ``dtype``."""
+    if op.cast is not None:
+        return op.cast
+    if op.kind in _ARITHMETIC_UFUNCS or op.kind == "clip":
+        return np.result_type(dtype, *op.args)
+    if op.kind == "cast":
+        return np.dtype(op.args[0])
+    if op.kind in ("nan_to_num", "view"):
+        return dtype
+    raise ValueError(f"Cannot infer dtype of {op.kind} step")
+
+
+def _clips_nothing(dtype: np.dtype, op: _Op) -> bool:
+    """Whether clipping integers of ``dtype`` to the op's bounds is a no-op."""
+    if op.kind != "clip" or op.cast is not None or dtype.kind not in "iu":
+        return False
+    info = np.iinfo(dtype)
+    return bool(op.args[0] <= info.min and op.args[1] >= info.max)
+
+
+def _optimize(ops: list[_Op], dtype: np.dtype | None, exact: bool) -> list[_Op]:
+    """Peephole-optimize ops for an input of ``dtype``.
+
+    Optimizations only apply while the dtype is known, i.e. until the first
+    opaque transform.
+    """
+    optimized: list[_Op] = []
+    # dtype before each optimized op, to check folds keep dtypes unchanged
+    input_dtypes: list[np.dtype | None] = []
+
+    def push(op: _Op, input_dtype: np.dtype | None) -> None:
+        optimized.append(op)
+        input_dtypes.append(input_dtype)
+
+    def pop() -> tuple[_Op, np.dtype | None]:
+        return optimized.pop(), input_dtypes.pop()
+
+    for op in ops:
+        if dtype is None or op.kind == "transform":
+            push(op, dtype)
+            dtype = None
+            continue
+        if _clips_nothing(dtype, op):
+            # Only the dtype changes, e.g. clipping uint8 to [0, 255]
+            op = _Op("cast", (_result_dtype(dtype, op),))
+        result = _result_dtype(dtype, op)
+        previous = optimized[-1] if optimized else None
+        previous_dtype = input_dtypes[-1] if input_dtypes else None
+        dtype_stable = result == dtype and previous_dtype == dtype
+
+        if op.kind == "cast":
+            if result == dtype:
+                continue
+            if (
+                previous is not None
+                and previous.kind == "cast"
+                and previous_dtype is not None
+                and np.can_cast(previous_dtype, dtype, "safe")
+            ):
+                # The previous cast was lossless, so cast directly
+                pop()
+                dtype = previous_dtype
+                if result != dtype:
+                    push(op, dtype)
+                    dtype = result
+                continue
+            if (
+                previous is not None
+                and previous.cast is None
+                and (previous.kind in _ARITHMETIC_UFUNCS or previous.kind == "clip")
+            ):
+                # Write the previous step's result straight into the cast buffer
+                optimized[-1] = _Op(previous.kind, previous.args, cast=result)
+                dtype = result
+                continue
+        if op.kind == "mul" and op.args[0] == 1.0 and result == dtype:
+            continue
+        if op.kind == "nan_to_num" and dtype.kind not in "fc":
+            # Only floating point data can hold NaN or infinity
+            continue
+        if (
+            op.kind == "mul"
+            and previous is not None
+            and previous.kind == "mul"
+            and previous.cast is None
+            and dtype_stable
+            and (not exact or -1.0 in (op.args[0], previous.args[0]))
+        ):
+            # Multiplying by -1 is exact, so x * a * -1 == x * -a bit for bit
+            factor = previous.args[0] * op.args[0]
+            pop()
+            if factor != 1.0:
+                push(_Op("mul", (factor,)), dtype)
+            continue
+        if (
+            not exact
+            and op.kind in _ARITHMETIC_UFUNCS
+            and dtype_stable
+            and previous is not None
+            and previous.kind in _ARITHMETIC_UFUNCS
+            and previous.cast is None
+            and _is_foldable(op)
+            and _is_foldable(previous)
+        ):
+            # Fold into a single multiply-add, x * scale + shift
+            scale, shift = 1.0, 0.0
+            while (
+                optimized
+                and optimized[-1].kind in _ARITHMETIC_UFUNCS
+                and optimized[-1].cast is None
+                and input_dtypes[-1] == dtype
+                and _is_foldable(optimized[-1])
+            ):
+                scale, shift = _compose(pop()[0], scale, shift)
+            scale, shift = _compose_after(op, scale, shift)
+            if scale != 1.0:
+                push(_Op("mul", (scale,)), dtype)
+            if shift != 0.0:
+                push(_Op("add", (shift,)), dtype)
+            continue
+        push(op, dtype)
+        dtype = result
+    return optimized
+
+
+def _is_foldable(op: _Op) -> bool:
+    """Whether an arithmetic op can be folded into a multiply-add."""
+    return not (op.kind == "div" and op.args[0] == 0)
+
+
+def _affine(op: _Op) -> tuple[float, float]:
+    """Express an arithmetic op as ``x * scale + shift``."""
+    value = float(op.args[0])
+    if op.kind == "mul":
+        return value, 0.0
+    if op.kind == "add":
+        return 1.0, value
+    if op.kind == "sub":
+        return 1.0, -value
+    return 1.0 / value, 0.0
+
+
+def _compose(op: _Op, scale: float, shift: float) -> tuple[float, float]:
+    """Compose ``op`` before the affine map ``x * scale + shift``."""
+    op_scale, op_shift = _affine(op)
+    return op_scale * scale, op_shift * scale + shift
+
+
+def _compose_after(op: _Op, scale: float, shift: float) -> tuple[float, float]:
+    """Compose ``op`` after the affine map ``x * scale + shift``."""
+    op_scale, op_shift = _affine(op)
+    return scale * op_scale, shift * op_scale + op_shift
+
+
+class CompiledDataTransformSequence:
+    """A DataTransformSequence compiled into a fused pipeline.
+
+    Use ``DataTransformSequence.compile`` to create one. Instances are callable
+    like the sequence they were compiled from and also support
+    ``apply_batch``. Execution plans are resolved lazily and cached per input
+    dtype.
+    """
+
+    def __init__(
+        self,
+        sequence: DataTransformSequence,
+        exact: bool = True,
+        reuse_buffers: bool = False,
+    ):
+        """Initialize the compiled sequence.
+
+        Args:
+            sequence: Sequence to compile.
+            exact: Only apply optimizations that keep results bit-identical
+                to the original sequence. If False, consecutive affine steps
+                are folded into a single multiply-add and orientation scaling
+                by 1.0 is dropped.
+            reuse_buffers: Reuse intermediate and output buffers across calls
+                with the same shapes. Results are then only valid until the
+                next call, so copy them if they need to be kept.
+        """
+        self.sequence = sequence
+        self.exact = exact
+        self.reuse_buffers = reuse_buffers
+        self.ops = _hoist_views(list(_lower(sequence.transforms, exact)))
+        self._plans: dict[np.dtype, list[_ResolvedOp]] = {}
+        self._buffers: dict[tuple[int, tuple[int, ...], np.dtype], np.ndarray] = {}
+
+    def _plan(self, dtype: np.dtype) -> list[_ResolvedOp]:
+        """Resolve the pipeline for inputs of ``dtype``."""
+        if dtype in self._plans:
+            return self._plans[dtype]
+        plan = []
+        owned = False
+        current: np.dtype | None = dtype
+        for op in _optimize(self.ops, dtype, self.exact):
+            if op.kind == "transform":
+                plan.append(_ResolvedOp(op, allocates=False, dtype=None))
+                current, owned = None, False
+                continue
+            if op.kind == "view":
+                plan.append(_ResolvedOp(op, allocates=False, dtype=current))
+                continue
+            if current is None:
+                # The dtype after an opaque transform is unknown, so never
+                # write in place into its (possibly aliased) output.
+                plan.append(_ResolvedOp(op, allocates=True, dtype=None))
+                continue
+            result = _result_dtype(current, op)
+            in_place = owned and result == current
+            plan.append(_ResolvedOp(op, allocates=not in_place, dtype=result))
+            current, owned = result, True
+        self._plans[dtype] = plan
+        return plan
+
+    def result_dtype(self, dtype: np.dtype) -> np.dtype | None:
+        """Return the dtype of the results for inputs of ``dtype``.
+
+        Args:
+            dtype: Input dtype.
+
+        Returns:
+            The result dtype, or None if it is set by an opaque transform.
+        """
+        plan = self._plan(np.dtype(dtype))
+        return plan[-1].dtype if plan else np.dtype(dtype)
+
+    def _buffer(
+        self, index: int, shape: tuple[int, ...], dtype: np.dtype
+    ) -> np.ndarray:
+        """Return a C-contiguous output buffer for step ``index``."""
+        if not self.reuse_buffers:
+            return np.empty(shape, dtype=dtype)
+        key = (index, shape, dtype)
+        if key not in self._buffers:
+            self._buffers[key] = np.empty(shape, dtype=dtype)
+        return self._buffers[key]
+
+    def _run(self, data: Any, batched: bool, out: np.ndarray | None) -> Any:
+        """Execute the pipeline."""
+        if not self.sequence.transforms:
+            return data
+        plan = self._plan(np.asarray(data).dtype)
+        last_allocation = max(
+            (i for i, step in enumerate(plan) if step.allocates), default=-1
+        )
+        if any(step.op.kind == "transform" for step in plan[last_allocation + 1 :]):
+            # The output comes from an opaque transform
+            last_allocation = -1
+
+        profiler = active_profiler()
+        x = data
+        # Whether x is a buffer allocated by this pipeline, rather than (a view
+        # of) the input or the output of an opaque transform
+        owned = False
+        for index, step in enumerate(plan):
+            op = step.op
+            if op.kind in ("transform", "view"):
+                assert op.transform is not None
+                if op.kind == "view":
+                    x = np.asarray(x)
+                if op.view is not None:
+                    apply = op.view
+                elif batched:
+                    apply = op.transform.apply_batch
+                else:
+                    apply = op.transform
+                if profiler is None:
+                    x = apply(x)
+                else:
+                    x = profiler.call(type(op.transform).__name__, apply, x)
+                owned = owned and op.kind == "view"
+                continue
+            x = np.asarray(x)
+            if not step.allocates:
+                destination = x
+            elif index == last_allocation and out is not None:
+                destination = out
+            else:
+                dtype = step.dtype or _result_dtype(x.dtype, op)
+                destination = self._buffer(index, x.shape, dtype)
+            if profiler is None:
+                x = self._apply(op, x, destination)
+            else:
+                start = time.perf_counter()
+                result = self._apply(op, x, destination)
+                profiler.record(
+                    f"compiled {op.kind}", time.perf_counter() - start, x, result
+                )
+                x = result
+            owned = True
+
+        if out is None and (
+            not plan or (plan[-1].op.kind != "transform" and not owned)
+        ):
+            # Every element-wise step was a no-op; still return a new array,
+            # as the original sequence would.
+            x = np.array(x, order="C")
+        if out is not None and x is not out:
+            np.copyto(out, x)
+            return out
+        if isinstance(x, np.ndarray) and x.ndim == 0:
+            return x[()]
+        return x
+
+    @staticmethod
+    def _apply(op: _Op, x: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Apply a single element-wise op, writing to ``out``."""
+        # Casting the result into ``out`` leaves the computation unchanged as
+        # long as the loop dtype is the one NumPy would pick without ``out``.
+        casting: Literal["same_kind", "unsafe"] = (
+            "same_kind" if op.cast is None else "unsafe"
+        )
+        if op.kind in _ARITHMETIC_UFUNCS:
+            return _ARITHMETIC_UFUNCS[op.kind](
+                x,
+                op.args[0],
+                out=out,
+                dtype=np.result_type(x.dtype, op.args[0]),
+                casting=casting,
+            )
+        if op.kind == "clip":
+            return np.clip(x, op.args[0], op.args[1], out=out, casting=casting)
+        if op.kind == "cast":
+            np.copyto(out, x, casting="unsafe")
+            return out
+        if op.kind == "nan_to_num":
+            if out is not x:
+                np.copyto(out, x)
+            return np.nan_to_num(out, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        raise ValueError(f"Unsupported compiled step: {op.kind}")
+
+    def __call__(self, data: Any, out: np.ndarray | None = None) -> Any:
+        """Apply the compiled pipeline to a single sample.
+
+        Args:
+            data: Input sample.
+            out: Optional array to write the result into.
+
+        Returns:
+            The transformed sample, equal to applying the original sequence.
+        """
+        return self._run(data, batched=False, out=out)
+
+    def apply_batch(self, data: np.ndarray, out: np.ndarray | None = None) -> Any:
+        """Apply the compiled pipeline to samples stacked along the first axis.
+
+        Args:
+            data: Input samples of shape ``(T, ...)``.
+            out: Optional array to write the result into.
+
+        Returns:
+            The transformed samples.
+        """
+        return self._run(data, batched=True, out=out)
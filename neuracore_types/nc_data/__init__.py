@@ -1,6 +1,8 @@
 """Init."""
 
+import hashlib
 import json
+import threading
 from enum import Enum
 from pathlib import Path
 from typing import Annotated, Union
@@ -32,6 +34,11 @@ from neuracore_types.nc_data.end_effector_pose_data import (
     EndEffectorPoseData,
     EndEffectorPoseDataStats,
 )
+from neuracore_types.nc_data.frame_provider import (  # noqa: F401
+    CachedFrameProvider,
+    FrameProvider,
+    LocalFileFrameProvider,
+)
 from neuracore_types.nc_data.joint_data import (
     JointData,
     JointDataStats,
@@ -46,6 +53,7 @@ from neuracore_types.nc_data.language_data import (
     LanguageDataStats,
 )
 from neuracore_types.nc_data.nc_data import (  # noqa: F401
+    DataItemStatsAccumulator,
     NCData,
     NCDataImportConfig,
     NCDataStats,
@@ -65,6 +73,12 @@ from neuracore_types.nc_data.pose_data import (
     PoseDataImportConfig,
     PoseDataStats,
 )
+from neuracore_types.nc_data.static_calibration import (  # noqa: F401
+    StaticCalibration,
+    dump_sensor_trace,
+    load_sensor_trace,
+    static_trace_value,
+)
 
 NCDataUnion = Annotated[
     Union[
@@ -164,6 +178,23 @@ DATA_TYPE_TO_NC_DATA_CLASS: dict[DataType, type[NCData]] = {
     DataType.CUSTOM_1D: Custom1DData,
 }
 
+DATA_TYPE_TO_NC_DATA_STATS_CLASS: dict[DataType, type[NCDataStats]] = {
+    DataType.JOINT_POSITIONS: JointDataStats,
+    DataType.JOINT_VELOCITIES: JointDataStats,
+    DataType.JOINT_TORQUES: JointDataStats,
+    DataType.JOINT_TARGET_POSITIONS: JointDataStats,
+    DataType.VISUAL_JOINT_POSITIONS: JointDataStats,
+    DataType.END_EFFECTOR_POSES: EndEffectorPoseDataStats,
+    DataType.PARALLEL_GRIPPER_OPEN_AMOUNTS: ParallelGripperOpenAmountDataStats,
+    DataType.PARALLEL_GRIPPER_TARGET_OPEN_AMOUNTS: ParallelGripperOpenAmountDataStats,
+    DataType.RGB_IMAGES: CameraDataStats,
+    DataType.DEPTH_IMAGES: CameraDataStats,
+    DataType.POINT_CLOUDS: PointCloudDataStats,
+    DataType.POSES: PoseDataStats,
+    DataType.LANGUAGE: LanguageDataStats,
+    DataType.CUSTOM_1D: Custom1DDataStats,
+}
+
 DATA_TYPE_TO_NC_DATA_IMPORT_CONFIG_CLASS: dict[DataType, type[NCDataImportConfig]] = {
     DataType.JOINT_POSITIONS: JointPositionsDataImportConfig,
     DataType.JOINT_VELOCITIES: JointVelocitiesDataImportConfig,
@@ -199,6 +230,13 @@ DATA_TYPE_CONTENT_MAPPING: dict[DataType, str] = {
     DataType.CUSTOM_1D: "JSON",
 }
 
+# The C loader parses large mapping configs an order of magnitude faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_CONFIG_CACHE_SIZE = 32
+# Parsed configs by class, file suffix and content digest
+_CONFIG_CACHE: dict[tuple[type, str, bytes], "DatasetImportConfig"] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
 
 class DatasetImportConfig(BaseModel):
     """Main dataset configuration model.
@@ -228,13 +266,34 @@ class DatasetImportConfig(BaseModel):
 
         suffix = config_path.suffix.lower()
         try:
-            with config_path.open("r") as f:
-                if suffix in {".yaml", ".yml"}:
-                    data = yaml.safe_load(f)
-                elif suffix == ".json":
-                    data = json.load(f)
-                else:
-                    raise ValueError(f"Unsupported config format: {suffix}")
+            content = config_path.read_bytes()
+        except Exception as exc:
+            raise RuntimeError(f"Failed to load config file: {exc}") from exc
+
+        # Identical files are parsed once. The cached config is never handed
+        # out: callers get a deep copy, so changing it leaves the cache intact.
+        key = (cls, suffix, hashlib.sha256(content).digest())
+        with _CONFIG_CACHE_LOCK:
+            config = _CONFIG_CACHE.get(key)
+        if config is None:
+            config = cls._from_bytes(content, suffix)
+            with _CONFIG_CACHE_LOCK:
+                if key not in _CONFIG_CACHE:
+                    if len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+                        del _CONFIG_CACHE[next(iter(_CONFIG_CACHE))]
+                    _CONFIG_CACHE[key] = config
+        return config.model_copy(deep=True)
+
+    @classmethod
+    def _from_bytes(cls, content: bytes, suffix: str) -> "DatasetImportConfig":
+        """Parse and build a dataset configuration from file contents."""
+        try:
+            if suffix in {".yaml", ".yml"}:
+                data = yaml.load(content, Loader=_YAML_LOADER)
+            elif suffix == ".json":
+                data = json.loads(content)
+            else:
+                raise ValueError(f"Unsupported config format: {suffix}")
         except Exception as exc:
             raise RuntimeError(f"Failed to load config file: {exc}") from exc
 
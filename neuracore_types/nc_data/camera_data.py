@@ -6,7 +6,7 @@ from typing import Literal
 
 import numpy as np
 from PIL import Image
-from pydantic import ConfigDict, Field, field_serializer, field_validator
+from pydantic import ConfigDict, Field, PrivateAttr, field_serializer, field_validator
 
 from neuracore_types.importer.config import (
     DistanceUnitsConfig,
@@ -29,6 +29,7 @@ from neuracore_types.importer.transform import (
     Squeeze,
     Unnormalize,
 )
+from neuracore_types.nc_data.frame_provider import FrameProvider
 from neuracore_types.nc_data.nc_data import (
     DataItemStats,
     NCData,
@@ -123,7 +124,9 @@ class CameraData(NCData):
 
     Contains image data along with camera intrinsic and extrinsic parameters
     for 3D reconstruction and computer vision applications. The frame field
-    is populated during dataset iteration for efficiency.
+    is populated during dataset iteration for efficiency. Otherwise a
+    ``FrameProvider`` attached with ``with_frame_provider`` resolves
+    ``frame_idx`` to pixels when ``load_frame`` is called.
     """
 
     model_config = ConfigDict(
@@ -138,6 +141,43 @@ class CameraData(NCData):
     intrinsics: NumpyArray | None = None
     frame: NumpyArray | str | None = None  # Only filled in when using dataset iter
 
+    _frame_provider: FrameProvider | None = PrivateAttr(default=None)
+
+    def with_frame_provider(self, frame_provider: FrameProvider) -> "CameraData":
+        """Return a shallow copy resolving its frame with a frame provider.
+
+        Args:
+            frame_provider: Provider of the frames of this camera.
+
+        Returns:
+            Copy sharing the arrays of this instance.
+        """
+        camera_data = self.model_copy()
+        camera_data._frame_provider = frame_provider
+        return camera_data
+
+    def load_frame(self) -> np.ndarray:
+        """Return the frame, fetching it by ``frame_idx`` if it is not loaded.
+
+        Fetched frames are not stored in the instance, so frame providers
+        control how long decoded frames are kept.
+
+        Returns:
+            np.ndarray: The frame.
+
+        Raises:
+            ValueError: If the frame is not loaded and no frame provider is
+                attached.
+        """
+        if isinstance(self.frame, np.ndarray):
+            return self.frame
+        if self._frame_provider is None:
+            raise ValueError(
+                f"{type(self).__name__} {self.frame_idx} has no frame and no "
+                "frame provider"
+            )
+        return self._frame_provider.get_frame(self.frame_idx)
+
     def calculate_statistics(self) -> CameraDataStats:
         """Calculate the statistics for this data type.
 
@@ -0,0 +1,245 @@
+"""Lazy access to camera frames by frame index.
+
+Camera data only holds its pixels in ``CameraData.frame`` when they were
+loaded with it. Otherwise ``CameraData.frame_idx`` locates the frame in the
+sensor's recording, and a ``FrameProvider`` resolves it to pixels when they
+are needed, so episodes can be synchronized, sliced and batched without
+decoding every frame up front.
+
+``LocalFileFrameProvider`` reads frames stored as one file per frame.
+``CachedFrameProvider`` wraps any provider with a bounded LRU cache of
+decoded frames, and decodes the next frames in a background thread when
+frames are read in sequence, as when iterating an episode.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock
+from typing import Any, Protocol, runtime_checkable
+
+import numpy as np
+from PIL import Image
+
+DEFAULT_CACHE_SIZE = 64
+DEFAULT_READ_AHEAD = 8
+
+
+@runtime_checkable
+class FrameProvider(Protocol):
+    """Source of the frames of one camera, by frame index."""
+
+    def get_frame(self, frame_idx: int) -> np.ndarray:
+        """Decode a frame.
+
+        Args:
+            frame_idx: Index of the frame in the camera's recording.
+
+        Returns:
+            np.ndarray: The frame, ``(H, W, 3)`` uint8 for RGB cameras and
+                ``(H, W)`` float32 for depth cameras.
+        """
+        ...
+
+
+def _decode_file(path: Path) -> np.ndarray:
+    """Decode a ``.npy`` array or an image file."""
+    if path.suffix == ".npy":
+        return np.load(path)
+    with Image.open(path) as image:
+        return np.array(image)
+
+
+class LocalFileFrameProvider:
+    """Frames stored in a directory as one file per frame.
+
+    Frames are ``.npy`` arrays or images readable by Pillow, e.g.
+    ``000042.png`` for frame 42 with the default file name format.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        file_name_format: str = "{frame_idx:06d}.png",
+        decode: Callable[[Path], np.ndarray] | None = None,
+    ):
+        """Initialize the provider.
+
+        Args:
+            directory: Directory of the frame files.
+            file_name_format: Format of the file names, with a ``frame_idx``
+                field.
+            decode: Function decoding a frame file, by default ``np.load``
+                for ``.npy`` files and Pillow for images. Depth frames stored
+                as RGB-encoded images can be decoded with
+                ``rgb_to_depth``.
+        """
+        self.directory = Path(directory)
+        self.file_name_format = file_name_format
+        self.decode = decode or _decode_file
+
+    def path(self, frame_idx: int) -> Path:
+        """Return the path of the file of a frame."""
+        return self.directory / self.file_name_format.format(frame_idx=frame_idx)
+
+    def get_frame(self, frame_idx: int) -> np.ndarray:
+        """Decode a frame from its file.
+
+        Args:
+            frame_idx: Index of the frame.
+
+        Returns:
+            np.ndarray: The decoded frame.
+
+        Raises:
+            FileNotFoundError: If the frame has no file.
+        """
+        return self.decode(self.path(frame_idx))
+
+
+class CachedFrameProvider:
+    """LRU cache of the decoded frames of a provider, with decode-ahead.
+
+    When a frame directly follows the previous one requested, the next
+    ``read_ahead`` frames are decoded in a background thread, so sequential
+    reads overlap decoding with their use. Cached frames are shared between
+    reads and made read-only.
+
+    Copies of camera data share their provider, so deep copies return the
+    cache itself. Pickling keeps the wrapped provider and the sizes only: the
+    unpickled cache starts empty.
+    """
+
+    def __init__(
+        self,
+        provider: FrameProvider,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ):
+        """Initialize the cache.
+
+        Args:
+            provider: Provider decoding the frames.
+            cache_size: Maximum number of decoded frames kept.
+            read_ahead: Number of frames decoded ahead of sequential reads,
+                0 to only decode frames when they are requested.
+
+        Raises:
+            ValueError: If the cache cannot hold the frames read ahead.
+        """
+        if cache_size < 1 or read_ahead < 0:
+            raise ValueError("cache_size must be positive and read_ahead not negative")
+        if read_ahead >= cache_size:
+            raise ValueError("cache_size must be larger than read_ahead")
+        self.provider = provider
+        self.cache_size = cache_size
+        self.read_ahead = read_ahead
+        self.hits = 0
+        self.misses = 0
+        self._frames: OrderedDict[int, np.ndarray] = OrderedDict()
+        self._pending: dict[int, Future[np.ndarray]] = {}
+        self._lock = Lock()
+        self._last_idx: int | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    def get_frame(self, frame_idx: int) -> np.ndarray:
+        """Return a frame, from the cache if it was already decoded.
+
+        Args:
+            frame_idx: Index of the frame.
+
+        Returns:
+            np.ndarray: The read-only decoded frame.
+        """
+        with self._lock:
+            frame = self._frames.get(frame_idx)
+            future = self._pending.pop(frame_idx, None)
+            if frame is not None:
+                self._frames.move_to_end(frame_idx)
+            if frame is not None or future is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+            sequential = self._last_idx is not None and frame_idx == self._last_idx + 1
+            self._last_idx = frame_idx
+        if frame is None:
+            if future is not None:
+                frame = future.result()
+            else:
+                frame = self._decode(frame_idx)
+            self._store(frame_idx, frame)
+        if sequential and self.read_ahead:
+            self._decode_ahead(frame_idx)
+        return frame
+
+    def clear(self) -> None:
+        """Drop every cached frame and cancel the frames decoded ahead."""
+        with self._lock:
+            self._frames.clear()
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._last_idx = None
+
+    def close(self) -> None:
+        """Clear the cache and stop the decode-ahead thread."""
+        self.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __getstate__(self) -> dict[str, object]:
+        """Pickle the wrapped provider and sizes, without cached frames."""
+        return {
+            "provider": self.provider,
+            "cache_size": self.cache_size,
+            "read_ahead": self.read_ahead,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore an empty cache."""
+        self.__init__(  # type: ignore[misc]
+            state["provider"], state["cache_size"], state["read_ahead"]
+        )
+
+    def __deepcopy__(self, memo: dict[int, object]) -> "CachedFrameProvider":
+        """Share the cache between deep copies."""
+        return self
+
+    def __enter__(self) -> "CachedFrameProvider":
+        """Use the cache as a context manager closing it on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the cache."""
+        self.close()
+
+    def _decode(self, frame_idx: int) -> np.ndarray:
+        """Decode a frame with the wrapped provider, as a read-only array."""
+        frame = self.provider.get_frame(frame_idx)
+        frame.flags.writeable = False
+        return frame
+
+    def _store(self, frame_idx: int, frame: np.ndarray) -> None:
+        """Cache a frame, evicting the least recently used ones."""
+        with self._lock:
+            self._frames[frame_idx] = frame
+            self._frames.move_to_end(frame_idx)
+            while len(self._frames) > self.cache_size:
+                self._frames.popitem(last=False)
+
+    def _decode_ahead(self, frame_idx: int) -> None:
+        """Start decoding the frames following ``frame_idx``."""
+        ahead = range(frame_idx + 1, frame_idx + 1 + self.read_ahead)
+        with self._lock:
+            # Frames ahead of an earlier position will not be read in sequence
+            for stale in [idx for idx in self._pending if idx not in ahead]:
+                self._pending.pop(stale).cancel()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="frame-decode-ahead"
+                )
+            for idx in ahead:
+                if idx not in self._frames and idx not in self._pending:
+                    self._pending[idx] = self._executor.submit(self._decode, idx)
@@ -12,12 +12,62 @@ from neuracore_types.utils.pydantic_to_ts import (
     REQUIRED_WITH_DEFAULT_FLAG,
     fix_required_with_defaults,
 )
+from neuracore_types.utils.trusted_construction import TrustedConstructionMixin
 
 
 class NCDataStats(BaseModel):
     """Base class for statistics of Neuracore data types."""
 
-    pass
+    @classmethod
+    def data_item_stats_fields(cls) -> list[str]:
+        """Names of the fields holding ``DataItemStats``."""
+        return [
+            name
+            for name, field in cls.model_fields.items()
+            if field.annotation is DataItemStats
+        ]
+
+    @classmethod
+    def accumulate(
+        cls, stats: list["NCDataStats"]
+    ) -> dict[str, "DataItemStatsAccumulator"]:
+        """Combine statistics of individual data items into accumulators.
+
+        Args:
+            stats: Statistics returned by ``NCData.calculate_statistics`` for
+                each data item of a single sensor.
+
+        Returns:
+            Mapping of stats field name to its mergeable accumulator.
+        """
+        return {
+            name: DataItemStatsAccumulator.from_data_item_stats(
+                [getattr(item_stats, name) for item_stats in stats]
+            )
+            for name in cls.data_item_stats_fields()
+        }
+
+    @classmethod
+    def from_accumulators(
+        cls, accumulators: dict[str, "DataItemStatsAccumulator"]
+    ) -> "NCDataStats":
+        """Create finalized statistics from accumulators.
+
+        Args:
+            accumulators: Mapping of stats field name to accumulator. Fields
+                without an accumulator are left empty.
+
+        Returns:
+            NCDataStats: Statistics of this class.
+        """
+        return cls(**{
+            name: (
+                accumulators[name].to_data_item_stats()
+                if name in accumulators
+                else DataItemStats()
+            )
+            for name in cls.data_item_stats_fields()
+        })
 
 
 class NCDataImportConfig(BaseModel):
@@ -50,7 +100,7 @@ class NCDataImportConfig(BaseModel):
         )
 
 
-class NCData(BaseModel):
+class NCData(TrustedConstructionMixin, BaseModel):
     """Base class for all Neuracore data with automatic timestamping.
 
     Provides a common base for all data types in the system with automatic
@@ -76,6 +126,9 @@ class NCData(BaseModel):
         raise NotImplementedError("sample method must be implemented in subclasses.")
 
 
+DATA_ITEM_STATS_FIELDS = ("mean", "std", "count", "min", "max", "q01", "q99")
+
+
 class DataItemStats(BaseModel):
     """Statistical summary of data dimensions and distributions.
 
@@ -122,14 +175,32 @@ class DataItemStats(BaseModel):
         if not isinstance(other, DataItemStats):
             raise ValueError("Can only concatenate with another DataItemStats object.")
 
-        return DataItemStats(
-            mean=np.concatenate((self.mean, other.mean)),
-            std=np.concatenate((self.std, other.std)),
-            count=np.concatenate((self.count, other.count)),
-            min=np.concatenate((self.min, other.min)),
-            max=np.concatenate((self.max, other.max)),
-            q01=np.concatenate((self.q01, other.q01)),
-            q99=np.concatenate((self.q99, other.q99)),
+        return DataItemStats.concatenate_many([self, other])
+
+    @classmethod
+    def concatenate_many(cls, stats: list["DataItemStats"]) -> "DataItemStats":
+        """Concatenate any number of DataItemStats along the data dimension.
+
+        Performs a single ``np.concatenate`` per field, rather than folding
+        ``concatenate`` pairwise which copies every array once per step.
+
+        Args:
+            stats: Statistics to concatenate, in order.
+
+        Returns:
+            DataItemStats: Concatenated statistics.
+        """
+        if not all(isinstance(item, DataItemStats) for item in stats):
+            raise ValueError("Can only concatenate DataItemStats objects.")
+        if not stats:
+            return cls()
+        # Inputs are already validated, so skip validation of the result
+        return cls.model_construct(
+            None,
+            **{
+                name: np.concatenate([getattr(item, name) for item in stats])
+                for name in DATA_ITEM_STATS_FIELDS
+            },
         )
 
     @classmethod
@@ -218,3 +289,564 @@ class DataItemStats(BaseModel):
     def serialize_q99(self, v: np.ndarray | None) -> list | None:
         """Serialize q99 field to JSON list."""
         return self._serialize_field(v)
+
+
+QUANTILE_SKETCH_RELATIVE_ACCURACY = 0.01
+QUANTILE_SKETCH_MIN_VALUE = 1e-9
+
+
+class QuantileSketch(BaseModel):
+    """Mergeable quantile sketch with one row of bucket counts per dimension.
+
+    Non-zero values are assigned to logarithmic buckets whose boundaries are
+    powers of ``gamma = (1 + relative_accuracy) / (1 - relative_accuracy)``.
+    Every sketch with the same relative accuracy shares the same bucket
+    boundaries, so two sketches can be merged or subtracted exactly by adding
+    or removing bucket counts. Quantile estimates are within
+    ``relative_accuracy`` of the true value. Values whose magnitude is below
+    ``QUANTILE_SKETCH_MIN_VALUE`` are counted in a dedicated zero bucket.
+
+    Counts are stored densely: column ``k`` of ``positive_counts`` holds the
+    bucket with key ``positive_offset + k`` (likewise for negative values).
+    """
+
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True, json_schema_extra=fix_required_with_defaults
+    )
+
+    relative_accuracy: float = Field(
+        default=QUANTILE_SKETCH_RELATIVE_ACCURACY,
+        json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG,
+    )
+    zero_count: NumpyArray = Field(
+        default_factory=lambda: np.zeros((0,), dtype=np.int64),
+        json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG,
+    )
+    positive_offset: int = Field(
+        default=0, json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG
+    )
+    positive_counts: NumpyArray = Field(
+        default_factory=lambda: np.zeros((0, 0), dtype=np.int64),
+        json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG,
+    )
+    negative_offset: int = Field(
+        default=0, json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG
+    )
+    negative_counts: NumpyArray = Field(
+        default_factory=lambda: np.zeros((0, 0), dtype=np.int64),
+        json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG,
+    )
+
+    @field_validator("zero_count", "positive_counts", "negative_counts", mode="before")
+    @classmethod
+    def decode_counts(cls, v: list | np.ndarray) -> np.ndarray:
+        """Decode bucket counts to int64 NumPy arrays."""
+        return np.array(v, dtype=np.int64) if isinstance(v, list) else v
+
+    @field_serializer(
+        "zero_count", "positive_counts", "negative_counts", when_used="json"
+    )
+    def serialize_counts(self, v: np.ndarray) -> list:
+        """Serialize bucket counts to JSON lists."""
+        return v.tolist()
+
+    @property
+    def gamma(self) -> float:
+        """Ratio between consecutive bucket boundaries."""
+        return (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+
+    @property
+    def num_dims(self) -> int:
+        """Number of data dimensions tracked by the sketch."""
+        return int(self.zero_count.shape[0])
+
+    @property
+    def total_count(self) -> np.ndarray:
+        """Number of values recorded for each dimension."""
+        return (
+            self.zero_count
+            + self.positive_counts.sum(axis=1)
+            + self.negative_counts.sum(axis=1)
+        )
+
+    @classmethod
+    def from_values(
+        cls,
+        values: np.ndarray,
+        relative_accuracy: float = QUANTILE_SKETCH_RELATIVE_ACCURACY,
+    ) -> "QuantileSketch":
+        """Build a sketch from a ``(N, D)`` array of values.
+
+        Args:
+            values: Samples along the first axis, dimensions along the second.
+            relative_accuracy: Relative accuracy of quantile estimates.
+
+        Returns:
+            QuantileSketch: Sketch holding the bucket counts of ``values``.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 2:
+            raise ValueError(f"Expected values of shape (N, D), got {values.shape}")
+        num_dims = values.shape[1]
+        log_gamma = np.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        magnitude = np.abs(values)
+        is_zero = magnitude < QUANTILE_SKETCH_MIN_VALUE
+        keys = np.zeros(values.shape, dtype=np.int64)
+        keys[~is_zero] = np.ceil(np.log(magnitude[~is_zero]) / log_gamma)
+        dims = np.broadcast_to(np.arange(num_dims), values.shape)
+
+        def _dense_counts(mask: np.ndarray) -> tuple[int, np.ndarray]:
+            if not mask.any():
+                return 0, np.zeros((num_dims, 0), dtype=np.int64)
+            offset = int(keys[mask].min())
+            width = int(keys[mask].max()) - offset + 1
+            flat = dims[mask] * width + (keys[mask] - offset)
+            counts = np.bincount(flat, minlength=num_dims * width)
+            return offset, counts.reshape(num_dims, width).astype(np.int64)
+
+        positive_offset, positive_counts = _dense_counts(~is_zero & (values > 0))
+        negative_offset, negative_counts = _dense_counts(~is_zero & (values < 0))
+        return cls(
+            relative_accuracy=relative_accuracy,
+            zero_count=is_zero.sum(axis=0).astype(np.int64),
+            positive_offset=positive_offset,
+            positive_counts=positive_counts,
+            negative_offset=negative_offset,
+            negative_counts=negative_counts,
+        )
+
+    @staticmethod
+    def _combine_dense(
+        a_offset: int,
+        a_counts: np.ndarray,
+        b_offset: int,
+        b_counts: np.ndarray,
+        sign: int,
+    ) -> tuple[int, np.ndarray]:
+        """Add (or subtract) two dense bucket ranges and trim empty edges."""
+        if b_counts.shape[1] == 0:
+            return a_offset, a_counts.copy()
+        if a_counts.shape[1] == 0:
+            a_offset = b_offset
+        start = min(a_offset, b_offset)
+        end = max(a_offset + a_counts.shape[1], b_offset + b_counts.shape[1])
+        counts = np.zeros((a_counts.shape[0], end - start), dtype=np.int64)
+        counts[:, a_offset - start : a_offset - start + a_counts.shape[1]] += a_counts
+        counts[:, b_offset - start : b_offset - start + b_counts.shape[1]] += (
+            sign * b_counts
+        )
+        if (counts < 0).any():
+            raise ValueError("Cannot remove values that were never added to sketch.")
+        occupied = np.flatnonzero(counts.any(axis=0))
+        if occupied.size == 0:
+            return 0, np.zeros((counts.shape[0], 0), dtype=np.int64)
+        return start + int(occupied[0]), counts[:, occupied[0] : occupied[-1] + 1]
+
+    def _combine(self, other: "QuantileSketch", sign: int) -> "QuantileSketch":
+        """Combine bucket counts with another compatible sketch."""
+        if not isinstance(other, QuantileSketch):
+            raise ValueError("Can only combine with another QuantileSketch object.")
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot combine sketches with different accuracies.")
+        if other.num_dims != self.num_dims:
+            raise ValueError(
+                f"Cannot combine sketches with {self.num_dims} and "
+                f"{other.num_dims} dimensions."
+            )
+        zero_count = self.zero_count + sign * other.zero_count
+        if (zero_count < 0).any():
+            raise ValueError("Cannot remove values that were never added to sketch.")
+        positive_offset, positive_counts = self._combine_dense(
+            self.positive_offset,
+            self.positive_counts,
+            other.positive_offset,
+            other.positive_counts,
+            sign,
+        )
+        negative_offset, negative_counts = self._combine_dense(
+            self.negative_offset,
+            self.negative_counts,
+            other.negative_offset,
+            other.negative_counts,
+            sign,
+        )
+        return QuantileSketch.model_construct(
+            relative_accuracy=self.relative_accuracy,
+            zero_count=zero_count,
+            positive_offset=positive_offset,
+            positive_counts=positive_counts,
+            negative_offset=negative_offset,
+            negative_counts=negative_counts,
+        )
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Return a sketch holding the values of both sketches."""
+        return self._combine(other, 1)
+
+    def subtract(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Return a sketch with the values of ``other`` removed."""
+        return self._combine(other, -1)
+
+    def quantile(self, q: float) -> np.ndarray:
+        """Estimate the ``q`` quantile of every dimension.
+
+        Args:
+            q: Quantile to estimate, between 0 and 1.
+
+        Returns:
+            np.ndarray: ``(D,)`` array of estimates; NaN for empty dimensions.
+        """
+        gamma = self.gamma
+        negative_keys = self.negative_offset + np.arange(self.negative_counts.shape[1])
+        positive_keys = self.positive_offset + np.arange(self.positive_counts.shape[1])
+        # Order buckets from the most negative to the most positive value.
+        bucket_values = np.concatenate([
+            -2 * gamma ** negative_keys[::-1] / (gamma + 1),
+            [0.0],
+            2 * gamma**positive_keys / (gamma + 1),
+        ])
+        counts = np.concatenate(
+            [
+                self.negative_counts[:, ::-1],
+                self.zero_count[:, np.newaxis],
+                self.positive_counts,
+            ],
+            axis=1,
+        )
+        cumulative = np.cumsum(counts, axis=1)
+        total = cumulative[:, -1]
+        rank = q * (total - 1)
+        bucket = np.argmax(cumulative > rank[:, np.newaxis], axis=1)
+        return np.where(total > 0, bucket_values[bucket], np.nan)
+
+
+class DataItemStatsAccumulator(BaseModel):
+    """Mergeable sufficient statistics for a data item.
+
+    Unlike ``DataItemStats``, which only stores finalized values, an accumulator
+    keeps the sample count, the per-dimension sum and the sum of squared
+    deviations from the mean (M2), plus an optional quantile sketch. Two
+    accumulators can be merged exactly, and a previously merged contribution
+    can be subtracted again, so dataset statistics can be updated in time
+    proportional to the data that was added or removed.
+
+    Minimum and maximum cannot be subtracted exactly. After a subtraction they
+    are tightened using the quantile sketch when available, and otherwise kept
+    as conservative bounds.
+    """
+
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True, json_schema_extra=fix_required_with_defaults
+    )
+
+    count: int = Field(default=0, json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG)
+    sum: NumpyArray = Field(
+        default_factory=lambda: np.array([]),
+        json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG,
+    )
+    m2: NumpyArray = Field(
+        default_factory=lambda: np.array([]),
+        json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG,
+    )
+    min: NumpyArray = Field(
+        default_factory=lambda: np.array([]),
+        json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG,
+    )
+    max: NumpyArray = Field(
+        default_factory=lambda: np.array([]),
+        json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG,
+    )
+    sketch: QuantileSketch | None = None
+
+    @field_validator("sum", "m2", "min", "max", mode="before")
+    @classmethod
+    def decode_array(cls, v: list | np.ndarray) -> np.ndarray:
+        """Decode statistics to float64 NumPy arrays."""
+        return np.array(v, dtype=np.float64) if isinstance(v, list) else v
+
+    @field_serializer("sum", "m2", "min", "max", when_used="json")
+    def serialize_array(self, v: np.ndarray) -> list:
+        """Serialize statistics to JSON lists."""
+        return v.tolist()
+
+    @property
+    def mean(self) -> np.ndarray:
+        """Mean of the accumulated values."""
+        return self.sum / max(self.count, 1)
+
+    @classmethod
+    def from_values(
+        cls, values: np.ndarray, with_sketch: bool = True
+    ) -> "DataItemStatsAccumulator":
+        """Build an accumulator from values stacked along the first axis.
+
+        Args:
+            values: Array of shape ``(N, ...)`` holding ``N`` samples.
+            with_sketch: Whether to build a quantile sketch. Disable it for
+                large items such as images, where only moments are needed.
+
+        Returns:
+            DataItemStatsAccumulator: Accumulator holding the ``N`` samples.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 0:
+            raise ValueError("Expected values with a leading sample axis.")
+        count = values.shape[0]
+        if count == 0:
+            return cls()
+        total = values.sum(axis=0)
+        m2 = np.square(values - total / count).sum(axis=0)
+        sketch = None
+        if with_sketch:
+            sketch = QuantileSketch.from_values(values.reshape(count, -1))
+        return cls.model_construct(
+            count=count,
+            sum=total,
+            m2=m2,
+            min=values.min(axis=0),
+            max=values.max(axis=0),
+            sketch=sketch,
+        )
+
+    @classmethod
+    def from_data_item_stats(
+        cls, stats: list[DataItemStats]
+    ) -> "DataItemStatsAccumulator":
+        """Build an accumulator from finalized statistics of disjoint value sets.
+
+        Mean, standard deviation, minimum and maximum are combined exactly.
+        A quantile sketch is only built when every entry describes a single
+        one-dimensional value (as returned for a single data item), since the
+        original values cannot otherwise be recovered.
+
+        Args:
+            stats: Statistics to combine. Entries without values are ignored,
+                unless every entry is dimensionless (e.g. for language data),
+                in which case each counts as one value without dimensions.
+
+        Returns:
+            DataItemStatsAccumulator: Accumulator holding all described values.
+        """
+        non_empty = [s for s in stats if s.mean.size and s.count.size and s.count.max()]
+        if not non_empty:
+            if any(s.mean.size for s in stats):
+                return cls()
+            empty = np.array([], dtype=np.float64)
+            return cls.model_construct(
+                count=len(stats), sum=empty, m2=empty, min=empty, max=empty
+            )
+        stats = non_empty
+        counts = np.array([int(s.count.max()) for s in stats], dtype=np.float64)
+        means = np.stack([s.mean for s in stats]).astype(np.float64)
+        stds = np.stack([s.std for s in stats]).astype(np.float64)
+        weights = counts.reshape((-1,) + (1,) * (means.ndim - 1))
+        count = int(counts.sum())
+        total = (means * weights).sum(axis=0)
+        m2 = (np.square(stds) * weights).sum(axis=0) + (
+            np.square(means - total / count) * weights
+        ).sum(axis=0)
+        sketch = None
+        if means.ndim <= 2 and (counts == 1).all():
+            sketch = QuantileSketch.from_values(means.reshape(len(stats), -1))
+        return cls.model_construct(
+            count=count,
+            sum=total,
+            m2=m2,
+            min=np.stack([s.min for s in stats]).astype(np.float64).min(axis=0),
+            max=np.stack([s.max for s in stats]).astype(np.float64).max(axis=0),
+            sketch=sketch,
+        )
+
+    def _check_compatible(self, other: "DataItemStatsAccumulator") -> None:
+        """Raise if ``other`` cannot be combined with this accumulator."""
+        if not isinstance(other, DataItemStatsAccumulator):
+            raise ValueError(
+                "Can only combine with another DataItemStatsAccumulator object."
+            )
+        if self.count and other.count and self.sum.shape != other.sum.shape:
+            raise ValueError(
+                f"Cannot combine accumulators of shape {self.sum.shape} and "
+                f"{other.sum.shape}."
+            )
+
+    def merge(self, other: "DataItemStatsAccumulator") -> "DataItemStatsAccumulator":
+        """Return an accumulator holding the values of both accumulators.
+
+        Uses the parallel variance update of Chan et al., which is exact up to
+        floating point rounding.
+        """
+        self._check_compatible(other)
+        if other.count == 0:
+            return self.model_copy(deep=True)
+        if self.count == 0:
+            return other.model_copy(deep=True)
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        m2 = self.m2 + other.m2 + delta**2 * (self.count * other.count / count)
+        sketch = None
+        if self.sketch is not None and other.sketch is not None:
+            sketch = self.sketch.merge(other.sketch)
+        return DataItemStatsAccumulator.model_construct(
+            count=count,
+            sum=self.sum + other.sum,
+            m2=m2,
+            min=np.minimum(self.min, other.min),
+            max=np.maximum(self.max, other.max),
+            sketch=sketch,
+        )
+
+    def subtract(self, other: "DataItemStatsAccumulator") -> "DataItemStatsAccumulator":
+        """Return an accumulator with a previously merged contribution removed.
+
+        Args:
+            other: Accumulator that was previously merged into this one.
+
+        Returns:
+            DataItemStatsAccumulator: Accumulator without ``other``'s values.
+
+        Raises:
+            ValueError: If ``other`` holds more values than this accumulator.
+        """
+        self._check_compatible(other)
+        if other.count == 0:
+            return self.model_copy(deep=True)
+        if other.count > self.count:
+            raise ValueError(
+                f"Cannot remove {other.count} values from an accumulator "
+                f"holding {self.count}."
+            )
+        count = self.count - other.count
+        if count == 0:
+            return DataItemStatsAccumulator()
+        total = self.sum - other.sum
+        delta = other.mean - total / count
+        m2 = self.m2 - other.m2 - delta**2 * (count * other.count / self.count)
+        minimum, maximum = self.min, self.max
+        sketch = None
+        if self.sketch is not None and other.sketch is not None:
+            sketch = self.sketch.subtract(other.sketch)
+            # Tighten the bounds to the sketch's extreme buckets, widened by
+            # the sketch accuracy so they never exclude a remaining value.
+            shape = minimum.shape
+            slack = 2 * sketch.relative_accuracy
+            lower = sketch.quantile(0.0).reshape(shape)
+            upper = sketch.quantile(1.0).reshape(shape)
+            minimum = np.maximum(minimum, lower - np.abs(lower) * slack)
+            maximum = np.minimum(maximum, upper + np.abs(upper) * slack)
+        return DataItemStatsAccumulator.model_construct(
+            count=count,
+            sum=total,
+            m2=np.maximum(m2, 0.0),
+            min=minimum,
+            max=maximum,
+            sketch=sketch,
+        )
+
+    def update(self, values: np.ndarray) -> "DataItemStatsAccumulator":
+        """Merge new samples into this accumulator in place.
+
+        Args:
+            values: Array of shape ``(N, ...)`` holding ``N`` new samples.
+
+        Returns:
+            DataItemStatsAccumulator: This accumulator, for chaining.
+        """
+        values = np.asarray(values)
+        # Only sketch one-dimensional features, e.g. not per-pixel image values
+        with_sketch = self.sketch is not None if self.count else values.ndim <= 2
+        merged = self.merge(self.from_values(values, with_sketch=with_sketch))
+        for name in ("count", "sum", "m2", "min", "max", "sketch"):
+            object.__setattr__(self, name, getattr(merged, name))
+        return self
+
+    def to_data_item_stats(self) -> DataItemStats:
+        """Finalize the accumulated values into a ``DataItemStats``.
+
+        The standard deviation is the population standard deviation, matching
+        ``np.std``. Without a quantile sketch, ``q01`` and ``q99`` fall back
+        to the minimum and maximum.
+        """
+        if self.count == 0:
+            return DataItemStats()
+        shape = self.sum.shape
+        if self.sketch is not None:
+            q01 = self.sketch.quantile(0.01).reshape(shape)
+            q99 = self.sketch.quantile(0.99).reshape(shape)
+        else:
+            q01, q99 = self.min, self.max
+        num_counts = shape[0] if len(shape) == 1 else 1
+        return DataItemStats(
+            mean=self.mean.astype(np.float32),
+            std=np.sqrt(np.maximum(self.m2 / self.count, 0.0)).astype(np.float32),
+            count=np.full((num_counts,), self.count, dtype=np.int64),
+            min=self.min.astype(np.float32),
+            max=self.max.astype(np.float32),
+            q01=np.clip(q01, self.min, self.max).astype(np.float32),
+            q99=np.clip(q99, self.min, self.max).astype(np.float32),
+        )
+
+
+class ConcatenatedDataItemStats:
+    """Statistics of several sensors stored in single concatenated arrays.
+
+    Keeps the combined ``DataItemStats`` used by models alongside the offsets
+    of each sensor, so per-sensor statistics can be retrieved as views into
+    the combined arrays without copying.
+    """
+
+    def __init__(self, stats: list[DataItemStats], names: list[str] | None = None):
+        """Initialize the container.
+
+        Args:
+            stats: Statistics of each sensor, in order.
+            names: Optional sensor names, used to look up sensors by name.
+        """
+        if names is not None and len(names) != len(stats):
+            raise ValueError(
+                f"Got {len(names)} names for {len(stats)} sets of statistics."
+            )
+        self.combined = DataItemStats.concatenate_many(stats)
+        self.names = list(names) if names is not None else []
+        self._name_to_index = {name: i for i, name in enumerate(self.names)}
+        # Fields may have different lengths (e.g. a single count for a 1D
+        # custom sensor), so offsets are tracked per field.
+        self._offsets = {
+            name: np.cumsum([0] + [len(getattr(item, name)) for item in stats])
+            for name in DATA_ITEM_STATS_FIELDS
+        }
+
+    def __len__(self) -> int:
+        """Number of sensors."""
+        return len(self._offsets["mean"]) - 1
+
+    def _index(self, key: int | str) -> int:
+        """Non-negative index of a sensor given by index or name."""
+        index = self._name_to_index[key] if isinstance(key, str) else key
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"Sensor index {index} out of range.")
+        return index % len(self)
+
+    def __getitem__(self, key: int | str) -> DataItemStats:
+        """Statistics of one sensor, as views into the combined arrays.
+
+        Args:
+            key: Index or name of the sensor.
+
+        Returns:
+            DataItemStats: Statistics whose arrays share memory with
+                ``combined``.
+        """
+        index = self._index(key)
+        return DataItemStats.model_construct(
+            None,
+            **{
+                name: getattr(self.combined, name)[offsets[index] : offsets[index + 1]]
+                for name, offsets in self._offsets.items()
+            },
+        )
+
+    def slice(self, key: int | str) -> slice:
+        """Slice of a sensor's values along the combined ``mean`` array."""
+        index = self._index(key)
+        offsets = self._offsets["mean"]
+        return slice(int(offsets[index]), int(offsets[index + 1]))
@@ -0,0 +1,175 @@
+"""Calibration shared by every frame of a sensor trace.
+
+Camera and point cloud data carry the extrinsics and intrinsics of their
+sensor in every frame, although calibration is almost always constant for a
+whole episode. ``StaticCalibration`` holds the calibration of a trace once:
+frames refer to its arrays instead of holding copies, and
+``dump_sensor_trace`` serializes the calibration once for the whole trace
+instead of once per frame.
+"""
+
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, field_serializer, field_validator
+
+from neuracore_types.nc_data.camera_data import CameraData
+from neuracore_types.nc_data.point_cloud_data import PointCloudData
+from neuracore_types.utils.numpy_array import NumpyArray
+
+CALIBRATION_FIELDS = ("extrinsics", "intrinsics")
+
+CalibratedData = TypeVar("CalibratedData", CameraData, PointCloudData)
+
+
+def static_trace_value(trace: np.ndarray) -> np.ndarray | None:
+    """Return the value of a trace if it is the same at every time step.
+
+    Args:
+        trace: Values of shape ``(T, ...)``.
+
+    Returns:
+        The first value of the trace if every value equals it, otherwise None.
+    """
+    if len(trace) == 0:
+        return None
+    first = trace[0]
+    if not np.array_equal(trace, np.broadcast_to(first, trace.shape), equal_nan=True):
+        return None
+    return first
+
+
+class StaticCalibration(BaseModel):
+    """Extrinsics and intrinsics shared by every frame of a sensor trace.
+
+    The arrays are read-only, as every frame attached to the calibration
+    refers to them.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    extrinsics: NumpyArray | None = None  # (4, 4)
+    intrinsics: NumpyArray | None = None  # (3, 3)
+
+    @field_validator("extrinsics", "intrinsics", mode="before")
+    @classmethod
+    def decode_matrix(cls, v: list | np.ndarray | None) -> np.ndarray | None:
+        """Decode a calibration matrix to a read-only NumPy array.
+
+        Args:
+            v: List of lists or NumPy array
+
+        Returns:
+            Decoded NumPy array or None
+        """
+        if v is None:
+            return None
+        array = np.array(v, dtype=np.float16) if isinstance(v, list) else v
+        if array.flags.writeable:
+            array = array.copy()
+            array.flags.writeable = False
+        return array
+
+    @field_serializer("extrinsics", "intrinsics", when_used="json")
+    def serialize_matrix(self, v: np.ndarray | None) -> list | None:
+        """Encode a calibration matrix to a JSON list.
+
+        Args:
+            v: NumPy array to encode
+
+        Returns:
+            Nested list or None
+        """
+        return v.tolist() if v is not None else None
+
+    @classmethod
+    def from_trace(
+        cls, trace: Sequence[CameraData | PointCloudData]
+    ) -> "StaticCalibration | None":
+        """Detect the calibration of a trace that is the same for every frame.
+
+        Args:
+            trace: Frames of one sensor, in time order.
+
+        Returns:
+            The calibration shared by every frame, or None if the trace is
+            empty or its calibration changes over time.
+        """
+        if not trace:
+            return None
+        calibration = {}
+        for field in CALIBRATION_FIELDS:
+            first = getattr(trace[0], field)
+            for nc_data in trace[1:]:
+                value = getattr(nc_data, field)
+                if value is first:
+                    continue
+                if (
+                    value is None
+                    or first is None
+                    or not np.array_equal(value, first, equal_nan=True)
+                ):
+                    return None
+            calibration[field] = first
+        return cls(**calibration)
+
+    def attach(self, trace: Sequence[CalibratedData]) -> list[CalibratedData]:
+        """Make every frame of a trace refer to this calibration.
+
+        Args:
+            trace: Frames of one sensor.
+
+        Returns:
+            The frames, modified in place.
+        """
+        for nc_data in trace:
+            nc_data.extrinsics = self.extrinsics
+            nc_data.intrinsics = self.intrinsics
+        return list(trace)
+
+
+def dump_sensor_trace(trace: Sequence[CameraData | PointCloudData]) -> dict[str, Any]:
+    """Serialize the frames of a sensor trace to their JSON form.
+
+    A static calibration is serialized once for the trace and left out of
+    every frame.
+
+    Args:
+        trace: Frames of one sensor, in time order.
+
+    Returns:
+        ``{"calibration": ..., "data": [...]}``, where ``calibration`` is the
+        JSON form of the trace's ``StaticCalibration`` or None if it changes
+        over time.
+    """
+    calibration = StaticCalibration.from_trace(trace)
+    if calibration is None:
+        return {
+            "calibration": None,
+            "data": [nc_data.model_dump(mode="json") for nc_data in trace],
+        }
+    exclude = set(CALIBRATION_FIELDS)
+    return {
+        "calibration": calibration.model_dump(mode="json"),
+        "data": [nc_data.model_dump(mode="json", exclude=exclude) for nc_data in trace],
+    }
+
+
+def load_sensor_trace(
+    dumped: dict[str, Any], nc_data_class: type[CalibratedData]
+) -> list[CalibratedData]:
+    """Deserialize a sensor trace serialized with ``dump_sensor_trace``.
+
+    Args:
+        dumped: Serialized trace.
+        nc_data_class: Class of the frames.
+
+    Returns:
+        The frames, all referring to the same calibration arrays if the
+        calibration is static.
+    """
+    trace = [nc_data_class.model_validate(nc_data) for nc_data in dumped["data"]]
+    if dumped["calibration"] is None:
+        return trace
+    return StaticCalibration.model_validate(dumped["calibration"]).attach(trace)
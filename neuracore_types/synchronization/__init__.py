@@ -1,4 +1,8 @@
 """Init."""
 
+from neuracore_types.synchronization.chunking import *  # noqa: F403
+from neuracore_types.synchronization.resampling import *  # noqa: F403
+from neuracore_types.synchronization.streaming_synchronizer import *  # noqa: F403
 from neuracore_types.synchronization.synchronization import *  # noqa: F403
 from neuracore_types.synchronization.synchronization_requests import *  # noqa: F403
+from neuracore_types.synchronization.synchronizer import *  # noqa: F403
@@ -0,0 +1,208 @@
+"""Chunked synchronization of long recordings.
+
+Synchronizing a recording of several hours into one ``SynchronizedEpisode``
+holds every observation in memory at once. The synchronization index only
+holds the timeline and a few integers per step, so it is computed once for
+the whole recording, then ``iter_index_chunks`` assembles the episode one
+fixed-duration chunk at a time, reading only the messages of the chunk.
+Peak memory is bounded by the chunk duration rather than the recording's.
+
+Chunks split the timeline at ``start + k * chunk_duration`` into half-open
+windows. Each chunk can also start ``overlap`` seconds earlier, so models
+see a history window before the chunk's first step. The history steps are
+also part of the previous chunk: ``EpisodeChunk.new_steps`` leaves them
+out, so statistics and training samples computed from it count every step
+once. ``chunked_episode_statistics`` merges the statistics of every chunk,
+and the chunk episodes batch like any other episode.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from neuracore_types.episode.episode import EpisodeStatistics, SynchronizedEpisode
+from neuracore_types.nc_data import DataType
+from neuracore_types.nc_data.nc_data import NCData
+from neuracore_types.synchronization.synchronization import SynchronizationDetails
+from neuracore_types.synchronization.synchronizer import (
+    SynchronizationIndex,
+    synchronize_timestamps,
+    trace_timestamps,
+)
+
+# Tolerance of the chunk boundaries, in chunks, against floating point rounding
+_CHUNK_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class EpisodeChunk:
+    """Fixed-duration part of a synchronized episode.
+
+    Attributes:
+        index: Position of the chunk's window in the episode, counting
+            windows without steps.
+        start_time: Start of the chunk, included.
+        end_time: End of the chunk, excluded unless it is the end of the
+            episode.
+        episode: Observations of the history window then of the chunk, with
+            ``start_time`` the start of the history window.
+        num_history_steps: Number of leading observations of ``episode``
+            before ``start_time``, which also belong to earlier chunks.
+    """
+
+    index: int
+    start_time: float
+    end_time: float
+    episode: SynchronizedEpisode
+    num_history_steps: int = 0
+
+    @property
+    def new_steps(self) -> SynchronizedEpisode:
+        """The chunk's observations without the history window."""
+        if not self.num_history_steps:
+            return self.episode
+        return SynchronizedEpisode.from_trusted(
+            observations=self.episode.observations[self.num_history_steps :],
+            start_time=self.start_time,
+            end_time=self.end_time,
+            robot_id=self.episode.robot_id,
+        )
+
+
+def chunk_boundaries(
+    timestamps: np.ndarray, chunk_duration: float, overlap: float = 0.0
+) -> list[tuple[int, slice, slice]]:
+    """Split sorted step timestamps into fixed-duration chunks.
+
+    Args:
+        timestamps: Sorted timestamps of the steps.
+        chunk_duration: Duration of every chunk, in seconds.
+        overlap: Duration of the history window before every chunk, in
+            seconds.
+
+    Returns:
+        For every chunk with steps, the position of its window, the range of
+        its steps and the range of its steps including the history window.
+
+    Raises:
+        ValueError: If the chunk duration is not positive or the overlap is
+            negative.
+    """
+    if chunk_duration <= 0:
+        raise ValueError("Chunk duration must be positive")
+    if overlap < 0:
+        raise ValueError("Chunk overlap must not be negative")
+    if not len(timestamps):
+        return []
+    start = float(timestamps[0])
+    windows = np.floor((timestamps - start) / chunk_duration + _CHUNK_TOLERANCE)
+    positions, firsts = np.unique(windows.astype(np.int64), return_index=True)
+    lasts = np.append(firsts[1:], len(timestamps))
+    history_starts = np.searchsorted(
+        timestamps, start + positions * chunk_duration - overlap, side="left"
+    )
+    return [
+        (position, slice(first, last), slice(min(history, first), last))
+        for position, first, last, history in zip(
+            positions.tolist(), firsts.tolist(), lasts.tolist(), history_starts.tolist()
+        )
+    ]
+
+
+def iter_index_chunks(
+    index: SynchronizationIndex,
+    traces: Mapping[DataType, Mapping[str, Sequence[NCData]]],
+    robot_id: str,
+    chunk_duration: float,
+    overlap: float = 0.0,
+) -> Iterator[EpisodeChunk]:
+    """Assemble a synchronized episode one chunk at a time.
+
+    Args:
+        index: Synchronization of the whole recording.
+        traces: Messages of every synchronized sensor, as for
+            ``SynchronizationIndex.to_episode``. They may load messages
+            lazily, only the messages of the current chunk are read.
+        robot_id: ID of the robot of the episode.
+        chunk_duration: Duration of every chunk, in seconds.
+        overlap: Duration of the history window before every chunk, in
+            seconds.
+
+    Yields:
+        EpisodeChunk: The chunks with steps, in time order.
+
+    Raises:
+        ValueError: If the chunk duration is not positive or the overlap is
+            negative.
+    """
+    boundaries = chunk_boundaries(index.timestamps, chunk_duration, overlap)
+    if not boundaries:
+        return
+    start = float(index.timestamps[0])
+    end = float(index.timestamps[-1])
+    for position, steps, history_steps in boundaries:
+        window = index.window(history_steps)
+        episode = window.to_episode(traces, robot_id)
+        chunk_start = start + position * chunk_duration
+        chunk_end = min(chunk_start + chunk_duration, end)
+        yield EpisodeChunk(
+            index=position,
+            start_time=chunk_start,
+            end_time=chunk_end,
+            episode=SynchronizedEpisode.from_trusted(
+                observations=episode.observations,
+                start_time=max(chunk_start - overlap, start),
+                end_time=chunk_end,
+                robot_id=robot_id,
+            ),
+            num_history_steps=steps.start - history_steps.start,
+        )
+
+
+def iter_synchronized_chunks(
+    traces: Mapping[DataType, Mapping[str, Sequence[NCData]]],
+    details: SynchronizationDetails,
+    robot_id: str,
+    chunk_duration: float,
+    overlap: float = 0.0,
+) -> Iterator[EpisodeChunk]:
+    """Synchronize the recorded messages of every sensor chunk by chunk.
+
+    Chunks hold the same observations as the matching steps of
+    ``synchronize_episode``.
+
+    Args:
+        traces: Per data type and sensor name, the messages of the sensor.
+        details: How to synchronize.
+        robot_id: ID of the recorded robot.
+        chunk_duration: Duration of every chunk, in seconds.
+        overlap: Duration of the history window before every chunk, in
+            seconds.
+
+    Yields:
+        EpisodeChunk: The chunks with steps, in time order.
+    """
+    index = synchronize_timestamps(trace_timestamps(traces), details, robot_id)
+    yield from iter_index_chunks(index, traces, robot_id, chunk_duration, overlap)
+
+
+def chunked_episode_statistics(chunks: Iterable[EpisodeChunk]) -> EpisodeStatistics:
+    """Compute the statistics of an episode from its chunks.
+
+    Only one chunk is held at a time, and history steps are not counted
+    twice.
+
+    Args:
+        chunks: Chunks of the episode, e.g. from ``iter_synchronized_chunks``.
+
+    Returns:
+        EpisodeStatistics: Statistics of the episode, with
+            ``data_accumulators`` populated.
+    """
+    statistics = EpisodeStatistics()
+    for chunk in chunks:
+        statistics = statistics.merge(
+            EpisodeStatistics.from_synchronized_episode(chunk.new_steps)
+        )
+    return statistics
@@ -0,0 +1,204 @@
+"""Resampling of sensor traces to synchronization steps.
+
+By default synchronization uses the message nearest to each step. High rate
+joint and pose streams are better resampled by interpolating between the
+messages around each step, which gives smoother signals at a lower
+synchronization frequency. ``SynchronizationDetails.resampling`` selects a
+``ResamplingMode`` per data type.
+
+Every function works on whole traces at once: steps are located among the
+messages with ``np.searchsorted`` and values are interpolated as arrays.
+"""
+
+from collections.abc import Sequence
+from enum import Enum
+
+import numpy as np
+
+from neuracore_types.nc_data import (
+    DATA_TYPE_TO_NC_DATA_CLASS,
+    Custom1DData,
+    DataType,
+    EndEffectorPoseData,
+    JointData,
+    ParallelGripperOpenAmountData,
+    PoseData,
+)
+from neuracore_types.nc_data.nc_data import NCData
+from neuracore_types.utils.quaternion_utils import quat_slerp
+
+# Index of a sensor missing from a synchronization step
+MISSING_MESSAGE = -1
+
+
+class ResamplingMode(str, Enum):
+    """How the messages of a sensor are resampled to synchronization steps.
+
+    NEAREST: The message nearest to the step.
+    ZERO_ORDER_HOLD: The latest message at or before the step.
+    LINEAR: Linear interpolation between the messages around the step, for
+        joints, gripper open amounts and custom 1D data.
+    SLERP: Linear interpolation of the position and spherical linear
+        interpolation of the orientation between the poses around the step,
+        for poses and end-effector poses.
+    """
+
+    NEAREST = "NEAREST"
+    ZERO_ORDER_HOLD = "ZERO_ORDER_HOLD"
+    LINEAR = "LINEAR"
+    SLERP = "SLERP"
+
+
+# Field interpolated for each NCData class supporting interpolation
+INTERPOLATED_FIELDS: dict[type[NCData], str] = {
+    JointData: "value",
+    ParallelGripperOpenAmountData: "open_amount",
+    Custom1DData: "data",
+    PoseData: "pose",
+    EndEffectorPoseData: "pose",
+}
+
+_INTERPOLATION_CLASSES: dict[ResamplingMode, tuple[type[NCData], ...]] = {
+    ResamplingMode.LINEAR: (JointData, ParallelGripperOpenAmountData, Custom1DData),
+    ResamplingMode.SLERP: (PoseData, EndEffectorPoseData),
+}
+
+
+def is_interpolated(mode: ResamplingMode) -> bool:
+    """Return whether a mode creates new values rather than reusing messages."""
+    return mode in _INTERPOLATION_CLASSES
+
+
+def validate_resampling_mode(data_type: DataType, mode: ResamplingMode) -> None:
+    """Check that a data type can be resampled with a mode.
+
+    Args:
+        data_type: Data type to resample.
+        mode: Resampling mode.
+
+    Raises:
+        ValueError: If the mode interpolates values the data type does not
+            support interpolating.
+    """
+    classes = _INTERPOLATION_CLASSES.get(mode)
+    if classes is not None and DATA_TYPE_TO_NC_DATA_CLASS[data_type] not in classes:
+        raise ValueError(
+            f"{mode.value} resampling is not supported for {data_type.value}, "
+            f"only for {', '.join(cls.__name__ for cls in classes)}"
+        )
+
+
+def hold_indices(timestamps: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Find the latest message at or before every target time.
+
+    Args:
+        timestamps: Sorted message timestamps of shape ``(M,)``.
+        targets: Target times of shape ``(T,)``.
+
+    Returns:
+        Indices into ``timestamps`` of shape ``(T,)``, ``MISSING_MESSAGE``
+        for targets before the first message.
+    """
+    return np.searchsorted(timestamps, targets, side="right") - 1
+
+
+def interpolation_weights(
+    timestamps: np.ndarray, targets: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Locate every target time between two messages.
+
+    Args:
+        timestamps: Sorted message timestamps of shape ``(M,)``, ``M > 0``.
+        targets: Target times of shape ``(T,)``.
+
+    Returns:
+        Indices of the messages before and after every target and the weight
+        of the latter, in ``[0, 1]``. Targets outside the messages get the
+        first or last message with weight 0.
+    """
+    lower = np.clip(np.searchsorted(timestamps, targets, side="right") - 1, 0, None)
+    lower = np.minimum(lower, len(timestamps) - 1)
+    upper = np.minimum(lower + 1, len(timestamps) - 1)
+    gap = timestamps[upper] - timestamps[lower]
+    weights = np.divide(
+        targets - timestamps[lower],
+        gap,
+        out=np.zeros(len(targets), dtype=np.float64),
+        where=gap > 0,
+    )
+    return lower, upper, np.clip(weights, 0.0, 1.0)
+
+
+def interpolate_values(
+    lower: np.ndarray,
+    upper: np.ndarray,
+    weights: np.ndarray,
+    mode: ResamplingMode,
+) -> np.ndarray:
+    """Interpolate between two arrays of values.
+
+    Args:
+        lower: Values at weight 0, of shape ``(T, ...)``. Poses are
+            ``(T, 7)`` arrays of positions and ``[x, y, z, w]`` quaternions.
+        upper: Values at weight 1, of the same shape.
+        weights: Interpolation weights of shape ``(T,)``.
+        mode: ``LINEAR`` or ``SLERP``.
+
+    Returns:
+        Interpolated values of shape ``(T, ...)``, in float64.
+
+    Raises:
+        ValueError: If the mode does not interpolate.
+    """
+    lower = np.asarray(lower, dtype=np.float64)
+    upper = np.asarray(upper, dtype=np.float64)
+    if mode == ResamplingMode.LINEAR:
+        weights = weights.reshape(-1, *([1] * (lower.ndim - 1)))
+        return lower + weights * (upper - lower)
+    if mode == ResamplingMode.SLERP:
+        result = np.empty_like(lower)
+        result[:, :3] = lower[:, :3] + weights[:, np.newaxis] * (
+            upper[:, :3] - lower[:, :3]
+        )
+        result[:, 3:] = quat_slerp(lower[:, 3:], upper[:, 3:], weights)
+        return result
+    raise ValueError(f"{mode.value} resampling does not interpolate")
+
+
+def interpolate_trace(
+    messages: Sequence[NCData],
+    lower: np.ndarray,
+    upper: np.ndarray,
+    weights: np.ndarray,
+    timestamps: np.ndarray,
+    mode: ResamplingMode,
+) -> list[NCData]:
+    """Create the messages of a sensor interpolated at target times.
+
+    Args:
+        messages: Messages of the sensor, all of the same NCData class.
+        lower: Index of the message before each target.
+        upper: Index of the message after each target.
+        weights: Weight of the message after each target.
+        timestamps: Target times, the timestamps of the new messages.
+        mode: ``LINEAR`` or ``SLERP``.
+
+    Returns:
+        One new message per target. Array values keep the dtype of the
+        original messages.
+    """
+    if not len(timestamps):
+        return []
+    nc_data_class = type(messages[lower[0]])
+    field = INTERPOLATED_FIELDS[nc_data_class]
+    lower_values = np.array([getattr(messages[i], field) for i in lower.tolist()])
+    upper_values = np.array([getattr(messages[i], field) for i in upper.tolist()])
+    values = interpolate_values(lower_values, upper_values, weights, mode)
+    if lower_values.ndim == 1:
+        rows = values.tolist()
+    else:
+        rows = list(values.astype(lower_values.dtype, copy=False))
+    return nc_data_class.construct_many(
+        {"timestamp": timestamp, field: row}
+        for timestamp, row in zip(timestamps.tolist(), rows)
+    )
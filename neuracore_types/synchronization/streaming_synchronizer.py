@@ -0,0 +1,225 @@
+"""Online synchronization of live sensor streams.
+
+``StreamingSynchronizer`` synchronizes messages as they are pushed, for
+teleoperation and live inference. It follows the offline synchronizer of
+``synchronizer.py``, with two differences imposed by running online:
+
+- Every emitted point holds every sensor of the embodiment description, as
+  a policy needs all its inputs. Steps where a sensor has no message within
+  ``max_delay_s``, or only one already used when ``allow_duplicates`` is
+  False, are skipped.
+- ``max_delay_s`` bounds the latency: a step is emitted as soon as every
+  sensor has a message at or after it, or at the latest once any sensor is
+  ``max_delay_s`` past it. Sensors lagging behind then contribute their
+  latest message if it is close enough.
+
+The timeline starts once every sensor has sent a message, at the latest of
+their first messages, as with ``trim_start_end``. Time is the timestamp of
+the messages, so replaying a recording gives the same points as running
+live.
+
+Each sensor keeps its recent messages in a bounded ring buffer. Steps only
+move forward, so messages older than the step being synchronized are
+dropped as soon as a newer one precedes it, and emitting a point only looks
+at the first two messages of each buffer.
+"""
+
+from collections import deque
+from typing import NamedTuple
+
+from neuracore_types.episode.episode import EmbodimentDescription, SynchronizedPoint
+from neuracore_types.nc_data import DataType
+from neuracore_types.nc_data.nc_data import NCData
+from neuracore_types.synchronization.resampling import ResamplingMode
+from neuracore_types.synchronization.synchronization import SynchronizationDetails
+
+DEFAULT_BUFFER_SIZE = 256
+
+
+class _Message(NamedTuple):
+    """A buffered message and its position in the sensor's stream."""
+
+    timestamp: float
+    sequence: int
+    nc_data: NCData
+
+
+class _SensorBuffer:
+    """Recent messages of one sensor."""
+
+    def __init__(self, data_type: DataType, name: str, buffer_size: int):
+        self.data_type = data_type
+        self.name = name
+        self.messages: deque[_Message] = deque(maxlen=buffer_size)
+        self.pushed = 0
+        self.last_used = -1
+
+    def nearest(self, timestamp: float) -> _Message:
+        """Return the buffered message nearest to ``timestamp``.
+
+        Messages before the last one at or before ``timestamp`` are dropped,
+        as later steps cannot use them either.
+        """
+        messages = self.messages
+        while len(messages) > 1 and messages[1].timestamp <= timestamp:
+            messages.popleft()
+        first = messages[0]
+        if len(messages) == 1:
+            return first
+        second = messages[1]
+        if abs(timestamp - first.timestamp) <= abs(second.timestamp - timestamp):
+            return first
+        return second
+
+
+class StreamingSynchronizer:
+    """Synchronize live sensor streams into synchronized points.
+
+    Push every message with ``push``, which returns the points that became
+    ready, in time order. Messages of each sensor must be pushed in time
+    order; sensors may interleave freely.
+    """
+
+    def __init__(
+        self,
+        embodiment_description: EmbodimentDescription,
+        details: SynchronizationDetails,
+        robot_id: str | None = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        """Initialize the synchronizer.
+
+        Args:
+            embodiment_description: Sensors to synchronize. Emitted points
+                hold each data type's sensors in the order of their indices.
+                Messages of other sensors are ignored.
+            details: Frequency, maximum delay and duplicate handling of the
+                synchronization. ``trim_start_end`` and
+                ``cross_embodiment_union`` do not apply online, and only
+                nearest resampling is supported.
+            robot_id: Robot ID of the emitted points.
+            buffer_size: Maximum number of messages buffered per sensor. It
+                must hold ``max_delay_s`` of the fastest sensor.
+
+        Raises:
+            ValueError: If the frequency, resampling, buffer size or
+                embodiment description is invalid.
+        """
+        if details.frequency <= 0:
+            raise ValueError("Synchronization frequency must be positive")
+        if any(mode != ResamplingMode.NEAREST for mode in details.resampling.values()):
+            raise ValueError(
+                "Streaming synchronization only supports NEAREST resampling"
+            )
+        if buffer_size < 2:
+            raise ValueError("buffer_size must be at least 2")
+        self.details = details
+        self.robot_id = robot_id
+        self._period = 1.0 / details.frequency
+        self._buffers = [
+            _SensorBuffer(data_type, indexed_names[index], buffer_size)
+            for data_type, indexed_names in embodiment_description.items()
+            for index in sorted(indexed_names)
+        ]
+        if not self._buffers:
+            raise ValueError("The embodiment description has no sensors")
+        self._by_key = {
+            (buffer.data_type, buffer.name): buffer for buffer in self._buffers
+        }
+        self._waiting = len(self._buffers)
+        self._start: float | None = None
+        self._step = 0
+        self._clock = float("-inf")
+
+    @property
+    def next_timestamp(self) -> float | None:
+        """Time of the next step, or None until every sensor has data."""
+        if self._start is None:
+            return None
+        return self._start + self._step * self._period
+
+    def push(
+        self, data_type: DataType, sensor_name: str, nc_data: NCData
+    ) -> list[SynchronizedPoint]:
+        """Add a message and emit the points it completes.
+
+        Args:
+            data_type: Data type of the sensor.
+            sensor_name: Name of the sensor.
+            nc_data: The message.
+
+        Returns:
+            The points ready to be emitted, in time order.
+
+        Raises:
+            ValueError: If the message is older than the previous message of
+                the sensor.
+        """
+        buffer = self._by_key.get((data_type, sensor_name))
+        if buffer is None:
+            return []
+        timestamp = nc_data.timestamp
+        if buffer.messages and timestamp < buffer.messages[-1].timestamp:
+            raise ValueError(
+                f"Messages of {data_type.value}/{sensor_name} must be pushed in "
+                "time order"
+            )
+        buffer.messages.append(_Message(timestamp, buffer.pushed, nc_data))
+        if buffer.pushed == 0:
+            self._waiting -= 1
+            if self._waiting == 0:
+                self._start = max(b.messages[0].timestamp for b in self._buffers)
+        buffer.pushed += 1
+        self._clock = max(self._clock, timestamp)
+        return self._emit(flush=False)
+
+    def flush(self) -> list[SynchronizedPoint]:
+        """Emit the remaining steps up to the latest message, at stream end.
+
+        Returns:
+            The points of the remaining steps that can still be completed.
+        """
+        return self._emit(flush=True)
+
+    def _emit(self, flush: bool) -> list[SynchronizedPoint]:
+        """Emit the points of every step ready to be synchronized."""
+        points: list[SynchronizedPoint] = []
+        if self._start is None:
+            return points
+        max_delay_s = self.details.max_delay_s
+        while True:
+            timestamp = self._start + self._step * self._period
+            if timestamp > self._clock:
+                break
+            # Wait for lagging sensors while the step is within max delay
+            if (
+                not flush
+                and self._clock - timestamp <= max_delay_s
+                and any(b.messages[-1].timestamp < timestamp for b in self._buffers)
+            ):
+                break
+            self._step += 1
+            point = self._point(timestamp)
+            if point is not None:
+                points.append(point)
+        return points
+
+    def _point(self, timestamp: float) -> SynchronizedPoint | None:
+        """Synchronize one step, or return None if a sensor cannot fill it."""
+        max_delay_s = self.details.max_delay_s
+        allow_duplicates = self.details.allow_duplicates
+        messages = []
+        for buffer in self._buffers:
+            message = buffer.nearest(timestamp)
+            if abs(message.timestamp - timestamp) > max_delay_s:
+                return None
+            if not allow_duplicates and message.sequence == buffer.last_used:
+                return None
+            messages.append(message)
+        data: dict[DataType, dict[str, NCData]] = {}
+        for buffer, message in zip(self._buffers, messages):
+            buffer.last_used = message.sequence
+            data.setdefault(buffer.data_type, {})[buffer.name] = message.nc_data
+        return SynchronizedPoint.from_trusted(
+            timestamp=timestamp, robot_id=self.robot_id, data=data
+        )
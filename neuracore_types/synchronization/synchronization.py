@@ -1,8 +1,13 @@
 """Request models for dataset and recording synchronization operations."""
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from neuracore_types.episode.episode import CrossEmbodimentUnion
+from neuracore_types.nc_data import DataType
+from neuracore_types.synchronization.resampling import (
+    ResamplingMode,
+    validate_resampling_mode,
+)
 from neuracore_types.utils.pydantic_to_ts import (
     REQUIRED_WITH_DEFAULT_FLAG,
     fix_required_with_defaults,
@@ -20,6 +25,8 @@ class SynchronizationDetails(BaseModel):
         allow_duplicates: Whether to allow duplicate data points in the synchronization.
         trim_start_end: Whether to trim the start and end of the episode
             when synchronizing.
+        resampling: Resampling mode of each data type. Data types not listed
+            use the nearest message.
     """
 
     frequency: int
@@ -33,9 +40,22 @@ class SynchronizationDetails(BaseModel):
     trim_start_end: bool = Field(
         default=True, json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG
     )
+    resampling: dict[DataType, ResamplingMode] = Field(
+        default_factory=dict, json_schema_extra=REQUIRED_WITH_DEFAULT_FLAG
+    )
 
     model_config = ConfigDict(frozen=True, json_schema_extra=fix_required_with_defaults)
 
+    @field_validator("resampling")
+    @classmethod
+    def validate_resampling(
+        cls, v: dict[DataType, ResamplingMode]
+    ) -> dict[DataType, ResamplingMode]:
+        """Validate that every data type supports its resampling mode."""
+        for data_type, mode in v.items():
+            validate_resampling_mode(data_type, mode)
+        return v
+
     def __hash__(self) -> int:
         """Compute a hash value for the SynchronizationDetails instance.
 
@@ -69,4 +89,5 @@ class SynchronizationDetails(BaseModel):
             self.max_delay_s,
             self.allow_duplicates,
             self.trim_start_end,
+            tuple(sorted(self.resampling.items())),
         ))
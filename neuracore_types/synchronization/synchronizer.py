@@ -0,0 +1,422 @@
+"""Offline synchronization of recorded sensor traces.
+
+``synchronize_timestamps`` implements ``SynchronizationDetails`` on the
+timestamps of every sensor alone: it builds the target timeline and, for
+every sensor, the index of the message used at each step. Messages are
+matched with ``np.searchsorted``, so synchronizing ``N`` messages costs
+``O(N log N)`` whatever the number of sensors, and no NCData is touched
+until ``SynchronizationIndex`` assembles the episode, as points with
+``to_episode`` or as columns with ``to_columnar_episode``.
+
+The details are applied as follows:
+
+- ``frequency``: steps are ``1 / frequency`` seconds apart, starting at the
+  first message of the timeline's range.
+- ``trim_start_end``: the timeline spans the range where every sensor has
+  data, from the latest first message to the earliest last message.
+  Otherwise it spans all messages.
+- ``resampling``: by default each step uses the message of each sensor
+  nearest to it. ``ResamplingMode`` also holds the latest message or
+  interpolates between the messages around the step.
+- ``max_delay_s``: a sensor is missing from steps further than
+  ``max_delay_s`` from the message it would use. Interpolated sensors use
+  the nearer of the two messages around the step, and only interpolate
+  between their first and last message.
+- ``allow_duplicates``: when False, a message is used by at most one step,
+  the nearest one. The sensor is missing from the other steps. Interpolated
+  values are new at every step and are not affected.
+- ``cross_embodiment_union``: only the sensors listed for the robot are
+  synchronized.
+
+Steps where every sensor is missing are dropped.
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+import numpy as np
+
+from neuracore_types.episode.columnar_episode import (
+    ColumnarSynchronizedEpisode,
+    object_array,
+)
+from neuracore_types.episode.episode import SynchronizedEpisode
+from neuracore_types.nc_data import DataType
+from neuracore_types.nc_data.nc_data import NCData
+from neuracore_types.synchronization.resampling import (
+    MISSING_MESSAGE,
+    ResamplingMode,
+    hold_indices,
+    interpolate_trace,
+    interpolation_weights,
+    is_interpolated,
+)
+from neuracore_types.synchronization.synchronization import SynchronizationDetails
+
+# Tolerance of the timeline end, in steps, against floating point rounding
+_STEP_TOLERANCE = 1e-9
+
+
+def nearest_indices(timestamps: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Find the message nearest to every target time.
+
+    Args:
+        timestamps: Sorted message timestamps of shape ``(M,)``, ``M > 0``.
+        targets: Target times of shape ``(T,)``.
+
+    Returns:
+        Indices into ``timestamps`` of shape ``(T,)``. Ties go to the earlier
+        message.
+    """
+    after = np.searchsorted(timestamps, targets, side="left")
+    after = np.minimum(after, len(timestamps) - 1)
+    before = np.maximum(after - 1, 0)
+    use_before = np.abs(targets - timestamps[before]) <= np.abs(
+        timestamps[after] - targets
+    )
+    return np.where(use_before, before, after)
+
+
+def _first_use_only(indices: np.ndarray, delays: np.ndarray) -> np.ndarray:
+    """Keep every message only at the step nearest to it.
+
+    Args:
+        indices: Message index per step, ``MISSING_MESSAGE`` where absent.
+        delays: Distance between each step and its message.
+
+    Returns:
+        ``indices`` with repeated messages replaced by ``MISSING_MESSAGE``, except at
+        their nearest step (the earliest on ties).
+    """
+    steps = np.arange(len(indices))
+    order = np.lexsort((steps, delays, indices))
+    sorted_indices = indices[order]
+    repeated = np.zeros(len(indices), dtype=bool)
+    repeated[1:] = sorted_indices[1:] == sorted_indices[:-1]
+    result = indices.copy()
+    result[order[repeated]] = MISSING_MESSAGE
+    return result
+
+
+class Interpolation(NamedTuple):
+    """Interpolation of a sensor between the messages around each step.
+
+    Attributes:
+        upper: Index of the message after each step, of shape ``(T,)``.
+        weights: Weight of the message after each step, of shape ``(T,)``.
+        mode: ``ResamplingMode.LINEAR`` or ``ResamplingMode.SLERP``.
+    """
+
+    upper: np.ndarray
+    weights: np.ndarray
+    mode: ResamplingMode
+
+
+@dataclass(frozen=True)
+class SynchronizationIndex:
+    """Target timeline and the message of every sensor at each step.
+
+    Attributes:
+        timestamps: Times of the synchronized steps, of shape ``(T,)``.
+        indices: Per data type and sensor name, the index of the message used
+            at every step, of shape ``(T,)``, or ``MISSING_MESSAGE``. Indices
+            refer to the messages in the order they were given. Interpolated
+            sensors hold the message before each step.
+        interpolation: Per data type and sensor name, how interpolated
+            sensors are interpolated.
+    """
+
+    timestamps: np.ndarray
+    indices: dict[DataType, dict[str, np.ndarray]]
+    interpolation: dict[DataType, dict[str, Interpolation]] = field(
+        default_factory=dict
+    )
+
+    def __len__(self) -> int:
+        """Number of synchronized steps."""
+        return len(self.timestamps)
+
+    def window(self, steps: slice) -> "SynchronizationIndex":
+        """Restrict the index to a range of steps.
+
+        Indices still refer to the messages of the whole traces, so the window
+        assembles from the same traces and only reads the messages it uses.
+
+        Args:
+            steps: Range of steps to keep.
+
+        Returns:
+            SynchronizationIndex: The index of the steps in the range, sharing
+                memory with this index.
+        """
+        return SynchronizationIndex(
+            timestamps=self.timestamps[steps],
+            indices={
+                data_type: {name: values[steps] for name, values in names.items()}
+                for data_type, names in self.indices.items()
+            },
+            interpolation={
+                data_type: {
+                    name: Interpolation(
+                        entry.upper[steps], entry.weights[steps], entry.mode
+                    )
+                    for name, entry in names.items()
+                }
+                for data_type, names in self.interpolation.items()
+            },
+        )
+
+    def to_episode(
+        self,
+        traces: Mapping[DataType, Mapping[str, Sequence[NCData]]],
+        robot_id: str,
+    ) -> SynchronizedEpisode:
+        """Assemble the synchronized episode from the messages of every sensor.
+
+        Observations refer to the given NCData, which are not copied or
+        validated again, except for interpolated sensors which get new NCData
+        at every step.
+
+        Args:
+            traces: Messages of every synchronized sensor, in the order their
+                timestamps were given to ``synchronize_timestamps``.
+            robot_id: ID of the robot of the episode.
+
+        Returns:
+            SynchronizedEpisode: One observation per step, holding the sensors
+                present at that step.
+        """
+        return self.to_columnar_episode(traces, robot_id).to_synchronized_episode()
+
+    def to_columnar_episode(
+        self,
+        traces: Mapping[DataType, Mapping[str, Sequence[NCData]]],
+        robot_id: str,
+    ) -> ColumnarSynchronizedEpisode:
+        """Assemble the synchronized episode as one column per sensor.
+
+        Columns are gathered from the messages with the index maps, without
+        creating any point.
+
+        Args:
+            traces: Messages of every synchronized sensor, in the order their
+                timestamps were given to ``synchronize_timestamps``.
+            robot_id: ID of the robot of the episode.
+
+        Returns:
+            ColumnarSynchronizedEpisode: The synchronized episode, referring to
+                the given NCData except for interpolated sensors.
+        """
+        return ColumnarSynchronizedEpisode(
+            timestamps=self.timestamps,
+            columns={
+                data_type: {
+                    name: self._column(data_type, name, traces[data_type][name])
+                    for name in sensors
+                }
+                for data_type, sensors in self.indices.items()
+            },
+            robot_id=robot_id,
+        )
+
+    def _column(
+        self, data_type: DataType, name: str, messages: Sequence[NCData]
+    ) -> np.ndarray:
+        """Gather the NCData of a sensor at every step, None where missing."""
+        indices = self.indices[data_type][name]
+        present = indices != MISSING_MESSAGE
+        column = np.full(len(indices), None, dtype=object)
+        interpolation = self.interpolation.get(data_type, {}).get(name)
+        if interpolation is None:
+            # Only the used messages are read, so lazily loaded traces are
+            # not materialized when assembling a window of the index
+            column[present] = object_array(
+                [messages[i] for i in indices[present].tolist()]
+            )
+        else:
+            column[present] = object_array(
+                interpolate_trace(
+                    messages,
+                    indices[present],
+                    interpolation.upper[present],
+                    interpolation.weights[present],
+                    self.timestamps[present],
+                    interpolation.mode,
+                )
+            )
+        return column
+
+
+def _match_sensor(
+    values: np.ndarray,
+    targets: np.ndarray,
+    details: SynchronizationDetails,
+    mode: ResamplingMode,
+) -> tuple[np.ndarray, Interpolation | None]:
+    """Find the messages of one sensor used at every target time."""
+    if not len(values):
+        return np.full(len(targets), MISSING_MESSAGE, dtype=np.intp), None
+    order = np.argsort(values, kind="stable")
+    ordered = values[order]
+    if is_interpolated(mode):
+        lower, upper, weights = interpolation_weights(ordered, targets)
+        delays = np.minimum(targets - ordered[lower], ordered[upper] - targets)
+        missing = (delays > details.max_delay_s) | (targets < ordered[0])
+        missing |= targets > ordered[-1]
+        indices = order[lower]
+        indices[missing] = MISSING_MESSAGE
+        return indices, Interpolation(order[upper], weights, mode)
+    if mode == ResamplingMode.ZERO_ORDER_HOLD:
+        held = hold_indices(ordered, targets)
+        indices = np.where(held == MISSING_MESSAGE, MISSING_MESSAGE, order[held])
+        delays = np.where(held == MISSING_MESSAGE, np.inf, targets - values[indices])
+    else:
+        indices = order[nearest_indices(ordered, targets)]
+        delays = np.abs(values[indices] - targets)
+    indices[delays > details.max_delay_s] = MISSING_MESSAGE
+    if not details.allow_duplicates:
+        indices = _first_use_only(indices, delays)
+    return indices, None
+
+
+def _selected_sensors(
+    timestamps: Mapping[DataType, Mapping[str, np.ndarray | Sequence[float]]],
+    details: SynchronizationDetails,
+    robot_id: str | None,
+) -> list[tuple[DataType, str, np.ndarray]]:
+    """List the sensors to synchronize with their timestamps as arrays."""
+    union = None
+    if details.cross_embodiment_union is not None:
+        if robot_id not in details.cross_embodiment_union:
+            raise ValueError(f"Robot {robot_id!r} is not in the cross embodiment union")
+        union = details.cross_embodiment_union[robot_id]
+    sensors = []
+    for data_type, names in timestamps.items():
+        if union is not None and data_type not in union:
+            continue
+        for name, values in names.items():
+            if union is not None and name not in union[data_type]:
+                continue
+            sensors.append((data_type, name, np.asarray(values, dtype=np.float64)))
+    if not sensors:
+        raise ValueError("No sensors to synchronize")
+    return sensors
+
+
+def synchronize_timestamps(
+    timestamps: Mapping[DataType, Mapping[str, np.ndarray | Sequence[float]]],
+    details: SynchronizationDetails,
+    robot_id: str | None = None,
+) -> SynchronizationIndex:
+    """Synchronize sensors from the timestamps of their messages.
+
+    Args:
+        timestamps: Per data type and sensor name, the timestamps of the
+            sensor's messages. They need not be sorted.
+        details: How to synchronize.
+        robot_id: Robot of the sensors, to select its sensors from
+            ``details.cross_embodiment_union``.
+
+    Returns:
+        SynchronizationIndex: The target timeline and message indices.
+
+    Raises:
+        ValueError: If the frequency is not positive, no sensor is selected or
+            the robot is not in the cross embodiment union.
+    """
+    if details.frequency <= 0:
+        raise ValueError("Synchronization frequency must be positive")
+    sensors = _selected_sensors(timestamps, details, robot_id)
+
+    non_empty = [values for _, _, values in sensors if len(values)]
+    if details.trim_start_end and len(non_empty) < len(sensors):
+        non_empty = []
+    if non_empty:
+        firsts = [values.min() for values in non_empty]
+        lasts = [values.max() for values in non_empty]
+        if details.trim_start_end:
+            start, end = max(firsts), min(lasts)
+        else:
+            start, end = min(firsts), max(lasts)
+        num_steps = max(
+            int(np.floor((end - start) * details.frequency + _STEP_TOLERANCE)) + 1, 0
+        )
+        targets = start + np.arange(num_steps) / details.frequency
+    else:
+        targets = np.zeros(0, dtype=np.float64)
+
+    present = np.zeros(len(targets), dtype=bool)
+    indices: dict[DataType, dict[str, np.ndarray]] = {}
+    interpolation: dict[DataType, dict[str, Interpolation]] = {}
+    for data_type, name, values in sensors:
+        mode = details.resampling.get(data_type, ResamplingMode.NEAREST)
+        sensor_indices, sensor_interpolation = _match_sensor(
+            values, targets, details, mode
+        )
+        present |= sensor_indices != MISSING_MESSAGE
+        indices.setdefault(data_type, {})[name] = sensor_indices
+        if sensor_interpolation is not None:
+            interpolation.setdefault(data_type, {})[name] = sensor_interpolation
+
+    return SynchronizationIndex(
+        timestamps=targets[present],
+        indices={
+            data_type: {name: values[present] for name, values in names.items()}
+            for data_type, names in indices.items()
+        },
+        interpolation={
+            data_type: {
+                name: Interpolation(
+                    entry.upper[present], entry.weights[present], entry.mode
+                )
+                for name, entry in names.items()
+            }
+            for data_type, names in interpolation.items()
+        },
+    )
+
+
+def trace_timestamps(
+    traces: Mapping[DataType, Mapping[str, Sequence[NCData]]],
+) -> dict[DataType, dict[str, np.ndarray]]:
+    """Collect the timestamps of the messages of every sensor.
+
+    Args:
+        traces: Per data type and sensor name, the messages of the sensor.
+
+    Returns:
+        Per data type and sensor name, the timestamps of the messages, in
+        the order of the messages.
+    """
+    return {
+        data_type: {
+            name: np.fromiter(
+                (message.timestamp for message in messages),
+                dtype=np.float64,
+                count=len(messages),
+            )
+            for name, messages in sensors.items()
+        }
+        for data_type, sensors in traces.items()
+    }
+
+
+def synchronize_episode(
+    traces: Mapping[DataType, Mapping[str, Sequence[NCData]]],
+    details: SynchronizationDetails,
+    robot_id: str,
+) -> SynchronizedEpisode:
+    """Synchronize the recorded messages of every sensor into an episode.
+
+    Args:
+        traces: Per data type and sensor name, the messages of the sensor.
+        details: How to synchronize.
+        robot_id: ID of the recorded robot.
+
+    Returns:
+        SynchronizedEpisode: The synchronized observations, referring to the
+            given messages.
+    """
+    index = synchronize_timestamps(trace_timestamps(traces), details, robot_id)
+    return index.to_episode(traces, robot_id)
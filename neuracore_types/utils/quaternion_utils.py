@@ -0,0 +1,389 @@
+"""Batched NumPy quaternion kernels.
+
+Internal helpers used by the importer transforms in place of
+``scipy.spatial.transform.Rotation``, which has a high per-call overhead and a
+slow import. Every function works on arrays with arbitrary leading dimensions,
+e.g. ``(T, 4)`` quaternions or ``(T, 3, 3)`` matrices.
+
+Quaternions are scalar-last ``[x, y, z, w]``. Euler sequences follow the scipy
+convention: lowercase axes (``"xyz"``) are extrinsic rotations and uppercase
+axes (``"XYZ"``) are intrinsic. Results match scipy, including the quaternion
+sign it returns, up to floating point rounding.
+"""
+
+import numpy as np
+
+_AXIS_INDEX = {"x": 0, "y": 1, "z": 2}
+# Below this angle rotation vector conversions use a Taylor expansion
+_SMALL_ANGLE = 1e-3
+# Second euler angles this close to 0 or pi are gimbal locked
+_GIMBAL_LOCK_EPSILON = 1e-7
+
+
+def quat_normalize(quat: np.ndarray) -> np.ndarray:
+    """Normalize quaternions to unit length.
+
+    Args:
+        quat: Quaternions of shape ``(..., 4)``.
+
+    Returns:
+        np.ndarray: Unit quaternions of shape ``(..., 4)``.
+
+    Raises:
+        ValueError: If any quaternion has zero norm.
+    """
+    quat = np.asarray(quat, dtype=np.float64)
+    norm = np.linalg.norm(quat, axis=-1, keepdims=True)
+    if np.any(norm == 0):
+        raise ValueError("Found zero norm quaternions.")
+    return quat / norm
+
+
+def quat_multiply(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Compose rotations, ``p * q`` applies ``q`` first and then ``p``.
+
+    Args:
+        p: Quaternions of shape ``(..., 4)``.
+        q: Quaternions of shape ``(..., 4)``, broadcastable against ``p``.
+
+    Returns:
+        np.ndarray: Hamilton products of shape ``(..., 4)``.
+    """
+    p, q = np.asarray(p), np.asarray(q)
+    px, py, pz, pw = p[..., 0], p[..., 1], p[..., 2], p[..., 3]
+    qx, qy, qz, qw = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    return np.stack(
+        [
+            pw * qx + qw * px + (py * qz - pz * qy),
+            pw * qy + qw * py + (pz * qx - px * qz),
+            pw * qz + qw * pz + (px * qy - py * qx),
+            pw * qw - px * qx - py * qy - pz * qz,
+        ],
+        axis=-1,
+    )
+
+
+def quat_left_matrix(p: np.ndarray) -> np.ndarray:
+    """Matrix ``L`` such that ``p * q == L @ q`` for a single quaternion ``p``."""
+    x, y, z, w = p
+    return np.array([
+        [w, -z, y, x],
+        [z, w, -x, y],
+        [-y, x, w, z],
+        [-x, -y, -z, w],
+    ])
+
+
+def quat_right_matrix(q: np.ndarray) -> np.ndarray:
+    """Matrix ``R`` such that ``p * q == R @ p`` for a single quaternion ``q``."""
+    x, y, z, w = q
+    return np.array([
+        [w, z, -y, x],
+        [-z, w, x, y],
+        [y, -x, w, z],
+        [-x, -y, -z, w],
+    ])
+
+
+def quat_rotate(quat: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """Rotate vectors by unit quaternions.
+
+    Args:
+        quat: Unit quaternions of shape ``(..., 4)``.
+        vectors: Vectors of shape ``(..., 3)``, broadcastable against ``quat``.
+
+    Returns:
+        np.ndarray: Rotated vectors.
+    """
+    u, w = quat[..., :3], quat[..., 3:]
+    uv = np.cross(u, vectors)
+    return vectors + 2 * (w * uv + np.cross(u, uv))
+
+
+def quat_to_matrix(quat: np.ndarray) -> np.ndarray:
+    """Convert unit quaternions to rotation matrices.
+
+    Args:
+        quat: Unit quaternions of shape ``(..., 4)``.
+
+    Returns:
+        np.ndarray: Rotation matrices of shape ``(..., 3, 3)``.
+    """
+    x, y, z, w = quat[..., 0], quat[..., 1], quat[..., 2], quat[..., 3]
+    x2, y2, z2, w2 = x * x, y * y, z * z, w * w
+    xy, zw, xz, yw, yz, xw = x * y, z * w, x * z, y * w, y * z, x * w
+    matrix = np.empty((*quat.shape[:-1], 3, 3), dtype=np.result_type(quat, 1.0))
+    matrix[..., 0, 0] = x2 - y2 - z2 + w2
+    matrix[..., 1, 0] = 2 * (xy + zw)
+    matrix[..., 2, 0] = 2 * (xz - yw)
+    matrix[..., 0, 1] = 2 * (xy - zw)
+    matrix[..., 1, 1] = -x2 + y2 - z2 + w2
+    matrix[..., 2, 1] = 2 * (yz + xw)
+    matrix[..., 0, 2] = 2 * (xz + yw)
+    matrix[..., 1, 2] = 2 * (yz - xw)
+    matrix[..., 2, 2] = -x2 - y2 + z2 + w2
+    return matrix
+
+
+def quat_from_matrix(matrix: np.ndarray) -> np.ndarray:
+    """Convert rotation matrices to unit quaternions.
+
+    Matrices that are not orthogonal are first replaced by the closest
+    rotation matrix.
+
+    Args:
+        matrix: Rotation matrices of shape ``(..., 3, 3)``.
+
+    Returns:
+        np.ndarray: Unit quaternions of shape ``(..., 4)``.
+
+    Raises:
+        ValueError: If any matrix has a non-positive determinant.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if matrix.shape[-2:] != (3, 3):
+        raise ValueError(f"Expected matrices of shape (..., 3, 3), got {matrix.shape}")
+    if np.any(np.linalg.det(matrix) <= 0):
+        raise ValueError("Found rotation matrices with non-positive determinant.")
+    gramians = matrix @ np.swapaxes(matrix, -1, -2)
+    orthogonal = np.all(np.isclose(gramians, np.eye(3), atol=1e-12), axis=(-2, -1))
+    if not np.all(orthogonal):
+        matrix = matrix.copy()
+        U, _, Vt = np.linalg.svd(matrix[~orthogonal])
+        matrix[~orthogonal] = U @ Vt
+
+    trace = matrix[..., 0, 0] + matrix[..., 1, 1] + matrix[..., 2, 2]
+    decision = np.stack(
+        [matrix[..., 0, 0], matrix[..., 1, 1], matrix[..., 2, 2], trace], axis=-1
+    )
+    choice = decision.argmax(axis=-1)
+    quat = np.empty((*matrix.shape[:-2], 4))
+
+    # Build each quaternion from its largest component for numerical stability
+    for i in range(3):
+        j, k = (i + 1) % 3, (i + 2) % 3
+        mask = choice == i
+        m = matrix[mask]
+        quat[mask, i] = 1 - trace[mask] + 2 * m[:, i, i]
+        quat[mask, j] = m[:, j, i] + m[:, i, j]
+        quat[mask, k] = m[:, k, i] + m[:, i, k]
+        quat[mask, 3] = m[:, k, j] - m[:, j, k]
+    mask = choice == 3
+    m = matrix[mask]
+    quat[mask, 0] = m[:, 2, 1] - m[:, 1, 2]
+    quat[mask, 1] = m[:, 0, 2] - m[:, 2, 0]
+    quat[mask, 2] = m[:, 1, 0] - m[:, 0, 1]
+    quat[mask, 3] = 1 + trace[mask]
+    return quat / np.linalg.norm(quat, axis=-1, keepdims=True)
+
+
+def quat_from_rotvec(rotvec: np.ndarray, degrees: bool = False) -> np.ndarray:
+    """Convert rotation vectors (axis * angle) to unit quaternions.
+
+    Args:
+        rotvec: Rotation vectors of shape ``(..., 3)``.
+        degrees: Whether the rotation vector magnitudes are in degrees.
+
+    Returns:
+        np.ndarray: Unit quaternions of shape ``(..., 4)``.
+
+    Raises:
+        ValueError: If the rotation vectors do not have 3 components.
+    """
+    rotvec = np.asarray(rotvec, dtype=np.float64)
+    if rotvec.shape[-1] != 3:
+        raise ValueError(
+            f"Expected rotation vectors of shape (..., 3), got {rotvec.shape}"
+        )
+    if degrees:
+        rotvec = np.deg2rad(rotvec)
+    angle = np.linalg.norm(rotvec, axis=-1, keepdims=True)
+    small = angle <= _SMALL_ANGLE
+    angle2 = angle**2
+    # sin(angle / 2) / angle, with a Taylor expansion for small angles
+    scale = np.where(
+        small,
+        0.5 - angle2 / 48 + angle2**2 / 3840,
+        np.sin(angle / 2) / np.where(small, 1.0, angle),
+    )
+    return np.concatenate([rotvec * scale, np.cos(angle / 2)], axis=-1)
+
+
+def quat_to_rotvec(quat: np.ndarray, degrees: bool = False) -> np.ndarray:
+    """Convert unit quaternions to rotation vectors with angles in ``[0, pi]``.
+
+    Args:
+        quat: Unit quaternions of shape ``(..., 4)``.
+        degrees: Whether to return rotation vector magnitudes in degrees.
+
+    Returns:
+        np.ndarray: Rotation vectors of shape ``(..., 3)``.
+    """
+    quat = np.where(quat[..., 3:] < 0, -quat, quat)
+    angle = 2 * np.arctan2(
+        np.linalg.norm(quat[..., :3], axis=-1, keepdims=True), quat[..., 3:]
+    )
+    small = angle <= _SMALL_ANGLE
+    angle2 = angle**2
+    # angle / sin(angle / 2), with a Taylor expansion for small angles
+    scale = np.where(
+        small,
+        2 + angle2 / 12 + 7 * angle2**2 / 2880,
+        angle / np.where(small, 1.0, np.sin(angle / 2)),
+    )
+    if degrees:
+        scale = np.rad2deg(scale)
+    return scale * quat[..., :3]
+
+
+def quat_power(quat: np.ndarray, exponent: float) -> np.ndarray:
+    """Scale rotation angles of unit quaternions by ``exponent``.
+
+    This is slerp from the identity: the result rotates about the same axis by
+    ``exponent`` times the (shortest) angle of ``quat``.
+
+    Args:
+        quat: Unit quaternions of shape ``(..., 4)``.
+        exponent: Factor applied to each rotation angle.
+
+    Returns:
+        np.ndarray: Unit quaternions of shape ``(..., 4)``.
+    """
+    return quat_from_rotvec(quat_to_rotvec(quat) * exponent)
+
+
+def quat_slerp(p: np.ndarray, q: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Spherical linear interpolation between unit quaternions.
+
+    Interpolates along the shortest path, whatever the signs of ``p`` and
+    ``q``.
+
+    Args:
+        p: Unit quaternions at ``t = 0``, of shape ``(..., 4)``.
+        q: Unit quaternions at ``t = 1``, of shape ``(..., 4)``.
+        t: Interpolation weights of shape ``(...)``.
+
+    Returns:
+        np.ndarray: Unit quaternions of shape ``(..., 4)``.
+    """
+    p, q = np.asarray(p, dtype=np.float64), np.asarray(q, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)[..., np.newaxis]
+    dot = np.sum(p * q, axis=-1, keepdims=True)
+    q = np.where(dot < 0, -q, q)
+    angle = np.arccos(np.clip(np.abs(dot), 0.0, 1.0))
+    sin_angle = np.sin(angle)
+    # Nearly identical rotations fall back to a normalized linear interpolation
+    small = sin_angle < _SMALL_ANGLE
+    safe_sin = np.where(small, 1.0, sin_angle)
+    weight_p = np.where(small, 1 - t, np.sin((1 - t) * angle) / safe_sin)
+    weight_q = np.where(small, t, np.sin(t * angle) / safe_sin)
+    result = weight_p * p + weight_q * q
+    return result / np.linalg.norm(result, axis=-1, keepdims=True)
+
+
+def _parse_euler_sequence(seq: str) -> tuple[list[int], bool]:
+    """Return the axis indices of ``seq`` and whether it is extrinsic."""
+    if len(seq) != 3 or not (seq.islower() or seq.isupper()):
+        raise ValueError(f"Expected 3 lowercase or 3 uppercase axes, got {seq}")
+    if any(axis not in _AXIS_INDEX for axis in seq.lower()):
+        raise ValueError(f"Expected axes from 'xyz' or 'XYZ', got {seq}")
+    if seq[0] == seq[1] or seq[1] == seq[2]:
+        raise ValueError(f"Expected consecutive axes to be different, got {seq}")
+    return [_AXIS_INDEX[axis] for axis in seq.lower()], seq.islower()
+
+
+def quat_from_euler(seq: str, angles: np.ndarray, degrees: bool = False) -> np.ndarray:
+    """Convert euler angles to unit quaternions.
+
+    Args:
+        seq: Axis sequence, lowercase for extrinsic or uppercase for intrinsic
+            rotations.
+        angles: Euler angles of shape ``(..., 3)``.
+        degrees: Whether the angles are in degrees.
+
+    Returns:
+        np.ndarray: Unit quaternions of shape ``(..., 4)``.
+
+    Raises:
+        ValueError: If the sequence or the angles are invalid.
+    """
+    axes, extrinsic = _parse_euler_sequence(seq)
+    angles = np.asarray(angles, dtype=np.float64)
+    if angles.shape[-1] != 3:
+        raise ValueError(f"Expected euler angles of shape (..., 3), got {angles.shape}")
+    if degrees:
+        angles = np.deg2rad(angles)
+    quat = None
+    for axis, angle in zip(axes, np.moveaxis(angles, -1, 0)):
+        elementary = np.zeros((*angle.shape, 4))
+        elementary[..., axis] = np.sin(angle / 2)
+        elementary[..., 3] = np.cos(angle / 2)
+        if quat is None:
+            quat = elementary
+        elif extrinsic:
+            quat = quat_multiply(elementary, quat)
+        else:
+            quat = quat_multiply(quat, elementary)
+    assert quat is not None
+    return quat
+
+
+def quat_to_euler(quat: np.ndarray, seq: str, degrees: bool = False) -> np.ndarray:
+    """Convert unit quaternions to euler angles.
+
+    Angles are in ``[-pi, pi]``, with the second angle in ``[-pi / 2, pi / 2]``
+    for Tait-Bryan sequences and ``[0, pi]`` for proper Euler sequences. At a
+    gimbal lock the third angle is set to zero.
+
+    Args:
+        quat: Unit quaternions of shape ``(..., 4)``.
+        seq: Axis sequence, lowercase for extrinsic or uppercase for intrinsic
+            rotations.
+        degrees: Whether to return the angles in degrees.
+
+    Returns:
+        np.ndarray: Euler angles of shape ``(..., 3)``.
+
+    Raises:
+        ValueError: If the sequence is invalid.
+    """
+    # Quaternion based method of Bernardes and Viollet (2022), which is
+    # formulated for extrinsic sequences. Intrinsic sequences are extrinsic
+    # ones with the axes and angles reversed.
+    axes, extrinsic = _parse_euler_sequence(seq)
+    i, j, k = axes if extrinsic else axes[::-1]
+    symmetric = i == k
+    if symmetric:
+        k = 3 - i - j
+    sign = (i - j) * (j - k) * (k - i) // 2
+
+    w = quat[..., 3]
+    if symmetric:
+        a, b, c, d = w, quat[..., i], quat[..., j], quat[..., k] * sign
+    else:
+        a = w - quat[..., j]
+        b = quat[..., i] + quat[..., k] * sign
+        c = quat[..., j] + w
+        d = quat[..., k] * sign - quat[..., i]
+
+    half_sum = np.arctan2(b, a)
+    half_diff = np.arctan2(d, c)
+    angles = np.zeros((*quat.shape[:-1], 3))
+    angles[..., 1] = 2 * np.arctan2(np.hypot(c, d), np.hypot(a, b))
+
+    first, third = (0, 2) if extrinsic else (2, 0)
+    near_zero = np.abs(angles[..., 1]) <= _GIMBAL_LOCK_EPSILON
+    near_pi = np.abs(angles[..., 1] - np.pi) <= _GIMBAL_LOCK_EPSILON
+    regular = ~(near_zero | near_pi)
+    angles[..., 0] = np.where(
+        near_zero, 2 * half_sum, 2 * half_diff * (-1 if extrinsic else 1)
+    )
+    angles[..., first] = np.where(regular, half_sum - half_diff, angles[..., first])
+    third_angle = np.where(regular, half_sum + half_diff, angles[..., third])
+    if not symmetric:
+        third_angle = third_angle * sign
+        angles[..., 1] -= np.pi / 2
+    angles[..., third] = third_angle
+
+    angles = (angles + np.pi) % (2 * np.pi) - np.pi
+    return np.rad2deg(angles) if degrees else angles
@@ -0,0 +1,121 @@
+"""Construction of models from trusted values, without validation.
+
+Validating a model converts and checks every value, which is wasted work
+for values the package produced itself, e.g. when assembling episodes from
+NCData that were already validated, or tensors built by the batched
+converters. ``model_construct`` skips validation but handles every case of
+the general model machinery and is no faster than validating small models.
+
+``TrustedConstructionMixin`` adds ``from_trusted`` and ``construct_many``,
+which precompute the defaults of each model class once and then only copy
+them and set the instance attributes. Values are stored as given: they must
+already have the types validation would produce, e.g. NumPy arrays rather
+than lists or base64 strings. Defaults are applied like validation does,
+including the ``type`` discriminators of NCData and batched data, and
+default factories are called, and mutable defaults copied, for every
+instance. ``construct_many`` also pauses the garbage collector while it
+allocates, which otherwise dominates the time to build large episodes.
+"""
+
+import copy
+import gc
+from collections.abc import Callable, Iterable, Mapping
+from functools import cache, partial
+from typing import Any, NamedTuple, TypeVar, cast
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+_Model = TypeVar("_Model", bound="TrustedConstructionMixin")
+
+# Placeholder keeping the position of fields with a default factory
+_FACTORY_DEFAULT = object()
+
+
+class _Defaults(NamedTuple):
+    """Defaults of a model class, computed once per class."""
+
+    values: dict[str, Any]
+    factories: tuple[tuple[str, Callable[[], Any]], ...]
+    private: dict[str, Any] | None
+
+
+@cache
+def _defaults(model_class: type[BaseModel]) -> _Defaults:
+    """Collect the default values and factories of a model class."""
+    values: dict[str, Any] = {}
+    factories: list[tuple[str, Callable[[], Any]]] = []
+    for name, field in model_class.model_fields.items():
+        if field.default_factory is not None:
+            values[name] = _FACTORY_DEFAULT
+            factories.append((name, cast(Callable[[], Any], field.default_factory)))
+        elif field.default is not PydanticUndefined:
+            if copy.deepcopy(field.default) is field.default:
+                values[name] = field.default
+            else:
+                # Mutable defaults are copied for every instance, as pydantic does
+                values[name] = _FACTORY_DEFAULT
+                factories.append((name, partial(copy.deepcopy, field.default)))
+    private = {
+        name: attribute.get_default()
+        for name, attribute in model_class.__private_attributes__.items()
+    }
+    return _Defaults(values, tuple(factories), private or None)
+
+
+def _construct(model_class: type[_Model], fields: Mapping[str, Any]) -> _Model:
+    """Create a model instance holding trusted field values."""
+    defaults = _defaults(cast(type[BaseModel], model_class))
+    values = defaults.values.copy()
+    values.update(fields)
+    for name, factory in defaults.factories:
+        if values[name] is _FACTORY_DEFAULT:
+            values[name] = factory()
+    model = model_class.__new__(model_class)
+    object.__setattr__(model, "__dict__", values)
+    object.__setattr__(model, "__pydantic_fields_set__", set(fields))
+    object.__setattr__(model, "__pydantic_extra__", None)
+    private = defaults.private
+    object.__setattr__(
+        model, "__pydantic_private__", None if private is None else private.copy()
+    )
+    return model
+
+
+class TrustedConstructionMixin:
+    """Mixin for pydantic models adding constructors skipping validation."""
+
+    @classmethod
+    def from_trusted(cls: type[_Model], **fields: Any) -> _Model:
+        """Create an instance from trusted values, without validation.
+
+        Args:
+            **fields: Field values, already of their validated types. Fields
+                left out get their default, as with validation.
+
+        Returns:
+            The new instance, holding the values as given.
+        """
+        return _construct(cls, fields)
+
+    @classmethod
+    def construct_many(
+        cls: type[_Model], rows: Iterable[Mapping[str, Any]]
+    ) -> list[_Model]:
+        """Create instances from rows of trusted values, without validation.
+
+        Args:
+            rows: Field values of each instance, as for ``from_trusted``.
+
+        Returns:
+            One instance per row.
+        """
+        # The new instances hold no reference cycles, so collecting garbage
+        # while allocating them only rescans the growing heap
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return [_construct(cls, fields) for fields in rows]
+        finally:
+            if gc_was_enabled:
+                gc.enable()
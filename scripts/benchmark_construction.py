@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Benchmark validated, model_construct and trusted episode assembly.
+
+Usage:
+    python scripts/benchmark_construction.py --num-steps 10000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+
+import numpy as np
+
+from neuracore_types import (
+    DataType,
+    JointData,
+    RGBCameraData,
+    SynchronizedEpisode,
+    SynchronizedPoint,
+)
+
+
+def _time(fn: Callable[[], object], repeats: int) -> float:
+    """Return the best wall time of ``repeats`` calls to ``fn``."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def validated(
+    timestamps: list[float], values: list[list[float]], frame: np.ndarray
+) -> SynchronizedEpisode:
+    """Assemble an episode with the validating constructors."""
+    observations = []
+    for timestamp, row in zip(timestamps, values):
+        joints = {
+            f"joint_{i}": JointData(timestamp=timestamp, value=value)
+            for i, value in enumerate(row)
+        }
+        camera = RGBCameraData(timestamp=timestamp, frame_idx=0, frame=frame)
+        observations.append(
+            SynchronizedPoint(
+                timestamp=timestamp,
+                robot_id="robot",
+                data={
+                    DataType.JOINT_POSITIONS: joints,
+                    DataType.RGB_IMAGES: {"wrist": camera},
+                },
+            )
+        )
+    return SynchronizedEpisode(
+        observations=observations,
+        start_time=timestamps[0],
+        end_time=timestamps[-1],
+        robot_id="robot",
+    )
+
+
+def constructed(
+    timestamps: list[float], values: list[list[float]], frame: np.ndarray
+) -> SynchronizedEpisode:
+    """Assemble an episode with ``model_construct``."""
+    observations = []
+    for timestamp, row in zip(timestamps, values):
+        joints = {
+            f"joint_{i}": JointData.model_construct(timestamp=timestamp, value=value)
+            for i, value in enumerate(row)
+        }
+        camera = RGBCameraData.model_construct(
+            timestamp=timestamp, frame_idx=0, frame=frame
+        )
+        observations.append(
+            SynchronizedPoint.model_construct(
+                timestamp=timestamp,
+                robot_id="robot",
+                data={
+                    DataType.JOINT_POSITIONS: joints,
+                    DataType.RGB_IMAGES: {"wrist": camera},
+                },
+            )
+        )
+    return SynchronizedEpisode.model_construct(
+        observations=observations,
+        start_time=timestamps[0],
+        end_time=timestamps[-1],
+        robot_id="robot",
+    )
+
+
+def trusted(
+    timestamps: list[float], values: list[list[float]], frame: np.ndarray
+) -> SynchronizedEpisode:
+    """Assemble an episode with the trusted constructors, a column at a time."""
+    names = [f"joint_{i}" for i in range(len(values[0]))]
+    joint_columns = [
+        JointData.construct_many(
+            {"timestamp": timestamp, "value": row[i]}
+            for timestamp, row in zip(timestamps, values)
+        )
+        for i in range(len(names))
+    ]
+    cameras = RGBCameraData.construct_many(
+        {"timestamp": timestamp, "frame_idx": 0, "frame": frame}
+        for timestamp in timestamps
+    )
+    observations = SynchronizedPoint.construct_many(
+        {
+            "timestamp": timestamp,
+            "robot_id": "robot",
+            "data": {
+                DataType.JOINT_POSITIONS: dict(zip(names, joints)),
+                DataType.RGB_IMAGES: {"wrist": camera},
+            },
+        }
+        for timestamp, camera, *joints in zip(timestamps, cameras, *joint_columns)
+    )
+    return SynchronizedEpisode.from_trusted(
+        observations=observations,
+        start_time=timestamps[0],
+        end_time=timestamps[-1],
+        robot_id="robot",
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-steps", type=int, default=10_000)
+    parser.add_argument("--num-joints", type=int, default=7)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    timestamps = (np.arange(args.num_steps) / 30.0).tolist()
+    values = rng.random((args.num_steps, args.num_joints)).tolist()
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    if validated(timestamps, values, frame) != trusted(timestamps, values, frame):
+        raise RuntimeError("Trusted construction does not match validation")
+
+    baseline = _time(lambda: validated(timestamps, values, frame), args.repeats)
+    print(f"{'validated':<16} {baseline * 1e3:>9.1f} ms")
+    for name, assemble in [("model_construct", constructed), ("trusted", trusted)]:
+        elapsed = _time(partial(assemble, timestamps, values, frame), args.repeats)
+        print(
+            f"{name:<16} {elapsed * 1e3:>9.1f} ms   "
+            f"speedup: {baseline / elapsed:>5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Benchmark per-sample, batched and compiled DataTransform throughput.
+
+Usage:
+    python scripts/benchmark_transforms.py --num-samples 100000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+from scipy.spatial.transform import Rotation as R
+
+from neuracore_types.importer.config import (
+    XYZ,
+    EulerOrderConfig,
+    Frame,
+    FrameTransformConfig,
+    ImageChannelOrderConfig,
+    ImageConventionConfig,
+    PoseConfig,
+    RollPitchYaw,
+    RotationConfig,
+)
+from neuracore_types.importer.transform import (
+    ApplyFrameTransform,
+    CastToNumpyDtype,
+    Clip,
+    DataTransformSequence,
+    FlipSign,
+    ImageChannelOrder,
+    ImageFormat,
+    NumpyToScalar,
+    Offset,
+    Pose,
+    ScaleOrientation,
+    ScalePosition,
+    Unnormalize,
+)
+
+
+def _pose_sequence() -> DataTransformSequence:
+    """Transforms applied when importing euler poses with a frame change."""
+    return DataTransformSequence(
+        transforms=[
+            Pose(
+                pose_type=PoseConfig.POSITION_ORIENTATION,
+                rotation_type=RotationConfig.EULER,
+                seq=EulerOrderConfig.XYZ,
+            ),
+            ScalePosition(factor=0.001),
+            ScaleOrientation(factor=1.0),
+            ApplyFrameTransform(
+                transforms=[
+                    FrameTransformConfig(
+                        rotation=RollPitchYaw(roll=0.0, pitch=0.0, yaw=np.pi / 2),
+                        translation=XYZ(x=0.1, y=0.0, z=0.0),
+                        frame=Frame.WORLD,
+                    )
+                ]
+            ),
+        ]
+    )
+
+
+def _joint_sequence() -> DataTransformSequence:
+    """Transforms applied when importing an inverted, offset gripper joint."""
+    return DataTransformSequence(
+        transforms=[
+            Unnormalize(min=0.0, max=0.08),
+            Clip(min=0.0, max=0.08),
+            FlipSign(),
+            Offset(value=0.08),
+            CastToNumpyDtype(dtype=np.float32),
+            NumpyToScalar(),
+        ]
+    )
+
+
+def _image_sequence() -> DataTransformSequence:
+    """Transforms applied when importing CHW BGR frames as HWC RGB uint8."""
+    return DataTransformSequence(
+        transforms=[
+            Clip(min=0.0, max=255.0),
+            CastToNumpyDtype(dtype=np.uint8),
+            ImageFormat(format=ImageConventionConfig.CHANNELS_FIRST),
+            ImageChannelOrder(order=ImageChannelOrderConfig.BGR),
+        ]
+    )
+
+
+def _time(fn: Callable[[], object], repeats: int) -> float:
+    """Return the best wall time of ``repeats`` calls to ``fn``."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(
+    name: str, transform: DataTransformSequence, data: np.ndarray, repeats: int
+) -> None:
+    """Print per-sample, batched and compiled throughput on ``data``."""
+    compiled = transform.compile(reuse_buffers=True)
+    per_sample = _time(lambda: [transform(sample) for sample in data], repeats)
+    batched = _time(lambda: transform.apply_batch(data), repeats)
+    fused = _time(lambda: compiled.apply_batch(data), repeats)
+    num_samples = len(data)
+    print(
+        f"{name:<8} per-sample: {num_samples / per_sample:>12,.0f} samples/s   "
+        f"batched: {num_samples / batched:>12,.0f} samples/s   "
+        f"compiled: {num_samples / fused:>12,.0f} samples/s   "
+        f"speedup: {per_sample / batched:>7.1f}x / {per_sample / fused:>7.1f}x"
+    )
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-samples", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    euler = R.random(args.num_samples, random_state=0).as_euler("xyz")
+    poses = np.concatenate(
+        [rng.normal(size=(args.num_samples, 3)) * 1000, euler], axis=-1
+    )
+    joints = rng.random((args.num_samples, 1))
+    images = rng.integers(
+        0, 256, size=(max(args.num_samples // 1000, 1), 3, 240, 320), dtype=np.uint8
+    )
+
+    benchmark("pose", _pose_sequence(), poses, args.repeats)
+    benchmark("joint", _joint_sequence(), joints, args.repeats)
+    benchmark("image", _image_sequence(), images, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Tests for columnar_episode.py module."""
+
+import numpy as np
+import pytest
+
+from neuracore_types import (
+    ColumnarSynchronizedEpisode,
+    DataType,
+    JointData,
+    LanguageData,
+    SynchronizedEpisode,
+    SynchronizedPoint,
+)
+from neuracore_types.synchronization.synchronization import SynchronizationDetails
+from neuracore_types.synchronization.synchronizer import synchronize_timestamps
+
+JOINTS = DataType.JOINT_POSITIONS
+LANGUAGE = DataType.LANGUAGE
+NUM_STEPS = 8
+ORDER = {JOINTS: {1: "joint_2", 0: "joint_1"}, LANGUAGE: {0: "instruction"}}
+
+
+def _episode() -> SynchronizedEpisode:
+    return SynchronizedEpisode(
+        observations=[
+            SynchronizedPoint(
+                timestamp=0.1 * step,
+                robot_id="robot",
+                data={
+                    JOINTS: {
+                        "joint_2": JointData(value=2.0 * step),
+                        "joint_1": JointData(value=1.0 * step),
+                    },
+                    LANGUAGE: {"instruction": LanguageData(text="pick")},
+                },
+            )
+            for step in range(NUM_STEPS)
+        ],
+        start_time=0.0,
+        end_time=1.0,
+        robot_id="robot",
+    )
+
+
+class TestColumnarSynchronizedEpisode:
+    """Tests for ColumnarSynchronizedEpisode."""
+
+    def test_round_trip(self):
+        """Test conversion both ways shares the NCData."""
+        episode = _episode()
+        columnar = ColumnarSynchronizedEpisode.from_synchronized_episode(episode)
+        assert len(columnar) == NUM_STEPS
+        assert (columnar.start_time, columnar.end_time) == (0.0, 1.0)
+        np.testing.assert_allclose(columnar.timestamps, 0.1 * np.arange(NUM_STEPS))
+        assert (
+            columnar.column(JOINTS, "joint_1")[3]
+            is episode.observations[3][JOINTS]["joint_1"]
+        )
+
+        restored = columnar.to_synchronized_episode()
+        assert restored.model_dump() == episode.model_dump()
+        assert restored.observations[2][JOINTS]["joint_2"] is (
+            episode.observations[2][JOINTS]["joint_2"]
+        )
+
+    def test_slicing(self):
+        """Test slices are views of the columns."""
+        columnar = ColumnarSynchronizedEpisode.from_synchronized_episode(_episode())
+        window = columnar[2:6]
+        assert isinstance(window, ColumnarSynchronizedEpisode)
+        assert len(window) == 4
+        assert window.start_time == pytest.approx(0.2)
+        assert np.shares_memory(window.timestamps, columnar.timestamps)
+        assert np.shares_memory(
+            window.column(JOINTS, "joint_1"), columnar.column(JOINTS, "joint_1")
+        )
+        np.testing.assert_allclose(
+            window.field_array(JOINTS, "joint_2", "value"), [4.0, 6.0, 8.0, 10.0]
+        )
+        assert [point.timestamp for point in columnar[::4]] == pytest.approx([
+            0.0,
+            0.4,
+        ])
+
+    def test_points(self):
+        """Test points are created on access, skipping missing sensors."""
+        episode = _episode()
+        del episode.observations[1].data[LANGUAGE]
+        columnar = ColumnarSynchronizedEpisode.from_synchronized_episode(episode)
+        point = columnar[-1]
+        assert isinstance(point, SynchronizedPoint)
+        assert point.robot_id == "robot"
+        assert point[JOINTS]["joint_1"].value == NUM_STEPS - 1
+        assert LANGUAGE not in columnar[1].data
+        assert columnar.column(LANGUAGE, "instruction")[1] is None
+        assert [p.timestamp for p in columnar] == pytest.approx(
+            list(columnar.timestamps)
+        )
+        with pytest.raises(IndexError):
+            columnar[NUM_STEPS]
+        with pytest.raises(ValueError, match="missing from steps"):
+            columnar.field_array(LANGUAGE, "instruction", "text")
+
+    def test_order(self):
+        """Test ordering permutes the columns and validates them once."""
+        columnar = ColumnarSynchronizedEpisode.from_synchronized_episode(_episode())
+        ordered = columnar.order(ORDER)
+        assert list(ordered.columns[JOINTS]) == ["joint_1", "joint_2"]
+        assert ordered.column(JOINTS, "joint_1") is columnar.column(JOINTS, "joint_1")
+        expected = _episode().order(ORDER)
+        for point, observation in zip(ordered, expected.observations):
+            assert list(point[JOINTS]) == list(observation[JOINTS])
+
+    def test_order_errors(self):
+        """Test ordering rejects mismatching or incomplete sensors."""
+        columnar = ColumnarSynchronizedEpisode.from_synchronized_episode(_episode())
+        with pytest.raises(ValueError, match="data types must exactly match"):
+            columnar.order({JOINTS: ORDER[JOINTS]})
+        with pytest.raises(ValueError, match="names for DataType .* must exactly"):
+            columnar.order({**ORDER, JOINTS: {0: "joint_1"}})
+        episode = _episode()
+        del episode.observations[1].data[JOINTS]["joint_2"]
+        columnar = ColumnarSynchronizedEpisode.from_synchronized_episode(episode)
+        with pytest.raises(ValueError, match="missing from steps"):
+            columnar.order(ORDER)
+
+    def test_column_shape(self):
+        """Test columns must have one entry per step."""
+        with pytest.raises(ValueError, match="has shape"):
+            ColumnarSynchronizedEpisode(
+                timestamps=np.zeros(3),
+                columns={JOINTS: {"joint_1": np.full(2, None, dtype=object)}},
+                robot_id="robot",
+            )
+
+    def test_from_synchronization_index(self):
+        """Test synchronization assembles columns from its index maps."""
+        joints = [JointData(timestamp=0.05 * t, value=t) for t in range(10)]
+        index = synchronize_timestamps(
+            {JOINTS: {"arm": [joint.timestamp for joint in joints]}},
+            SynchronizationDetails(frequency=10, cross_embodiment_union=None),
+        )
+        columnar = index.to_columnar_episode({JOINTS: {"arm": joints}}, "robot")
+        assert list(columnar.column(JOINTS, "arm")) == joints[::2]
@@ -0,0 +1,94 @@
+"""Tests for timestamp_index.py module."""
+
+import numpy as np
+import pytest
+
+from neuracore_types import (
+    ColumnarSynchronizedEpisode,
+    DataType,
+    ParallelGripperOpenAmountData,
+    SynchronizedEpisode,
+    SynchronizedPoint,
+    TimestampIndex,
+)
+
+GRIPPER = DataType.PARALLEL_GRIPPER_OPEN_AMOUNTS
+TIMESTAMPS = [0.0, 0.5, 1.0, 1.0, 2.0]
+
+
+def _episode() -> SynchronizedEpisode:
+    return SynchronizedEpisode(
+        observations=[
+            SynchronizedPoint(
+                timestamp=t,
+                data={
+                    GRIPPER: {"gripper": ParallelGripperOpenAmountData(open_amount=i)}
+                },
+            )
+            for i, t in enumerate(TIMESTAMPS)
+        ],
+        start_time=0.0,
+        end_time=2.5,
+        robot_id="robot",
+    )
+
+
+class TestTimestampIndex:
+    """Tests for TimestampIndex."""
+
+    def test_nearest(self):
+        """Test the nearest timestamp is found, the earlier one on ties."""
+        index = TimestampIndex(TIMESTAMPS)
+        times = [-1.0, 0.25, 0.3, 1.0, 1.6, 9.0]
+        assert [index.nearest(t) for t in times] == [0, 0, 1, 2, 4, 4]
+        with pytest.raises(ValueError, match="empty index"):
+            TimestampIndex([]).nearest(0.0)
+
+    def test_floor_ceil(self):
+        """Test floor and ceil include equal timestamps and detect the ends."""
+        index = TimestampIndex(TIMESTAMPS)
+        times = [-0.1, 0.0, 1.0, 1.5, 3.0]
+        assert [index.floor(t) for t in times] == [None, 0, 3, 3, 4]
+        assert [index.ceil(t) for t in [-0.1, 0.5, 1.0, 1.5, 3.0]] == [0, 1, 2, 4, None]
+
+    def test_between(self):
+        """Test windows are half-open."""
+        index = TimestampIndex(TIMESTAMPS)
+        assert index.between(0.5, 2.0) == slice(1, 4)
+        assert index.between(1.0, 1.0) == slice(2, 2)
+        assert index.between(2.0, 0.0) == slice(4, 4)
+        assert index.between(-5.0, 5.0) == slice(0, 5)
+
+    def test_unsorted(self):
+        """Test unsorted timestamps are rejected."""
+        with pytest.raises(ValueError, match="non-decreasing"):
+            TimestampIndex([0.0, 2.0, 1.0])
+
+
+class TestEpisodeLookups:
+    """Tests for the timestamp lookups of episodes."""
+
+    def test_synchronized_episode(self):
+        """Test lookups return the observations themselves."""
+        episode = _episode()
+        index = episode.timestamp_index()
+        assert episode.nearest(0.7, index) is episode.observations[1]
+        assert episode.floor(-1.0, index) is None
+        assert episode.ceil(1.2) is episode.observations[4]
+        window = episode.between(0.5, 1.5, index)
+        assert window.observations == episode.observations[1:4]
+        assert window.observations[0] is episode.observations[1]
+        assert (window.start_time, window.end_time) == (0.5, 1.5)
+        assert episode.between(1.5, 9.0).end_time == 2.5
+
+    def test_columnar_episode(self):
+        """Test columnar lookups return points and views."""
+        columnar = ColumnarSynchronizedEpisode.from_synchronized_episode(_episode())
+        assert columnar.nearest(1.9)[GRIPPER]["gripper"].open_amount == 4
+        assert columnar.floor(0.9)[GRIPPER]["gripper"].open_amount == 1
+        assert columnar.ceil(2.1) is None
+        window = columnar.between(1.0, 2.0)
+        assert len(window) == 2
+        assert (window.start_time, window.end_time) == (1.0, 2.0)
+        assert np.shares_memory(window.timestamps, columnar.timestamps)
+        assert columnar.timestamp_index() is columnar.timestamp_index()
@@ -0,0 +1,410 @@
+"""Unit tests for import_runner.py module."""
+
+import numpy as np
+import pytest
+
+from neuracore_types.import_runner.episode_source import (
+    LocalFileEpisodeSource,
+    iter_time_chunks,
+)
+from neuracore_types.import_runner.import_runner import ImportRunner
+from neuracore_types.importer.config import (
+    EndEffectorPoseInputTypeConfig,
+    ImageConventionConfig,
+    IndexRangeConfig,
+    OutputDatasetConfig,
+    RobotConfig,
+)
+from neuracore_types.importer.data_config import (
+    DataFormat,
+    DepthCameraDataMappingItem,
+    MappingItem,
+    RGBCameraDataMappingItem,
+)
+from neuracore_types.importer.transform import DataTransformSequence, Scale
+from neuracore_types.nc_data import (
+    DatasetImportConfig,
+    DataType,
+    DepthCameraData,
+    JointData,
+    RGBCameraData,
+)
+from neuracore_types.nc_data.camera_data import (
+    DepthCameraDataImportConfig,
+    RGBCameraDataImportConfig,
+)
+from neuracore_types.nc_data.custom_1d_data import Custom1DDataImportConfig
+from neuracore_types.nc_data.joint_data import JointPositionsDataImportConfig
+from neuracore_types.nc_data.language_data import LanguageDataImportConfig
+from neuracore_types.nc_data.pose_data import PoseDataImportConfig
+from neuracore_types.nc_data.static_calibration import load_sensor_trace
+
+NUM_STEPS = 10
+
+
+def _config(
+    frequency: float | None = None, **data_import_config
+) -> DatasetImportConfig:
+    return DatasetImportConfig(
+        input_dataset_name="input_dataset",
+        output_dataset=OutputDatasetConfig(name="output_dataset"),
+        robot=RobotConfig(name="robot"),
+        frequency=frequency,
+        data_import_config={
+            DataType(key): value for key, value in data_import_config.items()
+        },
+    )
+
+
+def _rgb_item() -> RGBCameraDataMappingItem:
+    item = RGBCameraDataMappingItem(
+        name="front", source_name="images/front", extrinsics_source="extrinsics"
+    )
+    item.extrinsics_transforms = DataTransformSequence(transforms=[Scale(factor=2.0)])
+    return item
+
+
+@pytest.fixture
+def config() -> DatasetImportConfig:
+    return _config(
+        JOINT_POSITIONS=JointPositionsDataImportConfig(
+            source="state",
+            mapping=[
+                MappingItem(name="joint_a", index=0),
+                MappingItem(name="joint_b", index=2, inverted=True, offset=0.5),
+            ],
+        ),
+        RGB_IMAGES=RGBCameraDataImportConfig(
+            format=DataFormat(image_convention=ImageConventionConfig.CHANNELS_FIRST),
+            mapping=[_rgb_item()],
+        ),
+        DEPTH_IMAGES=DepthCameraDataImportConfig(
+            source="images/depth", mapping=[DepthCameraDataMappingItem(name="depth")]
+        ),
+        CUSTOM_1D=Custom1DDataImportConfig(
+            source="state", mapping=[MappingItem(name="custom", index=1)]
+        ),
+        LANGUAGE=LanguageDataImportConfig(
+            source="instruction", mapping=[MappingItem(name="instruction")]
+        ),
+    )
+
+
+def _episode(seed: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return {
+        "timestamps": np.arange(NUM_STEPS) * 0.1 + seed,
+        "state": rng.normal(size=(NUM_STEPS, 3)),
+        "images/front": rng.integers(0, 256, size=(NUM_STEPS, 3, 8, 6)),
+        "images/depth": rng.random((NUM_STEPS, 8, 6, 1)).astype(np.float32),
+        "extrinsics": rng.normal(size=(NUM_STEPS, 4, 4)),
+        "instruction": np.array(["pick up the cube"] * NUM_STEPS),
+    }
+
+
+@pytest.fixture
+def source(tmp_path) -> LocalFileEpisodeSource:
+    for seed in range(3):
+        np.savez(tmp_path / f"episode_{seed}.npz", **_episode(seed))
+    return LocalFileEpisodeSource(tmp_path)
+
+
+class TestImportRunner:
+    """Tests for ImportRunner."""
+
+    def test_matches_per_sample_import(self, config, source):
+        """Test streams equal applying each mapping item's transforms per step."""
+        runner = ImportRunner(config, source, max_workers=0, encode=False)
+        episode = runner.import_episode("episode_1")
+        raw = _episode(1)
+
+        joints = config.data_import_config[DataType.JOINT_POSITIONS].mapping
+        for item in joints:
+            stream = episode.data[DataType.JOINT_POSITIONS][item.name]
+            assert len(stream) == NUM_STEPS
+            for t, joint in enumerate(stream):
+                assert isinstance(joint, JointData)
+                assert joint.timestamp == raw["timestamps"][t]
+                assert joint.value == item.transforms(raw["state"][t, item.index])
+
+        item = config.data_import_config[DataType.RGB_IMAGES].mapping[0]
+        frames = episode.data[DataType.RGB_IMAGES]["front"]
+        for t, frame in enumerate(frames):
+            assert isinstance(frame, RGBCameraData)
+            assert frame.frame_idx == t
+            np.testing.assert_array_equal(
+                frame.frame, item.transforms(raw["images/front"][t])
+            )
+            np.testing.assert_array_equal(frame.extrinsics, raw["extrinsics"][t] * 2.0)
+
+        depth = episode.data[DataType.DEPTH_IMAGES]["depth"]
+        assert isinstance(depth[0], DepthCameraData)
+        assert depth[0].frame.shape == (8, 6)
+        custom = episode.data[DataType.CUSTOM_1D]["custom"]
+        np.testing.assert_array_equal(custom[3].data, [raw["state"][3, 1]])
+        language = episode.data[DataType.LANGUAGE]["instruction"]
+        assert language[0].text == "pick up the cube"
+
+    @pytest.mark.parametrize("camera_workers, chunk_size", [(0, 16), (3, 3)])
+    def test_encode(self, config, source, camera_workers, chunk_size):
+        """Test encoded streams are the JSON form of the imported NCData."""
+        expected = ImportRunner(
+            config, source, max_workers=0, encode=False
+        ).import_episode("episode_0")
+        runner = ImportRunner(
+            config,
+            source,
+            max_workers=0,
+            camera_workers=camera_workers,
+            chunk_size=chunk_size,
+        )
+        episode = runner.import_episode("episode_0")
+        assert episode.data.keys() == expected.data.keys()
+        for data_type, streams in expected.data.items():
+            for name, stream in streams.items():
+                assert episode.data[data_type][name] == [
+                    nc_data.model_dump(mode="json") for nc_data in stream
+                ]
+        assert episode.data[DataType.RGB_IMAGES]["front"][0]["frame"].startswith(
+            "data:image/png;base64,"
+        )
+
+    def test_streams_extracted_once(self, config, source, monkeypatch):
+        """Test camera chunks do not extract their whole stream again."""
+        calls = {}
+        for chunk_size in (1, NUM_STEPS):
+            runner = ImportRunner(
+                config, source, max_workers=0, camera_workers=2, chunk_size=chunk_size
+            )
+            counts = calls[chunk_size] = {"_extract": 0, "_timestamps": 0}
+            for name in counts:
+
+                def counted(*args, _name=name, _method=getattr(runner, name)):
+                    counts[_name] += 1
+                    return _method(*args)
+
+                monkeypatch.setattr(runner, name, counted)
+            runner.import_episode("episode_0")
+        assert calls[1] == calls[NUM_STEPS]
+        assert calls[1]["_extract"] > 0
+
+    def test_run_in_process_pool(self, config, source):
+        """Test episodes imported in worker processes match in-process imports."""
+        serial = ImportRunner(config, source, max_workers=0)
+        runner = ImportRunner(config, source, max_workers=2, max_pending=1)
+        episodes = {episode.episode_id: episode for episode in runner.run()}
+        assert sorted(episodes) == ["episode_0", "episode_1", "episode_2"]
+        for episode_id, episode in episodes.items():
+            assert episode.data == serial.import_episode(episode_id).data
+
+    def test_run_subset(self, config, source):
+        """Test run only imports the requested episodes."""
+        runner = ImportRunner(config, source, max_workers=0)
+        assert [
+            episode.episode_id for episode in runner.run(["episode_2", "episode_0"])
+        ] == ["episode_2", "episode_0"]
+
+    def test_profile(self, config, source):
+        """Test profiled episodes carry their transform and encoding counters."""
+        runner = ImportRunner(config, source, max_workers=2, profile=True)
+        episodes = list(runner.run())
+        profile = episodes[0].profile
+        by_transform = dict(profile.summary())
+        assert by_transform["encode RGBCameraData"].calls == NUM_STEPS
+        assert by_transform["encode RGBCameraData"].bytes_out > 0
+        assert by_transform["ImageFormat"].calls > 0
+        items = dict(profile.summary(by="item"))
+        assert {"front", "depth", "joint_a", "joint_b"} <= set(items)
+
+        for episode in episodes[1:]:
+            profile.merge(episode.profile)
+        assert dict(profile.summary())["encode RGBCameraData"].calls == 3 * NUM_STEPS
+        assert (
+            ImportRunner(config, source, max_workers=0)
+            .import_episode("episode_0")
+            .profile
+            is None
+        )
+
+    def test_static_calibration(self, config, tmp_path):
+        """Test a constant calibration source is stored once per stream."""
+        episode = _episode(0)
+        episode["extrinsics"] = np.broadcast_to(
+            episode["extrinsics"][0], episode["extrinsics"].shape
+        )
+        np.savez(tmp_path / "episode.npz", **episode)
+        source = LocalFileEpisodeSource(tmp_path)
+
+        imported = ImportRunner(
+            config, source, max_workers=0, encode=False
+        ).import_episode("episode")
+        calibration = imported.calibration[DataType.RGB_IMAGES]["front"]
+        np.testing.assert_array_equal(
+            calibration.extrinsics, episode["extrinsics"][0] * 2.0
+        )
+        assert calibration.intrinsics is None
+        frames = imported.data[DataType.RGB_IMAGES]["front"]
+        assert all(frame.extrinsics is calibration.extrinsics for frame in frames)
+        assert DataType.DEPTH_IMAGES not in imported.calibration
+
+        encoded = ImportRunner(
+            config, source, max_workers=0, camera_workers=2, chunk_size=3
+        ).import_episode("episode")
+        dumped = encoded.data[DataType.RGB_IMAGES]["front"]
+        assert all("extrinsics" not in frame for frame in dumped)
+        loaded = load_sensor_trace(
+            {
+                "calibration": encoded.calibration[DataType.RGB_IMAGES][
+                    "front"
+                ].model_dump(mode="json"),
+                "data": dumped,
+            },
+            RGBCameraData,
+        )
+        # JSON calibration matrices decode to float16, with or without sharing
+        assert [frame.model_dump(mode="json") for frame in loaded] == [
+            RGBCameraData.model_validate(frame.model_dump(mode="json")).model_dump(
+                mode="json"
+            )
+            for frame in frames
+        ]
+
+    def test_memory_mapped_source(self, config, tmp_path):
+        """Test importing memory-mapped arrays chunk by chunk copies the values."""
+        config.data_import_config[DataType.CUSTOM_1D] = Custom1DDataImportConfig(
+            source="state",
+            mapping=[
+                MappingItem(name="custom", index_range=IndexRangeConfig(start=0, end=2))
+            ],
+        )
+        np.savez(tmp_path / "episode.npz", **_episode(0))
+        source = LocalFileEpisodeSource(tmp_path)
+        state = source.load("episode")["state"]
+        assert isinstance(state, np.memmap)
+
+        expected = ImportRunner(
+            config, LocalFileEpisodeSource(tmp_path, mmap_mode=None), max_workers=0
+        ).import_episode("episode")
+        runner = ImportRunner(
+            config, source, max_workers=0, camera_workers=0, chunk_size=3
+        )
+        assert runner.import_episode("episode").data == expected.data
+
+        runner.encode = False
+        episode = runner.import_episode("episode")
+        for custom in episode.data[DataType.CUSTOM_1D]["custom"]:
+            # Views of the read-only mapping would not be writeable
+            assert custom.data.flags.writeable
+
+    def test_timestamps_from_frequency(self, tmp_path):
+        """Test episodes without timestamps are timestamped from the frequency."""
+        episode = _episode(0)
+        del episode["timestamps"]
+        np.savez(tmp_path / "episode.npz", **episode)
+        source = LocalFileEpisodeSource(tmp_path)
+        config = _config(
+            frequency=20.0,
+            JOINT_POSITIONS=JointPositionsDataImportConfig(
+                source="state", mapping=[MappingItem(name="joint")]
+            ),
+        )
+        runner = ImportRunner(config, source, max_workers=0, encode=False)
+        joints = runner.import_episode("episode").data[DataType.JOINT_POSITIONS]
+        assert [joint.timestamp for joint in joints["joint"]] == [
+            t / 20.0 for t in range(NUM_STEPS)
+        ]
+
+        runner = ImportRunner(_config(**config.data_import_config), source)
+        with pytest.raises(ValueError):
+            runner.import_episode("episode")
+
+    def test_missing_source(self, config, tmp_path):
+        """Test a mapping item reading a missing source raises."""
+        episode = _episode(0)
+        del episode["state"]
+        np.savez(tmp_path / "episode.npz", **episode)
+        runner = ImportRunner(config, LocalFileEpisodeSource(tmp_path), max_workers=0)
+        with pytest.raises(ValueError, match="state"):
+            runner.import_episode("episode")
+
+    def test_kinematics_not_supported(self, source):
+        """Test configs needing forward kinematics are rejected."""
+        config = _config(
+            END_EFFECTOR_POSES=PoseDataImportConfig(
+                format=DataFormat(
+                    ee_pose_input_type=EndEffectorPoseInputTypeConfig.JOINT_POSITIONS
+                ),
+            ),
+        )
+        with pytest.raises(NotImplementedError):
+            ImportRunner(config, source)
+
+
+class TestLocalFileEpisodeSource:
+    """Tests for LocalFileEpisodeSource."""
+
+    def test_npz_and_npy_directories(self, tmp_path):
+        """Test episodes are read from .npz archives and .npy directories."""
+        np.savez(tmp_path / "b.npz", state=np.zeros((2, 3)))
+        (tmp_path / "a" / "images").mkdir(parents=True)
+        np.save(tmp_path / "a" / "state.npy", np.ones((2, 3)))
+        np.save(tmp_path / "a" / "images" / "front.npy", np.ones((2, 4, 4, 3)))
+        (tmp_path / "notes.txt").write_text("not an episode")
+
+        source = LocalFileEpisodeSource(tmp_path)
+        assert source.episode_ids() == ["a", "b"]
+        assert sorted(source.load("a")) == ["images/front", "state"]
+        np.testing.assert_array_equal(source.load("b")["state"], np.zeros((2, 3)))
+        with pytest.raises(ValueError):
+            source.load("c")
+
+    def test_memory_mapped(self, tmp_path):
+        """Test arrays are memory-mapped unless compressed or disabled."""
+        state = np.asfortranarray(np.arange(12.0).reshape(4, 3))
+        names = np.array(["a", "bc"])
+        np.savez(tmp_path / "stored.npz", state=state, names=names)
+        np.savez_compressed(tmp_path / "compressed.npz", state=state)
+        (tmp_path / "directory").mkdir()
+        np.save(tmp_path / "directory" / "state.npy", state)
+
+        source = LocalFileEpisodeSource(tmp_path)
+        for episode_id in ["stored", "directory"]:
+            loaded = source.load(episode_id)["state"]
+            assert isinstance(loaded, np.memmap)
+            assert not loaded.flags.writeable
+            np.testing.assert_array_equal(loaded, state)
+        np.testing.assert_array_equal(source.load("stored")["names"], names)
+        compressed = source.load("compressed")["state"]
+        assert not isinstance(compressed, np.memmap)
+        np.testing.assert_array_equal(compressed, state)
+
+        in_memory = LocalFileEpisodeSource(tmp_path, mmap_mode=None)
+        for episode_id in ["stored", "directory"]:
+            assert not isinstance(in_memory.load(episode_id)["state"], np.memmap)
+
+    def test_missing_root(self, tmp_path):
+        """Test a missing root directory raises."""
+        with pytest.raises(ValueError):
+            LocalFileEpisodeSource(tmp_path / "missing")
+
+
+class TestIterTimeChunks:
+    """Tests for iter_time_chunks."""
+
+    def test_chunks_are_views(self):
+        """Test chunks are views of the selected columns."""
+        array = np.arange(30.0).reshape(10, 3)
+        chunks = list(iter_time_chunks(array, 4, index=1))
+        assert [start for start, _ in chunks] == [0, 4, 8]
+        assert [len(chunk) for _, chunk in chunks] == [4, 4, 2]
+        for start, chunk in chunks:
+            assert np.shares_memory(chunk, array)
+            np.testing.assert_array_equal(chunk, array[start : start + 4, 1])
+
+        chunks = list(
+            iter_time_chunks(array, 16, index_range=IndexRangeConfig(start=1, end=3))
+        )
+        assert len(chunks) == 1
+        np.testing.assert_array_equal(chunks[0][1], array[:, 1:3])
+        with pytest.raises(ValueError):
+            list(iter_time_chunks(array, 0))
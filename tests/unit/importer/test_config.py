@@ -389,6 +389,47 @@ class TestDatasetConfig:
         assert isinstance(rgb_transforms[2], ImageFormat)
         assert isinstance(joint_transforms[0], NumpyToScalar)
 
+    def test_dataset_config_from_file_cached(self, tmp_path):
+        """Test repeated loads of a file return equal, independent configs."""
+        config_path = tmp_path / "config.yaml"
+        config_data = {
+            "input_dataset_name": "input_dataset",
+            "output_dataset": {"name": "output_dataset"},
+            "robot": {"name": "test_robot"},
+            "data_import_config": {
+                "JOINT_POSITIONS": {
+                    "source": "joint_sensor0",
+                    "format": {"angle_units": "DEGREES"},
+                    "mapping": [
+                        {"name": f"joint_{i}", "index": i, "inverted": True}
+                        for i in range(3)
+                    ],
+                },
+            },
+        }
+        config_path.write_text(yaml.dump(config_data))
+
+        first = DatasetImportConfig.from_file(config_path)
+        second = DatasetImportConfig.from_file(config_path)
+        assert first == second
+        assert first is not second
+        first.robot.name = "modified"
+        assert second.robot.name == "test_robot"
+        mapping = second.data_import_config[DataType.JOINT_POSITIONS].mapping
+        assert mapping[0].transforms.transforms[-1] is (
+            mapping[1].transforms.transforms[-1]
+        )
+
+        config_data["robot"]["name"] = "other_robot"
+        config_path.write_text(yaml.dump(config_data))
+        assert DatasetImportConfig.from_file(config_path).robot.name == "other_robot"
+
+        class SubclassConfig(DatasetImportConfig):
+            pass
+
+        assert type(SubclassConfig.from_file(config_path)) is SubclassConfig
+        assert type(DatasetImportConfig.from_file(config_path)) is DatasetImportConfig
+
     def test_dataset_config_from_file_not_found(self, tmp_path):
         """Test DatasetConfig.from_file with non-existent file."""
         config_path = tmp_path / "missing_config.yaml"
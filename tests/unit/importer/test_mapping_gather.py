@@ -0,0 +1,120 @@
+"""Unit tests for mapping_gather.py module."""
+
+import numpy as np
+import pytest
+
+from neuracore_types.importer.config import (
+    AngleConfig,
+    IndexRangeConfig,
+    NormalizeConfig,
+)
+from neuracore_types.importer.data_config import DataFormat, MappingItem
+from neuracore_types.importer.mapping_gather import (
+    MappingItemGather,
+    group_mapping_items,
+)
+from neuracore_types.nc_data.custom_1d_data import Custom1DDataImportConfig
+from neuracore_types.nc_data.joint_data import JointPositionsDataImportConfig
+from neuracore_types.nc_data.parallel_gripper_open_amount_data import (
+    ParallelGripperOpenAmountDataImportConfig,
+)
+
+NUM_JOINTS = 30
+
+
+def _joint_items() -> list[MappingItem]:
+    return [
+        MappingItem(
+            name=f"joint_{i}",
+            index=NUM_JOINTS - 1 - i,
+            inverted=i % 3 == 0,
+            offset=0.25 * i if i % 4 == 0 else 0.0,
+        )
+        for i in range(NUM_JOINTS)
+    ]
+
+
+def _sources() -> list[np.ndarray]:
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(64, NUM_JOINTS)) * 90
+    values[0, :3] = [np.nan, np.inf, -0.0]
+    values[1, :2] = [0.0, -np.inf]
+    return [values, values.astype(np.float32), np.round(values[2:]).astype(np.int32)]
+
+
+def _assert_matches_items(gather: MappingItemGather, data: np.ndarray) -> None:
+    values = gather.apply_batch(data)
+    assert values.shape == (len(data), len(gather.items))
+    for column, item in enumerate(gather.items):
+        expected = item.transforms.apply_batch(data[:, item.index])
+        np.testing.assert_array_equal(values[:, column], expected)
+        # Bit-identical, including the sign of zeros
+        assert np.signbit(values[:, column]).tolist() == np.signbit(expected).tolist()
+
+
+class TestMappingItemGather:
+    """Tests for MappingItemGather."""
+
+    @pytest.mark.parametrize("angle_units", list(AngleConfig))
+    def test_matches_per_item_transforms(self, angle_units):
+        """Test a gather equals transforming every joint on its own."""
+        config = JointPositionsDataImportConfig(
+            mapping=_joint_items(), format=DataFormat(angle_units=angle_units)
+        )
+        gathers, remaining = group_mapping_items(config.mapping)
+        assert len(gathers) == 1
+        assert not remaining
+        assert gathers[0].names == [item.name for item in config.mapping]
+        for data in _sources():
+            _assert_matches_items(gathers[0], data)
+
+    @pytest.mark.parametrize("invert_gripper_amount", [False, True])
+    def test_matches_gripper_transforms(self, invert_gripper_amount):
+        """Test gathering gripper items with shared clip and normalize steps."""
+        config = ParallelGripperOpenAmountDataImportConfig(
+            mapping=[
+                MappingItem(name="left", index=0),
+                MappingItem(name="right", index=1, inverted=True, offset=1.0),
+            ],
+            format=DataFormat(
+                normalize=NormalizeConfig(min=0.0, max=0.08),
+                invert_gripper_amount=invert_gripper_amount,
+            ),
+        )
+        gathers, remaining = group_mapping_items(config.mapping)
+        assert not remaining
+        for gather in gathers:
+            for data in _sources():
+                _assert_matches_items(gather, data[:, :2] / 1000)
+
+    def test_groups_by_shared_transforms(self):
+        """Test items are grouped by their shared transforms."""
+        radians = JointPositionsDataImportConfig(mapping=_joint_items()[:4])
+        degrees = JointPositionsDataImportConfig(
+            mapping=_joint_items()[4:],
+            format=DataFormat(angle_units=AngleConfig.DEGREES),
+        )
+        items = [*degrees.mapping[:2], *radians.mapping, *degrees.mapping[2:]]
+        gathers, remaining = group_mapping_items(items)
+        assert not remaining
+        assert [gather.items for gather in gathers] == [
+            [*degrees.mapping],
+            [*radians.mapping],
+        ]
+        with pytest.raises(ValueError):
+            MappingItemGather(items)
+
+    def test_ungatherable_items(self):
+        """Test items not selecting a single scalar column are left out."""
+        config = Custom1DDataImportConfig(
+            mapping=[
+                MappingItem(name="column", index=0),
+                MappingItem(name="range", index_range=IndexRangeConfig(start=0, end=2)),
+            ]
+        )
+        joints = JointPositionsDataImportConfig(mapping=_joint_items()[:2])
+        gathers, remaining = group_mapping_items([*config.mapping, *joints.mapping])
+        assert [gather.items for gather in gathers] == [[*joints.mapping]]
+        assert remaining == config.mapping
+        with pytest.raises(ValueError):
+            MappingItemGather([])
@@ -0,0 +1,161 @@
+"""Unit tests for profiling.py module."""
+
+import pickle
+import threading
+
+import numpy as np
+import pytest
+
+from neuracore_types.importer.config import PoseConfig
+from neuracore_types.importer.profiling import (
+    TransformProfiler,
+    TransformStats,
+    active_profiler,
+    profile_mapping_item,
+)
+from neuracore_types.importer.transform import (
+    CastToNumpyDtype,
+    Clip,
+    DataTransformSequence,
+    Pose,
+    Scale,
+)
+
+
+def _sequence() -> DataTransformSequence:
+    return DataTransformSequence(
+        transforms=[
+            Scale(factor=2.0),
+            Clip(min=0.0, max=255.0),
+            CastToNumpyDtype(dtype=np.uint8),
+        ]
+    )
+
+
+class TestTransformProfiler:
+    """Tests for TransformProfiler."""
+
+    def test_disabled_by_default(self):
+        """Test nothing is recorded without an active profiler."""
+        profiler = TransformProfiler()
+        _sequence().apply_batch(np.ones((4, 3)))
+        assert active_profiler() is None
+        assert profiler.stats == {}
+
+    def test_records_transforms(self):
+        """Test calls, bytes and mapping items are recorded per transform."""
+        data = np.ones((4, 3))
+        with TransformProfiler() as profiler:
+            assert active_profiler() is profiler
+            with profile_mapping_item("joint"):
+                _sequence().apply_batch(data)
+                _sequence()(data[0])
+            _sequence().apply_batch(data)
+        assert active_profiler() is None
+
+        scale = profiler.stats["Scale", "joint"]
+        assert scale.calls == 2
+        assert scale.bytes_in == data.nbytes + data[0].nbytes
+        assert profiler.stats["CastToNumpyDtype", None].bytes_out == 12
+        assert profiler.stats["Clip", None].seconds > 0
+
+        by_transform = dict(profiler.summary())
+        assert sorted(by_transform) == ["CastToNumpyDtype", "Clip", "Scale"]
+        assert by_transform["Scale"].calls == 3
+        assert dict(profiler.summary(by="item"))["joint"].calls == 6
+        assert "Scale [joint]" in dict(profiler.summary(by=None))
+
+        report = profiler.report(limit=2)
+        slowest = profiler.summary()[0][0]
+        assert report.splitlines()[1].split()[0] == slowest
+        assert len(report.splitlines()) == 3
+
+    def test_records_compiled_steps(self):
+        """Test compiled sequences record fused steps and opaque transforms."""
+        compiled = _sequence().compile()
+        poses = DataTransformSequence(
+            transforms=[Pose(pose_type=PoseConfig.MATRIX)]
+        ).compile()
+        with TransformProfiler() as profiler:
+            compiled.apply_batch(np.ones((4, 3)))
+            poses.apply_batch(np.tile(np.eye(4), (2, 1, 1)))
+        names = {name for name, _ in profiler.stats}
+        assert "Pose" in names
+        assert {"compiled mul", "compiled clip"} <= names
+
+    def test_nested_profilers(self):
+        """Test an inner profiler records until it exits."""
+        with TransformProfiler() as outer:
+            with TransformProfiler() as inner:
+                _sequence()(np.ones(3))
+            assert active_profiler() is outer
+            _sequence()(np.ones(3))
+        assert inner.stats["Scale", None].calls == 1
+        assert outer.stats["Scale", None].calls == 1
+
+    def test_concurrent_profilers(self):
+        """Test profilers active in different threads record separately."""
+        barrier = threading.Barrier(2)
+        profilers: dict[int, TransformProfiler] = {}
+
+        def profile(calls: int) -> None:
+            with TransformProfiler() as profiler:
+                barrier.wait()
+                for _ in range(calls):
+                    _sequence()(np.ones(3))
+                barrier.wait()
+            profilers[calls] = profiler
+
+        threads = [threading.Thread(target=profile, args=(n,)) for n in (1, 2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert active_profiler() is None
+        assert profilers[1].stats["Scale", None].calls == 1
+        assert profilers[2].stats["Scale", None].calls == 2
+
+    def test_shared_profiler_in_overlapping_threads(self):
+        """Test threads entering the same profiler can exit in any order."""
+        profiler = TransformProfiler()
+        entered = threading.Barrier(2)
+        first_exited = threading.Event()
+        errors: list[BaseException] = []
+
+        def profile(first: bool) -> None:
+            try:
+                with profiler:
+                    entered.wait()
+                    _sequence()(np.ones(3))
+                    if not first:
+                        first_exited.wait(timeout=5)
+                    assert active_profiler() is profiler
+                first_exited.set()
+                assert active_profiler() is None
+            except BaseException as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=profile, args=(f,)) for f in (True, False)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert profiler.stats["Scale", None].calls == 2
+        assert active_profiler() is None
+
+    def test_exit_without_enter_raises(self):
+        """Test exiting a profiler not entered in this context raises."""
+        with pytest.raises(ValueError, match="not entered"):
+            TransformProfiler().__exit__(None, None, None)
+
+    def test_merge_and_pickle(self):
+        """Test profilers from worker processes can be merged."""
+        with TransformProfiler() as profiler:
+            _sequence()(np.ones(3))
+        restored = pickle.loads(pickle.dumps(profiler))
+        restored.merge(profiler)
+        assert restored.stats["Scale", None].calls == 2
+        assert TransformStats(calls=1, seconds=1.0).merge(
+            TransformStats(calls=2, bytes_in=3)
+        ) == TransformStats(calls=3, seconds=1.0, bytes_in=3)
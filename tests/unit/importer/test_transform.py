@@ -1,5 +1,8 @@
 """Unit tests for transform.py module."""
 
+import copy
+import pickle
+
 import numpy as np
 import pytest
 from scipy.spatial.transform import Rotation as R
@@ -12,6 +15,8 @@ from neuracore_types.importer.config import (
     FrameTransformConfig,
     ImageChannelOrderConfig,
     ImageConventionConfig,
+    IntrinsicsConfig,
+    OrientationConfig,
     PoseConfig,
     QuaternionOrderConfig,
     RollPitchYaw,
@@ -23,9 +28,11 @@ from neuracore_types.importer.transform import (
     Clip,
     DataTransformSequence,
     DegreesToRadians,
+    ExtrinsicsToMatrix,
     FlipSign,
     ImageChannelOrder,
     ImageFormat,
+    IntrinsicsToMatrix,
     LanguageFromBytes,
     NanToNum,
     Normalize,
@@ -34,6 +41,9 @@ from neuracore_types.importer.transform import (
     Pose,
     Rotation,
     Scale,
+    ScaleOrientation,
+    ScalePosition,
+    Squeeze,
     Unnormalize,
 )
 
@@ -58,6 +68,21 @@ class TestDataTransformSequence:
         expected = np.array([3.0, 5.0, 7.0])  # (x * 2) + 1
         np.testing.assert_array_equal(result, expected)
 
+    def test_stateless_transforms_are_shared(self):
+        """Test copies and unpickled stateless transforms are shared instances."""
+        sequence = DataTransformSequence(
+            transforms=[FlipSign(), Scale(factor=2.0), NumpyToScalar()]
+        )
+        for copied in [
+            copy.deepcopy(sequence),
+            pickle.loads(pickle.dumps(sequence)),
+        ]:
+            assert copied == sequence
+            assert copied.transforms[0] is pickle.loads(pickle.dumps(FlipSign()))
+            assert copied.transforms[2] is copy.copy(copied.transforms[2])
+            # Transforms with fields are copied, as they may be modified
+            assert copied.transforms[1] is not sequence.transforms[1]
+
 
 class TestRotation:
     """Tests for Rotation transform."""
@@ -263,6 +288,26 @@ class TestRotation:
             out[3:7], R.from_euler("z", np.pi).as_quat()
         )
 
+    def test_apply_frame_transform_copies_compare_equal(self):
+        """Test copies keep the precomposed matrices and compare by value."""
+        transform = ApplyFrameTransform(
+            transforms=[
+                FrameTransformConfig(
+                    frame=Frame.WORLD, translation=XYZ(x=1.0, y=2.0, z=3.0)
+                )
+            ]
+        )
+        pose = np.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0])
+        for restored in [
+            copy.deepcopy(transform),
+            pickle.loads(pickle.dumps(transform)),
+        ]:
+            assert restored == transform
+            np.testing.assert_array_equal(restored(pose), transform(pose))
+        assert transform != ApplyFrameTransform()
+        poses = Pose(pose_type=PoseConfig.MATRIX)
+        assert copy.deepcopy(poses) == poses
+
     def test_rotation_euler_extrinsic_xyz_matches_ros_static_axes(self):
         """extrinsic_euler=True must produce extrinsic (ROS static-axes) quaternions.
 
@@ -717,3 +762,176 @@ class TestLanguageFromBytes:
         result = transform(data)
         assert isinstance(result, str)
         assert result == ""
+
+
+def _random_poses(num_poses: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    quats = R.random(num_poses, random_state=seed).as_quat()
+    return np.concatenate([rng.normal(size=(num_poses, 3)), quats], axis=-1)
+
+
+def _assert_batch_matches_per_sample(transform, batch: np.ndarray, **kwargs):
+    expected = np.stack([np.asarray(transform(sample)) for sample in batch])
+    np.testing.assert_allclose(transform.apply_batch(batch), expected, **kwargs)
+
+
+class TestApplyBatch:
+    """Tests that apply_batch matches applying __call__ to each sample."""
+
+    @pytest.mark.parametrize(
+        "rotation",
+        [
+            Rotation(seq=QuaternionOrderConfig.WXYZ),
+            Rotation(rotation_type=RotationConfig.MATRIX),
+            Rotation(rotation_type=RotationConfig.EULER, seq=EulerOrderConfig.ZYX),
+            Rotation(
+                rotation_type=RotationConfig.EULER,
+                seq=EulerOrderConfig.XYZ,
+                extrinsic_euler=True,
+                angle_type=AngleConfig.DEGREES,
+            ),
+            Rotation(rotation_type=RotationConfig.AXIS_ANGLE),
+        ],
+    )
+    def test_rotation(self, rotation):
+        """Test batched rotations match per-sample rotations."""
+        rotations = R.random(20, random_state=1)
+        inputs = {
+            RotationConfig.QUATERNION: rotations.as_quat(),
+            RotationConfig.MATRIX: rotations.as_matrix(),
+            RotationConfig.EULER: rotations.as_euler("xyz"),
+            RotationConfig.AXIS_ANGLE: rotations.as_rotvec(),
+        }
+        _assert_batch_matches_per_sample(rotation, inputs[rotation.rotation_type])
+
+    def test_pose_matrix_and_position_orientation(self):
+        """Test batched pose conversion matches per-sample conversion."""
+        poses = _random_poses(10)
+        matrices = np.broadcast_to(np.eye(4), (10, 4, 4)).copy()
+        matrices[:, :3, :3] = R.from_quat(poses[:, 3:]).as_matrix()
+        matrices[:, :3, 3] = poses[:, :3]
+        _assert_batch_matches_per_sample(Pose(pose_type=PoseConfig.MATRIX), matrices)
+        _assert_batch_matches_per_sample(
+            Pose(pose_type=PoseConfig.MATRIX), matrices.reshape(10, 16)
+        )
+        _assert_batch_matches_per_sample(
+            Pose(pose_type=PoseConfig.POSITION_ORIENTATION), poses
+        )
+
+    def test_scale_position_and_orientation(self):
+        """Test batched pose scaling matches per-sample scaling."""
+        poses = _random_poses(10)
+        _assert_batch_matches_per_sample(ScalePosition(factor=0.5), poses)
+        _assert_batch_matches_per_sample(ScaleOrientation(factor=0.5), poses)
+
+    def test_scale_position_rejects_wrong_shape(self):
+        """Test pose scaling rejects batches that are not (T, 7)."""
+        with pytest.raises(ValueError):
+            ScalePosition(factor=1.0).apply_batch(np.zeros((3, 6)))
+        with pytest.raises(ValueError):
+            ScaleOrientation(factor=1.0).apply_batch(np.zeros(7))
+
+    def test_apply_frame_transform(self):
+        """Test batched frame transforms match per-sample transforms."""
+        transform = ApplyFrameTransform(
+            transforms=[
+                FrameTransformConfig(
+                    rotation=RollPitchYaw(roll=0.1, pitch=-0.2, yaw=0.3),
+                    translation=XYZ(x=1.0, y=0.0, z=-1.0),
+                    frame=Frame.WORLD,
+                ),
+                FrameTransformConfig(
+                    rotation=RollPitchYaw(roll=0.0, pitch=0.5, yaw=0.0),
+                    translation=XYZ(x=0.0, y=0.2, z=0.0),
+                    frame=Frame.TOOL,
+                ),
+            ]
+        )
+        _assert_batch_matches_per_sample(transform, _random_poses(10), atol=1e-12)
+
+    def test_apply_frame_transform_matches_matrix_composition(self):
+        """Test precomposed frame transforms match composing each 4x4 in order."""
+        configs = [
+            FrameTransformConfig(
+                rotation=RollPitchYaw(roll=0.4, pitch=-0.6, yaw=1.1),
+                translation=XYZ(x=0.1, y=-0.2, z=0.3),
+                frame=frame,
+            )
+            for frame in [Frame.TOOL, Frame.WORLD, Frame.TOOL, Frame.WORLD]
+        ]
+        poses = _random_poses(50, seed=3)
+        expected = []
+        for pose in poses:
+            T = np.eye(4)
+            T[:3, 3] = pose[:3]
+            T[:3, :3] = R.from_quat(pose[3:]).as_matrix()
+            for config in configs:
+                X = ApplyFrameTransform._to_matrix(config)
+                T = X @ T if config.frame == Frame.WORLD else T @ X
+            expected.append(
+                np.concatenate([T[:3, 3], R.from_matrix(T[:3, :3]).as_quat()])
+            )
+        result = ApplyFrameTransform(transforms=configs).apply_batch(poses)
+        np.testing.assert_allclose(result, np.stack(expected), atol=1e-12)
+
+    def test_image_transforms(self):
+        """Test batched image transforms match per-sample transforms."""
+        images = np.random.default_rng(0).integers(0, 255, size=(4, 3, 5, 6))
+        _assert_batch_matches_per_sample(
+            ImageFormat(format=ImageConventionConfig.CHANNELS_FIRST), images
+        )
+        _assert_batch_matches_per_sample(
+            ImageChannelOrder(order=ImageChannelOrderConfig.BGR),
+            images.transpose(0, 2, 3, 1),
+        )
+
+    def test_squeeze_keeps_time_axis(self):
+        """Test batched squeeze does not squeeze a single time step."""
+        assert Squeeze().apply_batch(np.zeros((1, 4, 1, 5))).shape == (1, 4, 5)
+
+    def test_numpy_to_scalar(self):
+        """Test batched scalar conversion returns a (T,) array."""
+        result = NumpyToScalar().apply_batch(np.array([[1.0], [2.0], [3.0]]))
+        np.testing.assert_array_equal(result, [1.0, 2.0, 3.0])
+
+    def test_elementwise_sequence(self):
+        """Test a sequence of elementwise transforms is applied in one pass."""
+        sequence = DataTransformSequence(
+            transforms=[
+                Unnormalize(min=0.0, max=255.0),
+                Clip(min=0.0, max=255.0),
+                CastToNumpyDtype(dtype=np.uint8),
+                FlipSign(),
+                Offset(value=1.0),
+                NanToNum(),
+                DegreesToRadians(),
+                Scale(factor=2.0),
+                Normalize(min=-1.0, max=1.0),
+            ]
+        )
+        data = np.random.default_rng(0).random((8, 3))
+        _assert_batch_matches_per_sample(sequence, data)
+
+    def test_language_from_bytes(self):
+        """Test batched byte decoding returns an array of strings."""
+        result = LanguageFromBytes().apply_batch([b"a", "\u00e9".encode()])
+        assert list(result) == ["a", "\u00e9"]
+
+    def test_extrinsics_and_intrinsics(self):
+        """Test batched calibration conversion matches per-sample conversion."""
+        poses = _random_poses(5)
+        wxyz = np.concatenate([poses[:, :3], poses[:, [6, 3, 4, 5]]], axis=-1)
+        _assert_batch_matches_per_sample(
+            ExtrinsicsToMatrix(
+                extrinsics_format=PoseConfig.POSITION_ORIENTATION,
+                extrinsics_orientation=OrientationConfig(
+                    type=RotationConfig.QUATERNION,
+                    quaternion_order=QuaternionOrderConfig.WXYZ,
+                ),
+            ),
+            wxyz,
+        )
+        _assert_batch_matches_per_sample(
+            IntrinsicsToMatrix(intrinsics_format=IntrinsicsConfig.FLAT),
+            np.array([[500.0, 510.0, 320.0, 240.0], [1.0, 2.0, 3.0, 4.0]]),
+        )
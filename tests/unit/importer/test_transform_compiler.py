@@ -0,0 +1,313 @@
+"""Unit tests for transform_compiler.py module."""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
+
+from neuracore_types.importer.config import (
+    ImageChannelOrderConfig,
+    ImageConventionConfig,
+)
+from neuracore_types.importer.transform import (
+    CastToNumpyDtype,
+    Clip,
+    DataTransformSequence,
+    DegreesToRadians,
+    FlipSign,
+    ImageChannelOrder,
+    ImageFormat,
+    NanToNum,
+    Normalize,
+    NumpyToScalar,
+    Offset,
+    Scale,
+    ScaleOrientation,
+    ScalePosition,
+    Squeeze,
+    Unnormalize,
+)
+from neuracore_types.importer.transform_compiler import CompiledDataTransformSequence
+
+SEQUENCES = {
+    "joint": DataTransformSequence(
+        transforms=[
+            Unnormalize(min=0.0, max=0.08),
+            Clip(min=0.0, max=0.08),
+            FlipSign(),
+            Offset(value=0.08),
+            CastToNumpyDtype(dtype=np.float32),
+        ]
+    ),
+    "angles": DataTransformSequence(
+        transforms=[
+            DegreesToRadians(),
+            Scale(factor=2.0),
+            FlipSign(),
+            Offset(value=0.0),
+        ]
+    ),
+    "normalize": DataTransformSequence(
+        transforms=[NanToNum(), Normalize(min=-1.0, max=3.0), Scale(factor=1.0)]
+    ),
+    "rgb": DataTransformSequence(
+        transforms=[
+            ImageFormat(format=ImageConventionConfig.CHANNELS_FIRST),
+            Scale(factor=1.5),
+            Clip(min=0.0, max=255.0),
+            CastToNumpyDtype(dtype=np.uint8),
+        ]
+    ),
+    "bgr_chw": DataTransformSequence(
+        transforms=[
+            Clip(min=0.0, max=255.0),
+            CastToNumpyDtype(dtype=np.uint8),
+            ImageFormat(format=ImageConventionConfig.CHANNELS_FIRST),
+            ImageChannelOrder(order=ImageChannelOrderConfig.BGR),
+        ]
+    ),
+    "depth_mm": DataTransformSequence(
+        transforms=[
+            NanToNum(),
+            Scale(factor=0.001),
+            CastToNumpyDtype(dtype=np.float32),
+            Squeeze(),
+        ]
+    ),
+    "nested": DataTransformSequence(
+        transforms=[
+            FlipSign(),
+            DataTransformSequence(transforms=[FlipSign(), Scale(factor=3.0)]),
+            Clip(min=-2.0, max=2.0),
+            CastToNumpyDtype(dtype=np.float64),
+        ]
+    ),
+}
+
+
+def _inputs(name: str) -> list[np.ndarray]:
+    rng = np.random.default_rng(0)
+    if name in ("rgb", "bgr_chw"):
+        images = rng.integers(0, 256, size=(4, 3, 8, 6))
+        return [images.astype(np.uint8), images.astype(np.float32) * 1.2 - 20]
+    if name == "depth_mm":
+        depth = rng.random((4, 8, 6, 1)) * 5000
+        millimeters = depth.astype(np.uint16)
+        depth[0, 0, 0] = np.nan
+        return [depth, depth.astype(np.float32), millimeters]
+    values = rng.normal(size=(16, 3)) * 10
+    values[0, 0] = np.nan
+    values[1, 1] = np.inf
+    return [values, values.astype(np.float32), np.round(values[2:]).astype(np.int32)]
+
+
+class TestCompiledDataTransformSequence:
+    """Tests for CompiledDataTransformSequence."""
+
+    @pytest.mark.parametrize("reuse_buffers", [False, True])
+    @pytest.mark.parametrize("name", list(SEQUENCES))
+    def test_matches_uncompiled(self, name, reuse_buffers):
+        """Test compiled sequences return bit-identical results."""
+        sequence = SEQUENCES[name]
+        compiled = sequence.compile(reuse_buffers=reuse_buffers)
+        assert isinstance(compiled, CompiledDataTransformSequence)
+        for data in _inputs(name):
+            original = data.copy()
+            for _ in range(2):
+                expected = sequence.apply_batch(data)
+                result = compiled.apply_batch(data)
+                assert result.dtype == expected.dtype
+                np.testing.assert_array_equal(result, expected, strict=True)
+
+                expected = sequence(data[0])
+                result = compiled(data[0])
+                assert result.dtype == expected.dtype
+                np.testing.assert_array_equal(result, expected, strict=True)
+            np.testing.assert_array_equal(data, original)
+
+    def test_fuses_steps(self):
+        """Test sign flips are folded and casts are fused into the prior step."""
+        compiled = SEQUENCES["nested"].compile()
+        plan = compiled._plan(np.dtype(np.float64))
+        assert [step.op.kind for step in plan] == ["mul", "clip"]
+
+        compiled = SEQUENCES["joint"].compile()
+        plan = compiled._plan(np.dtype(np.float64))
+        assert [step.op.kind for step in plan] == ["mul", "add", "clip", "mul", "add"]
+        assert plan[-1].op.cast == np.float32
+        assert [step.allocates for step in plan] == [True, False, False, False, True]
+
+    def test_clip_cast_merged(self):
+        """Test a clip followed by a cast writes directly into the output."""
+        sequence = DataTransformSequence(
+            transforms=[Clip(min=0.0, max=255.0), CastToNumpyDtype(dtype=np.uint8)]
+        )
+        plan = sequence.compile()._plan(np.dtype(np.float32))
+        assert [(step.op.kind, step.op.cast) for step in plan] == [("clip", np.uint8)]
+
+    def test_drops_identity_scale_position(self):
+        """Test ScalePosition with factor 1.0 is removed."""
+        sequence = DataTransformSequence(
+            transforms=[ScalePosition(factor=1.0), Scale(factor=2.0)]
+        )
+        compiled = sequence.compile()
+        assert [op.kind for op in compiled.ops] == ["mul"]
+        poses = np.arange(14, dtype=np.float64).reshape(2, 7)
+        np.testing.assert_array_equal(compiled.apply_batch(poses), poses * 2.0)
+
+    def test_identity_returns_copy(self):
+        """Test a sequence that optimizes away does not alias its input."""
+        sequence = DataTransformSequence(transforms=[FlipSign(), FlipSign()])
+        data = np.array([1.0, -2.0])
+        result = sequence.compile()(data)
+        np.testing.assert_array_equal(result, data)
+        assert result is not data
+
+    def test_scalar_input(self):
+        """Test scalar inputs and outputs."""
+        sequence = DataTransformSequence(
+            transforms=[Scale(factor=2.0), Offset(value=1.0), NumpyToScalar()]
+        )
+        compiled = sequence.compile()
+        assert compiled(np.array([3.0])) == sequence(np.array([3.0])) == 7.0
+
+        sequence = DataTransformSequence(transforms=[FlipSign()])
+        assert sequence.compile()(0.5) == -0.5
+
+    def test_out(self):
+        """Test results are written into the given output array."""
+        data = np.random.default_rng(0).normal(size=(5, 2))
+        sequence = SEQUENCES["joint"]
+        out = np.empty((5, 2), dtype=np.float32)
+        result = sequence.compile().apply_batch(data, out=out)
+        assert result is out
+        np.testing.assert_array_equal(out, sequence.apply_batch(data))
+
+    def test_reuse_buffers(self):
+        """Test buffers are reused across calls with the same shape."""
+        compiled = SEQUENCES["joint"].compile(reuse_buffers=True)
+        data = np.random.default_rng(0).normal(size=(5, 2))
+        first = compiled.apply_batch(data)
+        second = compiled.apply_batch(data + 1)
+        assert first is second
+
+    def test_inexact_folds_affine_steps(self):
+        """Test exact=False folds affine steps into a single multiply-add."""
+        sequence = DataTransformSequence(
+            transforms=[
+                Unnormalize(min=-1.0, max=1.0),
+                Scale(factor=0.25),
+                Offset(value=0.5),
+            ]
+        )
+        compiled = sequence.compile(exact=False)
+        plan = compiled._plan(np.dtype(np.float64))
+        assert [step.op.kind for step in plan] == ["mul", "add"]
+        data = np.random.default_rng(0).normal(size=(8, 3))
+        np.testing.assert_allclose(compiled.apply_batch(data), sequence(data))
+
+    def test_inexact_drops_identity_scale_orientation(self):
+        """Test exact=False removes ScaleOrientation with factor 1.0."""
+        sequence = DataTransformSequence(transforms=[ScaleOrientation(factor=1.0)])
+        assert sequence.compile(exact=True).ops[0].kind == "transform"
+        assert not sequence.compile(exact=False).ops
+
+        poses = np.concatenate(
+            [np.zeros((4, 3)), R.random(4, random_state=0).as_quat()], axis=-1
+        )
+        result = sequence.compile(exact=False).apply_batch(poses)
+        np.testing.assert_allclose(
+            np.abs(result), np.abs(sequence.apply_batch(poses)), atol=1e-12
+        )
+
+    @pytest.mark.parametrize(
+        "name, dtype",
+        [
+            ("bgr_chw", np.uint8),
+            ("bgr_chw", np.float32),
+            ("depth_mm", np.float32),
+            ("depth_mm", np.uint16),
+        ],
+    )
+    def test_image_chains_make_one_contiguous_buffer(self, name, dtype):
+        """Test image chains allocate a single C-contiguous output buffer."""
+        compiled = SEQUENCES[name].compile()
+        data = next(data for data in _inputs(name) if data.dtype == dtype)
+        plan = compiled._plan(data.dtype)
+        assert sum(step.allocates for step in plan) <= 1
+        result = compiled.apply_batch(data)
+        assert result.flags.c_contiguous
+        assert not np.shares_memory(result, data)
+
+    @pytest.mark.parametrize(
+        "order", [ImageChannelOrderConfig.RGB, ImageChannelOrderConfig.BGR]
+    )
+    def test_image_chains_copy_frames_once(self, order):
+        """Test image chains copy uint8 frames once, in either channel order."""
+        compiled = DataTransformSequence(
+            transforms=[
+                Clip(min=0.0, max=255.0),
+                CastToNumpyDtype(dtype=np.uint8),
+                ImageFormat(format=ImageConventionConfig.CHANNELS_FIRST),
+                ImageChannelOrder(order=order),
+            ]
+        ).compile()
+        frames = np.random.default_rng(0).integers(
+            0, 256, size=(8, 3, 120, 160), dtype=np.uint8
+        )
+        tracemalloc.start()
+        try:
+            result = compiled.apply_batch(frames)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak < 1.5 * frames.nbytes
+        assert result.flags.c_contiguous
+        expected = np.moveaxis(frames, 1, -1)
+        if order == ImageChannelOrderConfig.BGR:
+            expected = expected[..., ::-1]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_uint8_clip_and_cast_are_no_ops(self):
+        """Test clipping uint8 frames to [0, 255] and casting to uint8 is elided."""
+        compiled = SEQUENCES["bgr_chw"].compile()
+        plan = compiled._plan(np.dtype(np.uint8))
+        assert [step.op.kind for step in plan] == ["view", "view"]
+
+    def test_image_chain_out(self):
+        """Test image chains write into a caller-provided frame buffer."""
+        sequence = SEQUENCES["bgr_chw"]
+        compiled = sequence.compile()
+        for data in _inputs("bgr_chw"):
+            out = np.empty((4, 8, 6, 3), dtype=np.uint8)
+            assert compiled.apply_batch(data, out=out) is out
+            np.testing.assert_array_equal(out, sequence.apply_batch(data))
+            frame = np.empty((8, 6, 3), dtype=np.uint8)
+            assert compiled(data[0], out=frame) is frame
+            np.testing.assert_array_equal(frame, sequence(data[0]))
+
+    def test_cast_chain_collapses(self):
+        """Test a lossless cast followed by another cast becomes one cast."""
+        sequence = DataTransformSequence(
+            transforms=[
+                CastToNumpyDtype(dtype=np.float64),
+                CastToNumpyDtype(dtype=np.int16),
+            ]
+        )
+        plan = sequence.compile()._plan(np.dtype(np.uint8))
+        assert [(step.op.kind, step.dtype) for step in plan] == [("cast", np.int16)]
+        data = np.arange(10, dtype=np.uint8)
+        np.testing.assert_array_equal(
+            sequence.compile()(data), sequence(data), strict=True
+        )
+
+    def test_result_dtype(self):
+        """Test the result dtype is resolved without running the pipeline."""
+        for name, sequence in SEQUENCES.items():
+            compiled = sequence.compile()
+            for data in _inputs(name):
+                expected = sequence.apply_batch(data).dtype
+                assert compiled.result_dtype(data.dtype) == expected
+        sequence = DataTransformSequence(transforms=[NumpyToScalar()])
+        assert sequence.compile().result_dtype(np.dtype(np.float32)) is None
@@ -309,6 +309,24 @@ class TestBatchedRGBData:
         # After transformation, frame should be resized to (224, 224)
         assert batched.frame.shape == (1, 5, 3, 224, 224)
 
+    def test_calculate_statistics(self):
+        """Test frame statistics are per pixel in (H, W, C) layout."""
+        frames = torch.rand(2, 3, 3, 4, 5)
+        extrinsics = torch.eye(4).expand(2, 3, 4, 4).clone()
+        extrinsics[0, 0, 0, 3] = 6.0
+        batched = BatchedRGBData(
+            frame=frames, extrinsics=extrinsics, intrinsics=torch.zeros(2, 3, 3, 3)
+        )
+        stats = batched.calculate_statistics()
+        hwc = frames.permute(0, 1, 3, 4, 2).reshape(-1, 4, 5, 3).numpy()
+
+        assert stats.frame.mean.shape == (4, 5, 3)
+        np.testing.assert_allclose(stats.frame.mean, hwc.mean(axis=0), rtol=1e-5)
+        np.testing.assert_allclose(stats.frame.std, hwc.std(axis=0), rtol=1e-4)
+        assert stats.extrinsics.max[0, 3] == 6.0
+        assert stats.extrinsics.min[0, 3] == 0.0
+        assert stats.extrinsics.mean[0, 0] == 1.0
+
 
 class TestBatchedDepthData:
     """Tests for BatchedDepthData functionality."""
@@ -534,6 +552,21 @@ class TestRGBCameraDataImportConfig:
         assert transformed_data[..., 1].max() == 255
         assert transformed_data[..., 2].max() == 255
 
+    def test_rgb_camera_data_import_config_bgr_batches(self):
+        """Test BGR imported frames can be batched."""
+        data_point = RGBCameraDataImportConfig(
+            source="camera",
+            mapping=[RGBCameraDataMappingItem(name="image")],
+            format=DataFormat(order_of_channels=ImageChannelOrderConfig.BGR),
+        )
+        frame = np.zeros((4, 5, 3), dtype=np.uint8)
+        frame[..., 2] = 255
+        transformed_data = data_point.mapping[0].transforms(frame)
+        batched = BatchedRGBData.from_nc_data(RGBCameraData(frame=transformed_data))
+        assert batched.frame.shape == (1, 1, 3, 4, 5)
+        assert batched.frame[0, 0, 0].min() == 255
+        assert batched.frame[0, 0, 2].max() == 0.0
+
 
 class TestDepthCameraDataImportConfig:
     """Tests for DepthCameraDataImportConfig class."""
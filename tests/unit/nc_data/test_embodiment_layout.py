@@ -0,0 +1,112 @@
+"""Tests for embodiment_layout.py module."""
+
+import numpy as np
+import pytest
+import torch
+
+from neuracore_types import (
+    BatchedJointData,
+    BatchedRGBData,
+    CrossEmbodimentLayout,
+    DataType,
+    JointData,
+    RGBCameraData,
+    SynchronizedEpisode,
+    SynchronizedPoint,
+)
+
+JOINTS = DataType.JOINT_POSITIONS
+RGB = DataType.RGB_IMAGES
+NUM_STEPS = 3
+DESCRIPTION = {
+    "arm6": {JOINTS: {i: f"joint{i}" for i in range(6)}, RGB: {0: "wrist"}},
+    "arm7": {JOINTS: {i: f"j{i}" for i in range(7)}},
+    "gripper": {JOINTS: {6: "finger"}, RGB: {1: "top"}},
+}
+
+
+def _episode(robot_id: str) -> SynchronizedEpisode:
+    description = DESCRIPTION[robot_id]
+    observations = []
+    for step in range(NUM_STEPS):
+        data: dict = {
+            JOINTS: {
+                name: JointData(value=100 * index + step)
+                for index, name in description[JOINTS].items()
+            }
+        }
+        if RGB in description:
+            data[RGB] = {
+                name: RGBCameraData(frame=np.full((2, 2, 3), step + 1, np.uint8))
+                for name in description[RGB].values()
+            }
+        observations.append(SynchronizedPoint(timestamp=0.1 * step, data=data))
+    return SynchronizedEpisode(
+        observations=observations, start_time=0.0, end_time=0.2, robot_id=robot_id
+    )
+
+
+class TestCrossEmbodimentLayout:
+    """Tests for CrossEmbodimentLayout."""
+
+    def test_slots(self):
+        """Test slots follow the description indices and masks the robots."""
+        layout = CrossEmbodimentLayout(DESCRIPTION)
+        assert layout.num_slots == {JOINTS: 7, RGB: 2}
+        gripper = layout.robot_slots("gripper")
+        assert gripper[JOINTS].names == ("finger",)
+        assert gripper[JOINTS].slots.tolist() == [6]
+        assert gripper[JOINTS].mask.tolist() == [False] * 6 + [True]
+        assert layout.robot_slots("arm7")[RGB].mask.tolist() == [False, False]
+        with pytest.raises(ValueError, match="not in the cross embodiment layout"):
+            layout.robot_slots("humanoid")
+
+    def test_batch(self):
+        """Test episodes of different robots are scattered into padded slots."""
+        layout = CrossEmbodimentLayout(DESCRIPTION)
+        batch = layout.batch([_episode("arm6"), _episode("arm7"), _episode("gripper")])
+        assert batch.robot_ids == ["arm6", "arm7", "gripper"]
+
+        joints = batch.data[JOINTS]
+        assert len(joints) == 7
+        assert all(isinstance(slot, BatchedJointData) for slot in joints)
+        values = torch.stack([slot.value for slot in joints], dim=1)
+        assert values.shape == (3, 7, NUM_STEPS, 1)
+        steps = torch.arange(NUM_STEPS, dtype=torch.float32)
+        torch.testing.assert_close(values[0, 5, :, 0], 500 + steps)
+        torch.testing.assert_close(values[0, 6, :, 0], torch.zeros(NUM_STEPS))
+        torch.testing.assert_close(values[1, 6, :, 0], 600 + steps)
+        torch.testing.assert_close(values[2, 6, :, 0], 600 + steps)
+        torch.testing.assert_close(values[2, :6], torch.zeros(6, NUM_STEPS, 1))
+        assert batch.masks[JOINTS].tolist() == [
+            [True] * 6 + [False],
+            [True] * 7,
+            [False] * 6 + [True],
+        ]
+
+        cameras = batch.data[RGB]
+        assert all(isinstance(slot, BatchedRGBData) for slot in cameras)
+        assert cameras[0].frame.shape == (3, NUM_STEPS, 3, 2, 2)
+        assert cameras[0].frame[:, :, 0, 0, 0].tolist() == [
+            [1.0, 2.0, 3.0],
+            [0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0],
+        ]
+        assert cameras[1].frame[2, :, 0, 0, 0].tolist() == [1.0, 2.0, 3.0]
+        assert batch.masks[RGB].tolist() == [
+            [True, False],
+            [False, False],
+            [False, True],
+        ]
+
+    def test_batch_errors(self):
+        """Test batches need episodes of equal length with every sensor."""
+        layout = CrossEmbodimentLayout(DESCRIPTION)
+        short = _episode("arm7")
+        short.observations.pop()
+        with pytest.raises(ValueError, match="same length"):
+            layout.batch([_episode("arm7"), short])
+        incomplete = _episode("arm7")
+        del incomplete.observations[1].data[JOINTS]["j3"]
+        with pytest.raises(ValueError, match="missing sensor JOINT_POSITIONS/j3"):
+            layout.batch([incomplete])
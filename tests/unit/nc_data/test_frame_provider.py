@@ -0,0 +1,173 @@
+"""Tests for frame_provider.py module."""
+
+import copy
+import pickle
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from neuracore_types import (
+    BatchedRGBData,
+    CachedFrameProvider,
+    DataType,
+    FrameProvider,
+    JointData,
+    LocalFileFrameProvider,
+    RGBCameraData,
+    SynchronizedEpisode,
+    SynchronizedPoint,
+)
+
+NUM_FRAMES = 20
+
+
+def _frame(frame_idx: int) -> np.ndarray:
+    return np.full((4, 6, 3), frame_idx, dtype=np.uint8)
+
+
+class CountingFrameProvider:
+    """Frame provider recording the frames it decodes."""
+
+    def __init__(self):
+        self.decoded: list[int] = []
+
+    def get_frame(self, frame_idx: int) -> np.ndarray:
+        if not 0 <= frame_idx < NUM_FRAMES:
+            raise IndexError(frame_idx)
+        self.decoded.append(frame_idx)
+        return _frame(frame_idx)
+
+
+class TestLocalFileFrameProvider:
+    """Tests for LocalFileFrameProvider."""
+
+    def test_images(self, tmp_path):
+        """Test frames are decoded from image files named by index."""
+        for frame_idx in range(3):
+            Image.fromarray(_frame(frame_idx)).save(tmp_path / f"{frame_idx:06d}.png")
+        provider = LocalFileFrameProvider(tmp_path)
+        assert isinstance(provider, FrameProvider)
+        np.testing.assert_array_equal(provider.get_frame(2), _frame(2))
+        with pytest.raises(FileNotFoundError):
+            provider.get_frame(3)
+
+    def test_arrays(self, tmp_path):
+        """Test frames are loaded from .npy files with a custom name format."""
+        depth = np.random.default_rng(0).random((4, 6)).astype(np.float32)
+        np.save(tmp_path / "depth_7.npy", depth)
+        provider = LocalFileFrameProvider(tmp_path, "depth_{frame_idx}.npy")
+        np.testing.assert_array_equal(provider.get_frame(7), depth)
+
+
+class TestCachedFrameProvider:
+    """Tests for CachedFrameProvider."""
+
+    def test_lru(self):
+        """Test the least recently used frames are evicted."""
+        source = CountingFrameProvider()
+        cache = CachedFrameProvider(source, cache_size=2, read_ahead=0)
+        for frame_idx in [5, 3, 5, 9, 5, 3]:
+            frame = cache.get_frame(frame_idx)
+            np.testing.assert_array_equal(frame, _frame(frame_idx))
+        assert source.decoded == [5, 3, 9, 3]
+        assert (cache.hits, cache.misses) == (2, 4)
+        assert not frame.flags.writeable
+
+    def test_decode_ahead(self):
+        """Test sequential reads decode the next frames in the background."""
+        source = CountingFrameProvider()
+        with CachedFrameProvider(source, cache_size=8, read_ahead=4) as cache:
+            cache.get_frame(10)
+            cache.get_frame(11)
+            # Frames read ahead count as hits, even past the last frame
+            for frame_idx in range(12, NUM_FRAMES):
+                np.testing.assert_array_equal(
+                    cache.get_frame(frame_idx), _frame(frame_idx)
+                )
+            assert cache.misses == 2
+            assert sorted(source.decoded) == list(range(10, NUM_FRAMES))
+            with pytest.raises(IndexError):
+                cache.get_frame(NUM_FRAMES)
+        assert cache._executor is None
+
+    def test_pickle_and_deepcopy(self):
+        """Test cameras with a cache pickle and deep copy with their provider."""
+        cache = CachedFrameProvider(CountingFrameProvider(), cache_size=4, read_ahead=2)
+        camera = RGBCameraData(frame_idx=3).with_frame_provider(cache)
+        camera.load_frame()
+
+        assert copy.deepcopy(camera)._frame_provider is cache
+        unpickled = pickle.loads(pickle.dumps(camera))
+        restored = unpickled._frame_provider
+        assert isinstance(restored, CachedFrameProvider)
+        assert (restored.cache_size, restored.read_ahead) == (4, 2)
+        assert (restored.hits, restored.misses) == (0, 0)
+        np.testing.assert_array_equal(unpickled.load_frame(), _frame(3))
+        # The frame decoded before pickling is decoded again
+        assert restored.provider.decoded == [3, 3]
+        cache.close()
+
+    def test_invalid_sizes(self):
+        """Test the cache must hold the frames read ahead."""
+        with pytest.raises(ValueError, match="larger than read_ahead"):
+            CachedFrameProvider(CountingFrameProvider(), cache_size=4, read_ahead=4)
+
+
+class TestLazyFrames:
+    """Tests for resolving CameraData frames with a frame provider."""
+
+    def _episode(self) -> SynchronizedEpisode:
+        return SynchronizedEpisode(
+            observations=[
+                SynchronizedPoint(
+                    timestamp=0.1 * step,
+                    data={
+                        DataType.RGB_IMAGES: {
+                            "wrist": RGBCameraData(timestamp=0.1 * step, frame_idx=step)
+                        },
+                        DataType.JOINT_POSITIONS: {"arm": JointData(value=step)},
+                    },
+                )
+                for step in range(3)
+            ],
+            start_time=0.0,
+            end_time=0.2,
+            robot_id="robot",
+        )
+
+    def test_load_frame(self):
+        """Test frames are fetched by frame_idx unless already loaded."""
+        camera = RGBCameraData(frame_idx=4)
+        with pytest.raises(ValueError, match="no frame provider"):
+            camera.load_frame()
+        lazy = camera.with_frame_provider(CountingFrameProvider())
+        np.testing.assert_array_equal(lazy.load_frame(), _frame(4))
+        assert lazy.frame is None
+        loaded = RGBCameraData(frame=_frame(1), frame_idx=4)
+        assert loaded.with_frame_provider(CountingFrameProvider()).load_frame() is (
+            loaded.frame
+        )
+
+    def test_episode(self):
+        """Test episodes attach providers to their cameras only."""
+        episode = self._episode()
+        source = CountingFrameProvider()
+        lazy = episode.with_frame_providers({DataType.RGB_IMAGES: {"wrist": source}})
+        assert source.decoded == []
+        for step, observation in enumerate(lazy.observations):
+            camera = observation[DataType.RGB_IMAGES]["wrist"]
+            np.testing.assert_array_equal(camera.load_frame(), _frame(step))
+            assert observation[DataType.JOINT_POSITIONS]["arm"] is (
+                episode.observations[step][DataType.JOINT_POSITIONS]["arm"]
+            )
+
+    def test_batched(self):
+        """Test batched converters fetch the frames lazily."""
+        lazy = self._episode().with_frame_providers(
+            {DataType.RGB_IMAGES: {"wrist": CountingFrameProvider()}}
+        )
+        cameras = [o[DataType.RGB_IMAGES]["wrist"] for o in lazy.observations]
+        batched = BatchedRGBData.from_nc_data_list(cameras)
+        assert batched.frame.shape == (1, 3, 3, 4, 6)
+        assert batched.frame[0, :, 0, 0, 0].tolist() == [0.0, 1.0, 2.0]
@@ -5,7 +5,7 @@ import pytest
 import torch
 from scipy.spatial.transform import Rotation as R
 
-from neuracore_types import BatchedJointData, JointData
+from neuracore_types import BatchedJointData, JointData, JointDataStats
 from neuracore_types.batched_nc_data import DATA_TYPE_TO_BATCHED_NC_DATA_CLASS
 from neuracore_types.importer.config import (
     ActionSpaceConfig,
@@ -201,6 +201,43 @@ class TestBatchedJointData:
         assert batched.value[0, 0, 0] == -1.0
         assert batched.value[0, 1, 0] == -2.0
 
+    def test_calculate_statistics(self):
+        """Test batched statistics reduce over batch and time dimensions."""
+        values = torch.tensor([[[1.0], [2.0]], [[3.0], [-4.0]]])
+        stats = BatchedJointData(value=values).calculate_statistics()
+        flat = values.reshape(-1).numpy()
+
+        assert isinstance(stats, JointDataStats)
+        np.testing.assert_allclose(stats.value.mean, [flat.mean()])
+        np.testing.assert_allclose(stats.value.std, [flat.std()])
+        np.testing.assert_allclose(stats.value.min, [-4.0])
+        np.testing.assert_allclose(stats.value.max, [3.0])
+        np.testing.assert_allclose(stats.value.q01, [np.quantile(flat, 0.01)])
+        np.testing.assert_allclose(stats.value.q99, [np.quantile(flat, 0.99)])
+        np.testing.assert_array_equal(stats.value.count, [4])
+
+    def test_calculate_statistics_single_item_matches_unbatched(self):
+        """Test statistics of a single item match the unbatched path."""
+        joint_data = JointData(value=0.25)
+        batched_stats = BatchedJointData.from_nc_data(joint_data).calculate_statistics()
+        stats = joint_data.calculate_statistics()
+
+        for field in ("mean", "std", "min", "max", "q01", "q99", "count"):
+            np.testing.assert_allclose(
+                getattr(batched_stats.value, field), getattr(stats.value, field)
+            )
+
+    def test_accumulate_statistics(self):
+        """Test accumulating batches matches statistics of all values."""
+        first = BatchedJointData(value=torch.tensor([[[1.0], [2.0]]]))
+        second = BatchedJointData(value=torch.tensor([[[6.0]], [[7.0]]]))
+        accumulators = second.accumulate_statistics(first.accumulate_statistics())
+
+        stats = JointDataStats.from_accumulators(accumulators)
+        np.testing.assert_allclose(stats.value.mean, [4.0])
+        np.testing.assert_allclose(stats.value.std, [np.std([1.0, 2.0, 6.0, 7.0])])
+        np.testing.assert_array_equal(stats.value.count, [4])
+
 
 class TestJointDataStatistics:
     """Tests for JointData statistics."""
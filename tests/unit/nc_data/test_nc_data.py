@@ -0,0 +1,213 @@
+"""Tests for the shared statistics helpers in nc_data."""
+
+import numpy as np
+import pytest
+
+from neuracore_types import CameraData, JointData, JointDataStats
+from neuracore_types.nc_data.camera_data import CameraDataStats
+from neuracore_types.nc_data.nc_data import (
+    ConcatenatedDataItemStats,
+    DataItemStats,
+    DataItemStatsAccumulator,
+    QuantileSketch,
+)
+
+
+def _stats(values: list[float], count: int = 1) -> DataItemStats:
+    array = np.array(values, dtype=np.float32)
+    return DataItemStats(
+        mean=array,
+        std=np.zeros_like(array),
+        count=np.array([count], dtype=np.int64),
+        min=array,
+        max=array,
+        q01=array,
+        q99=array,
+    )
+
+
+class TestDataItemStatsConcatenation:
+    """Tests for concatenating DataItemStats of several sensors."""
+
+    def test_concatenate_many_matches_pairwise(self):
+        """Test concatenate_many matches folding concatenate pairwise."""
+        stats = [_stats([1.0]), _stats([2.0, 3.0]), _stats([4.0])]
+        combined = DataItemStats.concatenate_many(stats)
+        pairwise = stats[0].concatenate(stats[1]).concatenate(stats[2])
+        for field in ("mean", "std", "count", "min", "max", "q01", "q99"):
+            np.testing.assert_array_equal(
+                getattr(combined, field), getattr(pairwise, field)
+            )
+
+    def test_concatenate_many_empty(self):
+        """Test concatenating no statistics returns empty statistics."""
+        assert DataItemStats.concatenate_many([]).mean.size == 0
+
+    def test_concatenate_many_rejects_other_types(self):
+        """Test concatenating other objects raises."""
+        with pytest.raises(ValueError):
+            DataItemStats.concatenate_many([_stats([1.0]), "not stats"])
+
+    def test_container_sensor_views(self):
+        """Test per-sensor statistics are views into the combined arrays."""
+        container = ConcatenatedDataItemStats(
+            [_stats([1.0]), _stats([2.0, 3.0], count=5)], names=["a", "b"]
+        )
+        np.testing.assert_array_equal(container.combined.mean, [1.0, 2.0, 3.0])
+        sensor = container["b"]
+        np.testing.assert_array_equal(sensor.mean, [2.0, 3.0])
+        np.testing.assert_array_equal(sensor.count, [5])
+        assert np.shares_memory(sensor.mean, container.combined.mean)
+        assert container.slice("b") == slice(1, 3)
+        np.testing.assert_array_equal(container[-1].max, [2.0, 3.0])
+        assert len(container) == 2
+        assert container.slice(-1) == container.slice(1) == slice(1, 3)
+        with pytest.raises(IndexError):
+            container[2]
+        with pytest.raises(IndexError):
+            container.slice(-3)
+
+
+class TestQuantileSketch:
+    """Tests for QuantileSketch."""
+
+    def test_quantile_within_relative_accuracy(self):
+        """Test quantile estimates are within the sketch accuracy."""
+        values = np.random.default_rng(0).lognormal(size=(2000, 2))
+        sketch = QuantileSketch.from_values(values)
+        for q in (0.1, 0.5, 0.9):
+            expected = np.quantile(values, q, axis=0, method="lower")
+            np.testing.assert_allclose(
+                sketch.quantile(q), expected, rtol=2 * sketch.relative_accuracy
+            )
+
+    def test_handles_negative_and_zero_values(self):
+        """Test negative and zero values are ordered correctly."""
+        sketch = QuantileSketch.from_values(np.array([[-4.0], [0.0], [2.0]]))
+        np.testing.assert_allclose(sketch.quantile(0.0), [-4.0], rtol=0.02)
+        np.testing.assert_allclose(sketch.quantile(0.5), [0.0])
+        np.testing.assert_allclose(sketch.quantile(1.0), [2.0], rtol=0.02)
+
+    def test_merge_then_subtract_round_trips(self):
+        """Test subtracting a merged sketch restores the original counts."""
+        rng = np.random.default_rng(1)
+        a = QuantileSketch.from_values(rng.normal(size=(100, 3)))
+        b = QuantileSketch.from_values(rng.normal(5.0, size=(50, 3)))
+        restored = a.merge(b).subtract(b)
+        np.testing.assert_array_equal(restored.total_count, a.total_count)
+        for q in (0.01, 0.5, 0.99):
+            np.testing.assert_array_equal(restored.quantile(q), a.quantile(q))
+
+    def test_subtract_unknown_values_raises(self):
+        """Test removing values that were never added raises."""
+        a = QuantileSketch.from_values(np.array([[1.0]]))
+        b = QuantileSketch.from_values(np.array([[100.0]]))
+        with pytest.raises(ValueError):
+            a.subtract(b)
+
+
+class TestDataItemStatsAccumulator:
+    """Tests for DataItemStatsAccumulator."""
+
+    def test_merge_matches_direct_computation(self):
+        """Test merged accumulators match statistics of all values."""
+        rng = np.random.default_rng(0)
+        x, y = rng.normal(size=(200, 4)), rng.normal(3.0, 2.0, size=(100, 4))
+        merged = DataItemStatsAccumulator.from_values(x).merge(
+            DataItemStatsAccumulator.from_values(y)
+        )
+        stats = merged.to_data_item_stats()
+        all_values = np.concatenate([x, y])
+        np.testing.assert_allclose(stats.mean, all_values.mean(axis=0), rtol=1e-5)
+        np.testing.assert_allclose(stats.std, all_values.std(axis=0), rtol=1e-5)
+        np.testing.assert_allclose(stats.min, all_values.min(axis=0), rtol=1e-6)
+        np.testing.assert_allclose(stats.max, all_values.max(axis=0), rtol=1e-6)
+        np.testing.assert_array_equal(stats.count, [300] * 4)
+
+    def test_subtract_restores_moments(self):
+        """Test subtracting a contribution restores the previous moments."""
+        rng = np.random.default_rng(1)
+        a = DataItemStatsAccumulator.from_values(rng.normal(size=(50, 2)))
+        b = DataItemStatsAccumulator.from_values(rng.normal(10.0, size=(20, 2)))
+        restored = a.merge(b).subtract(b)
+        assert restored.count == a.count
+        np.testing.assert_allclose(restored.sum, a.sum)
+        np.testing.assert_allclose(restored.m2, a.m2)
+        # Bounds stay conservative but are tightened by the sketch
+        assert np.all(restored.min <= a.min) and np.all(restored.max >= a.max)
+        assert np.all(restored.max < 5.0)
+
+    def test_subtract_too_many_values_raises(self):
+        """Test removing more values than were accumulated raises."""
+        a = DataItemStatsAccumulator.from_values(np.zeros((2, 1)))
+        b = DataItemStatsAccumulator.from_values(np.zeros((3, 1)))
+        with pytest.raises(ValueError):
+            a.subtract(b)
+
+    def test_update_in_place(self):
+        """Test update merges new samples into the accumulator."""
+        accumulator = DataItemStatsAccumulator()
+        accumulator.update(np.array([[1.0], [2.0]])).update(np.array([[3.0]]))
+        assert accumulator.count == 3
+        np.testing.assert_allclose(accumulator.mean, [2.0])
+
+    def test_from_data_item_stats_combines_exactly(self):
+        """Test finalized statistics of disjoint sets combine exactly."""
+        x = np.array([[1.0, 2.0], [3.0, 6.0]])
+        y = np.array([[5.0, -1.0]])
+        partial = [
+            DataItemStats(
+                mean=v.mean(axis=0),
+                std=v.std(axis=0),
+                count=np.array([len(v)] * 2),
+                min=v.min(axis=0),
+                max=v.max(axis=0),
+            )
+            for v in (x, y)
+        ]
+        accumulator = DataItemStatsAccumulator.from_data_item_stats(partial)
+        expected = DataItemStatsAccumulator.from_values(np.concatenate([x, y]))
+        assert accumulator.count == 3
+        np.testing.assert_allclose(accumulator.sum, expected.sum)
+        np.testing.assert_allclose(accumulator.m2, expected.m2)
+        assert accumulator.sketch is None
+
+    def test_json_round_trip(self):
+        """Test accumulators survive JSON serialization."""
+        accumulator = DataItemStatsAccumulator.from_values(np.arange(6.0).reshape(3, 2))
+        restored = DataItemStatsAccumulator.model_validate_json(
+            accumulator.model_dump_json()
+        )
+        assert restored.count == accumulator.count
+        np.testing.assert_allclose(restored.m2, accumulator.m2)
+        np.testing.assert_array_equal(
+            restored.sketch.quantile(0.5), accumulator.sketch.quantile(0.5)
+        )
+
+
+class TestNCDataStatsAccumulation:
+    """Tests for building NCDataStats from accumulators."""
+
+    def test_joint_stats_from_items(self):
+        """Test accumulated joint statistics match the item values."""
+        values = [0.5, 1.5, -1.0]
+        accumulators = JointDataStats.accumulate(
+            [JointData(value=v).calculate_statistics() for v in values]
+        )
+        stats = JointDataStats.from_accumulators(accumulators)
+        np.testing.assert_allclose(stats.value.mean, [np.mean(values)], rtol=1e-6)
+        np.testing.assert_allclose(stats.value.std, [np.std(values)], rtol=1e-6)
+        np.testing.assert_allclose(stats.value.min, [-1.0])
+        np.testing.assert_allclose(stats.value.max, [1.5])
+
+    def test_camera_stats_from_items(self):
+        """Test camera frames are accumulated per pixel without a sketch."""
+        frames = [np.full((2, 2, 3), v, dtype=np.uint8) for v in (10, 30)]
+        accumulators = CameraDataStats.accumulate(
+            [CameraData(frame=f).calculate_statistics() for f in frames]
+        )
+        assert accumulators["frame"].sketch is None
+        stats = CameraDataStats.from_accumulators(accumulators)
+        np.testing.assert_allclose(stats.frame.mean, np.full((2, 2, 3), 20.0))
+        np.testing.assert_allclose(stats.frame.std, np.full((2, 2, 3), 10.0))
+        assert stats.extrinsics.mean.shape == (4, 4)
@@ -0,0 +1,149 @@
+"""Tests for normalizers built from dataset statistics."""
+
+import numpy as np
+import pytest
+import torch
+
+from neuracore_types import (
+    BatchedJointData,
+    CameraDataStats,
+    DataType,
+    DataTypeNormalizer,
+    JointDataStats,
+    NormalizationMode,
+    Normalizer,
+)
+from neuracore_types.nc_data.nc_data import DataItemStats
+
+
+def _joint_stats(mean: float, std: float, low: float, high: float) -> JointDataStats:
+    return JointDataStats(
+        value=DataItemStats(
+            mean=np.array([mean]),
+            std=np.array([std]),
+            count=np.array([10]),
+            min=np.array([low]),
+            max=np.array([high]),
+            q01=np.array([low + 0.5]),
+            q99=np.array([high - 0.5]),
+        )
+    )
+
+
+STATS = [_joint_stats(1.0, 2.0, -3.0, 5.0), _joint_stats(-1.0, 0.0, 0.0, 4.0)]
+
+
+class TestDataTypeNormalizer:
+    """Tests for DataTypeNormalizer."""
+
+    def test_mean_std_normalize_in_place(self):
+        """Test mean/std normalization is applied to each sensor in place."""
+        normalizer = DataTypeNormalizer(STATS)
+        first = BatchedJointData(value=torch.full((2, 3, 1), 5.0))
+        second = BatchedJointData(value=torch.full((2, 3, 1), -1.0))
+        tensor = first.value
+
+        normalizer.normalize([first, second])
+
+        assert first.value is tensor
+        torch.testing.assert_close(first.value, torch.full((2, 3, 1), 2.0))
+        # Zero std is clamped to epsilon instead of dividing by zero
+        torch.testing.assert_close(second.value, torch.zeros((2, 3, 1)))
+
+    def test_unnormalize_inverts_normalize(self):
+        """Test unnormalizing restores the original values."""
+        for mode in NormalizationMode:
+            normalizer = DataTypeNormalizer(STATS, mode=mode)
+            values = torch.randn(4, 2, 2)
+            restored = normalizer.unnormalize_tensor(
+                normalizer.normalize_tensor(values)
+            )
+            torch.testing.assert_close(restored, values)
+
+    def test_min_max_and_quantile_ranges(self):
+        """Test range modes map the statistics range to [-1, 1]."""
+        bounds = torch.tensor([[-3.0, 0.0], [5.0, 4.0]])
+        min_max = DataTypeNormalizer(STATS, mode=NormalizationMode.MIN_MAX)
+        torch.testing.assert_close(
+            min_max.normalize_tensor(bounds), torch.tensor([[-1.0, -1.0], [1.0, 1.0]])
+        )
+        quantile = DataTypeNormalizer(STATS, mode=NormalizationMode.QUANTILE)
+        torch.testing.assert_close(
+            quantile.normalize_tensor(torch.tensor([-2.5, 3.5])),
+            torch.tensor([-1.0, 1.0]),
+        )
+
+    def test_sensor_count_mismatch_raises(self):
+        """Test applying to the wrong number of sensors raises."""
+        normalizer = DataTypeNormalizer(STATS)
+        with pytest.raises(ValueError):
+            normalizer.normalize([BatchedJointData.sample()])
+
+    def test_ambiguous_field_raises(self):
+        """Test statistics with several fields require an explicit field."""
+        empty = DataItemStats()
+        stats = CameraDataStats(frame=empty, extrinsics=empty, intrinsics=empty)
+        with pytest.raises(ValueError):
+            DataTypeNormalizer([stats])
+
+    def test_missing_quantiles_raise(self):
+        """Test quantile normalization requires quantile statistics."""
+        stats = JointDataStats(
+            value=DataItemStats(mean=np.array([0.0]), std=np.array([1.0]))
+        )
+        with pytest.raises(ValueError):
+            DataTypeNormalizer([stats], mode=NormalizationMode.QUANTILE)
+
+
+class TestNormalizer:
+    """Tests for Normalizer."""
+
+    def test_from_dataset_statistics(self):
+        """Test normalizers are built for each data type and applied."""
+        normalizer = Normalizer.from_dataset_statistics(
+            {DataType.JOINT_POSITIONS: STATS[:1]}
+        )
+        data = BatchedJointData(value=torch.tensor([[[3.0]]]))
+        batch = {
+            DataType.JOINT_POSITIONS: [data],
+            DataType.JOINT_VELOCITIES: [BatchedJointData.sample()],
+        }
+
+        normalizer.normalize(batch)
+        torch.testing.assert_close(data.value, torch.tensor([[[1.0]]]))
+        normalizer.unnormalize(batch)
+        torch.testing.assert_close(data.value, torch.tensor([[[3.0]]]))
+        assert DataType.JOINT_VELOCITIES not in normalizer
+
+    def test_from_mixed_joint_and_camera_statistics(self):
+        """Test camera statistics are skipped unless requested explicitly."""
+        frame = np.zeros((4, 6, 3))
+        camera_stats = CameraDataStats(
+            frame=DataItemStats(mean=frame, std=frame, min=frame, max=frame),
+            extrinsics=DataItemStats(mean=np.eye(4), std=np.zeros((4, 4))),
+            intrinsics=DataItemStats(mean=np.eye(3), std=np.zeros((3, 3))),
+        )
+        statistics = {
+            DataType.JOINT_POSITIONS: STATS,
+            DataType.RGB_IMAGES: [camera_stats],
+            DataType.LANGUAGE: [],
+        }
+
+        normalizer = Normalizer.from_dataset_statistics(statistics)
+        assert DataType.JOINT_POSITIONS in normalizer
+        assert DataType.RGB_IMAGES not in normalizer
+        assert normalizer[DataType.JOINT_POSITIONS].sizes == [1, 1]
+        normalizer = Normalizer.from_dataset_statistics(
+            statistics, fields={DataType.RGB_IMAGES: "frame"}
+        )
+        assert DataType.RGB_IMAGES not in normalizer
+        with pytest.raises(ValueError):
+            Normalizer.from_dataset_statistics(
+                statistics, data_types=[DataType.RGB_IMAGES]
+            )
+        with pytest.raises(ValueError, match="1D"):
+            Normalizer.from_dataset_statistics(
+                statistics,
+                data_types=[DataType.RGB_IMAGES],
+                fields={DataType.RGB_IMAGES: "frame"},
+            )
@@ -139,6 +139,17 @@ class TestBatchedPointCloudData:
         assert torch.equal(loaded.points, batched.points)
         assert loaded.points.shape == batched.points.shape
 
+    def test_calculate_statistics(self):
+        """Test statistics reduce over batch, time and point dimensions."""
+        points = torch.randn(2, 3, 3, 50)
+        stats = BatchedPointCloudData(points=points).calculate_statistics()
+        flat = points.transpose(-1, -2).reshape(-1, 3).numpy()
+
+        np.testing.assert_allclose(stats.points.mean, flat.mean(axis=0), atol=1e-6)
+        np.testing.assert_allclose(stats.points.min, flat.min(axis=0))
+        np.testing.assert_array_equal(stats.points.count, [300] * 3)
+        assert stats.rgb_points.mean.size == 0
+
 
 class TestPointCloudDataStatistics:
     """Tests for PointCloudData statistics."""
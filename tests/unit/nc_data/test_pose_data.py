@@ -137,6 +137,20 @@ class TestBatchedPoseData:
         assert torch.equal(loaded.pose, batched.pose)
         assert loaded.pose.shape == batched.pose.shape
 
+    def test_calculate_statistics(self):
+        """Test batched statistics are computed per pose dimension."""
+        poses = torch.randn(3, 4, 7)
+        stats = BatchedPoseData(pose=poses).calculate_statistics()
+        flat = poses.reshape(-1, 7).numpy()
+
+        assert stats.pose.mean.shape == (7,)
+        np.testing.assert_allclose(stats.pose.mean, flat.mean(axis=0), atol=1e-6)
+        np.testing.assert_allclose(stats.pose.std, flat.std(axis=0), rtol=1e-5)
+        np.testing.assert_allclose(
+            stats.pose.q99, np.quantile(flat, 0.99, axis=0), rtol=1e-5
+        )
+        np.testing.assert_array_equal(stats.pose.count, [12] * 7)
+
 
 class TestPoseDataStatistics:
     """Tests for PoseData statistics."""
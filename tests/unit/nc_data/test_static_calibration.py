@@ -0,0 +1,178 @@
+"""Tests for static_calibration.py module."""
+
+import numpy as np
+import pytest
+import torch
+
+from neuracore_types import (
+    BatchedPointCloudData,
+    BatchedRGBData,
+    PointCloudData,
+    RGBCameraData,
+)
+from neuracore_types.nc_data.static_calibration import (
+    StaticCalibration,
+    dump_sensor_trace,
+    load_sensor_trace,
+    static_trace_value,
+)
+
+NUM_FRAMES = 6
+
+
+def _rgb_trace(extrinsics: np.ndarray | None = None) -> list[RGBCameraData]:
+    extrinsics = np.eye(4, dtype=np.float16) if extrinsics is None else extrinsics
+    return [
+        RGBCameraData(
+            timestamp=0.1 * t,
+            frame_idx=t,
+            frame=np.full((4, 5, 3), t, dtype=np.uint8),
+            extrinsics=extrinsics.copy(),
+            intrinsics=np.eye(3, dtype=np.float16) * 500,
+        )
+        for t in range(NUM_FRAMES)
+    ]
+
+
+class TestStaticTraceValue:
+    """Tests for static_trace_value."""
+
+    def test_static_trace_value(self):
+        """Test only constant traces have a static value."""
+        trace = np.tile(np.arange(7.0), (5, 1))
+        np.testing.assert_array_equal(static_trace_value(trace), np.arange(7.0))
+        trace[3, 2] = -1.0
+        assert static_trace_value(trace) is None
+        assert static_trace_value(np.zeros((0, 7))) is None
+        assert static_trace_value(np.full((3, 2), np.nan)) is not None
+
+
+class TestStaticCalibration:
+    """Tests for StaticCalibration."""
+
+    def test_from_trace(self):
+        """Test a constant calibration is detected and attached by reference."""
+        trace = _rgb_trace()
+        calibration = StaticCalibration.from_trace(trace)
+        assert calibration is not None
+        np.testing.assert_array_equal(calibration.extrinsics, np.eye(4))
+        assert not calibration.extrinsics.flags.writeable
+
+        calibration.attach(trace)
+        assert all(frame.extrinsics is calibration.extrinsics for frame in trace)
+        assert all(frame.intrinsics is calibration.intrinsics for frame in trace)
+        assert StaticCalibration.from_trace(trace) == calibration
+
+    def test_changing_calibration(self):
+        """Test a calibration changing over time is not static."""
+        trace = _rgb_trace()
+        trace[-1].extrinsics = trace[-1].extrinsics * 2
+        assert StaticCalibration.from_trace(trace) is None
+        trace = _rgb_trace()
+        trace[2].intrinsics = None
+        assert StaticCalibration.from_trace(trace) is None
+        assert StaticCalibration.from_trace([]) is None
+
+
+class TestSensorTrace:
+    """Tests for dump_sensor_trace and load_sensor_trace."""
+
+    def test_static_calibration_dumped_once(self):
+        """Test a static calibration is serialized once for the trace."""
+        trace = _rgb_trace()
+        dumped = dump_sensor_trace(trace)
+        assert dumped["calibration"]["extrinsics"] == np.eye(4).tolist()
+        for frame in dumped["data"]:
+            assert "extrinsics" not in frame
+            assert "intrinsics" not in frame
+
+        loaded = load_sensor_trace(dumped, RGBCameraData)
+        assert all(frame.extrinsics is loaded[0].extrinsics for frame in loaded)
+        for frame, expected in zip(loaded, trace):
+            assert frame.model_dump(mode="json") == expected.model_dump(mode="json")
+
+    def test_changing_calibration_dumped_per_frame(self):
+        """Test a changing calibration is serialized with every frame."""
+        trace = [
+            PointCloudData(
+                points=np.full((3, 3), t, dtype=np.float16),
+                extrinsics=np.eye(4, dtype=np.float16) * (t + 1),
+            )
+            for t in range(3)
+        ]
+        dumped = dump_sensor_trace(trace)
+        assert dumped["calibration"] is None
+        loaded = load_sensor_trace(dumped, PointCloudData)
+        for frame, expected in zip(loaded, trace):
+            np.testing.assert_array_equal(frame.extrinsics, expected.extrinsics)
+            assert frame.intrinsics is None
+
+
+class TestBatchedStaticCalibration:
+    """Tests for batching frames sharing a static calibration."""
+
+    @pytest.mark.parametrize("shared", [False, True])
+    def test_from_nc_data_list(self, shared):
+        """Test shared calibration is repeated along time in its own memory."""
+        trace = _rgb_trace()
+        if shared:
+            StaticCalibration.from_trace(trace).attach(trace)
+        batched = BatchedRGBData.from_nc_data_list(trace)
+        assert batched.extrinsics.shape == (1, NUM_FRAMES, 4, 4)
+        assert batched.extrinsics.is_contiguous()
+        torch.testing.assert_close(
+            batched.extrinsics, torch.eye(4).expand(1, NUM_FRAMES, 4, 4)
+        )
+
+        expected = BatchedRGBData.from_nc_data_list(_rgb_trace())
+        stats = batched.calculate_statistics()
+        expected_stats = expected.calculate_statistics()
+        for field in ["extrinsics", "intrinsics"]:
+            for name in ["mean", "std", "count", "min", "max"]:
+                np.testing.assert_array_equal(
+                    getattr(getattr(stats, field), name),
+                    getattr(getattr(expected_stats, field), name),
+                )
+        accumulated = batched.accumulate_statistics()
+        expected_accumulated = expected.accumulate_statistics()
+        for field in ["extrinsics", "intrinsics"]:
+            assert accumulated[field].count == expected_accumulated[field].count
+            np.testing.assert_array_equal(
+                accumulated[field].sum, expected_accumulated[field].sum
+            )
+            np.testing.assert_array_equal(
+                accumulated[field].m2, expected_accumulated[field].m2
+            )
+
+        # Every time step owns its memory, so in-place writes stay local
+        batched.extrinsics[0, 0, 0, 3] = 5
+        assert batched.extrinsics[0, 1:, 0, 3].eq(0).all()
+        batched.intrinsics.mul_(2)
+
+    def test_statistics_of_expanded_calibration(self):
+        """Test statistics of a calibration expanded along time."""
+        batched = BatchedRGBData.from_nc_data_list(_rgb_trace())
+        expanded = batched.model_copy(
+            update={"extrinsics": torch.eye(4).expand(1, NUM_FRAMES, 4, 4)}
+        )
+        stats = expanded.calculate_statistics().extrinsics
+        expected = batched.calculate_statistics().extrinsics
+        for name in ["mean", "std", "count", "min", "max"]:
+            np.testing.assert_array_equal(getattr(stats, name), getattr(expected, name))
+        accumulated = expanded.accumulate_statistics()["extrinsics"]
+        expected_accumulated = batched.accumulate_statistics()["extrinsics"]
+        np.testing.assert_array_equal(accumulated.sum, expected_accumulated.sum)
+        np.testing.assert_array_equal(accumulated.m2, expected_accumulated.m2)
+
+    def test_point_cloud_from_nc_data_list(self):
+        """Test point clouds sharing a calibration repeat it along time."""
+        calibration = StaticCalibration(extrinsics=np.eye(4, dtype=np.float16))
+        trace = calibration.attach([
+            PointCloudData(points=np.ones((8, 3), dtype=np.float16))
+            for _ in range(NUM_FRAMES)
+        ])
+        batched = BatchedPointCloudData.from_nc_data_list(trace)
+        assert batched.extrinsics.is_contiguous()
+        assert batched.intrinsics is None
+        restored = BatchedPointCloudData.model_validate(batched.model_dump(mode="json"))
+        torch.testing.assert_close(restored.extrinsics, batched.extrinsics)
@@ -0,0 +1,123 @@
+"""Tests for chunking.py module."""
+
+from collections.abc import Sequence
+
+import numpy as np
+import pytest
+
+from neuracore_types import DataType, EpisodeStatistics, JointData
+from neuracore_types.synchronization.chunking import (
+    chunk_boundaries,
+    chunked_episode_statistics,
+    iter_index_chunks,
+    iter_synchronized_chunks,
+)
+from neuracore_types.synchronization.synchronization import SynchronizationDetails
+from neuracore_types.synchronization.synchronizer import (
+    synchronize_episode,
+    synchronize_timestamps,
+)
+
+JOINTS = DataType.JOINT_POSITIONS
+
+
+class _LazyTrace(Sequence):
+    """Messages created on access, recording which were read."""
+
+    def __init__(self, timestamps):
+        self.timestamps = timestamps
+        self.read: set[int] = set()
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        self.read.add(index)
+        timestamp = self.timestamps[index]
+        return JointData(timestamp=timestamp, value=timestamp * 2)
+
+
+def _traces(num_messages: int = 100):
+    timestamps = (np.arange(num_messages) / 10.0).tolist()
+    return {JOINTS: {"arm": [JointData(timestamp=t, value=t * 2) for t in timestamps]}}
+
+
+def test_chunk_boundaries():
+    """Test steps are split into half-open windows with history."""
+    timestamps = np.arange(10) * 0.5
+    boundaries = chunk_boundaries(timestamps, 2.0, overlap=1.0)
+    assert boundaries == [
+        (0, slice(0, 4), slice(0, 4)),
+        (1, slice(4, 8), slice(2, 8)),
+        (2, slice(8, 10), slice(6, 10)),
+    ]
+    assert chunk_boundaries(np.array([0.0, 0.1, 5.0]), 1.0)[1][0] == 5
+    assert chunk_boundaries(np.zeros(0), 1.0) == []
+    with pytest.raises(ValueError, match="positive"):
+        chunk_boundaries(timestamps, 0.0)
+    with pytest.raises(ValueError, match="negative"):
+        chunk_boundaries(timestamps, 1.0, overlap=-1.0)
+
+
+def test_chunks_match_whole_episode():
+    """Test the new steps of every chunk cover the whole episode once."""
+    traces = _traces()
+    details = SynchronizationDetails(frequency=10, cross_embodiment_union=None)
+    whole = synchronize_episode(traces, details, "robot")
+    chunks = list(
+        iter_synchronized_chunks(
+            traces, details, "robot", chunk_duration=3.0, overlap=0.5
+        )
+    )
+
+    assert [chunk.index for chunk in chunks] == [0, 1, 2, 3]
+    observations = [p for chunk in chunks for p in chunk.new_steps.observations]
+    assert observations == whole.observations
+    second = chunks[1]
+    assert (second.start_time, second.end_time) == (3.0, 6.0)
+    assert second.episode.start_time == 2.5
+    assert second.num_history_steps == 5
+    assert second.episode.observations[5].timestamp == pytest.approx(3.0)
+    assert chunks[0].num_history_steps == 0
+    assert chunks[-1].end_time == whole.end_time
+
+
+def test_chunks_read_only_their_messages():
+    """Test lazily loaded traces are only read for the current chunk."""
+    trace = _LazyTrace((np.arange(100) / 10.0).tolist())
+    details = SynchronizationDetails(frequency=10, cross_embodiment_union=None)
+    index = synchronize_timestamps({JOINTS: {"arm": trace.timestamps}}, details)
+    chunks = iter_index_chunks(
+        index, {JOINTS: {"arm": trace}}, "robot", chunk_duration=2.0
+    )
+    first = next(chunks)
+    assert len(first.episode.observations) == 20
+    assert trace.read == set(range(20))
+    next(chunks)
+    assert trace.read == set(range(40))
+
+
+def test_chunked_statistics():
+    """Test merged chunk statistics match those of the whole episode."""
+    traces = _traces()
+    details = SynchronizationDetails(frequency=10, cross_embodiment_union=None)
+    whole = EpisodeStatistics.from_synchronized_episode(
+        synchronize_episode(traces, details, "robot")
+    )
+    chunked = chunked_episode_statistics(
+        iter_synchronized_chunks(
+            traces, details, "robot", chunk_duration=2.5, overlap=1.0
+        )
+    )
+
+    assert chunked.episode_length == whole.episode_length == 100
+    expected = whole.data_accumulators[JOINTS]["arm"]["value"]
+    merged = chunked.data_accumulators[JOINTS]["arm"]["value"]
+    assert merged.count == expected.count
+    np.testing.assert_allclose(merged.mean, expected.mean)
+    np.testing.assert_allclose(merged.m2, expected.m2)
+    np.testing.assert_allclose(merged.max, expected.max)
+    assert chunked.get_data_types() == whole.get_data_types() == [JOINTS]
+    np.testing.assert_allclose(
+        chunked.data[JOINTS]["arm"].std, whole.data[JOINTS]["arm"].std, rtol=1e-6
+    )
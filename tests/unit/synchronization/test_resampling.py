@@ -0,0 +1,169 @@
+"""Tests for resampling.py module."""
+
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
+from scipy.spatial.transform import Slerp
+
+from neuracore_types import Custom1DData, DataType, JointData, PoseData, RGBCameraData
+from neuracore_types.synchronization.resampling import (
+    MISSING_MESSAGE,
+    ResamplingMode,
+    hold_indices,
+    interpolation_weights,
+)
+from neuracore_types.synchronization.synchronization import SynchronizationDetails
+from neuracore_types.synchronization.synchronizer import (
+    synchronize_episode,
+    synchronize_timestamps,
+)
+
+JOINTS = DataType.JOINT_POSITIONS
+
+
+def _details(resampling: dict, **kwargs) -> SynchronizationDetails:
+    return SynchronizationDetails(
+        frequency=kwargs.pop("frequency", 10),
+        cross_embodiment_union=None,
+        resampling=resampling,
+        **kwargs,
+    )
+
+
+class TestResamplingKernels:
+    """Tests for hold_indices and interpolation_weights."""
+
+    def test_hold_indices(self):
+        """Test the latest message at or before each target is held."""
+        timestamps = np.array([0.0, 1.0, 2.0])
+        targets = np.array([-0.5, 0.0, 0.9, 1.0, 3.0])
+        np.testing.assert_array_equal(
+            hold_indices(timestamps, targets), [MISSING_MESSAGE, 0, 0, 1, 2]
+        )
+
+    def test_interpolation_weights(self):
+        """Test targets are located between messages and clamped outside."""
+        timestamps = np.array([0.0, 1.0, 3.0])
+        targets = np.array([-1.0, 0.25, 1.0, 2.5, 4.0])
+        lower, upper, weights = interpolation_weights(timestamps, targets)
+        np.testing.assert_array_equal(lower, [0, 0, 1, 1, 2])
+        np.testing.assert_array_equal(upper, [1, 1, 2, 2, 2])
+        np.testing.assert_allclose(weights, [0.0, 0.25, 0.0, 0.75, 0.0])
+
+
+class TestSynchronizationDetails:
+    """Tests for the resampling modes of SynchronizationDetails."""
+
+    def test_unsupported_mode(self):
+        """Test interpolation is rejected for data types without support."""
+        with pytest.raises(ValueError, match="not supported for RGB_IMAGES"):
+            _details({DataType.RGB_IMAGES: ResamplingMode.LINEAR})
+        with pytest.raises(ValueError, match="not supported for JOINT_POSITIONS"):
+            _details({JOINTS: ResamplingMode.SLERP})
+        _details({DataType.RGB_IMAGES: ResamplingMode.ZERO_ORDER_HOLD})
+
+    def test_hash(self):
+        """Test the resampling modes are part of the hash."""
+        nearest = _details({JOINTS: ResamplingMode.NEAREST})
+        linear = _details({JOINTS: ResamplingMode.LINEAR})
+        assert hash(linear) == hash(_details({JOINTS: ResamplingMode.LINEAR}))
+        assert hash(linear) != hash(nearest)
+
+
+class TestResampledSynchronization:
+    """Tests for synchronization with resampling modes."""
+
+    def test_zero_order_hold(self):
+        """Test the latest message is held until max_delay_s."""
+        timestamps = {JOINTS: {"arm": [0.0, 0.08, 0.31]}}
+        index = synchronize_timestamps(
+            timestamps,
+            _details({JOINTS: ResamplingMode.ZERO_ORDER_HOLD}, max_delay_s=0.15),
+        )
+        np.testing.assert_allclose(index.timestamps, [0.0, 0.1, 0.2])
+        np.testing.assert_array_equal(index.indices[JOINTS]["arm"], [0, 1, 1])
+
+    def test_linear(self):
+        """Test joints and custom data are interpolated linearly."""
+        times = np.sort(np.random.default_rng(0).uniform(0.0, 2.0, 100))
+        joints = [JointData(timestamp=t, value=3 * t + 1) for t in times]
+        custom = [
+            Custom1DData(timestamp=t, data=np.array([t, -t], dtype=np.float32))
+            for t in times
+        ]
+        details = _details(
+            {
+                JOINTS: ResamplingMode.LINEAR,
+                DataType.CUSTOM_1D: ResamplingMode.LINEAR,
+            },
+            max_delay_s=0.1,
+        )
+        episode = synchronize_episode(
+            {JOINTS: {"arm": joints}, DataType.CUSTOM_1D: {"sensor": custom}},
+            details,
+            "robot",
+        )
+        assert len(episode.observations) > 10
+        for observation in episode.observations:
+            t = observation.timestamp
+            joint = observation[JOINTS]["arm"]
+            assert isinstance(joint, JointData)
+            assert joint.timestamp == t
+            assert joint.value == pytest.approx(3 * t + 1)
+            data = observation[DataType.CUSTOM_1D]["sensor"].data
+            assert data.dtype == np.float32
+            np.testing.assert_allclose(data, [t, -t], atol=1e-6)
+
+    def test_slerp(self):
+        """Test poses interpolate positions linearly and orientations by slerp."""
+        times = np.array([0.0, 0.5, 1.0])
+        rotations = R.random(3, random_state=0)
+        poses = [
+            PoseData(
+                timestamp=t,
+                pose=np.concatenate([[t, 2 * t, 0.0], rotation.as_quat()]),
+            )
+            for t, rotation in zip(times, rotations)
+        ]
+        episode = synchronize_episode(
+            {DataType.POSES: {"object": poses}},
+            _details({DataType.POSES: ResamplingMode.SLERP}, max_delay_s=0.5),
+            "robot",
+        )
+        targets = np.array([o.timestamp for o in episode.observations])
+        np.testing.assert_allclose(targets, np.arange(11) / 10)
+        result = np.stack(
+            [o[DataType.POSES]["object"].pose for o in episode.observations]
+        )
+        np.testing.assert_allclose(result[:, 0], targets)
+        np.testing.assert_allclose(result[:, 1], 2 * targets)
+        expected = Slerp(times, rotations)(targets).as_quat()
+        np.testing.assert_allclose(
+            result[:, 3:] * np.sign(result[:, 6:]),
+            expected * np.sign(expected[:, 3:]),
+            atol=1e-12,
+        )
+
+    def test_interpolation_limits(self):
+        """Test interpolation needs a message within max_delay_s of the step."""
+        timestamps = {JOINTS: {"arm": [0.0, 0.1, 1.0, 1.1]}}
+        index = synchronize_timestamps(
+            timestamps, _details({JOINTS: ResamplingMode.LINEAR}, max_delay_s=0.05)
+        )
+        np.testing.assert_allclose(index.timestamps, [0.0, 0.1, 1.0, 1.1])
+        np.testing.assert_allclose(index.interpolation[JOINTS]["arm"].weights, 0.0)
+
+    def test_nearest_unaffected(self):
+        """Test other data types still use the nearest message."""
+        frames = [
+            RGBCameraData(timestamp=0.1 * t, frame=np.zeros((2, 2, 3), np.uint8))
+            for t in range(5)
+        ]
+        joints = [JointData(timestamp=0.05 * t, value=t) for t in range(9)]
+        episode = synchronize_episode(
+            {DataType.RGB_IMAGES: {"wrist": frames}, JOINTS: {"arm": joints}},
+            _details({JOINTS: ResamplingMode.LINEAR}),
+            "robot",
+        )
+        for t, observation in enumerate(episode.observations):
+            assert observation[DataType.RGB_IMAGES]["wrist"] is frames[t]
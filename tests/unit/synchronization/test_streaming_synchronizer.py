@@ -0,0 +1,169 @@
+"""Tests for streaming_synchronizer.py module."""
+
+import heapq
+
+import numpy as np
+import pytest
+
+from neuracore_types import DataType, JointData, RGBCameraData
+from neuracore_types.synchronization.resampling import ResamplingMode
+from neuracore_types.synchronization.streaming_synchronizer import StreamingSynchronizer
+from neuracore_types.synchronization.synchronization import SynchronizationDetails
+from neuracore_types.synchronization.synchronizer import synchronize_episode
+
+JOINTS = DataType.JOINT_POSITIONS
+CAMERAS = DataType.RGB_IMAGES
+
+EMBODIMENT = {JOINTS: {1: "arm", 0: "gripper"}, CAMERAS: {0: "wrist"}}
+
+
+def _details(**kwargs) -> SynchronizationDetails:
+    return SynchronizationDetails(
+        frequency=kwargs.pop("frequency", 10), cross_embodiment_union=None, **kwargs
+    )
+
+
+def _traces(seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+
+    def joints(rate: float) -> list[JointData]:
+        times = np.arange(0.0, 3.0, 1 / rate) + rng.uniform(0, 0.002, int(3 * rate))
+        return [JointData(timestamp=t, value=float(i)) for i, t in enumerate(times)]
+
+    frames = [
+        RGBCameraData(
+            timestamp=0.05 + t / 15 + rng.uniform(0, 0.01),
+            frame_idx=t,
+            frame=np.zeros((2, 2, 3), dtype=np.uint8),
+        )
+        for t in range(40)
+    ]
+    return {
+        JOINTS: {"arm": joints(100), "gripper": joints(50)},
+        CAMERAS: {"wrist": frames},
+    }
+
+
+def _interleave(traces: dict) -> list[tuple[DataType, str, object]]:
+    """Order the messages of every sensor by time, as they would arrive."""
+    streams = [
+        [(message.timestamp, data_type, name, message) for message in messages]
+        for data_type, sensors in traces.items()
+        for name, messages in sensors.items()
+    ]
+    merged = heapq.merge(*streams, key=lambda entry: entry[0])
+    return [(data_type, name, message) for _, data_type, name, message in merged]
+
+
+def _stream(synchronizer: StreamingSynchronizer, traces: dict) -> list:
+    points = []
+    for data_type, name, message in _interleave(traces):
+        points.extend(synchronizer.push(data_type, name, message))
+    return points + synchronizer.flush()
+
+
+class TestStreamingSynchronizer:
+    """Tests for StreamingSynchronizer."""
+
+    @pytest.mark.parametrize("allow_duplicates", [True, False])
+    def test_matches_offline(self, allow_duplicates):
+        """Test streaming gives the complete steps of offline synchronization."""
+        traces = _traces()
+        details = _details(max_delay_s=0.04, allow_duplicates=allow_duplicates)
+        points = _stream(StreamingSynchronizer(EMBODIMENT, details, "robot"), traces)
+        # Unlike offline synchronization, streaming does not trim the end of
+        # the episode and keeps steps past the last message of a sensor while
+        # it is within max_delay_s
+        end = min(
+            messages[-1].timestamp
+            for sensors in traces.values()
+            for messages in sensors.values()
+        )
+        points = [point for point in points if point.timestamp <= end]
+
+        expected = [
+            observation
+            for observation in synchronize_episode(
+                traces, _details(max_delay_s=0.04), "robot"
+            ).observations
+            if sum(len(sensors) for sensors in observation.data.values()) == 3
+        ]
+        if not allow_duplicates:
+            used = set()
+            unique = []
+            for observation in expected:
+                frame = observation[CAMERAS]["wrist"]
+                if id(frame) not in used:
+                    used.add(id(frame))
+                    unique.append(observation)
+            expected = unique
+        assert len(points) == len(expected) > 10
+        for point, observation in zip(points, expected):
+            assert point.robot_id == "robot"
+            assert point.timestamp == pytest.approx(observation.timestamp)
+            for data_type, sensors in observation.data.items():
+                for name, message in sensors.items():
+                    assert point[data_type][name] is message
+
+    def test_ordered_by_embodiment_description(self):
+        """Test emitted points hold the sensors in embodiment order."""
+        points = _stream(StreamingSynchronizer(EMBODIMENT, _details()), _traces())
+        assert list(points[0].data) == [JOINTS, CAMERAS]
+        assert list(points[0][JOINTS]) == ["gripper", "arm"]
+
+    def test_emits_as_soon_as_ready(self):
+        """Test a step is emitted once every sensor has reached it."""
+        synchronizer = StreamingSynchronizer(
+            {JOINTS: {0: "arm"}, CAMERAS: {0: "wrist"}}, _details(max_delay_s=1.0)
+        )
+        frame = np.zeros((2, 2, 3), dtype=np.uint8)
+        assert not synchronizer.push(JOINTS, "arm", JointData(timestamp=0.0, value=0))
+        assert synchronizer.next_timestamp is None
+        assert synchronizer.push(
+            CAMERAS, "wrist", RGBCameraData(timestamp=0.0, frame=frame)
+        )
+        assert synchronizer.next_timestamp == pytest.approx(0.1)
+        # The camera has not reached 0.1 s yet
+        assert synchronizer.push(JOINTS, "arm", JointData(timestamp=0.1, value=1)) == []
+        points = synchronizer.push(
+            CAMERAS, "wrist", RGBCameraData(timestamp=0.1, frame=frame)
+        )
+        assert [point.timestamp for point in points] == [pytest.approx(0.1)]
+
+    def test_max_delay_bounds_latency(self):
+        """Test a lagging sensor delays steps by at most max_delay_s."""
+        synchronizer = StreamingSynchronizer(
+            {JOINTS: {0: "arm", 1: "gripper"}}, _details(max_delay_s=0.15)
+        )
+        synchronizer.push(JOINTS, "arm", JointData(timestamp=0.0, value=0))
+        points = synchronizer.push(JOINTS, "gripper", JointData(timestamp=0.0, value=0))
+        for step in range(1, 6):
+            points += synchronizer.push(
+                JOINTS, "arm", JointData(timestamp=0.1 * step, value=step)
+            )
+        # Steps at 0.1 s and later wait for the gripper until 0.15 s have
+        # passed, then use its message at 0.0 s while it is close enough
+        assert [point.timestamp for point in points] == pytest.approx([0.0, 0.1])
+        assert synchronizer.next_timestamp == pytest.approx(0.4)
+
+    def test_ignores_unknown_sensors(self):
+        """Test messages of sensors outside the embodiment are ignored."""
+        synchronizer = StreamingSynchronizer({JOINTS: {0: "arm"}}, _details())
+        assert synchronizer.push(JOINTS, "other", JointData(value=0.0)) == []
+        assert synchronizer.next_timestamp is None
+
+    def test_errors(self):
+        """Test invalid settings and out of order messages are rejected."""
+        with pytest.raises(ValueError, match="no sensors"):
+            StreamingSynchronizer({}, _details())
+        with pytest.raises(ValueError, match="NEAREST"):
+            StreamingSynchronizer(
+                {JOINTS: {0: "arm"}},
+                _details(resampling={JOINTS: ResamplingMode.LINEAR}),
+            )
+        with pytest.raises(ValueError, match="buffer_size"):
+            StreamingSynchronizer({JOINTS: {0: "arm"}}, _details(), buffer_size=1)
+        synchronizer = StreamingSynchronizer({JOINTS: {0: "arm"}}, _details())
+        synchronizer.push(JOINTS, "arm", JointData(timestamp=1.0, value=0.0))
+        with pytest.raises(ValueError, match="time order"):
+            synchronizer.push(JOINTS, "arm", JointData(timestamp=0.5, value=0.0))
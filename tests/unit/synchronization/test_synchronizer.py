@@ -0,0 +1,176 @@
+"""Tests for synchronizer.py module."""
+
+import numpy as np
+import pytest
+
+from neuracore_types import DataType, JointData, RGBCameraData
+from neuracore_types.synchronization.synchronization import SynchronizationDetails
+from neuracore_types.synchronization.synchronizer import (
+    MISSING_MESSAGE,
+    nearest_indices,
+    synchronize_episode,
+    synchronize_timestamps,
+)
+
+JOINTS = DataType.JOINT_POSITIONS
+CAMERAS = DataType.RGB_IMAGES
+
+
+def _details(**kwargs) -> SynchronizationDetails:
+    return SynchronizationDetails(
+        frequency=kwargs.pop("frequency", 10),
+        cross_embodiment_union=kwargs.pop("cross_embodiment_union", None),
+        **kwargs,
+    )
+
+
+def _reference(timestamps, details):
+    """Synchronize message by message, as a reference."""
+    sensors = [
+        (data_type, name, list(values))
+        for data_type, names in timestamps.items()
+        for name, values in names.items()
+    ]
+    if details.trim_start_end:
+        start = max(values[0] for _, _, values in sensors)
+        end = min(values[-1] for _, _, values in sensors)
+    else:
+        start = min(values[0] for _, _, values in sensors)
+        end = max(values[-1] for _, _, values in sensors)
+    targets = []
+    step = 0
+    while start + step / details.frequency <= end + 1e-9:
+        targets.append(start + step / details.frequency)
+        step += 1
+    rows = {}
+    for data_type, name, values in sensors:
+        row = []
+        for target in targets:
+            delays = [abs(value - target) for value in values]
+            best = delays.index(min(delays))
+            row.append(best if delays[best] <= details.max_delay_s else -1)
+        rows[data_type, name] = row
+    keep = [
+        step
+        for step in range(len(targets))
+        if any(row[step] != -1 for row in rows.values())
+    ]
+    return [targets[step] for step in keep], {
+        key: [row[step] for step in keep] for key, row in rows.items()
+    }
+
+
+class TestNearestIndices:
+    """Tests for nearest_indices."""
+
+    def test_nearest_indices(self):
+        """Test the nearest message is found, the earlier one on ties."""
+        timestamps = np.array([0.0, 1.0, 2.0])
+        targets = np.array([-1.0, 0.4, 0.5, 0.6, 2.5])
+        np.testing.assert_array_equal(
+            nearest_indices(timestamps, targets), [0, 0, 0, 1, 2]
+        )
+
+
+class TestSynchronizeTimestamps:
+    """Tests for synchronize_timestamps."""
+
+    @pytest.mark.parametrize("trim_start_end", [False, True])
+    def test_matches_reference(self, trim_start_end):
+        """Test random jittered streams match a message-by-message search."""
+        rng = np.random.default_rng(0)
+        timestamps = {
+            JOINTS: {
+                "arm": np.sort(rng.uniform(0.0, 5.0, 200)),
+                "gripper": np.sort(rng.uniform(0.5, 4.0, 30)),
+            },
+            CAMERAS: {"wrist": np.sort(rng.uniform(0.2, 5.5, 60))},
+        }
+        details = _details(max_delay_s=0.05, trim_start_end=trim_start_end)
+        index = synchronize_timestamps(timestamps, details)
+        targets, rows = _reference(timestamps, details)
+        np.testing.assert_allclose(index.timestamps, targets)
+        for (data_type, name), row in rows.items():
+            np.testing.assert_array_equal(index.indices[data_type][name], row)
+
+    def test_unsorted_timestamps(self):
+        """Test indices refer to the messages in the order they were given."""
+        timestamps = {JOINTS: {"arm": [0.2, 0.0, 0.1]}}
+        index = synchronize_timestamps(timestamps, _details())
+        np.testing.assert_allclose(index.timestamps, [0.0, 0.1, 0.2])
+        np.testing.assert_array_equal(index.indices[JOINTS]["arm"], [1, 2, 0])
+
+    def test_no_duplicates(self):
+        """Test a message is only used by its nearest step."""
+        timestamps = {
+            JOINTS: {"arm": np.arange(0.0, 1.0, 0.01)},
+            CAMERAS: {"wrist": [0.0, 0.32, 0.62]},
+        }
+        index = synchronize_timestamps(
+            timestamps, _details(max_delay_s=0.2, allow_duplicates=False)
+        )
+        missing = MISSING_MESSAGE
+        np.testing.assert_array_equal(
+            index.indices[CAMERAS]["wrist"],
+            [0, missing, missing, 1, missing, missing, 2],
+        )
+        with_duplicates = synchronize_timestamps(timestamps, _details(max_delay_s=0.2))
+        np.testing.assert_array_equal(
+            with_duplicates.indices[CAMERAS]["wrist"], [0, 0, 1, 1, 1, 2, 2]
+        )
+
+    def test_steps_without_sensors_dropped(self):
+        """Test steps further than max_delay_s from every message are dropped."""
+        timestamps = {JOINTS: {"arm": [0.0, 0.1, 0.5, 0.6]}}
+        index = synchronize_timestamps(timestamps, _details(max_delay_s=0.01))
+        np.testing.assert_allclose(index.timestamps, [0.0, 0.1, 0.5, 0.6])
+        np.testing.assert_array_equal(index.indices[JOINTS]["arm"], [0, 1, 2, 3])
+
+    def test_cross_embodiment_union(self):
+        """Test only the sensors of the robot in the union are synchronized."""
+        timestamps = {
+            JOINTS: {"arm": [0.0, 0.1], "other": [0.0, 0.1]},
+            CAMERAS: {"wrist": [0.0, 0.1]},
+        }
+        details = _details(cross_embodiment_union={"robot": {JOINTS: ["arm"]}})
+        index = synchronize_timestamps(timestamps, details, "robot")
+        assert index.indices == {JOINTS: {"arm": index.indices[JOINTS]["arm"]}}
+        with pytest.raises(ValueError, match="not in the cross embodiment union"):
+            synchronize_timestamps(timestamps, details, "unknown")
+
+    def test_empty_sensor(self):
+        """Test an empty sensor leaves no overlap to trim to."""
+        timestamps = {JOINTS: {"arm": [0.0, 0.1], "empty": []}}
+        assert len(synchronize_timestamps(timestamps, _details())) == 0
+        index = synchronize_timestamps(timestamps, _details(trim_start_end=False))
+        np.testing.assert_array_equal(
+            index.indices[JOINTS]["empty"], [MISSING_MESSAGE] * 2
+        )
+
+
+class TestSynchronizeEpisode:
+    """Tests for synchronize_episode."""
+
+    def test_synchronize_episode(self):
+        """Test observations refer to the nearest messages."""
+        joints = [JointData(timestamp=0.01 * t, value=float(t)) for t in range(100)]
+        frames = [
+            RGBCameraData(
+                timestamp=0.1 * t + 0.02,
+                frame_idx=t,
+                frame=np.zeros((2, 2, 3), dtype=np.uint8),
+            )
+            for t in range(10)
+        ]
+        episode = synchronize_episode(
+            {JOINTS: {"arm": joints}, CAMERAS: {"wrist": frames}},
+            _details(max_delay_s=0.03),
+            "robot",
+        )
+        assert episode.robot_id == "robot"
+        assert len(episode.observations) == 10
+        assert episode.start_time == pytest.approx(0.02)
+        for t, observation in enumerate(episode.observations):
+            assert observation.robot_id == "robot"
+            assert observation[CAMERAS]["wrist"] is frames[t]
+            assert observation[JOINTS]["arm"] is joints[10 * t + 2]
@@ -0,0 +1,142 @@
+"""Tests for incremental SynchronizedDatasetStatistics updates."""
+
+import numpy as np
+import pytest
+
+from neuracore_types import (
+    DataType,
+    EpisodeStatistics,
+    JointData,
+    SynchronizedDatasetStatistics,
+    SynchronizedEpisode,
+    SynchronizedPoint,
+)
+
+ROBOT_ID = "robot"
+
+
+def _episode(values: dict[str, list[float]]) -> SynchronizedEpisode:
+    length = len(next(iter(values.values())))
+    observations = [
+        SynchronizedPoint(
+            timestamp=float(i),
+            data={
+                DataType.JOINT_POSITIONS: {
+                    name: JointData(value=v[i]) for name, v in values.items()
+                }
+            },
+        )
+        for i in range(length)
+    ]
+    return SynchronizedEpisode(
+        observations=observations,
+        start_time=0.0,
+        end_time=float(length),
+        robot_id=ROBOT_ID,
+    )
+
+
+def _dataset_statistics() -> SynchronizedDatasetStatistics:
+    return SynchronizedDatasetStatistics(
+        synchronized_dataset_id="synced",
+        input_cross_embodiment_description={
+            ROBOT_ID: {DataType.JOINT_POSITIONS: {0: "j2", 1: "j1"}}
+        },
+        output_cross_embodiment_description={},
+    )
+
+
+class TestIncrementalDatasetStatistics:
+    """Tests for adding and removing episode statistics."""
+
+    def test_from_synchronized_episode(self):
+        """Test episode accumulators are built for every sensor."""
+        stats = EpisodeStatistics.from_synchronized_episode(
+            _episode({"j1": [0.0, 1.0, 2.0]})
+        )
+        assert stats.episode_length == 3
+        accumulator = stats.data_accumulators[DataType.JOINT_POSITIONS]["j1"]["value"]
+        assert accumulator.count == 3
+        np.testing.assert_allclose(accumulator.mean, [1.0])
+        assert stats.get_data_types() == [DataType.JOINT_POSITIONS]
+        np.testing.assert_allclose(
+            stats.data[DataType.JOINT_POSITIONS]["j1"].mean, [1.0]
+        )
+
+    def test_add_episodes_matches_full_recompute(self):
+        """Test adding episodes one by one matches statistics of all data."""
+        first = {"j1": [0.0, 1.0, 2.0], "j2": [5.0, 5.0, 5.0]}
+        second = {"j1": [10.0, 12.0], "j2": [1.0, 3.0]}
+        dataset_stats = _dataset_statistics()
+        for values in (first, second):
+            dataset_stats.add_episode_statistics(
+                ROBOT_ID, EpisodeStatistics.from_synchronized_episode(_episode(values))
+            )
+
+        stats = dataset_stats.dataset_statistics[ROBOT_ID][DataType.JOINT_POSITIONS]
+        # Sensors follow the order of the input cross embodiment description
+        for sensor_stats, name in zip(stats, ["j2", "j1"]):
+            all_values = np.array(first[name] + second[name])
+            np.testing.assert_allclose(
+                sensor_stats.value.mean, [all_values.mean()], rtol=1e-6
+            )
+            np.testing.assert_allclose(
+                sensor_stats.value.std, [all_values.std()], rtol=1e-6
+            )
+            np.testing.assert_array_equal(sensor_stats.value.count, [5])
+
+    def test_remove_episode_restores_statistics(self):
+        """Test removing an episode restores the previous statistics."""
+        first = EpisodeStatistics.from_synchronized_episode(
+            _episode({"j1": [0.0, 1.0, 2.0]})
+        )
+        second = EpisodeStatistics.from_synchronized_episode(
+            _episode({"j1": [100.0, 200.0]})
+        )
+        dataset_stats = _dataset_statistics()
+        dataset_stats.add_episode_statistics(ROBOT_ID, first)
+        expected = dataset_stats.dataset_statistics[ROBOT_ID][DataType.JOINT_POSITIONS][
+            0
+        ].value
+        dataset_stats.add_episode_statistics(ROBOT_ID, second)
+        dataset_stats.remove_episode_statistics(ROBOT_ID, second)
+
+        value = dataset_stats.dataset_statistics[ROBOT_ID][DataType.JOINT_POSITIONS][
+            0
+        ].value
+        np.testing.assert_allclose(value.mean, expected.mean, atol=1e-5)
+        np.testing.assert_allclose(value.std, expected.std, atol=1e-5)
+        np.testing.assert_array_equal(value.count, expected.count)
+        assert value.max[0] < 3.0
+
+        dataset_stats.remove_episode_statistics(ROBOT_ID, first)
+        assert (
+            DataType.JOINT_POSITIONS not in dataset_stats.dataset_statistics[ROBOT_ID]
+        )
+
+    def test_remove_unknown_episode_raises(self):
+        """Test removing an episode that was never added raises."""
+        dataset_stats = _dataset_statistics()
+        episode_stats = EpisodeStatistics.from_synchronized_episode(
+            _episode({"j1": [0.0]})
+        )
+        with pytest.raises(ValueError):
+            dataset_stats.remove_episode_statistics(ROBOT_ID, episode_stats)
+        assert dataset_stats.dataset_statistics == {}
+
+    def test_json_round_trip(self):
+        """Test dataset statistics with accumulators survive serialization."""
+        dataset_stats = _dataset_statistics()
+        dataset_stats.add_episode_statistics(
+            ROBOT_ID,
+            EpisodeStatistics.from_synchronized_episode(_episode({"j1": [1.0, 2.0]})),
+        )
+        restored = SynchronizedDatasetStatistics.model_validate_json(
+            dataset_stats.model_dump_json()
+        )
+        restored.add_episode_statistics(
+            ROBOT_ID,
+            EpisodeStatistics.from_synchronized_episode(_episode({"j1": [3.0]})),
+        )
+        value = restored.dataset_statistics[ROBOT_ID][DataType.JOINT_POSITIONS][0].value
+        np.testing.assert_allclose(value.mean, [2.0])
@@ -13,6 +13,7 @@ from neuracore_types import (
     Custom1DData,
     DataType,
     DepthCameraData,
+    EmbodimentOrderingPlan,
     JointData,
     LanguageData,
     PointCloudData,
@@ -207,3 +208,48 @@ def test_sync_point_ordering_errors_on_missing_sensor_name():
         ),
     ):
         sync_point.order(ORDER_SCHEMA)
+
+
+def test_ordering_plan():
+    """A compiled plan orders points and episodes like the description."""
+    plan = EmbodimentOrderingPlan(ORDER_SCHEMA)
+    assert dict(plan.keys)[DataType.RGB_IMAGES] == ("camera_1", "camera_2", "camera_3")
+
+    _verify_sync_point_ordering(SYNCHRONIZED_POINT_UNORDERED)
+    ordered = SYNCHRONIZED_POINT_UNORDERED.order(plan)
+    assert (
+        ordered.model_dump()
+        == SYNCHRONIZED_POINT_UNORDERED.order(ORDER_SCHEMA).model_dump()
+    )
+    assert (
+        ordered[DataType.POSES]["pose_1"]
+        is SYNCHRONIZED_POINT_UNORDERED[DataType.POSES]["pose_1"]
+    )
+
+    episode = SynchronizedEpisode(
+        observations=[SYNCHRONIZED_POINT_UNORDERED] * 3,
+        start_time=0.0,
+        end_time=1.0,
+        robot_id="robot1",
+    )
+    for frame in episode.order(plan).observations:
+        _verify_sync_point_ordering(frame)
+
+
+def test_ordering_plan_rejects_mismatching_points():
+    """A plan validates every point it orders."""
+    plan = EmbodimentOrderingPlan(ORDER_SCHEMA)
+    sync_point = SynchronizedPoint.model_validate(
+        SYNCHRONIZED_POINT_UNORDERED.model_dump()
+    )
+    sync_point.data[DataType.POSES]["pose_3"] = sync_point.data[DataType.POSES][
+        "pose_1"
+    ]
+    episode = SynchronizedEpisode(
+        observations=[SYNCHRONIZED_POINT_UNORDERED, sync_point],
+        start_time=0.0,
+        end_time=1.0,
+        robot_id="robot1",
+    )
+    with pytest.raises(ValueError, match="Extra names in synchronized point"):
+        episode.order(plan)
@@ -0,0 +1,159 @@
+"""Tests for quaternion_utils.py"""
+
+import warnings
+
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
+from scipy.spatial.transform import Slerp
+
+from neuracore_types.importer.config import EulerOrderConfig
+from neuracore_types.utils.quaternion_utils import (
+    quat_from_euler,
+    quat_from_matrix,
+    quat_from_rotvec,
+    quat_left_matrix,
+    quat_multiply,
+    quat_normalize,
+    quat_power,
+    quat_right_matrix,
+    quat_rotate,
+    quat_slerp,
+    quat_to_euler,
+    quat_to_matrix,
+    quat_to_rotvec,
+)
+
+ROTATIONS = R.random(200, random_state=0)
+EULER_SEQUENCES = [order.value.lower() for order in EulerOrderConfig] + [
+    order.value.upper() for order in EulerOrderConfig
+]
+
+
+@pytest.mark.parametrize("seq", EULER_SEQUENCES + ["xyx", "ZXZ"])
+def test_euler_matches_scipy(seq):
+    angles = ROTATIONS.as_euler(seq)
+    np.testing.assert_allclose(
+        quat_from_euler(seq, angles), R.from_euler(seq, angles).as_quat(), atol=1e-12
+    )
+    np.testing.assert_allclose(
+        quat_to_euler(ROTATIONS.as_quat(), seq), angles, atol=1e-12
+    )
+
+
+def test_euler_degrees_and_leading_dimensions():
+    angles = np.rad2deg(ROTATIONS.as_euler("zyx")).reshape(10, 20, 3)
+    quat = quat_from_euler("zyx", angles, degrees=True)
+    assert quat.shape == (10, 20, 4)
+    np.testing.assert_allclose(
+        quat, R.from_euler("zyx", angles, degrees=True).as_quat(), atol=1e-12
+    )
+    np.testing.assert_allclose(
+        quat_to_euler(quat, "zyx", degrees=True), angles, atol=1e-9
+    )
+
+
+@pytest.mark.parametrize("seq", ["xyz", "XYZ"])
+def test_euler_gimbal_lock_matches_scipy(seq):
+    rotations = R.from_euler(seq, [[0.3, np.pi / 2, 0.2], [0.1, 0.0, 0.4]])
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        expected = rotations.as_euler(seq)
+    np.testing.assert_allclose(
+        quat_to_euler(rotations.as_quat(), seq), expected, atol=1e-12
+    )
+
+
+def test_invalid_euler_sequence():
+    with pytest.raises(ValueError):
+        quat_from_euler("xYz", np.zeros(3))
+    with pytest.raises(ValueError):
+        quat_from_euler("xxy", np.zeros(3))
+    with pytest.raises(ValueError):
+        quat_to_euler(np.array([0.0, 0.0, 0.0, 1.0]), "xy")
+
+
+def test_matrix_matches_scipy():
+    matrix = ROTATIONS.as_matrix()
+    np.testing.assert_allclose(quat_to_matrix(ROTATIONS.as_quat()), matrix, atol=1e-12)
+    expected = R.from_matrix(matrix).as_quat()
+    np.testing.assert_allclose(quat_from_matrix(matrix), expected, atol=1e-12)
+    np.testing.assert_allclose(quat_from_matrix(matrix[0]), expected[0], atol=1e-12)
+
+
+def test_non_orthogonal_matrix_matches_scipy():
+    noise = np.random.default_rng(0).normal(scale=1e-4, size=(200, 3, 3))
+    matrix = ROTATIONS.as_matrix() + noise
+    np.testing.assert_allclose(
+        quat_from_matrix(matrix), R.from_matrix(matrix).as_quat(), atol=1e-12
+    )
+    with pytest.raises(ValueError):
+        quat_from_matrix(-np.eye(3))
+
+
+def test_rotvec_matches_scipy():
+    for rotvec in [ROTATIONS.as_rotvec(), ROTATIONS.as_rotvec() * 1e-5]:
+        quat = R.from_rotvec(rotvec).as_quat()
+        np.testing.assert_allclose(quat_from_rotvec(rotvec), quat, atol=1e-12)
+        np.testing.assert_allclose(quat_to_rotvec(quat), rotvec, atol=1e-12)
+    np.testing.assert_allclose(
+        quat_from_rotvec(np.full((5, 3), 30.0), degrees=True),
+        R.from_rotvec(np.full((5, 3), 30.0), degrees=True).as_quat(),
+        atol=1e-12,
+    )
+    # The rotation vector takes the shortest path for either quaternion sign
+    np.testing.assert_allclose(
+        quat_to_rotvec(-ROTATIONS.as_quat()), ROTATIONS.as_rotvec(), atol=1e-12
+    )
+
+
+def test_multiply_matches_scipy():
+    other = R.random(200, random_state=1)
+    expected = (ROTATIONS * other).as_quat()
+    np.testing.assert_allclose(
+        quat_multiply(ROTATIONS.as_quat(), other.as_quat()), expected, atol=1e-12
+    )
+    p, q = ROTATIONS[0].as_quat(), other[0].as_quat()
+    np.testing.assert_allclose(quat_left_matrix(p) @ q, expected[0], atol=1e-12)
+    np.testing.assert_allclose(quat_right_matrix(q) @ p, expected[0], atol=1e-12)
+
+
+def test_rotate_matches_scipy():
+    vectors = np.random.default_rng(0).normal(size=(200, 3))
+    np.testing.assert_allclose(
+        quat_rotate(ROTATIONS.as_quat(), vectors), ROTATIONS.apply(vectors), atol=1e-12
+    )
+
+
+@pytest.mark.parametrize("exponent", [0.0, 0.5, 1.0, 2.5, -1.0])
+def test_power_matches_scipy(exponent):
+    expected = R.from_rotvec(ROTATIONS.as_rotvec() * exponent).as_quat()
+    np.testing.assert_allclose(
+        quat_power(ROTATIONS.as_quat(), exponent), expected, atol=1e-12
+    )
+
+
+def test_slerp_matches_scipy():
+    other = R.random(200, random_state=1)
+    weights = np.random.default_rng(0).uniform(size=200)
+    expected = np.stack([
+        Slerp([0.0, 1.0], R.concatenate([p, q]))(w).as_quat()
+        for p, q, w in zip(ROTATIONS, other, weights)
+    ])
+    # Either sign of the endpoints interpolates along the shortest path
+    result = quat_slerp(ROTATIONS.as_quat(), -other.as_quat(), weights)
+    np.testing.assert_allclose(
+        result * np.sign(result[:, 3:]), expected * np.sign(expected[:, 3:]), atol=1e-12
+    )
+    np.testing.assert_allclose(
+        quat_slerp(ROTATIONS.as_quat(), ROTATIONS.as_quat(), weights),
+        ROTATIONS.as_quat(),
+        atol=1e-15,
+    )
+
+
+def test_normalize():
+    quat = ROTATIONS.as_quat() * 3.0
+    np.testing.assert_allclose(quat_normalize(quat), ROTATIONS.as_quat(), atol=1e-15)
+    with pytest.raises(ValueError):
+        quat_normalize(np.zeros(4))
@@ -0,0 +1,78 @@
+"""Tests for trusted_construction.py"""
+
+import gc
+
+import numpy as np
+import torch
+from pydantic import BaseModel, TypeAdapter
+
+from neuracore_types import (
+    BatchedJointData,
+    DataType,
+    JointData,
+    NCDataUnion,
+    RGBCameraData,
+    SynchronizedEpisode,
+    SynchronizedPoint,
+)
+from neuracore_types.utils.trusted_construction import TrustedConstructionMixin
+
+
+def test_nc_data_matches_validation():
+    """Test trusted NCData equal validated ones, discriminator included."""
+    trusted = JointData.from_trusted(timestamp=1.5, value=0.25)
+    assert trusted == JointData(timestamp=1.5, value=0.25)
+    assert trusted.type == "JointData"
+    assert trusted.model_fields_set == {"timestamp", "value"}
+    dumped = trusted.model_dump(mode="json")
+    assert TypeAdapter(NCDataUnion).validate_python(dumped) == trusted
+
+
+def test_default_factories():
+    """Test default factories are called for every instance."""
+    first, second = JointData.construct_many([{"value": 1.0}, {"value": 2.0}])
+    assert isinstance(first.timestamp, float)
+    assert second.timestamp >= first.timestamp
+    assert [first.value, second.value] == [1.0, 2.0]
+
+
+def test_private_attributes_and_mutable_defaults():
+    """Test instances get their own private attributes and mutable defaults."""
+
+    class Model(TrustedConstructionMixin, BaseModel):
+        tags: list[str] = []
+
+    first, second = Model.construct_many([{}, {}])
+    first.tags.append("a")
+    assert second.tags == []
+    camera = RGBCameraData.from_trusted(frame=np.zeros((2, 2, 3), np.uint8))
+    assert camera._frame_provider is None
+    assert camera.frame_idx == 0
+
+
+def test_construct_many_restores_gc():
+    """Test the garbage collector is restored after bulk construction."""
+    assert gc.isenabled()
+    JointData.construct_many({"value": float(i)} for i in range(10))
+    assert gc.isenabled()
+
+
+def test_episode_and_batched():
+    """Test points, episodes and batched data assemble without validation."""
+    joint = JointData.from_trusted(timestamp=0.0, value=1.0)
+    point = SynchronizedPoint.from_trusted(
+        timestamp=0.0, data={DataType.JOINT_POSITIONS: {"arm": joint}}
+    )
+    assert point.robot_id is None
+    episode = SynchronizedEpisode.from_trusted(
+        observations=[point], start_time=0.0, end_time=0.0, robot_id="robot"
+    )
+    assert episode == SynchronizedEpisode(
+        observations=[point], start_time=0.0, end_time=0.0, robot_id="robot"
+    )
+    assert episode.observations[0][DataType.JOINT_POSITIONS]["arm"] is joint
+
+    batched = BatchedJointData.from_trusted(value=torch.ones(2, 3, 1))
+    assert batched.type == "BatchedJointData"
+    restored = BatchedJointData.model_validate_json(batched.model_dump_json())
+    assert restored.value.shape == (2, 3, 1)